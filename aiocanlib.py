@@ -0,0 +1,217 @@
+##############################################################################
+#                                                                            #
+# Module: aiocanlib                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# asyncio interface for canlib. The notification handles of all buses used  #
+# on an event loop are waited on by one helper thread, so many channels can  #
+# be driven from a single loop without a thread (or executor) per bus.       #
+#                                                                            #
+##############################################################################
+import asyncio
+import collections
+import threading
+import weakref
+
+from canlib import CanBus, CanFrame, CanMessage, WaitForMultipleObjects
+
+# WaitForMultipleObjects can't wait on more handles at once
+MAXIMUM_WAIT_OBJECTS = 64
+
+class _NotificationWaiter(object):
+    # Waits on the notification handles of up to MAXIMUM_WAIT_OBJECTS buses in
+    # a daemon thread and wakes up the asyncio.Event of the signaled bus. The
+    # handle list is picked up again after every wait, so buses added later
+    # are waited on after at most refresh_ms.
+    def __init__(self, loop, refresh_ms=10):
+        self.loop = loop
+        self.refresh_ms = refresh_ms
+        self.buses = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def is_full(self):
+        return len(self.buses) >= MAXIMUM_WAIT_OBJECTS
+
+    def add(self, handle, event):
+        with self._lock:
+            self.buses[handle] = event
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="XLNotificationWaiter", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, handle):
+        with self._lock:
+            self.buses.pop(handle, None)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self.buses or self.loop.is_closed():
+                    self._thread = None
+                    return
+                handles = list(self.buses)
+                events = [self.buses[handle] for handle in handles]
+            result = WaitForMultipleObjects(handles, False, self.refresh_ms)
+            if 0 <= result < len(handles):
+                try:
+                    self.loop.call_soon_threadsafe(events[result].set)
+                except RuntimeError:
+                    # The loop has been closed in the meantime
+                    return
+
+_waiters = weakref.WeakKeyDictionary()
+
+def _get_waiter(loop):
+    waiters = _waiters.setdefault(loop, [])
+    for waiter in waiters:
+        if not waiter.is_full():
+            return waiter
+    waiter = _NotificationWaiter(loop)
+    waiters.append(waiter)
+    return waiter
+
+class AsyncCanBus(object):
+    # Wraps a CanBus (an existing one or one created from the keyword
+    # arguments) for the use with asyncio. Must be created within a running
+    # event loop. Frames that were read from the driver are buffered until
+    # they are returned by recv, so a cancelled recv never loses a frame.
+    def __init__(self, bus=None, **kwargs):
+        if bus is None:
+            bus = CanBus(**kwargs)
+        self.bus = bus
+        self.loop = asyncio.get_running_loop()
+        self._pending = collections.deque()
+        self._rx_event = asyncio.Event()
+        if bus.event_handle:
+            self._waiter = _get_waiter(self.loop)
+            self._waiter.add(bus.event_handle.value, self._rx_event)
+        else:
+            self._waiter = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self.recv(timeout=0.1)
+        if msg is None:
+            raise StopAsyncIteration
+        else:
+            return msg
+
+    def shutdown(self):
+        if self._waiter is not None:
+            self._waiter.remove(self.bus.event_handle.value)
+            self._waiter = None
+        self.bus.shutdown()
+
+    async def recv(self, timeout=None):
+        if not self._pending:
+            try:
+                if timeout is None:
+                    await self._wait_for_frames()
+                else:
+                    await asyncio.wait_for(self._wait_for_frames(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._pending.popleft()
+
+    async def recv_batch(self, max_events=None, timeout=None):
+        # Returns all frames that are available right now (at most max_events),
+        # waits until the first frame arrives (empty list on timeout)
+        msg = await self.recv(timeout=timeout)
+        if msg is None:
+            return []
+        msgs = [msg]
+        while self._pending and (max_events is None or len(msgs) < max_events):
+            msgs.append(self._pending.popleft())
+        return msgs
+
+    async def _wait_for_frames(self):
+        # Only reads from the driver in between awaits, so cancelling it can
+        # never drop frames that were already taken out of the driver queue
+        while True:
+            self._rx_event.clear()
+            self._read_frames()
+            if self._pending:
+                return
+            if self._waiter is not None:
+                await self._rx_event.wait()
+            else:
+                await asyncio.sleep(self.bus.poll_interval)
+
+    def _read_frames(self):
+        # Drains the driver queue without blocking, frames a synchronous
+        # dispatch (e.g. of an ISO-TP channel) kept for the bus come first
+        bus = self.bus
+        if bus.unclaimed:
+            self._pending.extend(bus._pop_unclaimed())
+        max_events = bus.rx_batch_size
+        while True:
+            if bus.is_can_fd:
+                event_count = bus._read_canfd_events(max_events)
+            else:
+                event_count = bus._read_can_events(max_events)
+            self._pending.extend(bus._decode_batch(event_count))
+            if event_count < max_events:
+                return
+
+    async def send(self, messages, timeout=None, channel=None):
+        # Transmits the messages, waits (without blocking the event loop) as
+        # long as the transmit queue is full. Returns the number of sent frames.
+        if isinstance(messages, (CanMessage, CanFrame)):
+            messages = [messages]
+        if timeout is not None:
+            end_time = self.loop.time() + timeout
+        else:
+            end_time = None
+        sent = 0
+        for mask, channel_messages in self.bus._group_by_channel(messages, channel):
+            sent += await self._send(channel_messages, mask, end_time)
+        return sent
+
+    async def _send(self, messages, mask, end_time):
+        # The events are built once, after a full transmit queue only the
+        # frames the driver didn't queue are resubmitted
+        xl_events = self.bus._build_tx_events(messages)
+        msg_count = len(messages)
+        sent = 0
+        while sent < msg_count:
+            sent += self.bus._transmit_once(xl_events, sent, msg_count, mask)
+            if sent >= msg_count:
+                break
+            if end_time is not None and self.loop.time() > end_time:
+                break
+            # Give the hardware some time to empty its transmit queue
+            await asyncio.sleep(0.001)
+        return sent
+
+async def recv_any(buses, timeout=None):
+    # Waits for the first frame on any of the given AsyncCanBus objects and
+    # returns it together with its bus, (None, None) on timeout
+    tasks = {asyncio.ensure_future(bus._wait_for_frames()): bus for bus in buses}
+    try:
+        done, _ = await asyncio.wait(
+            tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for task in tasks:
+            task.cancel()
+    # The results of all finished waits are retrieved, so an error of the
+    # driver is raised instead of getting lost
+    errors = [task.exception() for task in done]
+    for error in errors:
+        if error is not None:
+            raise error
+    for task in done:
+        bus = tasks[task]
+        return bus._pending.popleft(), bus
+    return None, None
@@ -0,0 +1,96 @@
+##############################################################################
+#                                                                            #
+# Module: benchmark                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Micro benchmarks of the canlib receive path. They work on prefilled XL     #
+# events, so no hardware (or the virtual driver) is needed.                  #
+#                                                                            #
+##############################################################################
+import timeit
+
+import xlapi
+from canlib import CanFrame, CanMessage
+
+def _xl_event(can_id, data):
+    xl_event = xlapi.XLevent()
+    xl_event.tag = xlapi.XL_EVENT_TAGS.RECEIVE_MSG
+    xl_event.timeStamp = 123456789
+    xl_event.msg.id = can_id
+    xl_event.msg.dlc = len(data)
+    xl_event.msg.data[:len(data)] = data
+    return xl_event
+
+def _xl_can_rx_event(can_id, data):
+    xl_can_rx_event = xlapi.XLcanRxEvent()
+    xl_can_rx_event.tag = xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK
+    xl_can_rx_event.timeStampSync = 123456789
+    msg = xl_can_rx_event.canRxOkMsg
+    msg.canId = can_id
+    msg.msgFlags = xlapi.XL_CAN_RXMSG_FLAG.EDL | xlapi.XL_CAN_RXMSG_FLAG.BRS
+    msg.dlc = CanMessage.can_fd_dlc.index(len(data))
+    msg.data[:len(data)] = data
+    return xl_can_rx_event
+
+def _can_message_from_xl_event(xl_event):
+    # The receive path before CanFrame
+    mid = xl_event.msg.id
+    dlc = xl_event.msg.dlc
+    flags = xl_event.msg.flags
+    return CanMessage(
+        is_can_fd=False,
+        timestamp=xl_event.timeStamp * 1e-9,
+        arbitration_id=mid & 0x1FFFFFFF,
+        is_extended_id=bool(mid & xlapi.XL_CAN_EXT_MSG_ID),
+        is_remote_frame=bool(flags & xlapi.XL_CAN_MSG_FLAG.REMOTE_FRAME),
+        is_error_frame=bool(flags & xlapi.XL_CAN_MSG_FLAG.ERROR_FRAME),
+        is_rx_frame=not bool(flags & xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED),
+        dlc=dlc,
+        data=xl_event.msg.data[:dlc],
+    )
+
+def _can_message_from_xl_can_rx_event(xl_can_rx_event):
+    # The receive path before CanFrame
+    msg = xl_can_rx_event.canRxOkMsg
+    mid = msg.canId
+    flags = msg.msgFlags
+    is_can_fd = bool(flags & xlapi.XL_CAN_RXMSG_FLAG.EDL)
+    is_remote_frame = bool(flags & xlapi.XL_CAN_RXMSG_FLAG.RTR)
+    dlc = xlapi.CANFD_GET_NUM_DATABYTES(msg.dlc, is_can_fd, is_remote_frame)
+    return CanMessage(
+        is_can_fd=is_can_fd,
+        timestamp=xl_can_rx_event.timeStampSync * 1e-9,
+        arbitration_id=mid & 0x1FFFFFFF,
+        is_extended_id=bool(mid & xlapi.XL_CAN_EXT_MSG_ID),
+        is_remote_frame=is_remote_frame,
+        is_error_frame=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.EF),
+        is_rx_frame=True,
+        bitrate_switch=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.BRS),
+        error_state_indicator=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.ESI),
+        dlc=dlc,
+        data=msg.data[:dlc],
+    )
+
+def _per_frame_us(function, arg, number):
+    return min(timeit.repeat(lambda: function(arg), number=number, repeat=5)) / number * 1e6
+
+def bench_decode(number=100000):
+    # Per frame cost of turning a received XL event into a frame object
+    xl_event = _xl_event(0x7E8, bytes(range(8)))
+    xl_can_rx_event = _xl_can_rx_event(0x7E8, bytes(range(64)))
+    results = [
+        ("CAN CanMessage", _per_frame_us(_can_message_from_xl_event, xl_event, number)),
+        ("CAN CanFrame", _per_frame_us(CanFrame.from_xl_event, xl_event, number)),
+        ("CAN FD CanMessage", _per_frame_us(
+            _can_message_from_xl_can_rx_event, xl_can_rx_event, number
+        )),
+        ("CAN FD CanFrame", _per_frame_us(
+            CanFrame.from_xl_can_rx_event, xl_can_rx_event, number
+        )),
+    ]
+    for name, us in results:
+        print("{0:<20} {1:6.2f} us/frame".format(name, us))
+    return results
+
+if __name__ == "__main__":
+    bench_decode()
@@ -0,0 +1,583 @@
+##############################################################################
+#                                                                            #
+# Module: candb                                                              #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Signal database (DBC), signal decoding and encoding. Every message is      #
+# compiled into an extraction plan (byte offset, shift, mask, sign, scaling  #
+# per signal), batches of received frames are decoded with one unaligned 64  #
+# bit load per signal into numpy columns. Message templates patch signals    #
+# straight into a persistent XL transmit event.                              #
+#                                                                            #
+##############################################################################
+import re
+import struct
+import threading
+
+import xlapi
+from canlib import CAN_FRAME_FLAG, CanMessage
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the column wise decoding (decode_columns, SignalDecoder)
+    np = None
+
+class Signal(object):
+    # start_bit as in DBC files: LSB for little endian (Intel), MSB for big
+    # endian (Motorola) signals. multiplexer_id: the multiplexer value the
+    # signal is sent with (None: always), is_multiplexer: signal selecting it
+    def __init__(
+        self,
+        name,
+        start_bit,
+        length,
+        is_little_endian=True,
+        is_signed=False,
+        factor=1,
+        offset=0,
+        minimum=None,
+        maximum=None,
+        unit="",
+        is_float=False,
+        is_multiplexer=False,
+        multiplexer_id=None,
+        choices=None,
+        receivers=None,
+    ):
+        self.name = name
+        self.start_bit = start_bit
+        self.length = length
+        self.is_little_endian = is_little_endian
+        self.is_signed = is_signed
+        self.factor = factor
+        self.offset = offset
+        self.minimum = minimum
+        self.maximum = maximum
+        self.unit = unit
+        self.is_float = is_float
+        self.is_multiplexer = is_multiplexer
+        self.multiplexer_id = multiplexer_id
+        self.choices = choices or {}
+        self.receivers = receivers or []
+        self.compile()
+
+    def __repr__(self):
+        return "Signal({0!r}, {1}|{2}@{3}{4})".format(
+            self.name, self.start_bit, self.length,
+            1 if self.is_little_endian else 0, "-" if self.is_signed else "+",
+        )
+
+    def compile(self):
+        # Extraction plan: the signal is read with one 64 bit load at
+        # byte_offset (little endian for Intel, big endian for Motorola)
+        if not 0 < self.length <= 64:
+            raise ValueError("Invalid signal length: {0}".format(self.length))
+        if self.is_float and self.length not in (32, 64):
+            raise ValueError("Float signals must be 32 or 64 bits long.")
+        self.byte_offset = self.start_bit // 8
+        if self.is_little_endian:
+            self.shift = self.start_bit % 8
+        else:
+            # MSB at bit 56 + start_bit % 8 of the big endian word
+            self.shift = 57 + self.start_bit % 8 - self.length
+        if self.shift < 0 or self.shift + self.length > 64:
+            raise ValueError("Signal {0} spans more than 8 bytes.".format(self.name))
+        self.mask = (1 << self.length) - 1
+        # Bytes written by write_raw and the shift within them
+        if self.is_little_endian:
+            self.byte_count = (self.shift + self.length + 7) // 8
+            self.byte_shift = self.shift
+            self.byteorder = "little"
+        else:
+            self.byte_count = 8 - self.shift // 8
+            self.byte_shift = self.shift % 8
+            self.byteorder = "big"
+        self.end_byte = self.byte_offset + self.byte_count
+        self.is_integer = (
+            not self.is_float and float(self.factor).is_integer()
+            and float(self.offset).is_integer()
+        )
+
+    def decode_raw(self, data):
+        # Raw value of one frame (data: bytes like, zero padded if too short)
+        word = bytes(data[self.byte_offset:self.byte_offset + 8]).ljust(8, b"\0")
+        if self.is_little_endian:
+            raw = (int.from_bytes(word, "little") >> self.shift) & self.mask
+        else:
+            raw = (int.from_bytes(word, "big") >> self.shift) & self.mask
+        if self.is_float:
+            size = self.length // 8
+            return struct.unpack("<f" if size == 4 else "<d", raw.to_bytes(size, "little"))[0]
+        if self.is_signed and raw >> (self.length - 1):
+            raw -= 1 << self.length
+        return raw
+
+    def decode(self, data):
+        raw = self.decode_raw(data)
+        if self.is_integer:
+            return raw * int(self.factor) + int(self.offset)
+        return raw * self.factor + self.offset
+
+    def encode_raw(self, value):
+        # Raw value (already masked to the signal length) of a physical value
+        if self.is_float:
+            value = (value - self.offset) / self.factor
+            raw = int.from_bytes(struct.pack("<f" if self.length == 32 else "<d", value), "little")
+        elif self.is_integer and self.factor == 1 and self.offset == 0:
+            raw = int(value)
+        else:
+            raw = int(round((value - self.offset) / self.factor))
+        return raw & self.mask
+
+    def write_raw(self, data, raw):
+        # Patches the raw value into data (a writable buffer, e.g. memoryview)
+        start, end, shift = self.byte_offset, self.end_byte, self.byte_shift
+        word = int.from_bytes(data[start:end], self.byteorder)
+        word = (word & ~(self.mask << shift)) | (raw << shift)
+        data[start:end] = word.to_bytes(self.byte_count, self.byteorder)
+
+    def decode_column(self, words_le, words_be):
+        # Column of physical values from the 64 bit words loaded at the byte
+        # offset of the signal (see Message.decode_columns)
+        words = words_le if self.is_little_endian else words_be
+        raw = (words >> np.uint64(self.shift)) & np.uint64(self.mask)
+        if self.is_float:
+            if self.length == 32:
+                return raw.astype(np.uint32).view(np.float32) * self.factor + self.offset
+            return raw.view(np.float64) * self.factor + self.offset
+        if self.is_signed:
+            raw = raw.astype(np.int64)
+            if self.length < 64:
+                raw -= (raw >> (self.length - 1)) << self.length
+        if self.is_integer:
+            if self.factor == 1 and self.offset == 0:
+                return raw
+            return raw.astype(np.int64) * int(self.factor) + int(self.offset)
+        return raw * self.factor + self.offset
+
+class Message(object):
+    # frame_id without XL_CAN_EXT_MSG_ID, length in bytes
+    def __init__(self, frame_id, name, length, signals=None, is_extended_id=False, senders=None):
+        self.frame_id = frame_id
+        self.name = name
+        self.length = length
+        self.signals = signals or []
+        self.is_extended_id = is_extended_id
+        self.senders = senders or []
+
+    def __repr__(self):
+        return "Message(0x{0:X}, {1!r}, {2}, {3} signals)".format(
+            self.frame_id, self.name, self.length, len(self.signals)
+        )
+
+    @property
+    def can_id(self):
+        # The ID with XL_CAN_EXT_MSG_ID set for ext. IDs (see CanBus)
+        if self.is_extended_id:
+            return self.frame_id | xlapi.XL_CAN_EXT_MSG_ID
+        return self.frame_id
+
+    def get_signal(self, name):
+        for signal in self.signals:
+            if signal.name == name:
+                return signal
+        raise KeyError(name)
+
+    def _multiplexer(self):
+        for signal in self.signals:
+            if signal.is_multiplexer:
+                return signal
+        return None
+
+    def decode(self, data):
+        # {signal name: physical value} of one frame, multiplexed signals
+        # that aren't sent with the current multiplexer value are left out
+        multiplexer = self._multiplexer()
+        mux = multiplexer.decode_raw(data) if multiplexer is not None else None
+        return {
+            signal.name: signal.decode(data) for signal in self.signals
+            if signal.multiplexer_id is None or signal.multiplexer_id == mux
+        }
+
+    def decode_columns(self, data):
+        # {signal name: numpy column} of many frames, data is a 2D uint8 array
+        # (one row per frame). Multiplexed signals are NaN in the rows with a
+        # different multiplexer value.
+        if np is None:
+            raise RuntimeError("Package numpy not installed.")
+        data = np.asarray(data, dtype=np.uint8)
+        count, width = data.shape
+        # Zero padded copy, so every signal can be read with a 64 bit load
+        padded = np.zeros((count, max(width, self.length) + 8), dtype=np.uint8)
+        padded[:, :width] = data
+        words = {}
+        columns = {}
+        multiplexer = self._multiplexer()
+        mux = None
+        for signal in sorted(self.signals, key=lambda signal: not signal.is_multiplexer):
+            offset = signal.byte_offset
+            if offset not in words:
+                words[offset] = (
+                    np.ndarray((count,), "<u8", padded, offset, (padded.strides[0],)),
+                    np.ndarray((count,), ">u8", padded, offset, (padded.strides[0],)),
+                )
+            column = signal.decode_column(*words[offset])
+            if signal is multiplexer:
+                mux = column
+            elif signal.multiplexer_id is not None and mux is not None:
+                column = np.where(mux == signal.multiplexer_id, column, np.nan)
+            columns[signal.name] = column
+        return columns
+
+class SignalDatabase(object):
+    def __init__(self, messages=None):
+        self.messages = []
+        self._by_id = {}
+        self._by_name = {}
+        for message in messages or []:
+            self.add_message(message)
+
+    def add_message(self, message):
+        self.messages.append(message)
+        self._by_id[message.can_id] = message
+        self._by_name[message.name] = message
+
+    def get_message(self, key):
+        # By name or by ID (with XL_CAN_EXT_MSG_ID for ext. IDs)
+        if isinstance(key, str):
+            return self._by_name[key]
+        return self._by_id[key]
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self):
+        return len(self.messages)
+
+    def decode(self, can_id, data):
+        return self._by_id[can_id].decode(data)
+
+    def decode_block(self, block, messages=None):
+        # Decodes a block of recv_block (CAN_FRAME_DTYPE) message by message,
+        # returns {message name: columns} incl. a timestamp and channel column.
+        # Only the given messages (names, IDs or Message objects) are decoded.
+        flag = CAN_FRAME_FLAG
+        if messages is None:
+            messages = self.messages
+        else:
+            messages = [
+                message if isinstance(message, Message) else self.get_message(message)
+                for message in messages
+            ]
+        is_extended_id = (block["flags"] & flag.EXTENDED_ID) != 0
+        valid = (block["flags"] & (flag.REMOTE_FRAME | flag.ERROR_FRAME)) == 0
+        results = {}
+        for message in messages:
+            rows = valid & (block["arbitration_id"] == message.frame_id)
+            rows &= is_extended_id if message.is_extended_id else ~is_extended_id
+            if not rows.any():
+                continue
+            frames = block[rows]
+            columns = message.decode_columns(frames["data"][:, :max(message.length, 1)])
+            columns["timestamp"] = frames["timestamp"]
+            columns["channel"] = frames["channel"]
+            results[message.name] = columns
+        return results
+
+# DBC file format (the parts needed for decoding)
+_DBC_MESSAGE = re.compile(r"^BO_\s+(\d+)\s+(\w+)\s*:\s*(\d+)\s+(\w+)")
+_DBC_SIGNAL = re.compile(
+    r"^SG_\s+(\w+)\s*(M|m\d+)?\s*:\s*(\d+)\|(\d+)@([01])([+-])\s*"
+    r"\(([^,]+),([^)]+)\)\s*\[([^|]*)\|([^\]]*)\]\s*\"([^\"]*)\"\s*(.*)$"
+)
+_DBC_CHOICES = re.compile(r"^VAL_\s+(\d+)\s+(\w+)\s+(.*);")
+_DBC_CHOICE = re.compile(r"(-?\d+)\s+\"([^\"]*)\"")
+_DBC_VALUE_TYPE = re.compile(r"^SIG_VALTYPE_\s+(\d+)\s+(\w+)\s*:?\s*(\d)\s*;")
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() and "." not in text and "e" not in text.lower() else value
+
+def parse_dbc(text):
+    # Messages, signals (incl. simple multiplexing), value tables and float
+    # signals of a DBC file. Everything else is skipped.
+    database = SignalDatabase()
+    message = None
+    messages = {}
+    for line in text.splitlines():
+        line = line.strip()
+        match = _DBC_MESSAGE.match(line)
+        if match:
+            dbc_id = int(match.group(1))
+            message = Message(
+                dbc_id & 0x1FFFFFFF,
+                match.group(2),
+                int(match.group(3)),
+                is_extended_id=bool(dbc_id & 0x80000000),
+                senders=[match.group(4)],
+            )
+            messages[dbc_id] = message
+            database.add_message(message)
+            continue
+        match = _DBC_SIGNAL.match(line)
+        if match and message is not None:
+            name, mux = match.group(1), match.group(2)
+            message.signals.append(Signal(
+                name,
+                int(match.group(3)),
+                int(match.group(4)),
+                is_little_endian=match.group(5) == "1",
+                is_signed=match.group(6) == "-",
+                factor=_number(match.group(7)),
+                offset=_number(match.group(8)),
+                minimum=_number(match.group(9)) if match.group(9).strip() else None,
+                maximum=_number(match.group(10)) if match.group(10).strip() else None,
+                unit=match.group(11),
+                is_multiplexer=mux == "M",
+                multiplexer_id=int(mux[1:]) if mux and mux != "M" else None,
+                receivers=[receiver for receiver in re.split(r"[\s,]+", match.group(12)) if receiver],
+            ))
+            continue
+        if not line.startswith("SG_"):
+            message = None
+        match = _DBC_CHOICES.match(line)
+        if match and int(match.group(1)) in messages:
+            try:
+                signal = messages[int(match.group(1))].get_signal(match.group(2))
+            except KeyError:
+                continue
+            signal.choices = {
+                int(value): label for value, label in _DBC_CHOICE.findall(match.group(3))
+            }
+            continue
+        match = _DBC_VALUE_TYPE.match(line)
+        if match and int(match.group(1)) in messages and match.group(3) in "12":
+            try:
+                signal = messages[int(match.group(1))].get_signal(match.group(2))
+            except KeyError:
+                continue
+            signal.is_float = True
+            signal.compile()
+    return database
+
+def load_dbc(filename, encoding="cp1252"):
+    with open(filename, "r", encoding=encoding) as file:
+        return parse_dbc(file.read())
+
+class SignalDecoder(object):
+    # Decodes the signals of subscribed messages straight from the receive
+    # path of a bus: the frames are read as a block (CanBus.recv_block) and
+    # only the subscribed messages are decoded, column wise per message.
+    def __init__(self, database, bus):
+        if np is None:
+            raise RuntimeError("Package numpy not installed.")
+        self.database = database
+        self.bus = bus
+        self.subscriptions = {}
+
+    def subscribe(self, message, callback=None):
+        # message: name, ID or Message. callback(message name, columns) is
+        # called by decode for every batch with frames of the message.
+        if not isinstance(message, Message):
+            message = self.database.get_message(message)
+        self.subscriptions.setdefault(message.name, (message, []))
+        if callback is not None:
+            self.subscriptions[message.name][1].append(callback)
+        return message
+
+    def unsubscribe(self, message):
+        if isinstance(message, Message):
+            message = message.name
+        elif not isinstance(message, str):
+            message = self.database.get_message(message).name
+        self.subscriptions.pop(message, None)
+
+    def decode(self, max_events=None, timeout=None):
+        # Reads one block of frames and returns {message name: columns} of the
+        # subscribed messages in it (empty dict on timeout)
+        block = self.bus.recv_block(max_events, timeout)
+        if not len(block) or not self.subscriptions:
+            return {}
+        results = self.database.decode_block(
+            block, [message for message, callbacks in self.subscriptions.values()]
+        )
+        for name, columns in results.items():
+            for callback in self.subscriptions[name][1]:
+                callback(name, columns)
+        return results
+
+class Crc8(object):
+    # Table driven CRC-8 (MSB first)
+    def __init__(self, poly, init=0xFF, xor_out=0xFF):
+        self.poly = poly
+        self.init = init
+        self.xor_out = xor_out
+        self.table = []
+        for byte in range(256):
+            crc = byte
+            for i in range(8):
+                crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+            self.table.append(crc)
+
+    def update(self, crc, data):
+        # Raw CRC register after data (no init/final XOR), for partial CRCs
+        table = self.table
+        for byte in data:
+            crc = table[crc ^ byte]
+        return crc
+
+    def __call__(self, data, init=None, xor_out=None):
+        crc = self.update(self.init if init is None else init, data)
+        return crc ^ (self.xor_out if xor_out is None else xor_out)
+
+CRC8_SAE_J1850 = Crc8(0x1D)
+CRC8_H2F = Crc8(0x2F)
+
+class E2EProfile1(object):
+    # AUTOSAR E2E profile 1 (data ID mode both): the counter counts 0-14, the
+    # CRC is a CRC-8 SAE J1850 over data ID low byte, data ID high byte and
+    # all payload bytes but the CRC byte. Chaining the AUTOSAR Crc calls comes
+    # down to a start value of 0x00 and no final XOR.
+    max_counter = 14
+
+    def __init__(self, data_id, crc_signal="CRC", counter_signal="Counter"):
+        self.data_id = data_id
+        self.crc_signal = crc_signal
+        self.counter_signal = counter_signal
+        # The data ID part of the CRC never changes
+        self._crc_start = CRC8_SAE_J1850.update(0x00, (data_id & 0xFF, data_id >> 8 & 0xFF))
+
+    def compute_crc(self, data, crc_byte, counter):
+        crc = CRC8_SAE_J1850.update(self._crc_start, data[:crc_byte])
+        return CRC8_SAE_J1850.update(crc, data[crc_byte+1:])
+
+    def protect(self, data, crc_signal, counter_signal):
+        counter = (counter_signal.decode_raw(data) + 1) % (self.max_counter + 1)
+        counter_signal.write_raw(data, counter)
+        crc_signal.write_raw(data, self.compute_crc(data, crc_signal.byte_offset, counter))
+
+class E2EProfile2(E2EProfile1):
+    # AUTOSAR E2E profile 2: the counter counts 0-15, the CRC is a CRC-8H2F
+    # over all payload bytes but the CRC byte, followed by the data ID of the
+    # counter value (data_id_list: 16 data IDs)
+    max_counter = 15
+
+    def __init__(self, data_id_list, crc_signal="CRC", counter_signal="Counter"):
+        if len(data_id_list) != 16:
+            raise ValueError("Profile 2 needs a data ID per counter value (16).")
+        self.data_id_list = list(data_id_list)
+        self.crc_signal = crc_signal
+        self.counter_signal = counter_signal
+
+    def compute_crc(self, data, crc_byte, counter):
+        crc = CRC8_H2F.update(CRC8_H2F.init, data[:crc_byte])
+        crc = CRC8_H2F.update(crc, data[crc_byte+1:])
+        return CRC8_H2F.update(crc, (self.data_id_list[counter],)) ^ CRC8_H2F.xor_out
+
+class MessageTemplate(object):
+    # A message of the database compiled into a persistent XL transmit event
+    # for a bus. set() patches the signals straight into the event data, so
+    # sending costs a few integer operations instead of building a
+    # CanMessage. A rolling counter signal and E2E protection (E2EProfile1/2)
+    # are updated before every send. Can be sent with send() or cyclic with
+    # bus.send_periodic(template, period).
+    def __init__(
+        self,
+        message,
+        bus,
+        values=None,
+        is_can_fd=None,
+        bitrate_switch=True,
+        counter=None,
+        e2e=None,
+        channel=None,
+    ):
+        if is_can_fd is None:
+            is_can_fd = message.length > 8
+        if is_can_fd and not bus.is_can_fd:
+            raise ValueError("CAN FD frames need a CAN FD bus.")
+        if message.length not in CanMessage.can_fd_dlc or not is_can_fd and message.length > 8:
+            raise ValueError("Invalid message length: {0}".format(message.length))
+        for signal in message.signals:
+            if signal.end_byte > message.length and signal.byte_offset < message.length:
+                raise ValueError("Signal {0} exceeds the message.".format(signal.name))
+        self.message = message
+        self.bus = bus
+        self.is_can_fd = is_can_fd
+        self.channel = channel
+        self.signals = {signal.name: signal for signal in message.signals}
+        # Shared with the CyclicScheduler when the template is sent cyclic
+        self.lock = threading.Lock()
+        self.sent_count = 0
+        if bus.is_can_fd:
+            self.xl_events = (xlapi.XLcanTxEvent * 1)()
+            self.xl_event = self.xl_events[0]
+            self.xl_event.tag = xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_MSG
+            self.xl_event.transId = 0xFFFF
+            msg = self.xl_event.canMsg
+            msg.canId = message.can_id
+            if is_can_fd:
+                msg.msgFlags = xlapi.XL_CAN_TXMSG_FLAG.EDL
+                if bitrate_switch:
+                    msg.msgFlags |= xlapi.XL_CAN_TXMSG_FLAG.BRS
+        else:
+            self.xl_events = (xlapi.XLevent * 1)()
+            self.xl_event = self.xl_events[0]
+            self.xl_event.tag = xlapi.XL_EVENT_TYPE.TRANSMIT_MSG
+            msg = self.xl_event.msg
+            msg.id = message.can_id
+        msg.dlc = CanMessage.can_fd_dlc.index(message.length)
+        self.data = memoryview(msg.data).cast("B")[:message.length]
+        if e2e is not None and counter == e2e.counter_signal:
+            raise ValueError("The E2E profile already updates the counter {0}.".format(counter))
+        self.counter = self.signals[counter] if counter is not None else None
+        self.e2e = e2e
+        if e2e is not None:
+            self._e2e_signals = (self.signals[e2e.crc_signal], self.signals[e2e.counter_signal])
+        if values:
+            self.set(**values)
+
+    def __getitem__(self, name):
+        return self.signals[name].decode(self.data)
+
+    def __setitem__(self, name, value):
+        self.set(**{name: value})
+
+    def set(self, **values):
+        # Patches physical signal values into the payload
+        with self.lock:
+            data, signals = self.data, self.signals
+            for name, value in values.items():
+                signal = signals[name]
+                signal.write_raw(data, signal.encode_raw(value))
+
+    def set_raw(self, **values):
+        with self.lock:
+            data, signals = self.data, self.signals
+            for name, value in values.items():
+                signal = signals[name]
+                signal.write_raw(data, value & signal.mask)
+
+    def prepare_send(self):
+        # Advances the counter and recomputes the E2E CRC, called right before
+        # every transmission (the caller holds the lock)
+        data = self.data
+        if self.counter is not None:
+            counter = self.counter
+            counter.write_raw(data, (counter.decode_raw(data) + 1) & counter.mask)
+        if self.e2e is not None:
+            self.e2e.protect(data, *self._e2e_signals)
+        self.sent_count += 1
+
+    def build_xl_class(self, build_fd=False):
+        # The persistent event itself (not a copy), see CyclicSendTask
+        if build_fd != self.bus.is_can_fd:
+            raise ValueError("The template was built for another bus type.")
+        return self.xl_event
+
+    def send(self, timeout=None):
+        mask = self.bus.get_channel_mask(self.channel)
+        with self.lock:
+            self.prepare_send()
+            return self.bus._transmit_events(self.xl_events, 1, timeout, mask)
@@ -0,0 +1,376 @@
+##############################################################################
+#                                                                            #
+# Module: canisotp                                                           #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# ISO-TP (ISO 15765-2) transport layer on top of CanBus, normal addressing.  #
+# All consecutive frames of a message are built into one XL event array      #
+# before the first frame is sent. Blocks are sent with one transmit call     #
+# when STmin is 0, otherwise paced against perf_counter.                     #
+#                                                                            #
+##############################################################################
+import collections
+import ctypes
+import threading
+import time
+
+import xlapi
+from canlib import CanMessage
+
+# Protocol control information (upper nibble of the first byte)
+N_PCI_SF = 0x0
+N_PCI_FF = 0x1
+N_PCI_CF = 0x2
+N_PCI_FC = 0x3
+
+# Flow status of a flow control frame
+FS_CTS = 0x0
+FS_WAIT = 0x1
+FS_OVFLW = 0x2
+
+# Largest message length of a first frame without the 32 bit escape
+MAX_FF_DL = 0xFFF
+
+_CAN_FD_DLC_BYTES = tuple(CanMessage.can_fd_dlc)
+
+class IsoTpError(Exception):
+    pass
+
+def encode_st_min(st_min):
+    # STmin in seconds to its byte value (0-127 ms, 100-900 us)
+    if st_min <= 0:
+        return 0
+    if st_min < 0.001:
+        return 0xF0 + min(9, max(1, int(round(st_min * 1e4))))
+    return min(0x7F, int(round(st_min * 1e3)))
+
+def decode_st_min(value):
+    if value <= 0x7F:
+        return value * 1e-3
+    if 0xF1 <= value <= 0xF9:
+        return (value - 0xF0) * 1e-4
+    # Reserved values are handled like the maximum
+    return 0x7F * 1e-3
+
+class IsoTpChannel(object):
+    # One ISO-TP connection (tx_id -> rx_id, XL_CAN_EXT_MSG_ID set for ext.
+    # ids) on a bus. The bus filters must let rx_id pass (the default filters
+    # cover the ISO 15765-4 diagnostic IDs). The channel subscribes rx_id and
+    # reads through CanBus.dispatch, so frames for other subscriptions are
+    # dispatched on the way and frames without a subscriber are kept for
+    # CanBus.recv/recv_batch (the newest unclaimed_size frames of the bus).
+    # If the frames are read elsewhere (e.g. by a CanBusReader) they must be
+    # passed to feed().
+    #   block_size/st_min: sent in our flow control frames (st_min in s)
+    #   is_can_fd: send CAN FD frames of up to tx_dl bytes (default: bus)
+    #   padding: fill byte for short frames (None: no padding for CAN)
+    #   timeout: N_Bs/N_Cr, the time to wait for a flow control/next frame
+    def __init__(
+        self,
+        bus,
+        tx_id,
+        rx_id,
+        block_size=0,
+        st_min=0.0,
+        is_can_fd=None,
+        tx_dl=None,
+        bitrate_switch=True,
+        padding=0xCC,
+        timeout=1.0,
+        max_wait_frames=10,
+        max_length=2**20,
+        channel=None,
+    ):
+        if is_can_fd is None:
+            is_can_fd = bus.is_can_fd
+        if is_can_fd and not bus.is_can_fd:
+            raise ValueError("CAN FD frames need a CAN FD bus.")
+        if tx_dl is None:
+            tx_dl = 64 if is_can_fd else 8
+        if tx_dl not in (_CAN_FD_DLC_BYTES[8:] if is_can_fd else (8,)):
+            raise ValueError("Invalid TX_DL: {0}".format(tx_dl))
+        self.bus = bus
+        self.tx_id = tx_id
+        self.rx_id = rx_id
+        self.block_size = block_size
+        self.st_min = st_min
+        self.is_can_fd = is_can_fd
+        self.tx_dl = tx_dl
+        self.bitrate_switch = bitrate_switch
+        self.padding = padding
+        self.timeout = timeout
+        self.max_wait_frames = max_wait_frames
+        self.max_length = max_length
+        self.mask = bus.get_channel_mask(channel)
+        self.error = None
+        self._messages = collections.deque()
+        self._frame_event = threading.Event()
+        self._flow_control = None
+        # Reassembly state of the message that is received
+        self._rx_buffer = None
+        self._rx_length = 0
+        self._rx_sequence = 0
+        self._rx_block_count = 0
+        self._rx_time = 0.0
+        self._fc_events = {}
+        bus.subscribe(self.feed, can_id=rx_id)
+
+    def close(self):
+        self.bus.unsubscribe(self.feed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ### Frames ###
+
+    def _frame_length(self, length):
+        # Length of a frame with length payload bytes incl. padding
+        if self.is_can_fd:
+            if self.padding is not None:
+                length = max(8, length)
+            for frame_length in _CAN_FD_DLC_BYTES:
+                if frame_length >= length:
+                    return frame_length
+        if self.padding is not None:
+            return 8
+        return length
+
+    def _build_events(self, payloads):
+        # XL transmit events for the payloads (bytes like objects)
+        bus = self.bus
+        can_id = self.tx_id
+        if bus.is_can_fd:
+            xl_events = (xlapi.XLcanTxEvent * len(payloads))()
+            tag = xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_MSG
+            if self.is_can_fd:
+                flags = xlapi.XL_CAN_TXMSG_FLAG.EDL
+                if self.bitrate_switch:
+                    flags |= xlapi.XL_CAN_TXMSG_FLAG.BRS
+            else:
+                flags = 0
+        else:
+            xl_events = (xlapi.XLevent * len(payloads))()
+            tag = xlapi.XL_EVENT_TYPE.TRANSMIT_MSG
+        padding = self.padding if self.padding is not None else 0xCC
+        for xl_event, payload in zip(xl_events, payloads):
+            length = len(payload)
+            frame_length = self._frame_length(length)
+            xl_event.tag = tag
+            if bus.is_can_fd:
+                xl_event.transId = 0xFFFF
+                msg = xl_event.canMsg
+                msg.canId = can_id
+                msg.msgFlags = flags
+            else:
+                msg = xl_event.msg
+                msg.id = can_id
+            msg.dlc = _CAN_FD_DLC_BYTES.index(frame_length)
+            ctypes.memmove(msg.data, bytes(payload), length)
+            if frame_length > length:
+                ctypes.memset(ctypes.addressof(msg.data) + length, padding, frame_length - length)
+        return xl_events
+
+    def _transmit(self, xl_events, first=0, count=None, timeout=None):
+        if count is None:
+            count = len(xl_events) - first
+        xl_class = type(xl_events)._type_
+        frames = (xl_class * count).from_buffer(xl_events, first * ctypes.sizeof(xl_class))
+        sent = self.bus._transmit_events(
+            frames, count, self.timeout if timeout is None else timeout, self.mask
+        )
+        if sent < count:
+            raise IsoTpError("Timeout while sending (N_As).")
+
+    def _send_flow_control(self, flow_status):
+        # The flow control frames are built once per flow status
+        xl_events = self._fc_events.get(flow_status)
+        if xl_events is None:
+            xl_events = self._fc_events[flow_status] = self._build_events([bytes([
+                (N_PCI_FC << 4) | flow_status, self.block_size, encode_st_min(self.st_min)
+            ])])
+        self._transmit(xl_events)
+
+    def segment(self, data):
+        # The payloads of the frames of a message: [single frame] or
+        # [first frame, consecutive frames...]
+        data = memoryview(bytes(data))
+        length = len(data)
+        sf_max = self.tx_dl - 2 if self.tx_dl > 8 else 7
+        if length <= 7:
+            return [bytes([(N_PCI_SF << 4) | length]) + data]
+        if length <= sf_max:
+            return [bytes([N_PCI_SF << 4, length]) + data]
+        if length <= MAX_FF_DL:
+            header = bytes([(N_PCI_FF << 4) | (length >> 8), length & 0xFF])
+        else:
+            header = bytes([N_PCI_FF << 4, 0]) + length.to_bytes(4, "big")
+        first = self.tx_dl - len(header)
+        payloads = [header + data[:first]]
+        cf_size = self.tx_dl - 1
+        sequence = 1
+        for offset in range(first, length, cf_size):
+            payloads.append(bytes([(N_PCI_CF << 4) | sequence]) + data[offset:offset + cf_size])
+            sequence = (sequence + 1) & 0xF
+        return payloads
+
+    ### Sending ###
+
+    def send(self, data):
+        # Sends a message, blocks until the last frame was handed to the driver
+        if len(data) > 0xFFFFFFFF:
+            raise ValueError("Message too long: {0}".format(len(data)))
+        xl_events = self._build_events(self.segment(data))
+        if len(xl_events) == 1:
+            self._transmit(xl_events)
+            return
+        self._flow_control = None
+        self._transmit(xl_events, 0, 1)
+        next_frame, frame_count = 1, len(xl_events)
+        while next_frame < frame_count:
+            block_size, st_min = self._wait_for_flow_control()
+            count = frame_count - next_frame
+            if block_size:
+                count = min(count, block_size)
+            if st_min == 0:
+                # The whole block in one transmit call
+                self._transmit(xl_events, next_frame, count)
+            else:
+                self._send_paced(xl_events, next_frame, count, st_min)
+            next_frame += count
+
+    def _send_paced(self, xl_events, first, count, st_min):
+        # One frame every st_min (sleep, then spin for the last bit)
+        next_time = time.perf_counter()
+        for i in range(first, first + count):
+            time_left = next_time - time.perf_counter()
+            if time_left > 0.002:
+                time.sleep(time_left - 0.001)
+            while time.perf_counter() < next_time:
+                pass
+            self._transmit(xl_events, i, 1)
+            next_time = time.perf_counter() + st_min
+
+    def _wait_for_flow_control(self):
+        end_time = time.perf_counter() + self.timeout
+        wait_frames = 0
+        while True:
+            flow_control = self._flow_control
+            if flow_control is None:
+                time_left = end_time - time.perf_counter()
+                if time_left <= 0:
+                    raise IsoTpError("Timeout while waiting for flow control (N_Bs).")
+                self._poll(time_left)
+                continue
+            self._flow_control = None
+            flow_status, block_size, st_min = flow_control
+            if flow_status == FS_CTS:
+                return block_size, decode_st_min(st_min)
+            elif flow_status == FS_WAIT:
+                wait_frames += 1
+                if wait_frames > self.max_wait_frames:
+                    raise IsoTpError("Too many flow control wait frames.")
+                end_time = time.perf_counter() + self.timeout
+            elif flow_status == FS_OVFLW:
+                raise IsoTpError("Receiver buffer overflow.")
+            else:
+                raise IsoTpError("Invalid flow status: {0}".format(flow_status))
+
+    ### Receiving ###
+
+    def _poll(self, timeout):
+        if self.bus.reader is None:
+            self.bus.dispatch(timeout=timeout, keep_unclaimed=True)
+        else:
+            self._frame_event.wait(timeout)
+            self._frame_event.clear()
+
+    def recv(self, timeout=None):
+        # Returns the next received message (bytes), None on timeout
+        if timeout is not None:
+            end_time = time.perf_counter() + timeout
+        else:
+            end_time = None
+        while True:
+            if self.error is not None:
+                error, self.error = self.error, None
+                raise error
+            if self._messages:
+                return self._messages.popleft()
+            now = time.perf_counter()
+            if self._rx_buffer is not None and now - self._rx_time > self.timeout:
+                self._rx_buffer = None
+                raise IsoTpError("Timeout while waiting for a consecutive frame (N_Cr).")
+            if end_time is not None and now > end_time:
+                return None
+            time_left = self.timeout if end_time is None else end_time - now
+            self._poll(min(time_left, self.timeout))
+
+    def request(self, data, timeout=None):
+        # Sends a request and returns the response (e.g. UDS)
+        self.send(data)
+        return self.recv(timeout if timeout is not None else self.timeout)
+
+    def feed(self, msg):
+        # Processes a frame received with rx_id
+        if not msg.is_rx_frame or not msg.data:
+            return
+        try:
+            self._process(msg.data)
+        except IsoTpError as error:
+            self._rx_buffer = None
+            self.error = error
+        self._frame_event.set()
+
+    def _process(self, data):
+        n_pci = data[0] >> 4
+        if n_pci == N_PCI_FC:
+            if len(data) < 3:
+                raise IsoTpError("Flow control frame too short.")
+            self._flow_control = (data[0] & 0xF, data[1], data[2])
+        elif n_pci == N_PCI_SF:
+            length = data[0] & 0xF
+            offset = 1
+            if length == 0 and len(data) > 8:
+                length, offset = data[1], 2
+            if not length or length > len(data) - offset:
+                raise IsoTpError("Invalid single frame length.")
+            if self._rx_buffer is not None:
+                # A new message aborts the one in progress
+                self._rx_buffer = None
+            self._messages.append(bytes(data[offset:offset + length]))
+        elif n_pci == N_PCI_FF:
+            length = ((data[0] & 0xF) << 8) | data[1]
+            offset = 2
+            if length == 0:
+                length, offset = int.from_bytes(bytes(data[2:6]), "big"), 6
+            if length > self.max_length:
+                self._send_flow_control(FS_OVFLW)
+                raise IsoTpError("Message too long: {0}".format(length))
+            self._rx_buffer = bytearray(data[offset:])
+            self._rx_length = length
+            self._rx_sequence = 1
+            self._rx_block_count = 0
+            self._rx_time = time.perf_counter()
+            self._send_flow_control(FS_CTS)
+        elif n_pci == N_PCI_CF:
+            if self._rx_buffer is None:
+                # Not meant for us (or after an error), ignored
+                return
+            if data[0] & 0xF != self._rx_sequence:
+                raise IsoTpError("Wrong sequence number: {0} (expected {1})".format(
+                    data[0] & 0xF, self._rx_sequence
+                ))
+            self._rx_sequence = (self._rx_sequence + 1) & 0xF
+            self._rx_buffer += data[1:]
+            self._rx_time = time.perf_counter()
+            if len(self._rx_buffer) >= self._rx_length:
+                self._messages.append(bytes(self._rx_buffer[:self._rx_length]))
+                self._rx_buffer = None
+            elif self.block_size:
+                self._rx_block_count += 1
+                if self._rx_block_count >= self.block_size:
+                    self._rx_block_count = 0
+                    self._send_flow_control(FS_CTS)
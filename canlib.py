@@ -8,9 +8,16 @@
 # (https://github.com/hardbyte/python-can).                                  #
 #                                                                            #
 ##############################################################################
+import abc
+import bisect
+import collections
 import ctypes
+import enum
+import functools
 import os
+import queue
 import sys
+import threading
 import time
 
 try:
@@ -28,9 +35,380 @@ except Exception as error:
     print("Could not import Vector XL Driver Library API: {0}".format(error))
     sys.exit(-1)
 
+if xlapi.XL_BACKEND == "virtual":
+    # Notification handles of the virtual driver are no WIN32 events
+    from xlvirtual import WaitForSingleObject, WaitForMultipleObjects, INFINITE
+
+from canstats import Histogram
+from xlconfig import channel_registry, driver_session
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the columnar frame blocks (CanBus.recv_block)
+    np = None
+
 DEBUG = False
 
+class CAN_FRAME_FLAG(enum.IntFlag):
+    EXTENDED_ID = 1
+    REMOTE_FRAME = 2
+    ERROR_FRAME = 4
+    RX_FRAME = 8
+    CAN_FD = 16
+    BITRATE_SWITCH = 32
+    ERROR_STATE_INDICATOR = 64
+
+def _xl_dtype(xl_class, fields):
+    # Builds a numpy dtype that views selected (nested) fields of a ctypes
+    # structure in place, so XL event buffers can be read with np.frombuffer
+    names, formats, offsets = [], [], []
+    for name, path in fields:
+        cls, offset = xl_class, 0
+        for attr in path.split("."):
+            offset += getattr(cls, attr).offset
+            cls = dict(cls._fields_)[attr]
+        names.append(name)
+        formats.append(np.dtype(cls))
+        offsets.append(offset)
+    return np.dtype({
+        "names": names,
+        "formats": formats,
+        "offsets": offsets,
+        "itemsize": ctypes.sizeof(xl_class),
+    })
+
+if np:
+    # One record per received frame, returned by CanBus.recv_block
+    CAN_FRAME_DTYPE = np.dtype([
+        ("timestamp", np.float64),
+        ("channel", np.uint8),
+        ("arbitration_id", np.uint32),
+        ("flags", np.uint32),
+        ("dlc", np.uint8),
+        ("data", np.uint8, (xlapi.XL_CAN_MAX_DATA_LEN,)),
+    ])
+    _XL_EVENT_DTYPE = _xl_dtype(xlapi.XLevent, [
+        ("tag", "tag"),
+        ("channel", "chanIndex"),
+        ("timestamp", "timeStamp"),
+        ("id", "tagData.msg.id"),
+        ("flags", "tagData.msg.flags"),
+        ("dlc", "tagData.msg.dlc"),
+        ("data", "tagData.msg.data"),
+    ])
+    _XL_TX_EVENT_DTYPE = _xl_dtype(xlapi.XLevent, [
+        ("tag", "tag"),
+        ("transId", "transId"),
+        ("id", "tagData.msg.id"),
+        ("flags", "tagData.msg.flags"),
+        ("dlc", "tagData.msg.dlc"),
+        ("data", "tagData.msg.data"),
+    ])
+    _XL_CAN_TX_EVENT_DTYPE = _xl_dtype(xlapi.XLcanTxEvent, [
+        ("tag", "tag"),
+        ("transId", "transId"),
+        ("id", "tagData.canMsg.canId"),
+        ("flags", "tagData.canMsg.msgFlags"),
+        ("dlc", "tagData.canMsg.dlc"),
+        ("data", "tagData.canMsg.data"),
+    ])
+    # canRxOkMsg and canTxOkMsg share the same layout in the tag data union
+    _XL_CAN_RX_EVENT_DTYPE = _xl_dtype(xlapi.XLcanRxEvent, [
+        ("tag", "tag"),
+        ("channel", "channelIndex"),
+        ("timestamp", "timeStampSync"),
+        ("id", "tagData.canRxOkMsg.canId"),
+        ("flags", "tagData.canRxOkMsg.msgFlags"),
+        ("dlc", "tagData.canRxOkMsg.dlc"),
+        ("data", "tagData.canRxOkMsg.data"),
+    ])
+else:
+    CAN_FRAME_DTYPE = None
+
+# Requests and responses of ISO 15765-4 (OBD on CAN)
+OBD_CAN_IDS = [0x7DF, (0x7E0, 0x7EF)]
+
+class AcceptanceFilter(object):
+    # Plans the hardware acceptance filters for a set of CAN IDs and ranges.
+    # Every entry is either an ID or an inclusive (first, last) range, ext.
+    # IDs have XL_CAN_EXT_MSG_ID set. Std. IDs are opened exactly with
+    # xlCanAddAcceptanceRange (neighbouring ranges are merged if there are
+    # more than max_ranges), ext. IDs with the tightest code/mask pair, as
+    # there is only one per channel. The hardware filter may let more IDs
+    # pass, so received frames are checked again with accepts().
+    def __init__(self, can_ids, max_ranges=30):
+        self.max_ranges = max_ranges
+        std_ranges, ext_ranges = [], []
+        for entry in can_ids:
+            if isinstance(entry, (tuple, list)):
+                first, last = entry
+            else:
+                first = last = entry
+            if (first | last) & xlapi.XL_CAN_EXT_MSG_ID:
+                ext_ranges.append((first & 0x1FFFFFFF, last & 0x1FFFFFFF))
+            elif last > 0x7FF:
+                raise ValueError("Std. Can Ids must be between 0 - 0x7FF (2^11)")
+            else:
+                std_ranges.append((first, last))
+        self.std_ranges = self._merge_ranges(std_ranges)
+        self.ext_ranges = self._merge_ranges(ext_ranges)
+        # Lookup table for std. IDs, ext. IDs are searched in the ranges
+        self._std_lookup = bytearray(0x800)
+        for first, last in self.std_ranges:
+            self._std_lookup[first:last+1] = b"\x01" * (last + 1 - first)
+        self._ext_firsts = [first for first, last in self.ext_ranges]
+
+    def __str__(self):
+        return "\n".join([
+            "Acceptance Filter:",
+            "  Std. IDs: {0}".format(self._format_ranges(self.std_ranges)),
+            "  Ext. IDs: {0}".format(self._format_ranges(self.ext_ranges)),
+        ])
+
+    @staticmethod
+    def _format_ranges(ranges):
+        return ", ".join([
+            "0x{0:X}".format(first) if first == last else
+            "0x{0:X}-0x{1:X}".format(first, last)
+            for first, last in ranges
+        ]) or "-"
+
+    @staticmethod
+    def _merge_ranges(ranges):
+        merged = []
+        for first, last in sorted(ranges):
+            if first > last:
+                raise ValueError("Invalid ID range: 0x{0:X}-0x{1:X}".format(first, last))
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+        return merged
+
+    @staticmethod
+    def code_mask(ranges, id_mask):
+        # The tightest code/mask pair that lets all IDs of the ranges pass
+        code, mask = ranges[0][0], id_mask
+        for first, last in ranges:
+            # Only the common leading bits of a range can be relevant
+            mask &= ~((1 << (first ^ last).bit_length()) - 1)
+            mask &= ~(first ^ code)
+        return code & mask, mask & id_mask
+
+    def hardware_ranges(self):
+        # Merges the ranges with the smallest gaps until max_ranges are left
+        ranges = list(self.std_ranges)
+        while len(ranges) > self.max_ranges:
+            i = min(
+                range(len(ranges) - 1),
+                key=lambda i: ranges[i+1][0] - ranges[i][1]
+            )
+            ranges[i:i+2] = [(ranges[i][0], ranges[i+1][1])]
+        return ranges
+
+    def install(self, port, access_mask):
+        std, ext = xlapi.XL_ACCEPTANCE_FILTER.CAN_STD, xlapi.XL_ACCEPTANCE_FILTER.CAN_EXT
+        xlapi.xlCanResetAcceptance(port, access_mask, std)
+        if self.std_ranges:
+            try:
+                xlapi.xlCanRemoveAcceptanceRange(port, access_mask, 0, 0x7FF)
+                for first, last in self.hardware_ranges():
+                    xlapi.xlCanAddAcceptanceRange(port, access_mask, first, last)
+            except xlapi.VectorError:
+                # No range filters, fall back to a single code/mask pair
+                xlapi.xlCanResetAcceptance(port, access_mask, std)
+                code, mask = self.code_mask(self.std_ranges, 0x7FF)
+                xlapi.xlCanSetChannelAcceptance(port, access_mask, code, mask, std)
+        else:
+            xlapi.xlCanSetChannelAcceptance(port, access_mask, 0xFFF, 0xFFF, std)
+        if self.ext_ranges:
+            code, mask = self.code_mask(self.ext_ranges, 0x1FFFFFFF)
+        else:
+            code, mask = 0xFFFFFFFF, 0xFFFFFFFF
+        xlapi.xlCanSetChannelAcceptance(port, access_mask, code, mask, ext)
+
+    def accepts(self, can_id, is_extended_id=False):
+        if not is_extended_id:
+            return bool(self._std_lookup[can_id & 0x7FF])
+        i = bisect.bisect_right(self._ext_firsts, can_id) - 1
+        return i >= 0 and can_id <= self.ext_ranges[i][1]
+
+    def accepts_array(self, can_ids, is_extended_id):
+        # Vectorized accepts for numpy arrays of IDs and ext. ID flags
+        accepted = np.frombuffer(self._std_lookup, dtype=np.uint8)[can_ids & 0x7FF] != 0
+        accepted &= ~is_extended_id
+        for first, last in self.ext_ranges:
+            accepted |= is_extended_id & (can_ids >= first) & (can_ids <= last)
+        return accepted
+
+class IdDispatcher(object):
+    # Routes frames to callbacks by their arbitration ID. Subscriptions are
+    # exact IDs, inclusive ID ranges or code/mask pairs (accept if
+    # (id ^ code) & mask == 0), ext. IDs have XL_CAN_EXT_MSG_ID set. The
+    # callbacks of every std. ID are kept in a dense table, those of ext. IDs
+    # are looked up once per ID and then kept in a dict.
+    def __init__(self):
+        self.subscriptions = []
+        self._std_table = [()] * 0x800
+        self._ext_table = {}
+
+    def __len__(self):
+        return len(self.subscriptions)
+
+    def subscribe(self, callback, can_id=None, id_range=None, mask=None):
+        if id_range is not None:
+            (first, last), mask = id_range, None
+        elif can_id is not None:
+            first = last = can_id
+        else:
+            raise ValueError("Either can_id or id_range is needed.")
+        is_extended_id = bool((first | last) & xlapi.XL_CAN_EXT_MSG_ID)
+        first, last = first & 0x1FFFFFFF, last & 0x1FFFFFFF
+        if not is_extended_id and last > 0x7FF:
+            raise ValueError("Std. Can Ids must be between 0 - 0x7FF (2^11)")
+        if first > last:
+            raise ValueError("Invalid ID range: 0x{0:X}-0x{1:X}".format(first, last))
+        self.subscriptions.append((callback, is_extended_id, first, last, mask))
+        self._rebuild()
+
+    def unsubscribe(self, callback):
+        self.subscriptions = [
+            subscription for subscription in self.subscriptions
+            if subscription[0] != callback
+        ]
+        self._rebuild()
+
+    def _rebuild(self):
+        std_table = [[] for i in range(0x800)]
+        for callback, is_extended_id, first, last, mask in self.subscriptions:
+            if is_extended_id:
+                continue
+            if mask is None:
+                can_ids = range(first, last + 1)
+            else:
+                can_ids = (i for i in range(0x800) if not (i ^ first) & mask)
+            for can_id in can_ids:
+                std_table[can_id].append(callback)
+        self._std_table = [tuple(callbacks) for callbacks in std_table]
+        self._ext_table = {}
+
+    def _ext_callbacks(self, can_id):
+        callbacks = tuple(
+            callback for callback, is_extended_id, first, last, mask in self.subscriptions
+            if is_extended_id and (
+                first <= can_id <= last if mask is None else
+                not (can_id ^ first) & mask & 0x1FFFFFFF
+            )
+        )
+        self._ext_table[can_id] = callbacks
+        return callbacks
+
+    def lookup(self, mid):
+        # mid: the raw ID of an XL event, XL_CAN_EXT_MSG_ID set for ext. IDs
+        if mid & xlapi.XL_CAN_EXT_MSG_ID:
+            can_id = mid & 0x1FFFFFFF
+            callbacks = self._ext_table.get(can_id)
+            if callbacks is None:
+                callbacks = self._ext_callbacks(can_id)
+            return callbacks
+        return self._std_table[mid & 0x7FF]
+
+# Timing limits of the controllers: clock in Hz, the possible prescalers and
+# the ranges of the time segments in time quanta
+BitTimingLimits = collections.namedtuple(
+    "BitTimingLimits",
+    "clock prescalers tseg1_min tseg1_max tseg2_min tseg2_max sjw_max"
+)
+# Classic CAN: Baudrate = f/(2*presc*(1+tseg1+tseg2)) with a 16 MHz crystal,
+# presc [1..64], sjw [1..4], tseg1 [1..16], tseg2 [1..8]
+CAN_BIT_TIMING = BitTimingLimits(16e6, range(2, 129, 2), 1, 16, 1, 8, 4)
+# CAN FD: (tseg1+tseg2+1)*bitrate*prescaler = 80 MHz, the prescaler is
+# chosen by the hardware
+CAN_FD_ARBITRATION_TIMING = BitTimingLimits(80e6, range(1, 257), 1, 255, 1, 128, 128)
+CAN_FD_DATA_TIMING = BitTimingLimits(80e6, range(1, 257), 1, 32, 1, 32, 64)
+
+BitTiming = collections.namedtuple(
+    "BitTiming",
+    "bitrate prescaler bit_cycles tseg1 tseg2 sample_point bitrate_error sample_point_error"
+)
+
+@functools.lru_cache(maxsize=None)
+def solve_bit_timing(
+    limits,
+    bitrate,
+    sample_point=0.8,
+    sample_point_tolerance=0.05,
+    bitrate_tolerance=1/256.0,
+    bit_cycles=None,
+):
+    # All valid timings (BitTiming) for the limits, bitrate and sample point,
+    # the best first: smallest bitrate error, smallest sample point error,
+    # most time quanta per bit. Results are cached, the tuple is shared.
+    timings = []
+    for prescaler in limits.prescalers:
+        cycles = limits.clock / (bitrate * prescaler)
+        if bit_cycles:
+            candidates = [bit_cycles]
+        else:
+            candidates = set([int(cycles), int(cycles) + 1])
+        for n in candidates:
+            if not 1 + limits.tseg1_min + limits.tseg2_min <= n <= 1 + limits.tseg1_max + limits.tseg2_max:
+                continue
+            actual = limits.clock / (prescaler * n)
+            bitrate_error = abs(actual - bitrate) / bitrate
+            if bitrate_error > bitrate_tolerance:
+                continue
+            # Sample point = (1 + tseg1)/n, rounded to the closest tseg1
+            tseg1 = int(round(sample_point * n)) - 1
+            tseg1 = max(limits.tseg1_min, min(limits.tseg1_max, tseg1, n - 1 - limits.tseg2_min))
+            tseg2 = n - 1 - tseg1
+            if not limits.tseg2_min <= tseg2 <= limits.tseg2_max:
+                continue
+            sample_point_error = abs((1 + tseg1) / float(n) - sample_point)
+            if sample_point_error > sample_point_tolerance:
+                continue
+            timings.append(BitTiming(
+                actual, prescaler, n, tseg1, tseg2, (1 + tseg1) / float(n),
+                bitrate_error, sample_point_error
+            ))
+    timings.sort(key=lambda t: (round(t.bitrate_error, 9), round(t.sample_point_error, 9), -t.bit_cycles))
+    return tuple(timings)
+
+@functools.lru_cache(maxsize=None)
+def check_bit_timing(limits, bitrate, tseg1, tseg2, sjw, bitrate_tolerance=1/256.0):
+    # Error message why the timing is invalid, None if it is valid
+    if not limits.tseg1_min <= tseg1 <= limits.tseg1_max:
+        return "tseg1 {0} not in [{1}..{2}]".format(tseg1, limits.tseg1_min, limits.tseg1_max)
+    if not limits.tseg2_min <= tseg2 <= limits.tseg2_max:
+        return "tseg2 {0} not in [{1}..{2}]".format(tseg2, limits.tseg2_min, limits.tseg2_max)
+    if not 1 <= sjw <= min(limits.sjw_max, tseg2):
+        return "sjw {0} not in [1..{1}]".format(sjw, min(limits.sjw_max, tseg2))
+    if not solve_bit_timing(
+        limits, bitrate, (1 + tseg1) / float(1 + tseg1 + tseg2), 0.0,
+        bitrate_tolerance, 1 + tseg1 + tseg2
+    ):
+        return "no prescaler for {0} bit/s with {1} time quanta".format(bitrate, 1 + tseg1 + tseg2)
+    return None
+
+def _best_bit_timing(limits, bitrate, sample_point, bit_cycles=None, prescaler=None):
+    timings = solve_bit_timing(limits, bitrate, sample_point, bit_cycles=bit_cycles)
+    if not timings:
+        # Too few time quanta per bit, take the closest sample point
+        timings = solve_bit_timing(limits, bitrate, sample_point, 1.0, bit_cycles=bit_cycles)
+    if not timings:
+        raise ValueError(
+            "No valid bit timing for {0} bit/s at sample point {1}.".format(bitrate, sample_point)
+        )
+    if prescaler is not None:
+        for timing in timings:
+            if timing.prescaler == prescaler:
+                return timing
+    return timings[0]
+
 class CanParameters(object):
+    timing_limits = CAN_BIT_TIMING
+
     def __init__(
         self,
         bitrate=500000,
@@ -55,23 +433,24 @@ class CanParameters(object):
             self.bit_cycles = 1 + tseg1 + tseg2
             self.sample_point = (1 + tseg1)/self.bit_cycles
         else:
-            # Calculation of baudrate
-            # Baudrate = f/(2*presc*(1+tseg1+tseg2))
-            # f: crystal frequency is 16 MHz
-            # presc: CAN-Prescaler [1..64] (will be conformed autom.)
-            # sjw: CAN-Synchronization-Jump-Width [1..4]
-            # tseg1: CAN-Time-Segment-1 [1..16]
-            # tseg2: CAN-Time-Segment-2 [1..8]
-            if bit_cycles:
-                self.bit_cycles = bit_cycles
-            else:
-                self.bit_cycles = int(16e6 / bitrate / 2)
-            if sample_point:
-                self.sample_point = sample_point
-            else:
-                self.sample_point = 0.8125
-            self.tseg1 = int(self.sample_point * self.bit_cycles) - 1
-            self.tseg2 = self.bit_cycles - 1 - self.tseg1
+            # Searched over all prescalers (see solve_bit_timing)
+            timing = _best_bit_timing(
+                self.timing_limits, bitrate, sample_point or 0.8125, bit_cycles
+            )
+            self.bit_cycles = timing.bit_cycles
+            self.sample_point = timing.sample_point
+            self.tseg1 = timing.tseg1
+            self.tseg2 = timing.tseg2
+            self.sjw = min(sjw, timing.tseg2, self.timing_limits.sjw_max)
+
+    def validate(self, is_can_fd=None):
+        # Raises a ValueError for settings the driver would reject, called by
+        # the CanBus before the driver is configured
+        if is_can_fd is not None and is_can_fd != getattr(self, "is_can_fd", False):
+            raise ValueError("The bus parameters don't match the bus (CAN FD: {0}).".format(is_can_fd))
+        error = check_bit_timing(self.timing_limits, self.bitrate, self.tseg1, self.tseg2, self.sjw)
+        if error:
+            raise ValueError("Invalid bit timing: {0}".format(error))
 
     def __str__(self):
         return "\n".join([
@@ -113,30 +492,11 @@ class CanFdParameters(CanParameters):
         sample_point_dbr=None,
         bit_cycles_dbr=None,
     ):
-        if(sample_point_abr and bit_cycles_abr or
-           tseg1_abr and tseg1_abr
-        ):
-            super(CanFdParameters, self).__init__(
-                bitrate=bitrate_abr,
-                sjw=sjw_abr,
-                tseg1=tseg1_abr,
-                tseg2=tseg2_abr,
-                samples=samples_abr,
-                sample_point=sample_point_abr,
-                bit_cycles=bit_cycles_abr
-            )
-        else:
-            super(CanFdParameters, self).__init__(
-                bitrate=bitrate_abr,
-                sjw=1,
-                samples=samples_abr,
-                sample_point=0.8,
-                bit_cycles=80
-            )
         self.is_can_fd = is_can_fd
         self.is_iso_fd = is_iso_fd
         self.bitrate_dbr = bitrate_dbr
         self.sjw_dbr = sjw_dbr
+        self.prescaler_dbr = None
         if sample_point_dbr and bit_cycles_dbr:
             self.sample_point_dbr = sample_point_dbr
             self.bit_cycles_dbr = bit_cycles_dbr
@@ -152,16 +512,72 @@ class CanFdParameters(CanParameters):
             # (tseg1+tseg2+1)*actualBitrate*prescaler = 80MHz. Where the
             # actual bitrate differs by less than 1:256 from the requested
             # bitrate.
-            if bit_cycles_dbr:
-                self.bit_cycles_dbr = bit_cycles_dbr
-            else:
-                self.bit_cycles_dbr = int(80e6 / bitrate_dbr)
-            if sample_point_dbr:
-                self.sample_point_dbr = sample_point_dbr
+            timing = _best_bit_timing(
+                CAN_FD_DATA_TIMING, bitrate_dbr, sample_point_dbr or 0.7, bit_cycles_dbr
+            )
+            self.prescaler_dbr = timing.prescaler
+            self.bit_cycles_dbr = timing.bit_cycles
+            self.sample_point_dbr = timing.sample_point
+            self.tseg1_dbr = timing.tseg1
+            self.tseg2_dbr = timing.tseg2
+            self.sjw_dbr = min(sjw_dbr, timing.tseg2, CAN_FD_DATA_TIMING.sjw_max)
+        if not is_can_fd:
+            super(CanFdParameters, self).__init__(
+                bitrate=bitrate_abr,
+                sjw=sjw_abr,
+                tseg1=tseg1_abr,
+                tseg2=tseg2_abr,
+                samples=samples_abr,
+                sample_point=sample_point_abr,
+                bit_cycles=bit_cycles_abr
+            )
+        elif(sample_point_abr and bit_cycles_abr or
+           tseg1_abr and tseg2_abr
+        ):
+            super(CanFdParameters, self).__init__(
+                bitrate=bitrate_abr,
+                sjw=sjw_abr,
+                tseg1=tseg1_abr,
+                tseg2=tseg2_abr,
+                samples=samples_abr,
+                sample_point=sample_point_abr,
+                bit_cycles=bit_cycles_abr
+            )
+        else:
+            # 80 time quanta and SJW 1 as before if the bitrate allows it,
+            # otherwise the prescaler of the data phase is preferred (ISO
+            # 11898-1 recommendation)
+            timings = solve_bit_timing(
+                CAN_FD_ARBITRATION_TIMING, bitrate_abr, sample_point_abr or 0.8,
+                bit_cycles=bit_cycles_abr or 80
+            )
+            if timings:
+                timing = timings[0]
             else:
-                self.sample_point_dbr = 0.7
-            self.tseg1_dbr = int(self.sample_point_dbr * self.bit_cycles_dbr) - 1
-            self.tseg2_dbr = self.bit_cycles_dbr - 1 - self.tseg1_dbr
+                timing = _best_bit_timing(
+                    CAN_FD_ARBITRATION_TIMING, bitrate_abr, sample_point_abr or 0.8,
+                    bit_cycles_abr, self.prescaler_dbr
+                )
+            super(CanFdParameters, self).__init__(
+                bitrate=bitrate_abr,
+                sjw=1,
+                samples=samples_abr,
+                tseg1=timing.tseg1,
+                tseg2=timing.tseg2,
+            )
+
+    @property
+    def timing_limits(self):
+        return CAN_FD_ARBITRATION_TIMING if self.is_can_fd else CAN_BIT_TIMING
+
+    def validate(self, is_can_fd=None):
+        super(CanFdParameters, self).validate(is_can_fd)
+        if self.is_can_fd:
+            error = check_bit_timing(
+                CAN_FD_DATA_TIMING, self.bitrate_dbr, self.tseg1_dbr, self.tseg2_dbr, self.sjw_dbr
+            )
+            if error:
+                raise ValueError("Invalid data bit timing: {0}".format(error))
 
     def __str__(self):
         tmp = [super(CanFdParameters, self).__str__()]
@@ -169,7 +585,7 @@ class CanFdParameters(CanParameters):
             tmp += [
                 "  FD Parameters:",
                 "    ISO FD: {0}".format(self.is_iso_fd),
-                "    Data Bitrate: {0}".format(self.bit_cycles_dbr),
+                "    Data Bitrate: {0}".format(self.bitrate_dbr),
                 "    Data SJW: {0}".format(self.sjw_dbr),
                 "    Data Tseg1: {0}".format(self.tseg1_dbr),
                 "    Data Tseg2: {0}".format(self.tseg2_dbr),
@@ -219,6 +635,7 @@ class CanMessage(object):
         error_state_indicator=False,
         dlc=None,
         data=[],
+        channel=None,
     ):
         # Argument Checks:
         if is_remote_frame:
@@ -226,8 +643,9 @@ class CanMessage(object):
                 raise ValueError("Can FD doesn't support remote frames.")
             if is_error_frame:
                 raise ValueError("Frame can't be a remote and error frame at the same time.")
-        if is_extended_id and not 0 <= arbitration_id <= 0x1FFFFFFF:
-            raise ValueError("Ext. Can Ids must be between 0 - 0x1FFFFFFF (2^29)")
+        if is_extended_id:
+            if not 0 <= arbitration_id <= 0x1FFFFFFF:
+                raise ValueError("Ext. Can Ids must be between 0 - 0x1FFFFFFF (2^29)")
         elif not 0 <= arbitration_id <= 0x7FF:
             raise ValueError("Std. Can Ids must be between 0 - 0x7FF (2^11)")
         if is_can_fd:
@@ -245,6 +663,8 @@ class CanMessage(object):
         self.error_state_indicator = error_state_indicator
         self.is_rx_frame = is_rx_frame
         self.is_error_frame = is_error_frame
+        # Channel index to send on (None: all channels of the bus)
+        self.channel = channel
         if is_remote_frame:
             self.data = bytearray()
         else:
@@ -331,6 +751,753 @@ class CanMessage(object):
             event.msg.data = tuple(self.data)
             return event
 
+# Plain ints of the flags used to decode received frames, operations on the
+# enum members are a lot slower
+_XL_CAN_EXT_MSG_ID = int(xlapi.XL_CAN_EXT_MSG_ID)
+_XL_CAN_MSG_FLAG_REMOTE_FRAME = int(xlapi.XL_CAN_MSG_FLAG.REMOTE_FRAME)
+_XL_CAN_MSG_FLAG_ERROR_FRAME = int(xlapi.XL_CAN_MSG_FLAG.ERROR_FRAME)
+_XL_CAN_MSG_FLAG_TX_COMPLETED = int(xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED)
+_XL_CAN_RXMSG_FLAG_EDL = int(xlapi.XL_CAN_RXMSG_FLAG.EDL)
+_XL_CAN_RXMSG_FLAG_RTR = int(xlapi.XL_CAN_RXMSG_FLAG.RTR)
+_XL_CAN_RXMSG_FLAG_EF = int(xlapi.XL_CAN_RXMSG_FLAG.EF)
+_XL_CAN_RXMSG_FLAG_BRS = int(xlapi.XL_CAN_RXMSG_FLAG.BRS)
+_XL_CAN_RXMSG_FLAG_ESI = int(xlapi.XL_CAN_RXMSG_FLAG.ESI)
+_XL_RECEIVE_MSG = int(xlapi.XL_EVENT_TAGS.RECEIVE_MSG)
+_XL_CAN_EV_TAG_RX_OK = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK)
+_XL_CAN_EV_TAG_TX_OK = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK)
+_XL_CAN_EV_TAG_RX_ERROR = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_ERROR)
+_XL_CAN_EV_TAG_TX_ERROR = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_ERROR)
+_XL_CAN_EV_TAG_TX_REQUEST = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_REQUEST)
+_XL_CAN_EV_TAG_CHIP_STATE = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_CHIP_STATE)
+_XL_CHIP_STATE = int(xlapi.XL_EVENT_TAGS.CHIP_STATE)
+_XL_SYNC_PULSE = int(xlapi.XL_EVENT_TAGS.SYNC_PULSE)
+_XL_TRANSCEIVER = int(xlapi.XL_EVENT_TAGS.TRANSCEIVER)
+_XL_TIMER = int(xlapi.XL_EVENT_TAGS.TIMER)
+_XL_EVENT_SIZE = ctypes.sizeof(xlapi.XLevent)
+_XL_EVENT_FLAG_OVERRUN = int(xlapi.XL_EVENT_FLAG_OVERRUN)
+_XL_CAN_QUEUE_OVERFLOW = int(xlapi.XL_CAN_QUEUE_OVERFLOW)
+_CAN_FD_DLC_BYTES = tuple(CanMessage.can_fd_dlc)
+
+class CanFrame(object):
+    # Compact type for received frames, the hardware already checked them.
+    # So unlike CanMessage, nothing is validated, converted or padded and the
+    # DLC is kept as received. Can be sent again like a CanMessage.
+    __slots__ = (
+        "is_can_fd",
+        "timestamp",
+        "arbitration_id",
+        "is_extended_id",
+        "is_remote_frame",
+        "is_error_frame",
+        "is_rx_frame",
+        "bitrate_switch",
+        "error_state_indicator",
+        "dlc",
+        "data",
+        "channel",
+    )
+
+    def __init__(
+        self,
+        is_can_fd,
+        timestamp,
+        arbitration_id,
+        is_extended_id,
+        is_remote_frame,
+        is_error_frame,
+        is_rx_frame,
+        bitrate_switch,
+        error_state_indicator,
+        dlc,
+        data,
+        channel=None,
+    ):
+        self.is_can_fd = is_can_fd
+        self.timestamp = timestamp
+        self.arbitration_id = arbitration_id
+        self.is_extended_id = is_extended_id
+        self.is_remote_frame = is_remote_frame
+        self.is_error_frame = is_error_frame
+        self.is_rx_frame = is_rx_frame
+        self.bitrate_switch = bitrate_switch
+        self.error_state_indicator = error_state_indicator
+        self.dlc = dlc
+        self.data = data
+        self.channel = channel
+
+    __str__ = CanMessage.__str__
+    __repr__ = CanMessage.__repr__
+    build_xl_class = CanMessage.build_xl_class
+
+    @classmethod
+    def from_xl_event(cls, xl_event, time_offset=0.0, share=False):
+        # Trusted conversion of a XL_RECEIVE_MSG event (the tag isn't checked).
+        # With share the data is a memoryview of the event instead of a copy,
+        # only use it for events that aren't reused.
+        msg = xl_event.msg
+        mid, flags, dlc = msg.id, msg.flags, msg.dlc
+        is_remote_frame = bool(flags & _XL_CAN_MSG_FLAG_REMOTE_FRAME)
+        data = memoryview(msg.data).cast("B")[:0 if is_remote_frame else min(dlc, 8)]
+        return cls(
+            False,
+            xl_event.timeStamp * 1e-9 + time_offset,
+            mid & 0x1FFFFFFF,
+            bool(mid & _XL_CAN_EXT_MSG_ID),
+            is_remote_frame,
+            bool(flags & _XL_CAN_MSG_FLAG_ERROR_FRAME),
+            not flags & _XL_CAN_MSG_FLAG_TX_COMPLETED,
+            False,
+            False,
+            dlc,
+            data if share else data.tobytes(),
+            xl_event.chanIndex,
+        )
+
+    @classmethod
+    def from_xl_can_rx_event(cls, xl_can_rx_event, time_offset=0.0, share=False):
+        # Same as from_xl_event for XL_CAN_EV_TAG_RX_OK/TX_OK events (V4)
+        msg = xl_can_rx_event.canRxOkMsg
+        mid, flags, dlc = msg.canId, msg.msgFlags, msg.dlc
+        is_can_fd = bool(flags & _XL_CAN_RXMSG_FLAG_EDL)
+        is_remote_frame = bool(flags & _XL_CAN_RXMSG_FLAG_RTR)
+        if is_remote_frame:
+            length = 0
+        elif is_can_fd:
+            length = _CAN_FD_DLC_BYTES[dlc & 0xF]
+        else:
+            length = min(dlc, 8)
+        data = memoryview(msg.data).cast("B")[:length]
+        return cls(
+            is_can_fd,
+            xl_can_rx_event.timeStampSync * 1e-9 + time_offset,
+            mid & 0x1FFFFFFF,
+            bool(mid & _XL_CAN_EXT_MSG_ID),
+            is_remote_frame,
+            bool(flags & _XL_CAN_RXMSG_FLAG_EF),
+            xl_can_rx_event.tag == _XL_CAN_EV_TAG_RX_OK,
+            bool(flags & _XL_CAN_RXMSG_FLAG_BRS),
+            bool(flags & _XL_CAN_RXMSG_FLAG_ESI),
+            dlc,
+            data if share else data.tobytes(),
+            xl_can_rx_event.channelIndex,
+        )
+
+class CanEvent(object):
+    # Base of the received events that are no frames. Returned by
+    # CanBus.recv_events and passed to the callbacks of subscribe_events.
+    __slots__ = ("timestamp", "channel")
+
+    def __init__(self, timestamp, channel):
+        self.timestamp = timestamp
+        self.channel = channel
+
+    def __repr__(self):
+        fields = [
+            "{0}={1!r}".format(name, getattr(self, name))
+            for cls in reversed(type(self).__mro__)
+            for name in getattr(cls, "__slots__", ())
+        ]
+        return "{0}({1})".format(type(self).__name__, ", ".join(fields))
+    __str__ = __repr__
+
+    @staticmethod
+    def from_xl_event(xl_event, time_offset=0.0):
+        # The events of a XLevent (V3): an overflow marker if events were lost
+        # before it, chip states and sync pulses. Error frames are CanFrames.
+        events = []
+        timestamp = xl_event.timeStamp * 1e-9 + time_offset
+        channel = xl_event.chanIndex
+        if xl_event.flags & _XL_EVENT_FLAG_OVERRUN:
+            events.append(CanOverflowEvent(timestamp, channel))
+        tag = xl_event.tag
+        if tag == _XL_CHIP_STATE:
+            chip_state = xl_event.chipState
+            events.append(CanChipStateEvent(
+                timestamp, channel, chip_state.busStatus,
+                chip_state.txErrorCounter, chip_state.rxErrorCounter,
+            ))
+        elif tag == _XL_SYNC_PULSE:
+            sync_pulse = xl_event.syncPulse
+            events.append(CanSyncPulseEvent(
+                timestamp, channel, sync_pulse.pulseCode, sync_pulse.time * 1e-9 + time_offset
+            ))
+        return events
+
+    @staticmethod
+    def from_xl_can_rx_event(xl_can_rx_event, time_offset=0.0):
+        # Same as from_xl_event for XLcanRxEvent (V4), which also has error
+        # and TX request events
+        events = []
+        timestamp = xl_can_rx_event.timeStampSync * 1e-9 + time_offset
+        channel = xl_can_rx_event.channelIndex
+        if xl_can_rx_event.flagsChip & _XL_CAN_QUEUE_OVERFLOW:
+            events.append(CanOverflowEvent(timestamp, channel))
+        tag = xl_can_rx_event.tag
+        if tag == _XL_CAN_EV_TAG_RX_ERROR or tag == _XL_CAN_EV_TAG_TX_ERROR:
+            events.append(CanErrorEvent(
+                timestamp, channel, xl_can_rx_event.canError.errorCode,
+                tag == _XL_CAN_EV_TAG_TX_ERROR,
+            ))
+        elif tag == _XL_CAN_EV_TAG_CHIP_STATE:
+            chip_state = xl_can_rx_event.canChipState
+            events.append(CanChipStateEvent(
+                timestamp, channel, chip_state.busStatus,
+                chip_state.txErrorCounter, chip_state.rxErrorCounter,
+            ))
+        elif tag == _XL_CAN_EV_TAG_TX_REQUEST:
+            msg = xl_can_rx_event.canTxRequest
+            mid, flags = msg.canId, msg.msgFlags
+            if flags & _XL_CAN_RXMSG_FLAG_RTR:
+                length = 0
+            elif flags & _XL_CAN_RXMSG_FLAG_EDL:
+                length = _CAN_FD_DLC_BYTES[msg.dlc & 0xF]
+            else:
+                length = min(msg.dlc, 8)
+            events.append(CanTxRequestEvent(
+                timestamp, channel, mid & 0x1FFFFFFF, bool(mid & _XL_CAN_EXT_MSG_ID),
+                msg.dlc, bytes(msg.data[:length]),
+            ))
+        elif tag == _XL_SYNC_PULSE:
+            sync_pulse = xl_can_rx_event.canSyncPulse
+            events.append(CanSyncPulseEvent(
+                timestamp, channel, sync_pulse.triggerSource, sync_pulse.time * 1e-9 + time_offset
+            ))
+        return events
+
+class CanOverflowEvent(CanEvent):
+    # Marks that the driver queue overflowed and events before this one are lost
+    __slots__ = ()
+
+class CanErrorEvent(CanEvent):
+    # Error on the bus, error_code is a XL_CAN_ERRC value
+    __slots__ = ("error_code", "is_tx_error")
+
+    def __init__(self, timestamp, channel, error_code, is_tx_error):
+        super(CanErrorEvent, self).__init__(timestamp, channel)
+        try:
+            self.error_code = xlapi.XL_CAN_ERRC(error_code)
+        except ValueError:
+            self.error_code = error_code
+        self.is_tx_error = is_tx_error
+
+class CanChipStateEvent(CanEvent):
+    # State of the CAN controller, bus_status is a XL_CHIPSTAT value
+    __slots__ = ("bus_status", "tx_error_counter", "rx_error_counter")
+
+    def __init__(self, timestamp, channel, bus_status, tx_error_counter, rx_error_counter):
+        super(CanChipStateEvent, self).__init__(timestamp, channel)
+        try:
+            self.bus_status = xlapi.XL_CHIPSTAT(bus_status)
+        except ValueError:
+            self.bus_status = bus_status
+        self.tx_error_counter = tx_error_counter
+        self.rx_error_counter = rx_error_counter
+
+class CanSyncPulseEvent(CanEvent):
+    # Sync pulse with its source and the time it occurred (PC time)
+    __slots__ = ("source", "sync_time")
+
+    def __init__(self, timestamp, channel, source, sync_time):
+        super(CanSyncPulseEvent, self).__init__(timestamp, channel)
+        self.source = source
+        self.sync_time = sync_time
+
+class CanTxRequestEvent(CanEvent):
+    # The hardware started the transmission of a frame (TX requests enabled)
+    __slots__ = ("arbitration_id", "is_extended_id", "dlc", "data")
+
+    def __init__(self, timestamp, channel, arbitration_id, is_extended_id, dlc, data):
+        super(CanTxRequestEvent, self).__init__(timestamp, channel)
+        self.arbitration_id = arbitration_id
+        self.is_extended_id = is_extended_id
+        self.dlc = dlc
+        self.data = data
+
+class CanBusReader(object):
+    # Drains the receive queue of a CanBus in a background thread, so the
+    # driver queue doesn't overflow while the application is busy. The frames
+    # are kept in a bounded ring buffer (the oldest frames are dropped when it
+    # is full). The deque is only appended to by the reader thread and popped
+    # by the consumer, both of which are atomic, so no lock is needed.
+    def __init__(self, bus, buffer_size=2**16, batch_size=None, poll_timeout=0.1):
+        self.bus = bus
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.overflow_count = 0
+        self.error = None
+        self._buffer = collections.deque(maxlen=buffer_size)
+        self._data_available = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._run, name="CanBusReader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Wake up consumers blocked in get()
+        self._data_available.set()
+
+    @property
+    def is_running(self):
+        return self._running
+
+    def _run(self):
+        buffer = self._buffer
+        try:
+            while self._running:
+                # Blocks on the notification handle of the port (or polls)
+                frames = self.bus._recv_events(
+                    self.batch_size, self.poll_timeout, self.bus._decode_batch
+                )
+                if not frames:
+                    continue
+                # Counted before the frames are added, so a concurrent get()
+                # can only lead to a slightly too high overflow count
+                dropped = len(buffer) + len(frames) - self.buffer_size
+                if dropped > 0:
+                    self.overflow_count += dropped
+                buffer.extend(frames)
+                self._data_available.set()
+        except Exception as error:
+            self.error = error
+        finally:
+            self._running = False
+            self._data_available.set()
+
+    def qsize(self):
+        return len(self._buffer)
+
+    def empty(self):
+        return not self._buffer
+
+    def full(self):
+        return len(self._buffer) >= self.buffer_size
+
+    def get(self, block=True, timeout=None):
+        if timeout is not None:
+            end_time = time.perf_counter() + timeout
+        else:
+            end_time = None
+        while True:
+            try:
+                return self._buffer.popleft()
+            except IndexError:
+                pass
+            if self.error is not None:
+                raise self.error
+            if not block or not self._running:
+                raise queue.Empty
+            # Clear before checking again, a frame added in between sets it
+            self._data_available.clear()
+            if self._buffer:
+                continue
+            if end_time is None:
+                self._data_available.wait()
+            else:
+                time_left = end_time - time.perf_counter()
+                if time_left <= 0 or not self._data_available.wait(time_left):
+                    raise queue.Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def get_batch(self, max_events=None, timeout=None):
+        # Returns all buffered frames (up to max_events), waits for the first one
+        try:
+            msgs = [self.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        buffer = self._buffer
+        while buffer and (max_events is None or len(msgs) < max_events):
+            try:
+                msgs.append(buffer.popleft())
+            except IndexError:
+                break
+        return msgs
+
+    def recv(self, timeout=None):
+        try:
+            return self.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        msg = self.recv(timeout=0.1)
+        if msg is None:
+            raise StopIteration
+        else:
+            return msg
+
+class CyclicSendTask(object):
+    # A message sent every period seconds by the CyclicScheduler of a bus.
+    # The XL event is built once, modify_data changes its payload in place.
+    def __init__(self, scheduler, msg, period, duration=None):
+        self.scheduler = scheduler
+        self.msg = msg
+        self.period = period
+        self.duration = duration
+        # Message templates (see candb.MessageTemplate) are sent from their own
+        # event, they update counters & CRCs before each send under our lock
+        self.prepare = getattr(msg, "prepare_send", None)
+        if self.prepare is not None:
+            if msg.bus is not scheduler.bus:
+                raise ValueError("The message template was built for another bus.")
+            msg.lock = scheduler.lock
+        self.xl_event = msg.build_xl_class(build_fd=scheduler.bus.is_can_fd)
+        self.xl_data = self.xl_event.canMsg.data if scheduler.bus.is_can_fd else self.xl_event.msg.data
+        self.mask = scheduler.bus.get_channel_mask(getattr(msg, "channel", None))
+        self.start_time = None
+        self.end_time = None
+        self.next_due = None
+        self.due_tick = None
+        self.sent_count = 0
+
+    def modify_data(self, data, offset=0):
+        # Replaces the payload (from offset on) for all following transmissions
+        with self.scheduler.lock:
+            self.xl_data[offset:offset+len(data)] = data
+
+    def stop(self):
+        self.scheduler.remove(self)
+
+    @property
+    def is_running(self):
+        return self in self.scheduler.tasks
+
+class CyclicScheduler(object):
+    # Runs all cyclic tasks of a bus in one thread. The tasks are kept in a
+    # timer wheel with a slot per tick (resolution seconds). Deadlines are
+    # absolute perf_counter times, so the periods don't drift, and all frames
+    # that are due in the same tick are sent with one transmit call.
+    def __init__(self, bus, resolution=0.001, wheel_size=1024, max_sleep=0.01):
+        self.bus = bus
+        self.resolution = resolution
+        self.wheel_size = wheel_size
+        self.max_sleep = max_sleep
+        self.tasks = set()
+        self.lock = threading.Lock()
+        self.late_count = 0
+        self._wheel = [[] for i in range(wheel_size)]
+        self._start_time = time.perf_counter()
+        self._tick = 0
+        self._tx_event_array = None
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def _tick_of(self, deadline):
+        # First tick at or after the deadline
+        return max(self._tick + 1, -int(-(deadline - self._start_time) // self.resolution))
+
+    def _insert(self, task):
+        task.due_tick = self._tick_of(task.next_due)
+        self._wheel[task.due_tick % self.wheel_size].append(task)
+
+    def add(self, msg, period, duration=None):
+        if period < self.resolution:
+            raise ValueError("Period must be at least {0} s.".format(self.resolution))
+        task = CyclicSendTask(self, msg, period, duration)
+        with self.lock:
+            task.start_time = task.next_due = time.perf_counter()
+            if duration is not None:
+                task.end_time = task.start_time + duration
+            self.tasks.add(task)
+            self._insert(task)
+        self.start()
+        self._wakeup.set()
+        return task
+
+    def remove(self, task):
+        with self.lock:
+            if task in self.tasks:
+                self.tasks.discard(task)
+                self._wheel[task.due_tick % self.wheel_size].remove(task)
+
+    def remove_all(self):
+        with self.lock:
+            self.tasks.clear()
+            self._wheel = [[] for i in range(self.wheel_size)]
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="CyclicScheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _next_tick(self):
+        # The next tick with a task in its slot (None if there are no tasks)
+        if not self.tasks:
+            return None
+        for tick in range(self._tick + 1, self._tick + 1 + self.wheel_size):
+            if self._wheel[tick % self.wheel_size]:
+                return tick
+        return None
+
+    def _run(self):
+        while self._running:
+            with self.lock:
+                tick = self._next_tick()
+            if tick is None:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            deadline = self._start_time + tick * self.resolution
+            time_left = deadline - time.perf_counter()
+            if time_left > 0:
+                # Short sleeps, so tasks that are added meanwhile aren't late
+                time.sleep(min(time_left, self.max_sleep))
+                if time_left > self.max_sleep:
+                    continue
+            self._process(time.perf_counter())
+
+    def _process(self, now):
+        now_tick = int((now - self._start_time) // self.resolution)
+        xl_class = xlapi.XLcanTxEvent if self.bus.is_can_fd else xlapi.XLevent
+        event_size = ctypes.sizeof(xl_class)
+        with self.lock:
+            due = []
+            for tick in range(self._tick + 1, min(now_tick, self._tick + self.wheel_size) + 1):
+                slot = self._wheel[tick % self.wheel_size]
+                if not slot:
+                    continue
+                remaining = [task for task in slot if task.due_tick > now_tick]
+                due += [task for task in slot if task.due_tick <= now_tick]
+                slot[:] = remaining
+            self._tick = max(self._tick, now_tick)
+
+            if self._tx_event_array is None or len(self._tx_event_array) < len(due):
+                self._tx_event_array = (xl_class * max(len(due), len(self.tasks)))()
+            xl_events = self._tx_event_array
+            msg_count = 0
+            # The frames are sent with one transmit call per channel
+            if len(self.bus.channel_masks) > 1:
+                due.sort(key=lambda task: task.mask)
+            batches = []
+            for task in due:
+                if task.end_time is not None and task.next_due > task.end_time:
+                    self.tasks.discard(task)
+                    continue
+                if not batches or batches[-1][0] != task.mask:
+                    batches.append((task.mask, msg_count))
+                if task.prepare is not None:
+                    task.prepare()
+                ctypes.memmove(
+                    ctypes.addressof(xl_events) + msg_count * event_size,
+                    ctypes.addressof(task.xl_event),
+                    event_size,
+                )
+                msg_count += 1
+                task.sent_count += 1
+                # Missed periods are skipped instead of being sent as a burst
+                task.next_due += task.period
+                if task.next_due <= now:
+                    self.late_count += 1
+                    missed = int((now - task.next_due) // task.period) + 1
+                    task.next_due += missed * task.period
+                self._insert(task)
+        batches.append((None, msg_count))
+        for (mask, first), (_, last) in zip(batches, batches[1:]):
+            if first == 0:
+                batch = xl_events
+            else:
+                batch = (xl_class * (last - first)).from_buffer(xl_events, first * event_size)
+            self.bus._transmit_events(batch, last - first, 0, mask)
+
+class WaitStrategy(abc.ABC):
+    # How a CanBus waits for received events when its queue is empty. Every
+    # wait is measured: the time waited, the CPU time the waiting thread used
+    # and the latency, the age of the first event read after a wait.
+    def __init__(self):
+        self.bus = None
+        self.latency = Histogram(bin_width=10e-6, bin_count=2000)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.wait_count = 0
+        self.wait_time = 0.0
+        self.cpu_time = 0.0
+        self.latency.reset()
+
+    def attach(self, bus):
+        self.bus = bus
+
+    def detach(self):
+        self.bus = None
+
+    def wait(self, end_time):
+        start_time, start_cpu_time = time.perf_counter(), time.thread_time()
+        self._wait(end_time)
+        self.wait_count += 1
+        self.wait_time += time.perf_counter() - start_time
+        self.cpu_time += time.thread_time() - start_cpu_time
+
+    @abc.abstractmethod
+    def _wait(self, end_time):
+        # Implemented by every strategy: returns when events may have been
+        # received or at end_time (perf_counter time, None: no limit)
+        pass
+
+    def add_latency(self, latency):
+        self.latency.add(latency)
+
+    def _time_left_ms(self, end_time, max_ms=None):
+        if end_time is None:
+            return INFINITE if max_ms is None else max_ms
+        time_left_ms = max(0, int((end_time - time.perf_counter()) * 1000))
+        return time_left_ms if max_ms is None else min(time_left_ms, max_ms)
+
+    def stats(self):
+        return {
+            "strategy": type(self).__name__,
+            "waits": self.wait_count,
+            "wait_time": self.wait_time,
+            "cpu_time": self.cpu_time,
+            # Share of the waiting time the CPU was busy
+            "cpu_load": self.cpu_time / self.wait_time if self.wait_time else 0.0,
+            "latency": self.latency.summary(),
+        }
+
+    def __str__(self):
+        stats = self.stats()
+        return "{0}: waits {1} cpu {2:.1%} latency {3}".format(
+            stats["strategy"], stats["waits"], stats["cpu_load"], self.latency
+        )
+
+class SleepWait(WaitStrategy):
+    # Sleeps a fixed interval (up to interval latency, no handles needed)
+    def __init__(self, interval=0.015):
+        super(SleepWait, self).__init__()
+        self.interval = interval
+
+    def _wait(self, end_time):
+        if end_time is not None:
+            time.sleep(max(0.0, min(self.interval, end_time - time.perf_counter())))
+        else:
+            time.sleep(self.interval)
+
+class EventWait(WaitStrategy):
+    # Waits for the notification handle the driver sets with every event
+    # (queue_level events for XLevents, bytes for CAN FD)
+    def __init__(self, queue_level=1):
+        super(EventWait, self).__init__()
+        self.queue_level = queue_level
+        self.handle = None
+
+    def attach(self, bus):
+        if WaitForSingleObject is None:
+            raise RuntimeError("Package pywin32 not installed.")
+        super(EventWait, self).attach(bus)
+        if bus.notification_level != self.queue_level:
+            bus._set_notification(self.queue_level)
+        self.handle = bus.event_handle
+
+    def _wait(self, end_time):
+        WaitForSingleObject(self.handle.value, self._time_left_ms(end_time))
+
+class TimerWait(WaitStrategy):
+    # Wakes up with the cyclic timer of the driver (xlSetTimerRate, steps of
+    # 1 ms), so the number of wakeups doesn't grow with the traffic. The
+    # driver puts a XL_TIMER event into the receive queue every period, the
+    # bus drops them right after reading (before loggers, statistics and
+    # decoding), so they only cost queue space and the read itself.
+    def __init__(self, period=0.001):
+        super(TimerWait, self).__init__()
+        self.period = period
+        self.handle = None
+
+    def attach(self, bus):
+        if WaitForSingleObject is None:
+            raise RuntimeError("Package pywin32 not installed.")
+        super(TimerWait, self).attach(bus)
+        self.handle = xlapi.XLhandle()
+        xlapi.xlSetTimerRate(bus.port, max(1, int(round(self.period * 1e5))))
+        xlapi.xlSetTimerBasedNotify(bus.port, self.handle)
+
+    def detach(self):
+        if self.bus is not None:
+            try:
+                xlapi.xlSetTimerRate(self.bus.port, 0)
+            except xlapi.VectorError:
+                pass
+        super(TimerWait, self).detach()
+
+    def _wait(self, end_time):
+        WaitForSingleObject(self.handle.value, self._time_left_ms(end_time))
+
+class SpinWait(WaitStrategy):
+    # Polls the receive queue level without sleeping, the lowest latency for
+    # the price of a busy CPU core
+    def _wait(self, end_time):
+        level = ctypes.c_int()
+        while True:
+            xlapi.xlGetReceiveQueueLevel(self.bus.port, level)
+            if level.value:
+                return
+            if end_time is not None and time.perf_counter() > end_time:
+                return
+            # Lets other python threads (e.g. a scheduler) take the GIL
+            time.sleep(0)
+
+class AdaptiveWait(WaitStrategy):
+    # Polls the receive queue level with an interval that is reset to
+    # min_interval when there is traffic and doubles (up to max_interval) on
+    # every empty poll. Intervals below spin_interval are busy waited, the OS
+    # sleep can't do them. With a notification handle the sleep is a wait on
+    # it, so an idle bus still wakes up on the first frame.
+    def __init__(self, min_interval=0.0001, max_interval=0.015, spin_interval=0.002):
+        super(AdaptiveWait, self).__init__()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.spin_interval = spin_interval
+        self.interval = min_interval
+
+    def _wait(self, end_time):
+        bus, level = self.bus, ctypes.c_int()
+        while True:
+            xlapi.xlGetReceiveQueueLevel(bus.port, level)
+            if level.value:
+                self.interval = self.min_interval
+                return
+            now = time.perf_counter()
+            if end_time is not None and now > end_time:
+                return
+            interval = self.interval
+            if end_time is not None:
+                interval = min(interval, end_time - now)
+            if interval < self.spin_interval:
+                while time.perf_counter() - now < interval:
+                    pass
+            elif bus.event_handle:
+                WaitForSingleObject(bus.event_handle.value, int(interval * 1000))
+            else:
+                time.sleep(interval)
+            self.interval = min(self.interval * 2, self.max_interval)
+
 class CanBus(object):
     def __init__(
         self,
@@ -339,7 +1506,12 @@ class CanBus(object):
         is_can_fd=False,
         is_iso_fd=True,
         rx_queue_size=2**14,
-        bus_params=None
+        bus_params=None,
+        rx_batch_size=256,
+        can_filters=OBD_CAN_IDS,
+        channels=None,
+        wait_strategy=None,
+        unclaimed_size=2**12,
     ):
         self.poll_interval = poll_interval_ms/1000.0
         self.recv_own_messages = recv_own_messages
@@ -347,122 +1519,138 @@ class CanBus(object):
         self.is_iso_fd = is_iso_fd
         self.rx_queue_size = rx_queue_size
         self.bus_params = bus_params
+        self.rx_batch_size = rx_batch_size
+        #Receive buffers are allocated once and reused by recv_batch
+        self._rx_event_array = None
+        self._rx_fd_event_array = None
+        self._tx_event_array = None
+        self.reader = None
+        self.can_filter = None
+        self.dispatcher = IdDispatcher()
+        #Frames read by dispatch(keep_unclaimed=True) without a subscriber,
+        #returned first by recv, recv_batch, recv_block and recv_events. Only
+        #the newest unclaimed_size frames are kept (the dropped ones are
+        #counted), so they can't pile up if nobody reads them.
+        self.unclaimed = collections.deque(maxlen=unclaimed_size)
+        self.unclaimed_overflow_count = 0
+        self.scheduler = None
+        #Loggers get every event read from the driver (see canlog.CanLogger)
+        self.loggers = []
+        #Gets every sent frame to match it with its TX receipt (see canstats)
+        self.tx_tracker = None
+        #(callback, event class) of subscribe_events
+        self.event_callbacks = []
+        self.wait_strategy = None
+        self.event_handle = None
+        self.notification_level = None
+        self._on_bus = False
+        self._has_session = False
 
-        #Open the xl driver
-        xlapi.xlOpenDriver()
-        self.mask, permission_mask = 0, xlapi.XLaccess()
-        self.channels = []
-        self.idx_to_channel, i = {}, 0
-        for channel in self.get_can_channels():
-            if channel.hwType == xlapi.XL_HWTYPE.VIRTUAL:
-                if DEBUG:
-                    pass
-                else:
-                    continue
-            if is_can_fd:
-                if (not is_iso_fd and not
-                    channel.channelCapabilities & xlapi.XL_CHANNEL_FLAG.CANFD_BOSCH_SUPPORT
-                ):
-                    continue
-                elif (is_iso_fd and not
-                    channel.channelCapabilities & xlapi.XL_CHANNEL_FLAG.CANFD_ISO_SUPPORT
-                ):
-                    continue
-            self.mask |= channel.channelMask
-            if not channel.isOnBus:
-                permission_mask.value |= channel.channelMask
-                if bus_params or is_can_fd:
-                    break
-            self.channels.append(channel.channelIndex)
-            self.idx_to_channel[i], i = channel.channelIndex, i+1
-        else:
-            raise ValueError("Couldn't find a bus.")
+        #Invalid bit timings are rejected before the driver is touched
+        if bus_params:
+            bus_params.validate(is_can_fd)
 
-        if is_can_fd:
-            interface_version = xlapi.XL_INTERFACE_VERSION.V4
-        else:
-            interface_version = xlapi.XL_INTERFACE_VERSION.V3
+        #Open the xl driver (shared by all buses of the process)
         self.port = xlapi.XLportHandle(xlapi.XL_INVALID_PORTHANDLE)
+        driver_session.acquire()
+        self._has_session = True
+        #Every failure from here on closes the port and releases the driver
         try:
-            xlapi.xlOpenPort(
-                self.port,
-                b"",
-                self.mask,
-                permission_mask,
-                rx_queue_size,
-                interface_version,
-                xlapi.XL_BUS_TYPE.CAN
-            )
-        except xlapi.VectorError as error:
-            self.shutdown()
-            raise error
-        if permission_mask != 0 and bus_params:
-            #Got init access, setting bus params for all available init access channels
-            xl_bus_params = bus_params.build_xl_class()
-            if is_can_fd:
-                xlapi.xlCanFdSetConfiguration(
-                    self.port, permission_mask, xl_bus_params
-                )
+            self.mask, permission_mask = 0, xlapi.XLaccess()
+            self.channels = []
+            self.channel_masks = {}
+            self.idx_to_channel, i = {}, 0
+            if not is_can_fd:
+                fd_support = 0
+            elif is_iso_fd:
+                fd_support = xlapi.XL_CHANNEL_FLAG.CANFD_ISO_SUPPORT
             else:
-                xlapi.xlCanSetChannelParams(
-                    self.port, permission_mask, xl_bus_params
-                )
+                fd_support = xlapi.XL_CHANNEL_FLAG.CANFD_BOSCH_SUPPORT
+            for channel in channel_registry.find(xlapi.XL_BUS_ACTIVE_CAP.CAN, fd_support):
+                if channel.hwType == xlapi.XL_HWTYPE.VIRTUAL:
+                    if DEBUG or xlapi.XL_BACKEND == "virtual":
+                        pass
+                    else:
+                        continue
+                if channels is not None and channel.channelIndex not in channels:
+                    continue
+                self.mask |= channel.channelMask
+                self.channels.append(channel.channelIndex)
+                self.channel_masks[channel.channelIndex] = channel.channelMask
+                self.idx_to_channel[i], i = channel.channelIndex, i+1
+                if not channel.isOnBus:
+                    permission_mask.value |= channel.channelMask
+                    #Without explicit channels only the first free one is used
+                    if channels is None and (bus_params or is_can_fd):
+                        break
+            if not self.channels:
+                #The hardware may have changed, read the configuration again
+                channel_registry.invalidate()
+                raise ValueError("Couldn't find a bus.")
 
-        tx_receipts = 1 if recv_own_messages else 0
-        xlapi.xlCanSetChannelMode(self.port, self.mask, tx_receipts, 0)
-        if WaitForSingleObject:
-            self.event_handle = xlapi.XLhandle()
-            xlapi.xlSetNotification(self.port, self.event_handle, 1)
-        else:
-            self.event_handle = None
-
-        #Set acceptance filters according to ISO 15765-4
-        can_ids = [
-            0x7df,
-            0x7e0, 0x7e8,
-            0x7e1, 0x7e9,
-            0x7e2, 0x7ea,
-            0x7e3, 0x7eb,
-            0x7e4, 0x7ec,
-            0x7e5, 0x7ed,
-            0x7e6, 0x7ee,
-            0x7e7, 0x7ef,
-        ]
-        for can_id in can_ids:
-            is_extended_id = can_id & xlapi.XL_CAN_EXT_MSG_ID
+            if is_can_fd:
+                interface_version = xlapi.XL_INTERFACE_VERSION.V4
+            else:
+                interface_version = xlapi.XL_INTERFACE_VERSION.V3
             try:
-                xlapi.xlCanSetChannelAcceptance(
+                xlapi.xlOpenPort(
                     self.port,
+                    b"",
                     self.mask,
-                    can_id,
-                    0x1FFFFFFF if is_extended_id else 0x7FF,
-                    xlapi.XL_ACCEPTANCE_FILTER.CAN_EXT
-                    if is_extended_id else
-                    xlapi.XL_ACCEPTANCE_FILTER.CAN_STD,
+                    permission_mask,
+                    rx_queue_size,
+                    interface_version,
+                    xlapi.XL_BUS_TYPE.CAN
                 )
             except xlapi.VectorError:
-                print(f"Could not set CAN ID: {can_id}")
-                xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_STD)
-                xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_EXT)
-                break
+                channel_registry.invalidate()
+                raise
+            if permission_mask != 0 and bus_params:
+                #Got init access, setting bus params for all available init access channels
+                xl_bus_params = bus_params.build_xl_class()
+                if is_can_fd:
+                    xlapi.xlCanFdSetConfiguration(
+                        self.port, permission_mask, xl_bus_params
+                    )
+                else:
+                    xlapi.xlCanSetChannelParams(
+                        self.port, permission_mask, xl_bus_params
+                    )
+
+            tx_receipts = 1 if recv_own_messages else 0
+            xlapi.xlCanSetChannelMode(self.port, self.mask, tx_receipts, 0)
+            if wait_strategy is None:
+                if WaitForSingleObject:
+                    wait_strategy = EventWait()
+                else:
+                    wait_strategy = SleepWait(self.poll_interval)
+            if WaitForSingleObject:
+                self._set_notification(getattr(wait_strategy, "queue_level", 1))
+            self.set_wait_strategy(wait_strategy)
+
+            self.set_filters(can_filters)
 
-        try:
             xlapi.xlActivateChannel(
                 self.port, self.mask, xlapi.XL_BUS_TYPE.CAN, xlapi.XL_ACTIVATE.RESET_CLOCK
             )
-        except xlapi.ValueError as error:
-            self.shutdown()
-            raise error
-        #Calculate the offset between sync time and PC time
-        offset = xlapi.XLuint64()
-        try:
+            channel_registry.set_on_bus(self.mask, True)
+            self._on_bus = True
+            #Calculate the offset between sync time and PC time
+            offset = xlapi.XLuint64()
             try:
-                xlapi.xlGetSyncTime(self.port, offset)
+                try:
+                    xlapi.xlGetSyncTime(self.port, offset)
+                except xlapi.VectorError:
+                    xlapi.xlGetChannelTime(self.port, self.mask, offset)
+                self._time_offset = time.perf_counter() - offset.value * 1e-9
             except xlapi.VectorError:
-                xlapi.xlGetChannelTime(self.port, self.mask, offset)
-            self._time_offset = time.perf_counter() - offset.value * 1e-9
-        except xlapi.VectorError:
-            self._time_offset = 0.0
+                self._time_offset = 0.0
+        except BaseException:
+            try:
+                self.shutdown()
+            except xlapi.VectorError:
+                pass
+            raise
 
     def __iter__(self):
         return self
@@ -474,54 +1662,369 @@ class CanBus(object):
         else:
             return msg
 
+    def set_filters(self, can_filters):
+        # Only lets the given IDs and (first, last) ranges pass (ext. IDs with
+        # XL_CAN_EXT_MSG_ID set), None receives all frames. The acceptance
+        # filter of the hardware is set as tight as possible, the exact check
+        # is done on received frames (Tx receipts always pass).
+        if can_filters is None:
+            self.can_filter = None
+            xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_STD)
+            xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_EXT)
+            return
+        self.can_filter = AcceptanceFilter(can_filters)
+        try:
+            self.can_filter.install(self.port, self.mask)
+        except xlapi.VectorError as error:
+            print("Could not set acceptance filter: {0}".format(error))
+            xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_STD)
+            xlapi.xlCanResetAcceptance(self.port, self.mask, xlapi.XL_ACCEPTANCE_FILTER.CAN_EXT)
+
+    def subscribe(self, callback, can_id=None, id_range=None, mask=None):
+        # Registers callback(msg) for an ID, an ID range or a code/mask pair,
+        # it is called by dispatch for every matching frame
+        self.dispatcher.subscribe(callback, can_id=can_id, id_range=id_range, mask=mask)
+
+    def unsubscribe(self, callback):
+        self.dispatcher.unsubscribe(callback)
+
+    def subscribe_events(self, callback, event_class=None):
+        # Registers callback(event) for the received events that are no frames
+        # (all CanEvent types or only event_class). It's called from every
+        # receive path right after the events were read from the driver.
+        self.event_callbacks.append((callback, event_class or CanEvent))
+
+    def unsubscribe_events(self, callback):
+        self.event_callbacks = [
+            (event_callback, event_class) for event_callback, event_class in self.event_callbacks
+            if event_callback != callback
+        ]
+
+    def send_periodic(self, msg, period, duration=None):
+        # Sends msg every period seconds (for duration seconds or until the
+        # returned task is stopped). All cyclic messages of the bus share one
+        # scheduler thread.
+        if self.scheduler is None:
+            self.scheduler = CyclicScheduler(self)
+        return self.scheduler.add(msg, period, duration)
+
+    def stop_all_periodic_tasks(self):
+        if self.scheduler is not None:
+            self.scheduler.stop()
+            self.scheduler = None
+
+    def start_reader(self, buffer_size=2**16, batch_size=None):
+        # Starts a background thread that drains the driver queue into a ring
+        # buffer. Until stop_reader is called, recv, recv_batch and iterating
+        # over the bus return the frames from that buffer.
+        if self.reader is None:
+            self.reader = CanBusReader(
+                self, buffer_size=buffer_size, batch_size=batch_size
+            )
+        self.reader.start()
+        return self.reader
+
+    def stop_reader(self):
+        if self.reader is not None:
+            self.reader.stop()
+            self.reader = None
+
+    def _set_notification(self, queue_level):
+        # The notification handle is set by the driver when the receive queue
+        # holds queue_level events (the only place calling xlSetNotification)
+        if self.event_handle is None:
+            self.event_handle = xlapi.XLhandle()
+        xlapi.xlSetNotification(self.port, self.event_handle, queue_level)
+        self.notification_level = queue_level
+
+    def set_wait_strategy(self, wait_strategy):
+        # How recv & co. wait for events: EventWait, TimerWait, SpinWait,
+        # AdaptiveWait or SleepWait (see their stats for latency and CPU)
+        if self.wait_strategy is not None:
+            self.wait_strategy.detach()
+        wait_strategy.attach(self)
+        self.wait_strategy = wait_strategy
+
     def shutdown(self):
+        self.stop_all_periodic_tasks()
+        self.stop_reader()
+        if self.wait_strategy is not None:
+            self.wait_strategy.detach()
         if self.port.value != xlapi.XL_INVALID_PORTHANDLE:
             xlapi.xlDeactivateChannel(self.port, self.mask)
             xlapi.xlClosePort(self.port)
-        #Close the xl driver
-        xlapi.xlCloseDriver()
+            self.port.value = xlapi.XL_INVALID_PORTHANDLE
+        if self._on_bus:
+            channel_registry.set_on_bus(self.mask, False)
+            self._on_bus = False
+        #Release the xl driver, closed with the last bus (see xlconfig)
+        if self._has_session:
+            self._has_session = False
+            driver_session.release()
 
-    def send(self, messages):
-        if isinstance(messages, CanMessage):
+    def send(self, messages, channel=None):
+        # Sends on the given channel index, the channel of the messages or
+        # (None) all channels of the bus. Messages for the same channel are
+        # sent with one transmit call.
+        if isinstance(messages, (CanMessage, CanFrame)):
             messages = [messages]
-        if self.is_can_fd:
-            self._send_can_fd_msgs(messages)
-        else:
-            self._send_can_msgs(messages)
+        for mask, channel_messages in self._group_by_channel(messages, channel):
+            if self.is_can_fd:
+                self._send_can_fd_msgs(channel_messages, mask)
+            else:
+                self._send_can_msgs(channel_messages, mask)
 
-    def _send_can_msgs(self, messages):
+    def get_channel_mask(self, channel=None):
+        if channel is None:
+            return self.mask
+        try:
+            return self.channel_masks[channel]
+        except KeyError:
+            raise ValueError("Channel {0} is not part of the bus.".format(channel))
+
+    def _group_by_channel(self, messages, channel=None):
+        # A CanMessage is sent on its channel (must be part of the bus). A
+        # CanFrame only keeps the channel it was received on, it's sent on all
+        # channels if that channel isn't part of this bus (forwarding).
+        if channel is not None:
+            return [(self.get_channel_mask(channel), messages)]
+        groups, channel_masks = {}, self.channel_masks
+        for msg in messages:
+            channel = getattr(msg, "channel", None)
+            if channel is not None and channel not in channel_masks and isinstance(msg, CanFrame):
+                channel = None
+            groups.setdefault(channel, []).append(msg)
+        return [
+            (self.get_channel_mask(channel), channel_messages)
+            for channel, channel_messages in groups.items()
+        ]
+
+    def _send_can_msgs(self, messages, mask=None):
+        if mask is None:
+            mask = self.mask
         msg_count = ctypes.c_uint(len(messages))
 
         xl_msg_array = (msg.build_xl_class(build_fd=False) for msg in messages)
         xl_event_array = (xlapi.XLevent * msg_count.value)(*xl_msg_array)
 
-        xlapi.xlCanTransmit(
-            self.port, self.mask, msg_count, xl_event_array
-        )
+        event_count = msg_count.value
+        tx_tracker = self.tx_tracker
+        send_time = time.perf_counter()
+        if tx_tracker is not None:
+            tx_tracker.add_sent(xl_event_array, event_count, mask, send_time)
+        try:
+            xlapi.xlCanTransmit(
+                self.port, mask, msg_count, xl_event_array
+            )
+        except xlapi.VectorError as error:
+            if tx_tracker is not None:
+                if error.error_code == xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_FULL:
+                    queued = min(msg_count.value, event_count)
+                else:
+                    queued = 0
+                tx_tracker.remove_unsent(xl_event_array, queued, event_count, mask, send_time)
+            raise error
         return msg_count.value
 
-    def _send_can_fd_msgs(self, messages):
-        mask = self.mask
+    def _send_can_fd_msgs(self, messages, mask=None):
+        if mask is None:
+            mask = self.mask
         msg_count = len(messages)
 
         xl_msg_array = (msg.build_xl_class(build_fd=True) for msg in messages)
         xl_can_fd_event_array = (xlapi.XLcanTxEvent * msg_count)(*xl_msg_array)
 
         msg_count_sent = ctypes.c_uint(0)
-        xlapi.xlCanTransmitEx(
-            self.port, self.mask, msg_count, msg_count_sent, xl_can_fd_event_array
-        )
+        tx_tracker = self.tx_tracker
+        send_time = time.perf_counter()
+        if tx_tracker is not None:
+            tx_tracker.add_sent(xl_can_fd_event_array, msg_count, mask, send_time)
+        try:
+            xlapi.xlCanTransmitEx(
+                self.port, mask, msg_count, msg_count_sent, xl_can_fd_event_array
+            )
+        finally:
+            queued = min(msg_count_sent.value, msg_count)
+            if tx_tracker is not None and queued < msg_count:
+                tx_tracker.remove_unsent(
+                    xl_can_fd_event_array, queued, msg_count, mask, send_time
+                )
         return msg_count_sent.value
 
+    def send_many(
+        self, arbitration_ids, payloads, dlcs=None, flags=None, timeout=None, channel=None
+    ):
+        # Transmits many frames without building CanMessage objects. The frames
+        # are given column wise: arbitration ids (XL_CAN_EXT_MSG_ID set for ext.
+        # ids), payloads (2D array, one contiguous buffer with a fixed size per
+        # frame or a sequence of buffers), DLCs and XL_CAN_TXMSG_FLAG (CAN FD)
+        # or XL_CAN_MSG_FLAG (CAN) flags. They are written into one reusable
+        # XL event array, frames the driver couldn't queue are resubmitted
+        # until the timeout expires (None: until all are sent). All frames are
+        # sent on the given channel index (None: all channels of the bus).
+        mask = self.get_channel_mask(channel)
+        msg_count = len(arbitration_ids)
+        if not msg_count:
+            return 0
+        xl_class = xlapi.XLcanTxEvent if self.is_can_fd else xlapi.XLevent
+        if self._tx_event_array is None or len(self._tx_event_array) < msg_count:
+            self._tx_event_array = (xl_class * msg_count)()
+        xl_events = self._tx_event_array
+        ctypes.memset(xl_events, 0, msg_count * ctypes.sizeof(xl_class))
+        if np is None:
+            self._fill_tx_events(xl_events, msg_count, arbitration_ids, payloads, dlcs, flags)
+        else:
+            self._fill_tx_events_np(xl_events, msg_count, arbitration_ids, payloads, dlcs, flags)
+        return self._transmit_events(xl_events, msg_count, timeout, mask)
+
+    def _fill_tx_events(self, xl_events, msg_count, arbitration_ids, payloads, dlcs, flags):
+        if isinstance(payloads, (list, tuple)):
+            rows = payloads
+        else:
+            payloads = memoryview(payloads).cast("B")
+            width = len(payloads) // msg_count
+            rows = [payloads[i*width:(i+1)*width] for i in range(msg_count)]
+        max_length = xlapi.XL_CAN_MAX_DATA_LEN if self.is_can_fd else xlapi.MAX_MSG_LEN
+        for i in range(msg_count):
+            data = rows[i]
+            length = min(len(data), max_length)
+            dlc = bisect.bisect_left(CanMessage.can_fd_dlc, length) if dlcs is None else dlcs[i]
+            if self.is_can_fd:
+                if flags is not None:
+                    msg_flags = flags[i]
+                elif dlc > 8:
+                    msg_flags = xlapi.XL_CAN_TXMSG_FLAG.EDL | xlapi.XL_CAN_TXMSG_FLAG.BRS
+                else:
+                    msg_flags = xlapi.XL_CAN_TXMSG_FLAG.EDL
+                event = xl_events[i]
+                event.tag = xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_MSG
+                event.transId = 0xFFFF
+                msg = event.canMsg
+                msg.canId = arbitration_ids[i]
+                msg.msgFlags = msg_flags
+            else:
+                event = xl_events[i]
+                event.tag = xlapi.XL_EVENT_TYPE.TRANSMIT_MSG
+                msg = event.msg
+                msg.id = arbitration_ids[i]
+                msg.flags = 0 if flags is None else flags[i]
+            msg.dlc = dlc
+            msg.data[:length] = data[:length]
+
+    def _fill_tx_events_np(self, xl_events, msg_count, arbitration_ids, payloads, dlcs, flags):
+        if self.is_can_fd:
+            events = np.frombuffer(xl_events, dtype=_XL_CAN_TX_EVENT_DTYPE, count=msg_count)
+            events["tag"] = xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_MSG
+            events["transId"] = 0xFFFF
+        else:
+            events = np.frombuffer(xl_events, dtype=_XL_TX_EVENT_DTYPE, count=msg_count)
+            events["tag"] = xlapi.XL_EVENT_TYPE.TRANSMIT_MSG
+        max_length = events["data"].shape[1]
+        events["id"] = arbitration_ids
+
+        if isinstance(payloads, (list, tuple)):
+            # Buffers of different length, copy them one by one
+            data = events["data"]
+            lengths = np.empty(msg_count, dtype=np.uint8)
+            for i, row in enumerate(payloads):
+                length = lengths[i] = min(len(row), max_length)
+                data[i, :length] = np.frombuffer(row, dtype=np.uint8, count=length)
+        else:
+            if isinstance(payloads, np.ndarray):
+                data = payloads.reshape(msg_count, -1)
+            else:
+                data = np.frombuffer(payloads, dtype=np.uint8).reshape(msg_count, -1)
+            length = min(data.shape[1], max_length)
+            events["data"][:, :length] = data[:, :length]
+            lengths = np.full(msg_count, length, dtype=np.uint8)
+
+        if dlcs is None:
+            dlcs = np.searchsorted(CanMessage.can_fd_dlc, lengths)
+        events["dlc"] = dlcs
+        if flags is not None:
+            events["flags"] = flags
+        elif self.is_can_fd:
+            events["flags"] = np.where(
+                np.asarray(dlcs) > 8,
+                xlapi.XL_CAN_TXMSG_FLAG.EDL | xlapi.XL_CAN_TXMSG_FLAG.BRS,
+                xlapi.XL_CAN_TXMSG_FLAG.EDL,
+            )
+
+    def _transmit_events(self, xl_events, msg_count, timeout, mask=None):
+        if mask is None:
+            mask = self.mask
+        if timeout is not None:
+            end_time = time.perf_counter() + timeout
+        else:
+            end_time = None
+        sent = 0
+        while True:
+            sent += self._transmit_once(xl_events, sent, msg_count, mask)
+            if sent >= msg_count:
+                return sent
+            if end_time is not None and time.perf_counter() > end_time:
+                return sent
+            # Give the hardware some time to empty its transmit queue
+            time.sleep(0.001)
+
+    def _transmit_once(self, xl_events, sent, msg_count, mask):
+        # One transmit call for the unsent tail xl_events[sent:msg_count],
+        # returns how many of them the driver queued (also if the queue got
+        # full, so only the rest is resubmitted)
+        xl_class = type(xl_events)._type_
+        pending_count = msg_count - sent
+        pending = (xl_class * pending_count).from_buffer(
+            xl_events, sent * ctypes.sizeof(xl_class)
+        )
+        if self.is_can_fd:
+            msg_count_sent = ctypes.c_uint(0)
+        else:
+            msg_count_sent = ctypes.c_uint(pending_count)
+        tx_tracker = self.tx_tracker
+        send_time = time.perf_counter()
+        if tx_tracker is not None:
+            # Before the call, the receipt may be read by another thread
+            # before it returns
+            tx_tracker.add_sent(pending, pending_count, mask, send_time)
+        try:
+            if self.is_can_fd:
+                xlapi.xlCanTransmitEx(
+                    self.port, mask, pending_count, msg_count_sent, pending
+                )
+            else:
+                xlapi.xlCanTransmit(self.port, mask, msg_count_sent, pending)
+        except xlapi.VectorError as error:
+            if error.error_code != xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_FULL:
+                if tx_tracker is not None:
+                    tx_tracker.remove_unsent(pending, 0, pending_count, mask, send_time)
+                raise error
+        queued = min(msg_count_sent.value, pending_count)
+        if tx_tracker is not None and queued < pending_count:
+            tx_tracker.remove_unsent(pending, queued, pending_count, mask, send_time)
+        return queued
+
+    def _build_tx_events(self, messages):
+        # The XL transmit events (XLcanTxEvent/XLevent array) of the messages
+        is_can_fd = self.is_can_fd
+        xl_class = xlapi.XLcanTxEvent if is_can_fd else xlapi.XLevent
+        return (xl_class * len(messages))(
+            *(msg.build_xl_class(build_fd=is_can_fd) for msg in messages)
+        )
+
     def flush_tx_buffer(self):
         xlapi.xlCanFlushTransmitQueue(self.port, self.mask)
 
     def recv(self, timeout=None):
+        if self.reader is not None:
+            return self.reader.recv(timeout)
+        if self.unclaimed:
+            return self.unclaimed.popleft()
         if timeout:
             end_time = time.perf_counter() + timeout
         else:
             end_time = None
 
+        waited = False
         while True:
             try:
                 if self.is_can_fd:
@@ -533,83 +2036,411 @@ class CanBus(object):
                     raise error
             else:
                 if msg:
+                    if waited:
+                        self.wait_strategy.add_latency(
+                            time.perf_counter() - msg.timestamp
+                        )
                     return msg
+                # An event that is no frame was read, don't wait for the next
+                if end_time is None or time.perf_counter() < end_time:
+                    continue
+                return None
 
             # if no message was received, wait or return on timeout
-            if end_time is not None and time.perf_counter() > end_time:
+            if not self._wait_for_rx(end_time):
                 return None
+            waited = True
 
-            if self.event_handle:
-                # Wait for receive event to occur
-                if end_time is None:
-                    time_left_ms = INFINITE
-                else:
-                    time_left = end_time - time.perf_counter()
-                    time_left_ms = max(0, int(time_left * 1000))
-                WaitForSingleObject(self.event_handle.value, time_left_ms)
+    def recv_batch(self, max_events=None, timeout=None):
+        # Drains up to max_events from the driver queue into a reusable event
+        # array and returns all decoded frames at once (empty list on timeout)
+        if self.reader is not None:
+            return self.reader.get_batch(max_events, timeout)
+        if self.unclaimed:
+            return self._pop_unclaimed(max_events)
+        msgs = self._recv_events(max_events, timeout, self._decode_batch)
+        return msgs if msgs is not None else []
+
+    def recv_block(self, max_events=None, timeout=None):
+        # Same as recv_batch, but returns a numpy record array (CAN_FRAME_DTYPE)
+        # that is filled straight from the XL event buffers
+        if np is None:
+            raise RuntimeError("Package numpy not installed.")
+        if self.reader is not None:
+            raise RuntimeError("Receive thread is running, use recv_batch.")
+        if self.unclaimed:
+            return self._frames_to_block(self._pop_unclaimed(max_events))
+        block = self._recv_events(max_events, timeout, self._decode_block)
+        if block is None:
+            return np.zeros(0, dtype=CAN_FRAME_DTYPE)
+        return block
+
+    def recv_events(self, max_events=None, timeout=None):
+        # Same as recv_batch, but returns the CanEvent objects (errors, chip
+        # states, overflow markers, ...) together with the frames in the order
+        # they were received
+        if self.reader is not None:
+            raise RuntimeError("Receive thread is running, use recv_batch.")
+        if self.unclaimed:
+            return self._pop_unclaimed(max_events)
+        items = self._recv_events(max_events, timeout, self._decode_all)
+        return items if items is not None else []
+
+    def dispatch(self, max_events=None, timeout=None, keep_unclaimed=False):
+        # Reads a batch of events and calls the subscribed callbacks. The ID is
+        # looked up in the raw XL event, so frames without a subscriber are
+        # never decoded, they are dropped or (keep_unclaimed) kept for the
+        # receive methods (the newest unclaimed_size frames). Returns the number of dispatched frames (0 on
+        # timeout).
+        if self.reader is not None:
+            raise RuntimeError("Receive thread is running, use recv_batch.")
+        if keep_unclaimed:
+            decode = lambda event_count: self._dispatch_batch(event_count, self.unclaimed)
+        else:
+            decode = self._dispatch_batch
+        msgs = self._recv_events(max_events, timeout, decode)
+        return len(msgs) if msgs is not None else 0
+
+    def _pop_unclaimed(self, max_events=None):
+        unclaimed = self.unclaimed
+        count = len(unclaimed) if max_events is None else min(max_events, len(unclaimed))
+        return [unclaimed.popleft() for i in range(count)]
+
+    def _frames_to_block(self, msgs):
+        block = np.zeros(len(msgs), dtype=CAN_FRAME_DTYPE)
+        for i, msg in enumerate(msgs):
+            flags = CAN_FRAME_FLAG(0)
+            flags |= CAN_FRAME_FLAG.EXTENDED_ID if msg.is_extended_id else 0
+            flags |= CAN_FRAME_FLAG.REMOTE_FRAME if msg.is_remote_frame else 0
+            flags |= CAN_FRAME_FLAG.ERROR_FRAME if msg.is_error_frame else 0
+            flags |= CAN_FRAME_FLAG.RX_FRAME if msg.is_rx_frame else 0
+            flags |= CAN_FRAME_FLAG.CAN_FD if msg.is_can_fd else 0
+            flags |= CAN_FRAME_FLAG.BITRATE_SWITCH if msg.bitrate_switch else 0
+            flags |= CAN_FRAME_FLAG.ERROR_STATE_INDICATOR if msg.error_state_indicator else 0
+            block[i]["timestamp"] = msg.timestamp
+            block[i]["channel"] = msg.channel or 0
+            block[i]["arbitration_id"] = msg.arbitration_id
+            block[i]["flags"] = flags
+            block[i]["dlc"] = msg.dlc
+            block[i]["data"][:len(msg.data)] = bytearray(msg.data)
+        return block
+
+    def _dispatch_batch(self, event_count, unclaimed=None):
+        lookup = self.dispatcher.lookup
+        msgs = []
+        kept = []
+        if self.is_can_fd:
+            xl_events = self._rx_fd_event_array
+            rx_ok, tx_ok = _XL_CAN_EV_TAG_RX_OK, _XL_CAN_EV_TAG_TX_OK
+            for i in range(event_count):
+                xl_event = xl_events[i]
+                if xl_event.tag != rx_ok and xl_event.tag != tx_ok:
+                    continue
+                # canRxOkMsg and canTxOkMsg share the same layout
+                callbacks = lookup(xl_event.tagData.canRxOkMsg.canId)
+                if callbacks:
+                    msg = self._decode_xl_can_rx_event(xl_event)
+                    if msg:
+                        for callback in callbacks:
+                            callback(msg)
+                        msgs.append(msg)
+                elif unclaimed is not None:
+                    msg = self._decode_xl_can_rx_event(xl_event)
+                    if msg:
+                        kept.append(msg)
+        else:
+            xl_events = self._rx_event_array
+            receive_msg = _XL_RECEIVE_MSG
+            for i in range(event_count):
+                xl_event = xl_events[i]
+                if xl_event.tag != receive_msg:
+                    continue
+                callbacks = lookup(xl_event.tagData.msg.id)
+                if callbacks:
+                    msg = self._decode_xl_event(xl_event)
+                    if msg:
+                        for callback in callbacks:
+                            callback(msg)
+                        msgs.append(msg)
+                elif unclaimed is not None:
+                    msg = self._decode_xl_event(xl_event)
+                    if msg:
+                        kept.append(msg)
+        if kept:
+            if unclaimed.maxlen is not None:
+                dropped = len(unclaimed) + len(kept) - unclaimed.maxlen
+                if dropped > 0:
+                    self.unclaimed_overflow_count += dropped
+            unclaimed.extend(kept)
+        return msgs
+
+    def _recv_events(self, max_events, timeout, decode):
+        if max_events is None:
+            max_events = self.rx_batch_size
+        if timeout:
+            end_time = time.perf_counter() + timeout
+        else:
+            end_time = None
+
+        waited = False
+        while True:
+            if self.is_can_fd:
+                event_count = self._read_canfd_events(max_events)
             else:
-                time.sleep(self.poll_interval)
+                event_count = self._read_can_events(max_events)
+            if waited and event_count:
+                self.wait_strategy.add_latency(self._first_event_age())
+                waited = False
+            frames = decode(event_count)
+            if len(frames):
+                return frames
+            # The queue still holds events that were no frames, read again
+            if event_count == max_events:
+                continue
+
+            if not self._wait_for_rx(end_time):
+                return None
+            waited = True
+
+    def _wait_for_rx(self, end_time):
+        if end_time is not None and time.perf_counter() > end_time:
+            return False
+        self.wait_strategy.wait(end_time)
+        return True
+
+    def _first_event_age(self):
+        # Time since the first event of the receive array was received
+        if self.is_can_fd:
+            timestamp = self._rx_fd_event_array[0].timeStampSync
+        else:
+            timestamp = self._rx_event_array[0].timeStamp
+        return time.perf_counter() - (timestamp * 1e-9 + self._time_offset)
 
     def _recv_can(self):
         xl_event = xlapi.XLevent()
         event_count = ctypes.c_uint(1)
         xlapi.xlReceive(self.port, event_count, xl_event)
+        if xl_event.tag == _XL_TIMER:
+            return None
+        if xl_event.tag == _XL_TRANSCEIVER:
+            self._device_changed()
+        if self.loggers:
+            self._log_events(xl_event, 1)
+        if self.event_callbacks:
+            self._notify_events(xl_event, 1)
+        return self._decode_xl_event(xl_event, share=True)
+
+    def _read_can_events(self, max_events):
+        if self._rx_event_array is None or len(self._rx_event_array) < max_events:
+            self._rx_event_array = (xlapi.XLevent * max_events)()
+        event_count = ctypes.c_uint(max_events)
+        try:
+            xlapi.xlReceive(self.port, event_count, self._rx_event_array)
+        except xlapi.VectorError as error:
+            if error.error_code != xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_EMPTY:
+                raise error
+            return 0
+        event_count = event_count.value
+        # The tag is the first byte of a XLevent, so the tags of the batch
+        # are one strided slice of the raw events
+        size = event_count * _XL_EVENT_SIZE
+        tags = memoryview(self._rx_event_array).cast("B")[:size:_XL_EVENT_SIZE].tobytes()
+        if _XL_TRANSCEIVER in tags:
+            self._device_changed()
+        if _XL_TIMER in tags:
+            event_count = self._drop_timer_events(tags)
+        if self.loggers:
+            self._log_events(self._rx_event_array, event_count)
+        if self.event_callbacks:
+            self._notify_events(self._rx_event_array, event_count)
+        return event_count
+
+    def _drop_timer_events(self, tags):
+        # Removes the XL_TIMER events (see TimerWait) from the read events in
+        # place, one memmove per run of other events. Returns the new count.
+        address = ctypes.addressof(self._rx_event_array)
+        event_count = len(tags)
+        write = read = 0
+        while read < event_count:
+            end = tags.find(_XL_TIMER, read)
+            if end < 0:
+                end = event_count
+            if write != read and end > read:
+                ctypes.memmove(
+                    address + write * _XL_EVENT_SIZE,
+                    address + read * _XL_EVENT_SIZE,
+                    (end - read) * _XL_EVENT_SIZE,
+                )
+            write += end - read
+            read = end + 1
+        return write
+
+    def _device_changed(self):
+        # A transceiver event: a cab was plugged or removed, so the driver
+        # configuration changed
+        channel_registry.invalidate()
+
+    def _log_events(self, xl_events, event_count):
+        for logger in self.loggers:
+            logger.log_events(xl_events, event_count)
+
+    def _notify_events(self, xl_events, event_count):
+        if self.is_can_fd:
+            xl_class, from_xl = xlapi.XLcanRxEvent, CanEvent.from_xl_can_rx_event
+        else:
+            xl_class, from_xl = xlapi.XLevent, CanEvent.from_xl_event
+        # xl_events is an event array or a single event
+        xl_events = (xl_class * event_count).from_address(ctypes.addressof(xl_events))
+        for xl_event in xl_events:
+            for event in from_xl(xl_event, self._time_offset):
+                for callback, event_class in self.event_callbacks:
+                    if isinstance(event, event_class):
+                        callback(event)
+
+    def _decode_all(self, event_count):
+        if self.is_can_fd:
+            xl_events, decode = self._rx_fd_event_array, self._decode_xl_can_rx_event
+            from_xl = CanEvent.from_xl_can_rx_event
+        else:
+            xl_events, decode = self._rx_event_array, self._decode_xl_event
+            from_xl = CanEvent.from_xl_event
+        items = []
+        for i in range(event_count):
+            xl_event = xl_events[i]
+            # An overflow marker goes in front of the frame it's attached to
+            items.extend(from_xl(xl_event, self._time_offset))
+            msg = decode(xl_event)
+            if msg:
+                items.append(msg)
+        return items
+
+    def _decode_batch(self, event_count):
+        if self.is_can_fd:
+            xl_events, decode = self._rx_fd_event_array, self._decode_xl_can_rx_event
+        else:
+            xl_events, decode = self._rx_event_array, self._decode_xl_event
+        msgs = []
+        for i in range(event_count):
+            msg = decode(xl_events[i])
+            if msg:
+                msgs.append(msg)
+        return msgs
 
-        if xl_event.tag != xlapi.XL_EVENT_TAGS.RECEIVE_MSG:
+    def _decode_block(self, event_count):
+        flag = CAN_FRAME_FLAG
+        if self.is_can_fd:
+            events = np.frombuffer(
+                self._rx_fd_event_array, dtype=_XL_CAN_RX_EVENT_DTYPE, count=event_count
+            )
+            is_rx_frame = events["tag"] == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK
+            is_tx_frame = events["tag"] == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK
+            events = events[is_rx_frame | is_tx_frame]
+            is_rx_frame = is_rx_frame[is_rx_frame | is_tx_frame]
+            xl_flags = events["flags"]
+            flags = np.where(xl_flags & xlapi.XL_CAN_RXMSG_FLAG.EDL, flag.CAN_FD, 0)
+            flags |= np.where(xl_flags & xlapi.XL_CAN_RXMSG_FLAG.RTR, flag.REMOTE_FRAME, 0)
+            flags |= np.where(xl_flags & xlapi.XL_CAN_RXMSG_FLAG.EF, flag.ERROR_FRAME, 0)
+            flags |= np.where(xl_flags & xlapi.XL_CAN_RXMSG_FLAG.BRS, flag.BITRATE_SWITCH, 0)
+            flags |= np.where(xl_flags & xlapi.XL_CAN_RXMSG_FLAG.ESI, flag.ERROR_STATE_INDICATOR, 0)
+        else:
+            events = np.frombuffer(
+                self._rx_event_array, dtype=_XL_EVENT_DTYPE, count=event_count
+            )
+            events = events[events["tag"] == xlapi.XL_EVENT_TAGS.RECEIVE_MSG]
+            xl_flags = events["flags"]
+            is_rx_frame = (xl_flags & xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED) == 0
+            flags = np.where(xl_flags & xlapi.XL_CAN_MSG_FLAG.REMOTE_FRAME, flag.REMOTE_FRAME, 0)
+            flags |= np.where(xl_flags & xlapi.XL_CAN_MSG_FLAG.ERROR_FRAME, flag.ERROR_FRAME, 0)
+        is_extended_id = (events["id"] & xlapi.XL_CAN_EXT_MSG_ID) != 0
+        if self.can_filter is not None:
+            accepted = ~is_rx_frame | self.can_filter.accepts_array(
+                events["id"] & 0x1FFFFFFF, is_extended_id
+            )
+            events, flags = events[accepted], flags[accepted]
+            is_rx_frame, is_extended_id = is_rx_frame[accepted], is_extended_id[accepted]
+        flags |= np.where(is_rx_frame, flag.RX_FRAME, 0)
+        flags |= np.where(is_extended_id, flag.EXTENDED_ID, 0)
+
+        block = np.zeros(len(events), dtype=CAN_FRAME_DTYPE)
+        block["timestamp"] = events["timestamp"] * 1e-9 + self._time_offset
+        block["channel"] = events["channel"]
+        block["arbitration_id"] = events["id"] & 0x1FFFFFFF
+        block["flags"] = flags
+        block["dlc"] = events["dlc"]
+        block["data"][:, :events["data"].shape[1]] = events["data"]
+        return block
+
+    def _decode_xl_event(self, xl_event, share=False):
+        if xl_event.tag != _XL_RECEIVE_MSG:
             return None
 
-        mid = xl_event.msg.id
-        dlc = xl_event.msg.dlc
-        flags = xl_event.msg.flags
-        timestamp = xl_event.timeStamp * 1e-9
-        channel = xl_event.chanIndex
+        if self.can_filter is not None:
+            mid = xl_event.msg.id
+            is_rx_frame = not xl_event.msg.flags & _XL_CAN_MSG_FLAG_TX_COMPLETED
+            if is_rx_frame and not self.can_filter.accepts(
+                mid & 0x1FFFFFFF, bool(mid & _XL_CAN_EXT_MSG_ID)
+            ):
+                return None
 
-        return CanMessage(
-            is_can_fd=False,
-            timestamp=timestamp + self._time_offset,
-            arbitration_id=mid & 0x1FFFFFFF,
-            is_extended_id=bool(mid & xlapi.XL_CAN_EXT_MSG_ID),
-            is_remote_frame=bool(flags & xlapi.XL_CAN_MSG_FLAG.REMOTE_FRAME),
-            is_error_frame=bool(flags & xlapi.XL_CAN_MSG_FLAG.ERROR_FRAME),
-            is_rx_frame=not bool(flags & xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED),
-            dlc=dlc,
-            data=xl_event.msg.data[:dlc],
-        )
+        return CanFrame.from_xl_event(xl_event, self._time_offset, share)
 
     def _recv_canfd(self):
         xl_can_rx_event = xlapi.XLcanRxEvent()
         xlapi.xlCanReceive(self.port, xl_can_rx_event)
+        if xl_can_rx_event.tag == _XL_TIMER:
+            return None
+        if xl_can_rx_event.tag == _XL_TRANSCEIVER:
+            self._device_changed()
+        if self.loggers:
+            self._log_events(xl_can_rx_event, 1)
+        if self.event_callbacks:
+            self._notify_events(xl_can_rx_event, 1)
+        return self._decode_xl_can_rx_event(xl_can_rx_event, share=True)
 
-        if xl_can_rx_event.tag == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK:
+    def _read_canfd_events(self, max_events):
+        # xlCanReceive only hands out one event per call, but the events are
+        # read into a preallocated array so no per event allocation is needed
+        if self._rx_fd_event_array is None or len(self._rx_fd_event_array) < max_events:
+            self._rx_fd_event_array = (xlapi.XLcanRxEvent * max_events)()
+        xl_can_rx_event_array = self._rx_fd_event_array
+        event_count = 0
+        while event_count < max_events:
+            try:
+                xlapi.xlCanReceive(self.port, xl_can_rx_event_array[event_count])
+            except xlapi.VectorError as error:
+                if error.error_code != xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_EMPTY:
+                    raise error
+                break
+            tag = xl_can_rx_event_array[event_count].tag
+            if tag == _XL_TIMER:
+                # Overwritten by the next event (see TimerWait)
+                continue
+            if tag == _XL_TRANSCEIVER:
+                self._device_changed()
+            event_count += 1
+        if self.loggers and event_count:
+            self._log_events(xl_can_rx_event_array, event_count)
+        if self.event_callbacks and event_count:
+            self._notify_events(xl_can_rx_event_array, event_count)
+        return event_count
+
+    def _decode_xl_can_rx_event(self, xl_can_rx_event, share=False):
+        tag = xl_can_rx_event.tag
+        if tag == _XL_CAN_EV_TAG_RX_OK:
             is_rx_frame = True
-            msg = xl_can_rx_event.canRxOkMsg
-        elif xl_can_rx_event.tag == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK:
+        elif tag == _XL_CAN_EV_TAG_TX_OK:
             is_rx_frame = False
-            msg = xl_can_rx_event.canTxOkMsg
         else:
             return None
 
-        mid = msg.canId
-        flags = msg.msgFlags
-        is_can_fd = bool(flags & xlapi.XL_CAN_RXMSG_FLAG.EDL)
-        is_remote_frame = bool(flags & xlapi.XL_CAN_RXMSG_FLAG.RTR)
-        dlc = xlapi.CANFD_GET_NUM_DATABYTES(msg.dlc, is_can_fd, is_remote_frame)
-        timestamp = xl_can_rx_event.timeStampSync * 1e-9
-        channel = xl_can_rx_event.channelIndex
+        if self.can_filter is not None and is_rx_frame:
+            mid = xl_can_rx_event.canRxOkMsg.canId
+            if not self.can_filter.accepts(
+                mid & 0x1FFFFFFF, bool(mid & _XL_CAN_EXT_MSG_ID)
+            ):
+                return None
 
-        return CanMessage(
-            is_can_fd=is_can_fd,
-            timestamp=timestamp + self._time_offset,
-            arbitration_id=mid & 0x1FFFFFFF,
-            is_extended_id=bool(mid & xlapi.XL_CAN_EXT_MSG_ID),
-            is_remote_frame=is_remote_frame,
-            is_error_frame=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.EF),
-            is_rx_frame=is_rx_frame,
-            bitrate_switch=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.BRS),
-            error_state_indicator=bool(flags & xlapi.XL_CAN_RXMSG_FLAG.ESI),
-            dlc=dlc,
-            data=msg.data[:dlc],
-        )
+        return CanFrame.from_xl_can_rx_event(xl_can_rx_event, self._time_offset, share)
 
     def reset(self):
             xlapi.xlDeactivateChannel(self.port, self.mask)
@@ -623,17 +2454,9 @@ class CanBus(object):
 
     @staticmethod
     def get_can_channels():
-        driver_config = xlapi.XLdriverConfig()
-        try:
-            xlapi.xlGetDriverConfig(driver_config)
-        except VectorError:
-            return []
-        channels = []
-        for i in range(driver_config.channelCount):
-            channel = driver_config.channel[i]
-            if xlapi.XL_BUS_ACTIVE_CAP.CAN|channel.channelBusCapabilities:
-                channels.append(channel)
-        return channels
+        # Looked up in the cached driver configuration (see xlconfig)
+        with driver_session:
+            return list(channel_registry.find(xlapi.XL_BUS_ACTIVE_CAP.CAN))
 
 if __name__ == "__main__":
     DEBUG = True
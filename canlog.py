@@ -0,0 +1,593 @@
+##############################################################################
+#                                                                            #
+# Module: canlog                                                             #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Logging of CanBus traffic. The XL events read from the driver are written  #
+# to disk unchanged (one header per file, then fixed size raw records), so   #
+# logging costs one memory copy per batch. The logs can be converted to ASC  #
+# and BLF afterwards.                                                        #
+#                                                                            #
+##############################################################################
+import ctypes
+import datetime
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import canlib
+import xlapi
+from canlib import CanFrame
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed for the trace index and TraceFile
+    np = None
+
+# File header: magic, version, event type, record size, time offset (the
+# record timestamps + time offset = perf_counter time), perf_counter and wall
+# clock time at the start of the file
+LOG_MAGIC = b"PYXLLOG\0"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<8sHHIddd")
+
+# Event types of the raw records
+LOG_XL_EVENT = 0 # XLevent (interface version V3)
+LOG_XL_CAN_RX_EVENT = 1 # XLcanRxEvent (interface version V4)
+
+_LOG_EVENT_CLASSES = {
+    LOG_XL_EVENT: xlapi.XLevent,
+    LOG_XL_CAN_RX_EVENT: xlapi.XLcanRxEvent,
+}
+
+# Sparse index of a log file (written next to it as <log file>.idx): one
+# entry per block of records with the block's time span and two 2048 bit
+# maps of the IDs in the block, one for std. IDs and one with a hash of
+# the ext. IDs (so the map may have false positives, but no misses)
+INDEX_MAGIC = b"PYXLIDX\0"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<8sHHI")
+if np:
+    INDEX_DTYPE = np.dtype([
+        ("first_record", np.uint64),
+        ("record_count", np.uint32),
+        ("min_timestamp", np.uint64),
+        ("max_timestamp", np.uint64),
+        ("std_ids", np.uint8, (256,)),
+        ("ext_ids", np.uint8, (256,)),
+    ])
+else:
+    INDEX_DTYPE = None
+
+def _log_event_dtype(event_type):
+    if event_type == LOG_XL_EVENT:
+        return canlib._XL_EVENT_DTYPE
+    return canlib._XL_CAN_RX_EVENT_DTYPE
+
+def _frame_mask(events, event_type):
+    if event_type == LOG_XL_EVENT:
+        return events["tag"] == xlapi.XL_EVENT_TAGS.RECEIVE_MSG
+    return (
+        (events["tag"] == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK) |
+        (events["tag"] == xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK)
+    )
+
+def _id_bits(can_ids):
+    # Bit of the raw IDs (XL_CAN_EXT_MSG_ID set for ext. IDs) in the ID maps
+    can_ids = can_ids & 0x1FFFFFFF
+    return (can_ids ^ (can_ids >> 11) ^ (can_ids >> 22)) & 0x7FF
+
+def _index_entries(events, event_type, first_record, block_records):
+    entries = np.zeros(-(-len(events) // block_records), dtype=INDEX_DTYPE)
+    is_frame = _frame_mask(events, event_type)
+    for i, entry in enumerate(entries):
+        block = events[i*block_records:(i+1)*block_records]
+        frame_ids = block["id"][is_frame[i*block_records:(i+1)*block_records]]
+        is_extended_id = (frame_ids & xlapi.XL_CAN_EXT_MSG_ID) != 0
+        std_ids, ext_ids = np.zeros(0x800, dtype=bool), np.zeros(0x800, dtype=bool)
+        std_ids[_id_bits(frame_ids[~is_extended_id])] = True
+        ext_ids[_id_bits(frame_ids[is_extended_id])] = True
+        entry["first_record"] = first_record + i * block_records
+        entry["record_count"] = len(block)
+        entry["min_timestamp"] = block["timestamp"].min()
+        entry["max_timestamp"] = block["timestamp"].max()
+        entry["std_ids"] = np.packbits(std_ids)
+        entry["ext_ids"] = np.packbits(ext_ids)
+    return entries
+
+class TraceIndexWriter(object):
+    # Builds the index of a log file while it is written
+    def __init__(self, filename, event_type, block_records=4096):
+        self.filename = filename
+        self.event_type = event_type
+        self.block_records = block_records
+        self.record_size = ctypes.sizeof(_LOG_EVENT_CLASSES[event_type])
+        self.record_count = 0
+        self._pending = bytearray()
+        self._file = open(filename, "wb")
+        self._file.write(INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, event_type, block_records
+        ))
+
+    def add(self, records):
+        self._pending += records
+        block_size = self.block_records * self.record_size
+        if len(self._pending) >= block_size:
+            size = len(self._pending) // block_size * block_size
+            self._write(self._pending[:size])
+            del self._pending[:size]
+
+    def _write(self, records):
+        events = np.frombuffer(records, dtype=_log_event_dtype(self.event_type))
+        entries = _index_entries(events, self.event_type, self.record_count, self.block_records)
+        self._file.write(entries.tobytes())
+        self.record_count += len(events)
+
+    def close(self):
+        if self._pending:
+            self._write(bytes(self._pending))
+            self._pending = bytearray()
+        self._file.close()
+
+class CanLogger(object):
+    # Logs all events the bus reads from the driver (by recv, recv_batch,
+    # the reader thread, ...). The records are collected in memory and
+    # written in chunks of buffer_size bytes by a writer thread, so disk
+    # latencies never stall the receive path. With max_bytes or max_seconds
+    # the log is rotated into numbered files (name_0000.xllog, ...).
+    def __init__(
+        self,
+        bus,
+        filename,
+        max_bytes=None,
+        max_seconds=None,
+        buffer_size=2**20,
+        flush_interval=1.0,
+        index=True,
+    ):
+        self.bus = bus
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        # The index of the log files is only written if numpy is available
+        self.index = index and np is not None
+        if bus.is_can_fd:
+            self.event_type = LOG_XL_CAN_RX_EVENT
+        else:
+            self.event_type = LOG_XL_EVENT
+        self.record_size = ctypes.sizeof(_LOG_EVENT_CLASSES[self.event_type])
+        self.filenames = []
+        self.record_count = 0
+        self.error = None
+        self._file = None
+        self._index = None
+        self._file_size = 0
+        self._file_end_time = None
+        self._buffer = bytearray()
+        self._flush_time = time.perf_counter() + flush_interval
+        self._chunks = queue.Queue()
+        self._open_file()
+        self._thread = threading.Thread(
+            target=self._run, name="CanLogger", daemon=True
+        )
+        self._thread.start()
+        bus.loggers.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def log_events(self, xl_events, event_count):
+        # Nothing is collected anymore after the writer thread failed
+        if self.error is not None:
+            return
+        size = event_count * self.record_size
+        self._buffer += ctypes.string_at(ctypes.addressof(xl_events), size)
+        self.record_count += event_count
+        if len(self._buffer) >= self.buffer_size or time.perf_counter() > self._flush_time:
+            self.flush()
+
+    def flush(self):
+        # Raises the error of the writer thread (e.g. disk full)
+        if self.error is not None:
+            self._buffer = bytearray()
+            raise self.error
+        if self._buffer:
+            self._chunks.put(bytes(self._buffer))
+            self._buffer = bytearray()
+        self._flush_time = time.perf_counter() + self.flush_interval
+
+    def close(self):
+        if self in self.bus.loggers:
+            self.bus.loggers.remove(self)
+        try:
+            self.flush()
+        finally:
+            self._chunks.put(None)
+            self._thread.join()
+        # The last chunks can still fail after the flush
+        if self.error is not None:
+            raise self.error
+
+    def _next_filename(self):
+        if self.max_bytes is None and self.max_seconds is None:
+            return self.filename
+        root, ext = os.path.splitext(self.filename)
+        return "{0}_{1:04d}{2}".format(root, len(self.filenames), ext)
+
+    def _open_file(self):
+        filename = self._next_filename()
+        self._file = open(filename, "wb")
+        self._file.write(LOG_HEADER.pack(
+            LOG_MAGIC,
+            LOG_VERSION,
+            self.event_type,
+            self.record_size,
+            self.bus._time_offset,
+            time.perf_counter(),
+            time.time(),
+        ))
+        self._file_size = LOG_HEADER.size
+        if self.max_seconds is not None:
+            self._file_end_time = time.perf_counter() + self.max_seconds
+        if self.index:
+            self._index = TraceIndexWriter(filename + ".idx", self.event_type)
+        self.filenames.append(filename)
+
+    def _close_file(self):
+        self._file.close()
+        if self._index is not None:
+            self._index.close()
+
+    def _rotate(self):
+        if self._file_size == LOG_HEADER.size:
+            return False
+        if self.max_bytes is not None and self._file_size + self.record_size > self.max_bytes:
+            return True
+        if self._file_end_time is not None and time.perf_counter() > self._file_end_time:
+            return True
+        return False
+
+    def _run(self):
+        try:
+            while True:
+                chunk = self._chunks.get()
+                if chunk is None:
+                    break
+                chunk = memoryview(chunk)
+                while chunk:
+                    if self._rotate():
+                        self._close_file()
+                        self._open_file()
+                    size = len(chunk)
+                    if self.max_bytes is not None:
+                        # Split at a record boundary to keep to max_bytes
+                        room = (self.max_bytes - self._file_size) // self.record_size
+                        size = min(size, max(room, 1) * self.record_size)
+                    self._file.write(chunk[:size])
+                    if self._index is not None:
+                        self._index.add(chunk[:size])
+                    self._file_size += size
+                    chunk = chunk[size:]
+        except Exception as error:
+            self.error = error
+            # Frees the chunks that can't be written anymore
+            try:
+                while True:
+                    self._chunks.get_nowait()
+            except queue.Empty:
+                pass
+        finally:
+            self._close_file()
+
+class LogReader(object):
+    # Reads one or more (rotated) log files and yields the logged frames as
+    # CanFrame objects, other events are skipped
+    def __init__(self, filenames, chunk_records=4096):
+        if isinstance(filenames, (str, bytes, os.PathLike)):
+            filenames = [filenames]
+        self.filenames = list(filenames)
+        self.chunk_records = chunk_records
+        self.start_time = None
+        self.start_perf_counter = None
+        with open(self.filenames[0], "rb") as file:
+            header = self._read_header(file)
+        self.event_type = header[2]
+        self.time_offset, self.start_perf_counter, self.start_time = header[4:7]
+
+    @staticmethod
+    def _read_header(file):
+        header = LOG_HEADER.unpack(file.read(LOG_HEADER.size))
+        if header[0] != LOG_MAGIC:
+            raise ValueError("{0} is no log file.".format(file.name))
+        if header[2] not in _LOG_EVENT_CLASSES:
+            raise ValueError("Unknown event type {0}.".format(header[2]))
+        return header
+
+    def __iter__(self):
+        for filename in self.filenames:
+            with open(filename, "rb") as file:
+                header = self._read_header(file)
+                event_type, record_size, time_offset = header[2:5]
+                xl_class = _LOG_EVENT_CLASSES[event_type]
+                if event_type == LOG_XL_EVENT:
+                    tag, decode = xlapi.XL_EVENT_TAGS.RECEIVE_MSG, CanFrame.from_xl_event
+                    is_frame = lambda xl_event: xl_event.tag == tag
+                else:
+                    tags = (
+                        xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK,
+                        xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK,
+                    )
+                    decode = CanFrame.from_xl_can_rx_event
+                    is_frame = lambda xl_event: xl_event.tag in tags
+                while True:
+                    chunk = file.read(record_size * self.chunk_records)
+                    record_count = len(chunk) // record_size
+                    if not record_count:
+                        break
+                    xl_events = (xl_class * record_count).from_buffer_copy(chunk)
+                    for xl_event in xl_events:
+                        if is_frame(xl_event):
+                            yield decode(xl_event, time_offset)
+
+class TraceFile(object):
+    # Memory maps a log file, so it can be searched without reading it. The
+    # records are a numpy array (fields tag, channel, timestamp, id, flags,
+    # dlc, data) straight on the file. With the index (loaded from the .idx
+    # file or built once) time windows are found by a binary search and ID
+    # searches only scan the blocks that contain the ID.
+    def __init__(self, filename, block_records=4096):
+        if np is None:
+            raise RuntimeError("Package numpy not installed.")
+        self.filename = filename
+        with open(filename, "rb") as file:
+            header = LogReader._read_header(file)
+        self.event_type, self.record_size = header[2:4]
+        self.time_offset, self.start_perf_counter, self.start_time = header[4:7]
+        dtype = _log_event_dtype(self.event_type)
+        record_count = (os.path.getsize(filename) - LOG_HEADER.size) // self.record_size
+        if record_count:
+            self.events = np.memmap(
+                filename, dtype=dtype, mode="r", offset=LOG_HEADER.size, shape=(record_count,)
+            )
+        else:
+            self.events = np.zeros(0, dtype=dtype)
+        self.index = self._load_index(filename + ".idx", block_records)
+
+    def __len__(self):
+        return len(self.events)
+
+    def _load_index(self, filename, block_records):
+        try:
+            with open(filename, "rb") as file:
+                magic, version, event_type, block_records = INDEX_HEADER.unpack(
+                    file.read(INDEX_HEADER.size)
+                )
+                index = np.frombuffer(file.read(), dtype=INDEX_DTYPE)
+            if magic == INDEX_MAGIC and event_type == self.event_type:
+                indexed = int(index["record_count"].sum())
+                if indexed == len(self.events):
+                    return index
+        except (OSError, struct.error):
+            pass
+        # No (complete) index, build it in memory
+        return _index_entries(self.events, self.event_type, 0, block_records)
+
+    def timestamps(self, events):
+        # Converts the raw timestamps of records to seconds (perf_counter time
+        # like CanFrame.timestamp)
+        return events["timestamp"] * 1e-9 + self.time_offset
+
+    def _raw_time(self, timestamp):
+        return max(0, int(round((timestamp - self.time_offset) * 1e9)))
+
+    def window(self, start=None, stop=None):
+        # Zero copy view of the records with start <= timestamp < stop (in
+        # seconds like CanFrame.timestamp)
+        index = self.index
+        lo, hi = 0, len(self.events)
+        if start is not None:
+            raw_start = self._raw_time(start)
+            block = np.searchsorted(index["max_timestamp"], raw_start, side="left")
+            if block >= len(index):
+                return self.events[:0]
+            first = int(index["first_record"][block])
+            block_events = self.events[first:first+int(index["record_count"][block])]
+            lo = first + int(np.searchsorted(block_events["timestamp"], raw_start, side="left"))
+        if stop is not None:
+            raw_stop = self._raw_time(stop)
+            block = np.searchsorted(index["min_timestamp"], raw_stop, side="left") - 1
+            if block < 0:
+                return self.events[:0]
+            first = int(index["first_record"][block])
+            block_events = self.events[first:first+int(index["record_count"][block])]
+            hi = first + int(np.searchsorted(block_events["timestamp"], raw_stop, side="left"))
+        return self.events[lo:max(lo, hi)]
+
+    def find_id(self, can_id, is_extended_id=False, start=None, stop=None):
+        # Record numbers of the frames with the ID (optionally within a time
+        # window), only the blocks whose ID map contains the ID are scanned
+        index = self.index
+        raw_id = can_id | xlapi.XL_CAN_EXT_MSG_ID if is_extended_id else can_id
+        bit = int(_id_bits(np.uint32(raw_id)))
+        id_map = index["ext_ids"] if is_extended_id else index["std_ids"]
+        candidates = (id_map[:, bit >> 3] >> (7 - (bit & 7))) & 1 != 0
+        if start is not None:
+            candidates &= index["max_timestamp"] >= self._raw_time(start)
+        if stop is not None:
+            candidates &= index["min_timestamp"] < self._raw_time(stop)
+        records = []
+        for entry in index[candidates]:
+            first = int(entry["first_record"])
+            block = self.events[first:first+int(entry["record_count"])]
+            match = _frame_mask(block, self.event_type) & (block["id"] == raw_id)
+            if start is not None:
+                match &= block["timestamp"] >= self._raw_time(start)
+            if stop is not None:
+                match &= block["timestamp"] < self._raw_time(stop)
+            records.append(np.flatnonzero(match) + first)
+        if not records:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(records)
+
+    def select_id(self, can_id, is_extended_id=False, start=None, stop=None):
+        # The records of the ID (a copy of the matching records only)
+        return self.events[self.find_id(can_id, is_extended_id, start, stop)]
+
+def convert_to_asc(log_filenames, asc_filename):
+    # Writes the frames of the log files to a Vector ASC file (channels are
+    # 1 based, timestamps relative to the start of the first log file)
+    reader = LogReader(log_filenames)
+    start = reader.start_perf_counter
+    date = datetime.datetime.fromtimestamp(reader.start_time)
+    date_string = "{0}.{1:03d} {2}".format(
+        date.strftime("%a %b %d %I:%M:%S"), date.microsecond // 1000, date.strftime("%p %Y")
+    )
+    count = 0
+    with open(asc_filename, "w") as file:
+        file.write("date {0}\n".format(date_string))
+        file.write("base hex  timestamps absolute\n")
+        file.write("internal events logged\n")
+        file.write("Begin Triggerblock {0}\n".format(date_string))
+        file.write("{0:>11.6f} Start of measurement\n".format(0))
+        for frame in reader:
+            timestamp = frame.timestamp - start
+            can_id = "{0:X}{1}".format(frame.arbitration_id, "x" if frame.is_extended_id else "")
+            direction = "Rx" if frame.is_rx_frame else "Tx"
+            data = " ".join(["{0:02X}".format(x) for x in frame.data])
+            if frame.is_error_frame:
+                line = "{0:<2} ErrorFrame".format(frame.channel + 1)
+            elif frame.is_can_fd:
+                line = "CANFD {0:>3} {1:<4} {2:>8} {3:>32} {4} {5} {6:x} {7:>2} {8}".format(
+                    frame.channel + 1,
+                    direction,
+                    can_id,
+                    "",
+                    1 if frame.bitrate_switch else 0,
+                    1 if frame.error_state_indicator else 0,
+                    frame.dlc,
+                    len(frame.data),
+                    data,
+                )
+            elif frame.is_remote_frame:
+                line = "{0:<2} {1:<15} {2:<4} r {3:x}".format(
+                    frame.channel + 1, can_id, direction, frame.dlc
+                )
+            else:
+                line = "{0:<2} {1:<15} {2:<4} d {3:x} {4}".format(
+                    frame.channel + 1, can_id, direction, len(frame.data), data
+                )
+            file.write("{0:>11.6f} {1}\n".format(timestamp, line))
+            count += 1
+        file.write("End TriggerBlock\n")
+    return count
+
+# BLF (binary logging format) structures
+BLF_FILE_HEADER = struct.Struct("<4sLBBBBBBBBQQLL8H8H")
+BLF_FILE_HEADER_SIZE = 144
+BLF_OBJ_HEADER_BASE = struct.Struct("<4sHHLL")
+BLF_OBJ_HEADER_V1 = struct.Struct("<LHHQ")
+BLF_LOG_CONTAINER = struct.Struct("<H6xL4x")
+BLF_CAN_MSG = struct.Struct("<HBBL8s")
+BLF_CAN_FD_MSG = struct.Struct("<HBBLLBBB5x64s")
+BLF_CAN_MESSAGE = 1
+BLF_LOG_CONTAINER_TYPE = 10
+BLF_CAN_FD_MESSAGE = 100
+BLF_TIME_ONE_NANS = 2
+BLF_ZLIB_DEFLATE = 2
+BLF_CAN_MSG_EXT = 0x80000000
+BLF_DIR = 0x1
+BLF_REMOTE_FLAG = 0x80
+BLF_EDL = 0x1
+BLF_BRS = 0x2
+BLF_ESI = 0x4
+
+def _systemtime(timestamp):
+    date = datetime.datetime.fromtimestamp(timestamp)
+    return (
+        date.year, date.month, date.isoweekday() % 7, date.day,
+        date.hour, date.minute, date.second, date.microsecond // 1000,
+    )
+
+def convert_to_blf(log_filenames, blf_filename, container_size=128*1024, compression_level=6):
+    # Writes the frames of the log files to a Vector BLF file (CAN_MESSAGE
+    # and CAN_FD_MESSAGE objects in zlib compressed log containers)
+    reader = LogReader(log_filenames)
+    start = reader.start_perf_counter
+    stop_time = reader.start_time
+    object_count = 0
+    uncompressed_size = BLF_FILE_HEADER_SIZE
+    container = bytearray()
+
+    def write_container(file, data):
+        compressed = zlib.compress(data, compression_level)
+        size = BLF_OBJ_HEADER_BASE.size + BLF_LOG_CONTAINER.size + len(compressed)
+        file.write(BLF_OBJ_HEADER_BASE.pack(
+            b"LOBJ", BLF_OBJ_HEADER_BASE.size, 1, size, BLF_LOG_CONTAINER_TYPE
+        ))
+        file.write(BLF_LOG_CONTAINER.pack(BLF_ZLIB_DEFLATE, len(data)))
+        file.write(compressed)
+        file.write(b"\0" * (size % 4))
+        return BLF_OBJ_HEADER_BASE.size + BLF_LOG_CONTAINER.size + len(data)
+
+    def write_header(file, file_size):
+        file.write(BLF_FILE_HEADER.pack(
+            b"LOGG", BLF_FILE_HEADER_SIZE, 0, 0, 0, 0, 2, 6, 8, 1,
+            file_size, uncompressed_size, object_count, 0,
+            *(_systemtime(reader.start_time) + _systemtime(stop_time))
+        ))
+        file.write(b"\0" * (BLF_FILE_HEADER_SIZE - BLF_FILE_HEADER.size))
+
+    with open(blf_filename, "wb") as file:
+        write_header(file, 0)
+        for frame in reader:
+            arbitration_id = frame.arbitration_id
+            if frame.is_extended_id:
+                arbitration_id |= BLF_CAN_MSG_EXT
+            flags = 0 if frame.is_rx_frame else BLF_DIR
+            if frame.is_can_fd:
+                fd_flags = BLF_EDL
+                if frame.bitrate_switch:
+                    fd_flags |= BLF_BRS
+                if frame.error_state_indicator:
+                    fd_flags |= BLF_ESI
+                data = BLF_CAN_FD_MSG.pack(
+                    frame.channel + 1, flags, frame.dlc, arbitration_id, 0, 0,
+                    fd_flags, len(frame.data), bytes(frame.data)
+                )
+                object_type = BLF_CAN_FD_MESSAGE
+            else:
+                if frame.is_remote_frame:
+                    flags |= BLF_REMOTE_FLAG
+                data = BLF_CAN_MSG.pack(
+                    frame.channel + 1, flags, frame.dlc, arbitration_id, bytes(frame.data)
+                )
+                object_type = BLF_CAN_MESSAGE
+            timestamp = max(0, int((frame.timestamp - start) * 1e9))
+            header_size = BLF_OBJ_HEADER_BASE.size + BLF_OBJ_HEADER_V1.size
+            container += BLF_OBJ_HEADER_BASE.pack(
+                b"LOBJ", header_size, 1, header_size + len(data), object_type
+            )
+            container += BLF_OBJ_HEADER_V1.pack(BLF_TIME_ONE_NANS, 0, 0, timestamp)
+            container += data
+            container += b"\0" * (len(data) % 4)
+            object_count += 1
+            if len(container) >= container_size:
+                uncompressed_size += write_container(file, bytes(container[:container_size]))
+                del container[:container_size]
+        if object_count:
+            stop_time = reader.start_time + (frame.timestamp - start)
+        if container:
+            uncompressed_size += write_container(file, bytes(container))
+        file_size = file.tell()
+        file.seek(0)
+        write_header(file, file_size)
+    return object_count
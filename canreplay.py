@@ -0,0 +1,228 @@
+##############################################################################
+#                                                                            #
+# Module: canreplay                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Replays recorded CAN traffic with its original timing. The XL transmit     #
+# events are built before the replay starts, while replaying all frames      #
+# that are due are sent in bursts with one transmit call per channel.        #
+#                                                                            #
+##############################################################################
+import bisect
+import ctypes
+import math
+import os
+import threading
+import time
+
+import canlog
+import xlapi
+
+class ReplayReport(object):
+    # Timing error of a replay: send time - scheduled time of the frames
+    def __init__(self):
+        self.frame_count = 0
+        self.burst_count = 0
+        self.skipped_count = 0
+        # Frames the transmit queue had no room for within tx_timeout
+        self.unsent_count = 0
+        self.duration = 0.0
+        self.scheduled_duration = 0.0
+        self.error_sum = 0.0
+        self.min_error = math.inf
+        self.max_error = -math.inf
+        self.burst_errors = []
+
+    def add_burst(self, send_time, times, first, last):
+        count = last - first
+        self.frame_count += count
+        self.burst_count += 1
+        self.error_sum += count * send_time - math.fsum(times[first:last])
+        # The first frame of the burst waited longest, the last one the least
+        self.max_error = max(self.max_error, send_time - times[first])
+        self.min_error = min(self.min_error, send_time - times[last-1])
+        self.burst_errors.append(send_time - times[first])
+
+    @property
+    def mean_error(self):
+        return self.error_sum / self.frame_count if self.frame_count else 0.0
+
+    def percentile(self, percent):
+        # Percentile of the error of the first (most delayed) frame per burst
+        if not self.burst_errors:
+            return 0.0
+        errors = sorted(self.burst_errors)
+        return errors[min(len(errors) - 1, int(len(errors) * percent / 100.0))]
+
+    def __str__(self):
+        return "\n".join([
+            "Replay Report:",
+            "  Frames: {0}".format(self.frame_count),
+            "  Bursts: {0}".format(self.burst_count),
+            "  Skipped Frames: {0}".format(self.skipped_count),
+            "  Unsent Frames: {0}".format(self.unsent_count),
+            "  Duration: {0:.6f} s (scheduled {1:.6f} s)".format(
+                self.duration, self.scheduled_duration
+            ),
+            "  Mean Error: {0:.1f} us".format(self.mean_error * 1e6),
+            "  Min/Max Error: {0:.1f} / {1:.1f} us".format(
+                (self.min_error if self.frame_count else 0.0) * 1e6,
+                (self.max_error if self.frame_count else 0.0) * 1e6,
+            ),
+            "  99% Burst Error: {0:.1f} us".format(self.percentile(99) * 1e6),
+        ])
+
+class _ChannelTrack(object):
+    # The prebuilt frames of the trace for one access mask
+    def __init__(self, mask, xl_class, xl_events):
+        self.mask = mask
+        self.times = []
+        self.xl_class = xl_class
+        self.xl_events = (xl_class * len(xl_events))(*xl_events)
+        self.next = 0
+
+class CanReplay(object):
+    # Replays a trace (CanMessage/CanFrame iterable, LogReader or log file) on
+    # a bus. Frames are sent on their channel (remapped by channel_map) or
+    # on all channels if the bus doesn't have it. speed scales the timing
+    # (2.0: twice as fast), loop is the number of times the trace is played
+    # (True: until stopped, False: once). A list of log files (e.g. rotated
+    # logs) is read as one trace.
+    # Frames due within the next burst_interval are sent together. A burst
+    # waits at most tx_timeout for room in the transmit queue (e.g. bus off),
+    # the frames that didn't fit are dropped and counted as unsent.
+    def __init__(
+        self,
+        bus,
+        trace,
+        speed=1.0,
+        loop=False,
+        channel_map=None,
+        burst_interval=0.001,
+        spin_time=0.0005,
+        only_rx_frames=False,
+        tx_timeout=0.005,
+    ):
+        if speed <= 0:
+            raise ValueError("Speed must be greater than 0.")
+        self.bus = bus
+        self.speed = speed
+        self.loop = loop
+        self.channel_map = channel_map or {}
+        self.burst_interval = burst_interval
+        self.spin_time = spin_time
+        self.tx_timeout = tx_timeout
+        self.report = ReplayReport()
+        self._running = False
+        self._thread = None
+        if isinstance(trace, (str, bytes, os.PathLike)):
+            trace = canlog.LogReader(trace)
+        elif isinstance(trace, (list, tuple)) and trace and all(
+            isinstance(filename, (str, bytes, os.PathLike)) for filename in trace
+        ):
+            trace = canlog.LogReader(list(trace))
+        self._build(trace, only_rx_frames)
+
+    def _channel_mask(self, channel):
+        channel = self.channel_map.get(channel, channel)
+        return self.bus.channel_masks.get(channel, self.bus.mask)
+
+    def _build(self, trace, only_rx_frames):
+        is_can_fd = self.bus.is_can_fd
+        xl_class = xlapi.XLcanTxEvent if is_can_fd else xlapi.XLevent
+        tracks, first_time, skipped = {}, None, 0
+        for msg in trace:
+            if msg.is_error_frame or only_rx_frames and not msg.is_rx_frame:
+                continue
+            if msg.is_can_fd and not is_can_fd:
+                skipped += 1
+                continue
+            if first_time is None:
+                first_time = msg.timestamp
+            mask = self._channel_mask(getattr(msg, "channel", None))
+            times, xl_events = tracks.setdefault(mask, ([], []))
+            times.append((msg.timestamp - first_time) / self.speed)
+            xl_events.append(msg.build_xl_class(build_fd=is_can_fd))
+        self.report.skipped_count = skipped
+        self.tracks = []
+        for mask, (times, xl_events) in tracks.items():
+            track = _ChannelTrack(mask, xl_class, xl_events)
+            track.times = times
+            self.tracks.append(track)
+        self.duration = max([track.times[-1] for track in self.tracks] or [0.0])
+        self.frame_count = sum([len(track.times) for track in self.tracks])
+
+    def start(self):
+        # Replays in a background thread
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CanReplay", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self.wait()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+        return self.report
+
+    @property
+    def is_running(self):
+        return self._running
+
+    def run(self):
+        # Replays in the calling thread and returns the ReplayReport
+        self._running = True
+        self._run()
+        return self.report
+
+    def _run(self):
+        report = self.report = ReplayReport()
+        start_time = time.perf_counter()
+        period = self.duration + self.burst_interval
+        repetition = 0
+        try:
+            while self._running:
+                self._replay_once(start_time + repetition * period, report)
+                repetition += 1
+                if self.loop is not True and repetition >= int(self.loop):
+                    break
+        finally:
+            self._running = False
+            report.duration = time.perf_counter() - start_time
+            report.scheduled_duration = repetition * period - self.burst_interval
+
+    def _replay_once(self, start_time, report):
+        for track in self.tracks:
+            track.next = 0
+        tracks = [track for track in self.tracks if track.times]
+        while tracks and self._running:
+            # Wait for the next frame (sleep, then spin for the last bit)
+            due = start_time + min([track.times[track.next] for track in tracks])
+            time_left = due - time.perf_counter()
+            if time_left > self.spin_time:
+                time.sleep(time_left - self.spin_time)
+            while time.perf_counter() < due:
+                pass
+            now = time.perf_counter()
+            elapsed = now - start_time + self.burst_interval
+            for track in tracks:
+                first = track.next
+                last = bisect.bisect_right(track.times, elapsed, first)
+                if last == first:
+                    continue
+                burst = (track.xl_class * (last - first)).from_buffer(
+                    track.xl_events, first * ctypes.sizeof(track.xl_class)
+                )
+                send_time = time.perf_counter() - start_time
+                sent = self.bus._transmit_events(burst, last - first, self.tx_timeout, track.mask)
+                if sent:
+                    report.add_burst(send_time, track.times, first, first + sent)
+                report.unsent_count += last - first - sent
+                track.next = last
+            tracks = [track for track in tracks if track.next < len(track.times)]
@@ -0,0 +1,593 @@
+##############################################################################
+#                                                                            #
+# Module: canstats                                                           #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Timing and load statistics of a CanBus. Sent frames are matched with their #
+# TX receipts to measure the time from the transmit call until the frame was #
+# on the wire. Bus load, error and chip state statistics are computed from   #
+# the raw received events in sliding windows.                                #
+#                                                                            #
+##############################################################################
+import collections
+import ctypes
+import math
+import threading
+import time
+
+import xlapi
+
+_XL_RECEIVE_MSG = int(xlapi.XL_EVENT_TAGS.RECEIVE_MSG)
+_XL_CHIP_STATE = int(xlapi.XL_EVENT_TAGS.CHIP_STATE)
+_XL_CAN_EV_TAG_RX_OK = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK)
+_XL_CAN_EV_TAG_TX_OK = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK)
+_XL_CAN_EV_TAG_RX_ERROR = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_RX_ERROR)
+_XL_CAN_EV_TAG_TX_ERROR = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_ERROR)
+_XL_CAN_EV_TAG_CHIP_STATE = int(xlapi.XL_EVENT_TAGS.CAN_EV_TAG_CHIP_STATE)
+_XL_CAN_EXT_MSG_ID = int(xlapi.XL_CAN_EXT_MSG_ID)
+_XL_CAN_MSG_FLAG_REMOTE_FRAME = int(xlapi.XL_CAN_MSG_FLAG.REMOTE_FRAME)
+_XL_CAN_MSG_FLAG_ERROR_FRAME = int(xlapi.XL_CAN_MSG_FLAG.ERROR_FRAME)
+_XL_CAN_MSG_FLAG_TX_COMPLETED = int(xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED)
+_XL_CAN_RXMSG_FLAG_EDL = int(xlapi.XL_CAN_RXMSG_FLAG.EDL)
+_XL_CAN_RXMSG_FLAG_BRS = int(xlapi.XL_CAN_RXMSG_FLAG.BRS)
+_XL_CAN_RXMSG_FLAG_RTR = int(xlapi.XL_CAN_RXMSG_FLAG.RTR)
+_XL_CAN_RXMSG_FLAG_EF = int(xlapi.XL_CAN_RXMSG_FLAG.EF)
+_XL_EVENT_FLAG_OVERRUN = int(xlapi.XL_EVENT_FLAG_OVERRUN)
+_XL_CAN_QUEUE_OVERFLOW = int(xlapi.XL_CAN_QUEUE_OVERFLOW)
+_CAN_FD_DLC_BYTES = (0, 1, 2, 3, 4, 5, 6, 7, 8, 12, 16, 20, 24, 32, 48, 64)
+
+class Histogram(object):
+    # Histogram with bin_count bins of bin_width seconds, values outside of
+    # them end up in the first or the last (overflow) bin
+    def __init__(self, bin_width=10e-6, bin_count=1000):
+        self.bin_width = bin_width
+        self.bin_count = bin_count
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (self.bin_count + 1)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        index = int(value / self.bin_width)
+        if index < 0:
+            index = 0
+        elif index > self.bin_count:
+            index = self.bin_count
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def percentile(self, percent):
+        # Upper edge of the bin that holds the percentile (max for overflows)
+        if not self.count:
+            return 0.0
+        limit = self.count * percent / 100.0
+        total = 0
+        for index, count in enumerate(self.counts):
+            total += count
+            if total >= limit:
+                break
+        if index == self.bin_count:
+            return self.max
+        return min((index + 1) * self.bin_width, self.max)
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "mean": self.mean,
+            "std": self.std,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+    def __str__(self):
+        return (
+            "n={count} mean={0:.1f}us std={1:.1f}us min={2:.1f}us "
+            "p50={3:.1f}us p99={4:.1f}us max={5:.1f}us"
+        ).format(
+            *[self.summary()[key] * 1e6 for key in ("mean", "std", "min", "p50", "p99", "max")],
+            count=self.count
+        )
+
+class TxLatencyTracker(object):
+    # Matches the frames sent on a bus with their TX receipts (the bus needs
+    # recv_own_messages=True) and collects per frame:
+    #   latency:  transmit call -> receipt timestamp (host to wire)
+    #   queueing: time the frame waited for earlier frames of its channel
+    # The driver keeps transId/userHandle for internal use and doesn't echo
+    # them, but receipts come back in transmit order per channel, so a frame
+    # is matched with the oldest pending send of its channel and ID.
+    def __init__(self, bus, bin_width=10e-6, bin_count=1000, max_pending=4096, per_id=False):
+        if not bus.recv_own_messages:
+            raise ValueError("TX receipts are not enabled (recv_own_messages).")
+        self.bus = bus
+        self.bin_width = bin_width
+        self.bin_count = bin_count
+        self.max_pending = max_pending
+        self.per_id = per_id
+        self.latency = Histogram(bin_width, bin_count)
+        self.queueing = Histogram(bin_width, bin_count)
+        self.id_latency = {}
+        self.sent_count = 0
+        self.matched_count = 0
+        # Sent frames whose receipt never arrived (dropped after max_pending)
+        self.lost_count = 0
+        # Receipts without a matching send (e.g. sent by another port)
+        self.unmatched_count = 0
+        self._pending = {}
+        self._last_wire_time = {}
+        self._mask_channels = {}
+        self._lock = threading.Lock()
+        if bus.is_can_fd:
+            self._event_class = xlapi.XLcanRxEvent
+        else:
+            self._event_class = xlapi.XLevent
+        # Receipts are picked up like a logger, sends are reported by the bus
+        bus.loggers.append(self)
+        bus.tx_tracker = self
+
+    def close(self):
+        if self in self.bus.loggers:
+            self.bus.loggers.remove(self)
+        if self.bus.tx_tracker is self:
+            self.bus.tx_tracker = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def reset(self):
+        with self._lock:
+            self.latency.reset()
+            self.queueing.reset()
+            self.id_latency = {}
+            self.sent_count = self.matched_count = 0
+            self.lost_count = self.unmatched_count = 0
+            self._pending = {}
+            self._last_wire_time = {}
+
+    def _channels(self, mask):
+        channels = self._mask_channels.get(mask)
+        if channels is None:
+            channels = self._mask_channels[mask] = [
+                index for index, channel_mask in self.bus.channel_masks.items()
+                if channel_mask & mask
+            ]
+        return channels
+
+    def add_sent(self, xl_events, event_count, mask, send_time):
+        # Called by the bus with the XLevent/XLcanTxEvent array right before
+        # the transmit call (the receipt may be read by another thread before
+        # the call returns), send_time is the perf_counter before it
+        channels = self._channels(mask)
+        with self._lock:
+            pending = self._pending
+            for i in range(event_count):
+                xl_event = xl_events[i]
+                if self.bus.is_can_fd:
+                    can_id = xl_event.canMsg.canId
+                else:
+                    can_id = xl_event.msg.id
+                for channel in channels:
+                    sends = pending.get((channel, can_id))
+                    if sends is None:
+                        sends = pending[(channel, can_id)] = collections.deque()
+                    elif len(sends) >= self.max_pending:
+                        sends.popleft()
+                        self.lost_count += 1
+                    sends.append(send_time)
+            self.sent_count += event_count * len(channels)
+
+    def remove_unsent(self, xl_events, first, last, mask, send_time):
+        # Takes back the sends of xl_events[first:last] the driver didn't
+        # queue, they are the newest pending sends with send_time of their
+        # channel and ID
+        channels = self._channels(mask)
+        with self._lock:
+            pending = self._pending
+            for i in range(last - 1, first - 1, -1):
+                xl_event = xl_events[i]
+                if self.bus.is_can_fd:
+                    can_id = xl_event.canMsg.canId
+                else:
+                    can_id = xl_event.msg.id
+                for channel in channels:
+                    sends = pending.get((channel, can_id), ())
+                    for j in range(len(sends) - 1, -1, -1):
+                        if sends[j] == send_time:
+                            del sends[j]
+                            break
+            self.sent_count -= (last - first) * len(channels)
+
+    def log_events(self, xl_events, event_count):
+        # Called by the bus with every batch of events read from the driver
+        xl_events = (self._event_class * event_count).from_address(
+            ctypes.addressof(xl_events)
+        )
+        time_offset = self.bus._time_offset
+        with self._lock:
+            for xl_event in xl_events:
+                if self.bus.is_can_fd:
+                    if xl_event.tag != xlapi.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK:
+                        continue
+                    can_id = xl_event.canTxOkMsg.canId
+                    channel = xl_event.channelIndex
+                    wire_time = xl_event.timeStampSync * 1e-9 + time_offset
+                else:
+                    if (xl_event.tag != xlapi.XL_EVENT_TAGS.RECEIVE_MSG
+                        or not xl_event.msg.flags & xlapi.XL_CAN_MSG_FLAG.TX_COMPLETED
+                    ):
+                        continue
+                    can_id = xl_event.msg.id
+                    channel = xl_event.chanIndex
+                    wire_time = xl_event.timeStamp * 1e-9 + time_offset
+                self._match(channel, can_id, wire_time)
+
+    def _match(self, channel, can_id, wire_time):
+        sends = self._pending.get((channel, can_id))
+        if not sends:
+            self.unmatched_count += 1
+            return
+        send_time = sends.popleft()
+        latency = wire_time - send_time
+        last_wire_time = self._last_wire_time.get(channel, send_time)
+        self._last_wire_time[channel] = wire_time
+        self.matched_count += 1
+        self.latency.add(latency)
+        self.queueing.add(max(0.0, last_wire_time - send_time))
+        if self.per_id:
+            histogram = self.id_latency.get(can_id)
+            if histogram is None:
+                histogram = self.id_latency[can_id] = Histogram(self.bin_width, self.bin_count)
+            histogram.add(latency)
+
+    @property
+    def pending_count(self):
+        return sum([len(sends) for sends in self._pending.values()])
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                "sent": self.sent_count,
+                "matched": self.matched_count,
+                "pending": self.pending_count,
+                "lost": self.lost_count,
+                "unmatched": self.unmatched_count,
+                "latency": self.latency.summary(),
+                "queueing": self.queueing.summary(),
+            }
+            if self.per_id:
+                stats["id_latency"] = {
+                    can_id: histogram.summary()
+                    for can_id, histogram in self.id_latency.items()
+                }
+        return stats
+
+    def __str__(self):
+        return "\n".join([
+            "TX Latency:",
+            "  Sent: {0} Matched: {1} Pending: {2} Lost: {3} Unmatched: {4}".format(
+                self.sent_count, self.matched_count, self.pending_count,
+                self.lost_count, self.unmatched_count,
+            ),
+            "  Latency:  {0}".format(self.latency),
+            "  Queueing: {0}".format(self.queueing),
+        ])
+
+def frame_bits(is_extended_id, length, is_can_fd=False, bitrate_switch=False):
+    # Worst case number of bits (with stuff bits) of a frame incl. the
+    # interframe space, returned as (arbitration phase, data phase) bits.
+    # CAN: 34/54 bits (std/ext) subject to stuffing + 8 per data byte, then
+    # 13 bits CRC delimiter, ACK, EOF and IFS (Tindell's formula).
+    if not is_can_fd:
+        stuffed = (54 if is_extended_id else 34) + 8 * length
+        return stuffed + 13 + (stuffed - 1) // 4, 0
+    # CAN FD: SOF up to BRS in the arbitration phase, ESI up to the CRC in the
+    # data phase (stuff count and fixed stuff bits of the CRC field included)
+    arbitration = 36 if is_extended_id else 17
+    crc = 17 if length <= 16 else 21
+    data = 1 + 4 + 8 * length
+    data += data // 4 + 4 + crc + (crc + 3) // 4
+    arbitration += arbitration // 4 + 13
+    if bitrate_switch:
+        return arbitration, data
+    return arbitration + data, 0
+
+class _ChannelWindow(object):
+    # Per channel counters of the last slot_count time slots plus totals
+    def __init__(self, slot_count):
+        self.slot_count = slot_count
+        self.slots = [-1] * slot_count
+        self.frames = [0] * slot_count
+        self.bits = [0] * slot_count
+        self.busy_time = [0.0] * slot_count
+        self.errors = [0] * slot_count
+        self.error_codes = [collections.Counter() for i in range(slot_count)]
+        self.frame_count = 0
+        self.rx_count = 0
+        self.tx_count = 0
+        self.bit_count = 0
+        self.error_count = 0
+        self.error_code_counts = collections.Counter()
+        self.overrun_count = 0
+        self.chip_state = None
+
+    def _slot(self, slot):
+        index = slot % self.slot_count
+        if self.slots[index] != slot:
+            self.slots[index] = slot
+            self.frames[index] = self.bits[index] = self.errors[index] = 0
+            self.busy_time[index] = 0.0
+            self.error_codes[index].clear()
+        return index
+
+    def add_frame(self, slot, bits, busy_time, is_rx_frame):
+        index = self._slot(slot)
+        self.frames[index] += 1
+        self.bits[index] += bits
+        self.busy_time[index] += busy_time
+        self.frame_count += 1
+        self.bit_count += bits
+        if is_rx_frame:
+            self.rx_count += 1
+        else:
+            self.tx_count += 1
+
+    def add_error(self, slot, error_code):
+        index = self._slot(slot)
+        self.errors[index] += 1
+        self.error_codes[index][error_code] += 1
+        self.error_count += 1
+        self.error_code_counts[error_code] += 1
+
+    def window(self, slot):
+        # Sums of the slots that are part of the window ending with slot
+        frames, bits, busy_time, errors = 0, 0, 0.0, 0
+        error_codes = collections.Counter()
+        for index in range(self.slot_count):
+            if slot - self.slot_count < self.slots[index] <= slot:
+                frames += self.frames[index]
+                bits += self.bits[index]
+                busy_time += self.busy_time[index]
+                errors += self.errors[index]
+                error_codes.update(self.error_codes[index])
+        return frames, bits, busy_time, errors, error_codes
+
+def _error_name(error_code):
+    if error_code is None:
+        return "ERROR_FRAME"
+    try:
+        return xlapi.XL_CAN_ERRC(error_code).name
+    except ValueError:
+        return str(error_code)
+
+class BusStatistics(object):
+    # Live per channel statistics of a bus: frames/s, bits/s and bus load,
+    # error frames by XL_CAN_ERRC code, receive queue overruns and the last
+    # chip state (see request_chip_state). Computed incrementally from every
+    # event read from the driver (registered like a logger) in a sliding
+    # window of window seconds that moves in slot_count steps. The frame
+    # timing is estimated from the bitrates of the bus (worst case stuffing),
+    # totalBitCnt of CAN FD events is used instead if the hardware sets it.
+    # Buses without bus_params need the bitrates (default: 500 kbit/s for
+    # both phases).
+    # Own frames are only seen with TX receipts (recv_own_messages).
+    def __init__(self, bus, window=1.0, slot_count=10, bitrate=None, data_bitrate=None):
+        self.bus = bus
+        self.window_time = window
+        self.slot_count = slot_count
+        self.slot_time = window / slot_count
+        bus_params = bus.bus_params
+        if bitrate is None:
+            bitrate = getattr(bus_params, "bitrate", None) or 500000
+        if data_bitrate is None:
+            data_bitrate = getattr(bus_params, "bitrate_dbr", None) or bitrate
+        self.bitrate = bitrate
+        self.data_bitrate = data_bitrate
+        self.channels = {}
+        self._lock = threading.Lock()
+        if bus.is_can_fd:
+            self._event_class = xlapi.XLcanRxEvent
+        else:
+            self._event_class = xlapi.XLevent
+        bus.loggers.append(self)
+
+    def close(self):
+        if self in self.bus.loggers:
+            self.bus.loggers.remove(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def reset(self):
+        with self._lock:
+            self.channels = {}
+
+    def request_chip_state(self):
+        # The driver answers with a chip state event per channel, it is picked
+        # up with the next events that are read from the bus
+        xlapi.xlCanRequestChipState(self.bus.port, self.bus.mask)
+
+    def _channel(self, channel):
+        window = self.channels.get(channel)
+        if window is None:
+            window = self.channels[channel] = _ChannelWindow(self.slot_count)
+        return window
+
+    def _frame(self, window, slot, can_id, length, is_can_fd, bitrate_switch, is_rx_frame, total_bits):
+        arbitration_bits, data_bits = frame_bits(
+            can_id & _XL_CAN_EXT_MSG_ID, length, is_can_fd, bitrate_switch
+        )
+        bits = arbitration_bits + data_bits
+        busy_time = arbitration_bits / self.bitrate + data_bits / self.data_bitrate
+        if total_bits:
+            # Measured by the hardware, split between the phases like the estimate
+            busy_time *= total_bits / bits
+            bits = total_bits
+        window.add_frame(slot, bits, busy_time, is_rx_frame)
+
+    def log_events(self, xl_events, event_count):
+        # Called by the bus with every batch of events read from the driver
+        xl_events = (self._event_class * event_count).from_address(
+            ctypes.addressof(xl_events)
+        )
+        slot_time = self.slot_time
+        with self._lock:
+            if self._event_class is xlapi.XLcanRxEvent:
+                for xl_event in xl_events:
+                    tag = xl_event.tag
+                    window = self._channel(xl_event.channelIndex)
+                    slot = int(xl_event.timeStampSync * 1e-9 / slot_time)
+                    if xl_event.flagsChip & _XL_CAN_QUEUE_OVERFLOW:
+                        window.overrun_count += 1
+                    if tag == _XL_CAN_EV_TAG_RX_OK or tag == _XL_CAN_EV_TAG_TX_OK:
+                        # canRxOkMsg and canTxOkMsg share the same layout
+                        msg = xl_event.canRxOkMsg
+                        flags = msg.msgFlags
+                        if flags & _XL_CAN_RXMSG_FLAG_EF:
+                            window.add_error(slot, None)
+                            continue
+                        is_can_fd = flags & _XL_CAN_RXMSG_FLAG_EDL
+                        if flags & _XL_CAN_RXMSG_FLAG_RTR:
+                            length = 0
+                        elif is_can_fd:
+                            length = _CAN_FD_DLC_BYTES[msg.dlc & 0xF]
+                        else:
+                            length = min(msg.dlc, 8)
+                        self._frame(
+                            window, slot, msg.canId, length, is_can_fd,
+                            flags & _XL_CAN_RXMSG_FLAG_BRS, tag == _XL_CAN_EV_TAG_RX_OK,
+                            msg.totalBitCnt,
+                        )
+                    elif tag == _XL_CAN_EV_TAG_RX_ERROR or tag == _XL_CAN_EV_TAG_TX_ERROR:
+                        window.add_error(slot, xl_event.canError.errorCode)
+                    elif tag == _XL_CAN_EV_TAG_CHIP_STATE:
+                        chip_state = xl_event.canChipState
+                        window.chip_state = (
+                            xl_event.timeStampSync * 1e-9 + self.bus._time_offset,
+                            chip_state.busStatus,
+                            chip_state.txErrorCounter,
+                            chip_state.rxErrorCounter,
+                        )
+            else:
+                for xl_event in xl_events:
+                    tag = xl_event.tag
+                    window = self._channel(xl_event.chanIndex)
+                    slot = int(xl_event.timeStamp * 1e-9 / slot_time)
+                    if xl_event.flags & _XL_EVENT_FLAG_OVERRUN:
+                        window.overrun_count += 1
+                    if tag == _XL_RECEIVE_MSG:
+                        msg = xl_event.msg
+                        flags = msg.flags
+                        if flags & _XL_CAN_MSG_FLAG_ERROR_FRAME:
+                            # The CAN interface doesn't report the error code
+                            window.add_error(slot, None)
+                            continue
+                        length = 0 if flags & _XL_CAN_MSG_FLAG_REMOTE_FRAME else min(msg.dlc, 8)
+                        self._frame(
+                            window, slot, msg.id, length, False, False,
+                            not flags & _XL_CAN_MSG_FLAG_TX_COMPLETED, 0,
+                        )
+                    elif tag == _XL_CHIP_STATE:
+                        chip_state = xl_event.chipState
+                        window.chip_state = (
+                            xl_event.timeStamp * 1e-9 + self.bus._time_offset,
+                            chip_state.busStatus,
+                            chip_state.txErrorCounter,
+                            chip_state.rxErrorCounter,
+                        )
+
+    def stats(self, channel=None):
+        # Statistics of all channels ({channel index: stats}) or one channel
+        if channel is not None:
+            return self.stats().get(channel)
+        # Window end in driver time, so the rates drop when the bus goes quiet
+        now = time.perf_counter() - self.bus._time_offset
+        slot = int(now / self.slot_time)
+        elapsed = (self.slot_count - 1) * self.slot_time + (now - slot * self.slot_time)
+        stats = {}
+        with self._lock:
+            for index, window in self.channels.items():
+                frames, bits, busy_time, errors, error_codes = window.window(slot)
+                chip_state = None
+                if window.chip_state is not None:
+                    timestamp, bus_status, tx_error_counter, rx_error_counter = window.chip_state
+                    try:
+                        bus_status = xlapi.XL_CHIPSTAT(bus_status).name
+                    except ValueError:
+                        pass
+                    chip_state = {
+                        "timestamp": timestamp,
+                        "bus_status": bus_status,
+                        "tx_error_counter": tx_error_counter,
+                        "rx_error_counter": rx_error_counter,
+                    }
+                stats[index] = {
+                    "frames_per_s": frames / elapsed,
+                    "bits_per_s": bits / elapsed,
+                    "bus_load": busy_time / elapsed,
+                    "errors_per_s": errors / elapsed,
+                    "window_frames": frames,
+                    "window_errors": errors,
+                    "window_error_codes": {
+                        _error_name(code): count for code, count in error_codes.items()
+                    },
+                    "frames": window.frame_count,
+                    "rx_frames": window.rx_count,
+                    "tx_frames": window.tx_count,
+                    "bits": window.bit_count,
+                    "errors": window.error_count,
+                    "error_codes": {
+                        _error_name(code): count
+                        for code, count in window.error_code_counts.items()
+                    },
+                    "overruns": window.overrun_count,
+                    "chip_state": chip_state,
+                }
+        return stats
+
+    def __str__(self):
+        lines = ["Bus Statistics:"]
+        for index, stats in sorted(self.stats().items()):
+            lines.append(
+                "  Channel {0}: {1:.0f} frames/s {2:.0f} bit/s load {3:.1%} "
+                "errors {4} (total) overruns {5}".format(
+                    index, stats["frames_per_s"], stats["bits_per_s"], stats["bus_load"],
+                    stats["errors"], stats["overruns"],
+                )
+            )
+            if stats["chip_state"] is not None:
+                lines.append(
+                    "    {bus_status} TEC {tx_error_counter} REC {rx_error_counter}".format(
+                        **stats["chip_state"]
+                    )
+                )
+        return "\n".join(lines)
@@ -0,0 +1,64 @@
+##############################################################################
+#                                                                            #
+# Module: conftest                                                           #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The tests run against the virtual driver (xlvirtual), its two channels     #
+# share one bus, so every frame sent by one bus is received by the others.   #
+#                                                                            #
+##############################################################################
+import ctypes
+import os
+import sys
+
+# Must be set before xlapi is imported
+os.environ["XLAPI_BACKEND"] = "virtual"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import xlapi
+from canlib import CanBus, CanFdParameters, CanParameters
+
+@pytest.fixture
+def can_pair():
+    # (tx, rx) buses on the classic CAN bus, rx receives all frames
+    tx = CanBus(bus_params=CanParameters(), can_filters=None)
+    rx = CanBus(can_filters=None)
+    yield tx, rx
+    tx.shutdown()
+    rx.shutdown()
+
+@pytest.fixture
+def can_fd_pair():
+    tx = CanBus(bus_params=CanFdParameters(), is_can_fd=True, can_filters=None)
+    rx = CanBus(is_can_fd=True, can_filters=None, rx_queue_size=2**19)
+    yield tx, rx
+    tx.shutdown()
+    rx.shutdown()
+
+@pytest.fixture
+def queue_full_once(monkeypatch):
+    # The first xlCanTransmit(Ex) call only queues `queued` frames and fails
+    # with XL_ERR_QUEUE_IS_FULL, like a driver with a full transmit queue
+    def install(queued):
+        calls = []
+        for name in ("xlCanTransmit", "xlCanTransmitEx"):
+            original = getattr(xlapi, name)
+            def transmit(port, mask, *args, original=original, name=name):
+                calls.append(name)
+                if len(calls) > 1:
+                    return original(port, mask, *args)
+                if name == "xlCanTransmit":
+                    count, events = args
+                    original(port, mask, ctypes.c_uint(queued), events)
+                    count.value = queued
+                else:
+                    count, sent, events = args
+                    original(port, mask, queued, sent, events)
+                raise xlapi.VectorError(
+                    xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_FULL, "XL_ERR_QUEUE_IS_FULL", name
+                )
+            monkeypatch.setattr(xlapi, name, transmit)
+        return calls
+    return install
@@ -0,0 +1,173 @@
+##############################################################################
+#                                                                            #
+# Module: test_candb                                                         #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import math
+import struct
+
+import pytest
+
+from candb import (
+    CRC8_H2F, CRC8_SAE_J1850, E2EProfile1, E2EProfile2, MessageTemplate, SignalDecoder, parse_dbc,
+)
+from canlib import CanMessage
+
+np = pytest.importorskip("numpy")
+
+DBC = '''
+VERSION ""
+
+BO_ 2024 EngineData: 8 ECU
+ SG_ EngineSpeed : 24|16@1+ (0.125,0) [0|8031.875] "rpm" Vector__XXX
+ SG_ Temp : 8|8@1- (1,-40) [-40|215] "C" Vector__XXX
+ SG_ MotoSig : 39|12@0+ (1,0) [0|4095] "" Vector__XXX
+ SG_ MotoSigned : 55|7@0- (0.5,0) [0|0] "" Vector__XXX
+ SG_ Switch : 0|8@1+ (1,0) [0|1] "" Vector__XXX
+
+BO_ 2364540158 ExtMux: 64 ECU
+ SG_ Mux M : 0|8@1+ (1,0) [0|3] "" Vector__XXX
+ SG_ A m0 : 8|16@1+ (1,0) [0|0] "" Vector__XXX
+ SG_ B m1 : 8|32@1- (1,0) [0|0] "" Vector__XXX
+ SG_ Fl : 480|32@1- (1,0) [0|0] "" Vector__XXX
+
+BO_ 256 Protected: 8 ECU
+ SG_ CRC : 0|8@1+ (1,0) [0|255] "" Vector__XXX
+ SG_ Counter : 8|4@1+ (1,0) [0|15] "" Vector__XXX
+ SG_ Value : 16|16@1+ (1,0) [0|65535] "" Vector__XXX
+
+VAL_ 2024 Switch 0 "Off" 1 "On" ;
+SIG_VALTYPE_ 2364540158 Fl : 1;
+'''
+
+# AUTOSAR CRC specification check values
+CRC_VECTORS = [
+    ("00000000", 0x59, 0x12),
+    ("F20183", 0x37, 0xC2),
+    ("0FAA0055", 0x79, 0xC6),
+    ("00FF5511", 0xB8, 0x77),
+    ("332255AABBCCDDEEFF", 0xCB, 0x11),
+    ("926B55", 0x8C, 0x33),
+    ("FFFFFFFF", 0x74, 0x6C),
+]
+
+@pytest.fixture(scope="module")
+def database():
+    return parse_dbc(DBC)
+
+def crc8(poly, data, crc=0x00):
+    # Bitwise reference implementation (no final XOR)
+    for byte in data:
+        crc ^= byte
+        for i in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+def test_parse(database):
+    message = database.get_message("EngineData")
+    assert database.get_message(2024) is message
+    assert message.get_signal("Switch").choices == {0: "Off", 1: "On"}
+    ext = database.get_message("ExtMux")
+    assert ext.is_extended_id and ext.frame_id == 0x0CF004FE and ext.length == 64
+    assert ext.get_signal("Fl").is_float
+
+def test_decode_intel_motorola_signed(database):
+    message = database.get_message("EngineData")
+    data = bytes([1, 0xF6, 0x00, 0x40, 0x1F, 0xAB, 0xC3, 0x00])
+    values = message.decode(data)
+    assert values["Switch"] == 1
+    assert values["Temp"] == -10 - 40
+    assert values["EngineSpeed"] == 0x1F40 * 0.125
+    # Motorola: MSB at bit 39 (byte 4 bit 7), 12 bits
+    assert values["MotoSig"] == 0x1FA
+    # Motorola signed: 7 bits from bit 55 (byte 6 bits 7-1) = 0x61 = -31
+    assert values["MotoSigned"] == -31 * 0.5
+
+def test_decode_columns_match_scalar(database):
+    message = database.get_message("EngineData")
+    rows = np.random.default_rng(1).integers(0, 256, size=(500, 8), dtype=np.uint8)
+    columns = message.decode_columns(rows)
+    for i in range(len(rows)):
+        for name, value in message.decode(bytes(rows[i])).items():
+            assert columns[name][i] == value
+
+def test_decode_mux_float(database):
+    message = database.get_message("ExtMux")
+    data = bytearray(64)
+    data[1:5] = struct.pack("<i", -2)
+    data[60:64] = struct.pack("<f", 1.5)
+    assert message.decode(data) == {"Mux": 0, "A": 0xFFFE, "Fl": 1.5}
+    data[0] = 1
+    assert message.decode(data) == {"Mux": 1, "B": -2, "Fl": 1.5}
+    rows = np.frombuffer(bytes(data) + bytes(64), np.uint8).reshape(2, 64)
+    columns = message.decode_columns(rows)
+    assert math.isnan(columns["A"][0]) and columns["B"][0] == -2
+    assert columns["A"][1] == 0 and math.isnan(columns["B"][1])
+
+def test_signal_decoder(can_pair, database):
+    tx, rx = can_pair
+    decoder = SignalDecoder(database, rx)
+    calls = []
+    decoder.subscribe("EngineData", lambda name, columns: calls.append(len(columns["Temp"])))
+    tx.send(
+        [CanMessage(arbitration_id=2024, data=[0, 90, 0, 0x40, 0x1F, 0, 0, 0])] * 5
+        + [CanMessage(arbitration_id=0x100, data=[1])] * 5
+    )
+    results = decoder.decode(timeout=1.0)
+    assert list(results["EngineData"]["Temp"]) == [50] * 5
+    assert list(results["EngineData"]["EngineSpeed"]) == [1000.0] * 5
+    assert calls == [5]
+
+@pytest.mark.parametrize("data,j1850,h2f", CRC_VECTORS)
+def test_crc8_vectors(data, j1850, h2f):
+    data = bytes.fromhex(data)
+    assert CRC8_SAE_J1850(data) == j1850
+    assert CRC8_H2F(data) == h2f
+
+def test_crc8_check_values():
+    assert CRC8_SAE_J1850(b"123456789") == 0x4B
+    assert CRC8_H2F(b"123456789") == 0xDF
+
+def test_e2e_profile1(database):
+    message = database.get_message("Protected")
+    crc_signal, counter_signal = message.get_signal("CRC"), message.get_signal("Counter")
+    profile = E2EProfile1(0x1234)
+    data = bytearray(b"\x00\x00\x34\x12\x00\x00\x00\x00")
+    counters = []
+    for i in range(16):
+        profile.protect(data, crc_signal, counter_signal)
+        counters.append(data[1] & 0xF)
+        # CRC-8 SAE J1850 (start 0x00, no final XOR) over data ID low,
+        # data ID high and the payload without the CRC byte
+        assert data[0] == crc8(0x1D, b"\x34\x12" + data[1:])
+    assert counters == list(range(1, 15)) + [0, 1]
+
+def test_e2e_profile2(database):
+    message = database.get_message("Protected")
+    crc_signal, counter_signal = message.get_signal("CRC"), message.get_signal("Counter")
+    data_ids = list(range(0x10, 0x20))
+    profile = E2EProfile2(data_ids)
+    data = bytearray(b"\x00\x0E\x34\x12\x00\x00\x00\x00")
+    for counter in (15, 0, 1):
+        profile.protect(data, crc_signal, counter_signal)
+        assert data[1] & 0xF == counter
+        # CRC-8H2F (start 0xFF, final XOR 0xFF) over the payload without the
+        # CRC byte and the data ID of the counter
+        assert data[0] == crc8(0x2F, data[1:] + bytes([data_ids[counter]]), 0xFF) ^ 0xFF
+    with pytest.raises(ValueError):
+        E2EProfile2(data_ids[:15])
+
+def test_template_e2e(can_pair, database):
+    tx, rx = can_pair
+    message = database.get_message("Protected")
+    template = MessageTemplate(message, tx, values={"Value": 0x1234}, e2e=E2EProfile1(0x1234))
+    for i in range(3):
+        template.send()
+    frames = rx.recv_batch(timeout=1.0)
+    assert [frame.data[1] & 0xF for frame in frames] == [1, 2, 3]
+    for frame in frames:
+        assert frame.data[0] == crc8(0x1D, b"\x34\x12" + bytes(frame.data[1:]))
+        assert message.decode(frame.data)["Value"] == 0x1234
+    with pytest.raises(ValueError):
+        MessageTemplate(message, tx, counter="Counter", e2e=E2EProfile1(0x1234))
@@ -0,0 +1,114 @@
+##############################################################################
+#                                                                            #
+# Module: test_canisotp                                                      #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import asyncio
+import os
+import threading
+
+import pytest
+
+from aiocanlib import AsyncCanBus
+from canisotp import IsoTpChannel, decode_st_min, encode_st_min
+from canlib import CanBus, CanMessage
+
+def echo(channel, count=1):
+    # Answers count requests with the reversed request in a thread
+    def run():
+        for i in range(count):
+            data = channel.recv(timeout=5.0)
+            channel.send(data[::-1])
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+def test_segment_classic(can_pair):
+    tx, _ = can_pair
+    channel = IsoTpChannel(tx, 0x7E0, 0x7E8)
+    assert channel.segment(b"1234567") == [b"\x071234567"]
+    frames = channel.segment(bytes(range(20)))
+    assert frames[0] == b"\x10\x14" + bytes(range(6))
+    assert frames[1] == b"\x21" + bytes(range(6, 13))
+    assert frames[2] == b"\x22" + bytes(range(13, 20))
+    # Sequence numbers wrap from 0xF to 0x0
+    frames = channel.segment(bytes(6 + 7 * 16))
+    assert [frame[0] for frame in frames[15:]] == [0x2F, 0x20]
+
+def test_segment_escape_and_fd(can_fd_pair):
+    tx, _ = can_fd_pair
+    channel = IsoTpChannel(tx, 0x7E0, 0x7E8)
+    assert channel.segment(bytes(7))[0][:1] == b"\x07"
+    assert channel.segment(bytes(62)) == [b"\x00\x3E" + bytes(62)]
+    frames = channel.segment(bytes(63))
+    assert frames[0][:2] == b"\x10\x3F" and len(frames[0]) == 64
+    # More than 4095 bytes: FF_DL escape with a 32 bit length
+    frames = channel.segment(bytes(5000))
+    assert frames[0][:6] == b"\x10\x00\x00\x00\x13\x88"
+    assert sum(len(frame) - 1 for frame in frames[1:]) == 5000 - 58
+
+def test_st_min():
+    assert encode_st_min(0.005) == 5
+    assert encode_st_min(0.0003) == 0xF3
+    assert decode_st_min(0x7F) == 0.127
+    assert decode_st_min(0xF1) == pytest.approx(0.0001)
+
+@pytest.mark.parametrize("block_size,st_min", [(0, 0.0), (2, 0.0), (3, 0.001)])
+def test_round_trip(can_pair, block_size, st_min):
+    tx, rx = can_pair
+    tester = IsoTpChannel(tx, 0x7E0, 0x7E8)
+    ecu = IsoTpChannel(rx, 0x7E8, 0x7E0, block_size=block_size, st_min=st_min)
+    thread = echo(ecu, 2)
+    for data in (b"\x22\xF1\x90", os.urandom(300)):
+        assert tester.request(data, timeout=5.0) == data[::-1]
+    thread.join()
+
+def test_round_trip_fd_long(can_fd_pair):
+    tx, rx = can_fd_pair
+    tester = IsoTpChannel(tx, 0x7E0, 0x7E8)
+    ecu = IsoTpChannel(rx, 0x7E8, 0x7E0, block_size=8)
+    thread = echo(ecu)
+    data = os.urandom(5000)
+    assert tester.request(data, timeout=5.0) == data[::-1]
+    thread.join()
+
+def test_keeps_other_frames(can_pair):
+    tx, rx = can_pair
+    tester = IsoTpChannel(tx, 0x7E0, 0x7E8)
+    ecu = IsoTpChannel(rx, 0x7E8, 0x7E0)
+    def run():
+        data = ecu.recv(timeout=5.0)
+        rx.send([CanMessage(arbitration_id=0x123, data=[i]) for i in range(3)])
+        ecu.send(data)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert tester.request(bytes(100), timeout=5.0) == bytes(100)
+    thread.join()
+    # Frames without a subscriber read by the ISO-TP channel are kept
+    frames = [frame for frame in tx.recv_batch(timeout=0.1) if frame.arbitration_id == 0x123]
+    assert [frame.data[0] for frame in frames] == [0, 1, 2]
+
+def test_unclaimed_frames_are_bounded(can_pair):
+    tx, _ = can_pair
+    rx = CanBus(can_filters=None, unclaimed_size=100)
+    try:
+        channel = IsoTpChannel(rx, 0x7E8, 0x7E0)
+        tx.send_many([0x123] * 300, [bytes([i & 0xFF]) for i in range(300)])
+        for i in range(20):
+            assert channel.recv(timeout=0.01) is None
+        assert len(rx.unclaimed) == 100 and rx.unclaimed_overflow_count == 200
+        # The newest frames are kept
+        assert [frame.data[0] for frame in rx.recv_batch(timeout=0.1)] == [i & 0xFF for i in range(200, 300)]
+    finally:
+        rx.shutdown()
+
+def test_async_recv_gets_unclaimed_frames(can_pair):
+    tx, rx = can_pair
+    IsoTpChannel(rx, 0x7E8, 0x7E0)
+    tx.send([CanMessage(arbitration_id=0x123, data=[i]) for i in range(3)])
+    rx.dispatch(timeout=0.1, keep_unclaimed=True)
+    async def recv():
+        bus = AsyncCanBus(rx)
+        return [await bus.recv(timeout=1.0) for i in range(3)]
+    assert [frame.data[0] for frame in asyncio.run(recv())] == [0, 1, 2]
@@ -0,0 +1,166 @@
+##############################################################################
+#                                                                            #
+# Module: test_canlib                                                        #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import asyncio
+import time
+
+import pytest
+
+import xlapi
+from aiocanlib import AsyncCanBus, recv_any
+from canlib import CanBus, CanMessage, WaitStrategy
+
+def recv_all(bus, count, timeout=1.0):
+    # Reads frames until count frames arrived or nothing came for timeout
+    frames = []
+    while len(frames) < count:
+        batch = bus.recv_batch(timeout=timeout)
+        if not batch:
+            break
+        frames += batch
+    return frames
+
+def test_can_round_trip(can_pair):
+    tx, rx = can_pair
+    messages = [CanMessage(arbitration_id=0x100 + i, data=bytes([i] * (i % 9))) for i in range(20)]
+    messages.append(CanMessage(arbitration_id=0x12345678, is_extended_id=True, data=b"\x01\x02"))
+    messages.append(CanMessage(arbitration_id=0x7E0, is_remote_frame=True, dlc=4))
+    tx.send(messages)
+    frames = recv_all(rx, len(messages))
+    assert [(f.arbitration_id, f.is_extended_id, bytes(f.data)) for f in frames] == [
+        (m.arbitration_id, m.is_extended_id, bytes(m.data)) for m in messages
+    ]
+    assert all(f.is_rx_frame and not f.is_can_fd for f in frames)
+    assert frames[-1].is_remote_frame and frames[-1].dlc == 4
+    assert rx.recv(timeout=0.05) is None
+
+def test_can_recv_single(can_pair):
+    tx, rx = can_pair
+    tx.send(CanMessage(arbitration_id=0x7EF, data=[1, 2, 3]))
+    frame = rx.recv(timeout=1.0)
+    assert frame.arbitration_id == 0x7EF and bytes(frame.data) == b"\x01\x02\x03"
+
+def test_can_fd_round_trip(can_fd_pair):
+    tx, rx = can_fd_pair
+    messages = [
+        CanMessage(is_can_fd=True, bitrate_switch=True, arbitration_id=0x200 + i, data=bytes(range(length)))
+        for i, length in enumerate(CanMessage.can_fd_dlc)
+    ]
+    messages.append(CanMessage(arbitration_id=0x300, data=b"classic"))
+    tx.send(messages)
+    frames = recv_all(rx, len(messages))
+    assert [(f.arbitration_id, bytes(f.data)) for f in frames] == [
+        (m.arbitration_id, bytes(m.data)) for m in messages
+    ]
+    assert all(f.is_can_fd and f.bitrate_switch for f in frames[:-1])
+    assert not frames[-1].is_can_fd
+
+def test_send_many(can_pair):
+    tx, rx = can_pair
+    ids = [0x100 + i % 50 for i in range(500)]
+    assert tx.send_many(ids, [bytes([i & 0xFF] * 8) for i in range(500)]) == 500
+    frames = recv_all(rx, 500)
+    assert [f.arbitration_id for f in frames] == ids
+
+def test_filters(can_pair):
+    tx, _ = can_pair
+    rx = CanBus(can_filters=[0x123, (0x200, 0x20F), 0x1234567 | xlapi.XL_CAN_EXT_MSG_ID])
+    try:
+        tx.send([
+            CanMessage(arbitration_id=can_id, is_extended_id=extended, data=[1])
+            for can_id, extended in (
+                (0x122, False), (0x123, False), (0x1FF, False), (0x200, False),
+                (0x20F, False), (0x210, False), (0x123, True), (0x1234567, True),
+            )
+        ])
+        frames = recv_all(rx, 4, timeout=0.2)
+        assert [(f.arbitration_id, f.is_extended_id) for f in frames] == [
+            (0x123, False), (0x200, False), (0x20F, False), (0x1234567, True)
+        ]
+        rx.set_filters(None)
+        tx.send(CanMessage(arbitration_id=0x555, data=[1]))
+        assert rx.recv(timeout=1.0).arbitration_id == 0x555
+    finally:
+        rx.shutdown()
+
+def test_recv_timeout(can_pair):
+    _, rx = can_pair
+    start = time.perf_counter()
+    assert rx.recv(timeout=0.05) is None
+    assert time.perf_counter() - start < 1.0
+
+def test_queue_full_resubmits_rest(can_pair, queue_full_once):
+    tx, rx = can_pair
+    calls = queue_full_once(3)
+    assert tx.send_many(list(range(10)), [bytes([i]) for i in range(10)]) == 10
+    assert len(calls) == 2
+    assert [f.arbitration_id for f in recv_all(rx, 10, timeout=0.2)] == list(range(10))
+
+def test_queue_full_resubmits_rest_fd(can_fd_pair, queue_full_once):
+    tx, rx = can_fd_pair
+    calls = queue_full_once(5)
+    flags = [xlapi.XL_CAN_TXMSG_FLAG.EDL] * 8
+    assert tx.send_many(list(range(8)), [bytes([i] * 12) for i in range(8)], flags=flags) == 8
+    assert calls == ["xlCanTransmitEx", "xlCanTransmitEx"]
+    assert [f.arbitration_id for f in recv_all(rx, 8, timeout=0.2)] == list(range(8))
+
+def test_async_queue_full_resubmits_rest(can_pair, queue_full_once):
+    tx, rx = can_pair
+    async def send():
+        async with AsyncCanBus(tx) as bus:
+            return await bus.send([CanMessage(arbitration_id=i, data=[i]) for i in range(10)])
+    calls = queue_full_once(3)
+    assert asyncio.run(send()) == 10
+    assert len(calls) == 2
+    assert [f.arbitration_id for f in recv_all(rx, 10, timeout=0.2)] == list(range(10))
+
+def test_wait_strategy_is_abstract():
+    with pytest.raises(TypeError):
+        WaitStrategy()
+    class NoWait(WaitStrategy):
+        pass
+    with pytest.raises(TypeError):
+        NoWait()
+
+@pytest.mark.parametrize("pair,receive", [("can_pair", "xlReceive"), ("can_fd_pair", "xlCanReceive")])
+def test_timer_events_are_dropped(request, monkeypatch, pair, receive):
+    # The virtual driver has no timer events, the frames with even IDs are
+    # turned into XL_TIMER events (see TimerWait)
+    tx, rx = request.getfixturevalue(pair)
+    original = getattr(xlapi, receive)
+    def timer_events(port, *args):
+        original(port, *args)
+        if receive == "xlReceive":
+            xl_events = args[-1][:args[0].value]
+            can_ids = [xl_event.tagData.msg.id for xl_event in xl_events]
+        else:
+            xl_events = [args[-1]]
+            can_ids = [args[-1].tagData.canRxOkMsg.canId]
+        for xl_event, can_id in zip(xl_events, can_ids):
+            if can_id % 2 == 0:
+                xl_event.tag = xlapi.XL_EVENT_TAGS.TIMER
+    monkeypatch.setattr(xlapi, receive, timer_events)
+    logged = []
+    class Logger(object):
+        def log_events(self, xl_events, event_count):
+            logged.extend(xl_events[i].tag for i in range(event_count))
+    rx.loggers.append(Logger())
+    tx.send([CanMessage(arbitration_id=i, data=[i]) for i in range(20)])
+    assert [f.arbitration_id for f in recv_all(rx, 10, timeout=0.2)] == list(range(1, 20, 2))
+    assert len(logged) == 10 and int(xlapi.XL_EVENT_TAGS.TIMER) not in logged
+
+def test_recv_any_raises_driver_errors(can_pair, monkeypatch):
+    tx, rx = can_pair
+    def read_error():
+        raise xlapi.VectorError(
+            xlapi.XL_DRIVER_STATUS.ERR_HW_NOT_PRESENT, "XL_ERR_HW_NOT_PRESENT", "xlReceive"
+        )
+    async def recv():
+        first, second = AsyncCanBus(tx), AsyncCanBus(rx)
+        monkeypatch.setattr(second, "_read_frames", read_error)
+        return await recv_any([first, second], timeout=1.0)
+    with pytest.raises(xlapi.VectorError):
+        asyncio.run(recv())
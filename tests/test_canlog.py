@@ -0,0 +1,190 @@
+##############################################################################
+#                                                                            #
+# Module: test_canlog                                                        #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import time
+import zlib
+
+import pytest
+
+import xlapi
+from canlib import CanFrame, CanMessage
+from canlog import (
+    BLF_CAN_FD_MESSAGE, BLF_CAN_FD_MSG, BLF_CAN_MESSAGE, BLF_CAN_MSG, BLF_FILE_HEADER,
+    BLF_FILE_HEADER_SIZE, BLF_LOG_CONTAINER, BLF_LOG_CONTAINER_TYPE, BLF_OBJ_HEADER_BASE,
+    CanLogger, LogReader, TraceFile, convert_to_asc, convert_to_blf,
+)
+from canreplay import CanReplay
+
+def log_traffic(tx, rx, filename, messages, **kwargs):
+    # Sends the messages and logs what rx reads, returns the logger and the
+    # received frames
+    logger = CanLogger(rx, str(filename), **kwargs)
+    tx.send(messages)
+    frames = []
+    while len(frames) < len(messages):
+        batch = rx.recv_batch(timeout=1.0)
+        if not batch:
+            break
+        frames += batch
+    logger.close()
+    return logger, frames
+
+def read_blf(filename):
+    # (object count of the file header, [(object type, payload)...])
+    with open(filename, "rb") as file:
+        raw = file.read()
+    object_count = BLF_FILE_HEADER.unpack_from(raw, 0)[12]
+    position, data = BLF_FILE_HEADER_SIZE, b""
+    while position < len(raw):
+        signature, header_size, version, size, object_type = BLF_OBJ_HEADER_BASE.unpack_from(
+            raw, position
+        )
+        assert signature == b"LOBJ" and object_type == BLF_LOG_CONTAINER_TYPE
+        method, uncompressed_size = BLF_LOG_CONTAINER.unpack_from(raw, position + header_size)
+        data += zlib.decompress(raw[position + header_size + BLF_LOG_CONTAINER.size:position + size])
+        position += size + size % 4
+    objects, position = [], 0
+    while position < len(data):
+        signature, header_size, version, size, object_type = BLF_OBJ_HEADER_BASE.unpack_from(
+            data, position
+        )
+        assert signature == b"LOBJ"
+        objects.append((object_type, data[position + header_size:position + size]))
+        position += size + size % 4
+    return object_count, objects
+
+def test_log_round_trip(can_pair, tmp_path):
+    tx, rx = can_pair
+    messages = [CanMessage(arbitration_id=0x100 + i % 20, data=bytes([i & 0xFF] * 8)) for i in range(300)]
+    messages.append(CanMessage(arbitration_id=0x1ABCDEF, is_extended_id=True, data=b"\x01"))
+    messages.append(CanMessage(arbitration_id=0x7E0, is_remote_frame=True, dlc=4))
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace.xllog", messages, max_bytes=4096)
+    assert logger.record_count >= len(messages)
+    assert len(logger.filenames) > 1
+    logged = list(LogReader(logger.filenames))
+    fields = lambda f: (f.arbitration_id, f.is_extended_id, f.is_remote_frame, f.dlc, bytes(f.data))
+    assert [fields(f) for f in logged] == [fields(f) for f in frames]
+    assert [f.timestamp for f in logged] == pytest.approx([f.timestamp for f in frames])
+
+def test_log_round_trip_fd(can_fd_pair, tmp_path):
+    tx, rx = can_fd_pair
+    messages = [
+        CanMessage(is_can_fd=True, bitrate_switch=True, arbitration_id=0x200 + i, data=bytes(range(64)))
+        for i in range(50)
+    ]
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace_fd.xllog", messages)
+    logged = list(LogReader(logger.filename))
+    assert len(logged) == 50
+    assert all(f.is_can_fd and f.bitrate_switch and bytes(f.data) == bytes(range(64)) for f in logged)
+
+def test_convert_to_asc(can_pair, tmp_path):
+    tx, rx = can_pair
+    messages = [
+        CanMessage(arbitration_id=0x123, data=[0xDE, 0xAD]),
+        CanMessage(arbitration_id=0x1ABCDEF, is_extended_id=True, data=[1]),
+        CanMessage(arbitration_id=0x7E0, is_remote_frame=True, dlc=4),
+    ]
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace.xllog", messages)
+    asc = tmp_path / "trace.asc"
+    assert convert_to_asc(logger.filenames, str(asc)) == 3
+    lines = asc.read_text().splitlines()
+    assert lines[0].startswith("date ") and lines[-1] == "End TriggerBlock"
+    body = [line.split() for line in lines[5:-1]]
+    channel = str(frames[0].channel + 1)
+    assert body[0][1:] == [channel, "123", "Rx", "d", "2", "DE", "AD"]
+    assert body[1][1:] == [channel, "1ABCDEFx", "Rx", "d", "1", "01"]
+    assert body[2][1:] == [channel, "7E0", "Rx", "r", "4"]
+
+@pytest.mark.parametrize("is_can_fd", [False, True])
+def test_convert_to_blf(request, tmp_path, is_can_fd):
+    tx, rx = request.getfixturevalue("can_fd_pair" if is_can_fd else "can_pair")
+    messages = [
+        CanMessage(is_can_fd=is_can_fd, arbitration_id=0x100 + i % 50, data=bytes([i & 0xFF] * 8))
+        for i in range(2000)
+    ]
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace.xllog", messages)
+    blf = tmp_path / "trace.blf"
+    # Small containers, so the objects are split over several containers
+    assert convert_to_blf(logger.filenames, str(blf), container_size=4096) == 2000
+    object_count, objects = read_blf(str(blf))
+    assert object_count == 2000 and len(objects) == 2000
+    if is_can_fd:
+        object_type, layout = BLF_CAN_FD_MESSAGE, BLF_CAN_FD_MSG
+    else:
+        object_type, layout = BLF_CAN_MESSAGE, BLF_CAN_MSG
+    assert all(objects_type == object_type for objects_type, payload in objects)
+    for (objects_type, payload), frame in zip(objects, frames):
+        fields = layout.unpack(payload[:layout.size])
+        assert fields[3] == frame.arbitration_id
+        assert fields[-1][:len(frame.data)] == bytes(frame.data)
+
+def test_trace_file(can_fd_pair, tmp_path):
+    pytest.importorskip("numpy")
+    tx, rx = can_fd_pair
+    messages = [
+        CanMessage(is_can_fd=True, arbitration_id=0x200 + i, data=bytes(range(64))) for i in range(50)
+    ]
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace.xllog", messages)
+    trace = TraceFile(logger.filename)
+    assert len(trace) == 50
+    found = trace.select_id(0x210)
+    assert len(found) == 1 and bytes(found["data"][0][:64]) == bytes(range(64))
+    window = trace.window(frames[10].timestamp, frames[20].timestamp)
+    assert list(window["id"]) == [f.arbitration_id for f in frames[10:20]]
+
+def test_replay_log(can_pair, tmp_path):
+    tx, rx = can_pair
+    messages = [CanMessage(arbitration_id=0x100 + i, data=[i]) for i in range(20)]
+    logger, frames = log_traffic(tx, rx, tmp_path / "trace.xllog", messages)
+    report = CanReplay(tx, logger.filename, speed=10.0).run()
+    assert report.frame_count == 20
+    replayed = rx.recv_batch(timeout=1.0)
+    assert [f.arbitration_id for f in replayed] == [f.arbitration_id for f in frames]
+
+def test_replay_full_transmit_queue(can_pair, monkeypatch):
+    tx, rx = can_pair
+    trace = [
+        CanFrame(False, i * 0.001, 0x100, False, False, False, True, False, False, 1, bytes([i]))
+        for i in range(20)
+    ]
+    def queue_full(port, mask, count, events):
+        count.value = 0
+        raise xlapi.VectorError(
+            xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_FULL, "XL_ERR_QUEUE_IS_FULL", "xlCanTransmit"
+        )
+    monkeypatch.setattr(xlapi, "xlCanTransmit", queue_full)
+    # A replay that can't send must still stop
+    replay = CanReplay(tx, trace, loop=True)
+    replay.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    replay.stop()
+    assert time.perf_counter() - start < 1.0 and not replay.is_running
+    assert replay.report.frame_count == 0 and replay.report.unsent_count > 0
+
+def test_logger_write_error(can_pair, tmp_path):
+    tx, rx = can_pair
+    logger = CanLogger(rx, str(tmp_path / "trace.xllog"), buffer_size=1)
+    class FullDisk(object):
+        def write(self, data):
+            raise OSError(28, "No space left on device")
+        def close(self):
+            pass
+    logger._file = FullDisk()
+    tx.send(CanMessage(arbitration_id=0x100, data=[1]))
+    rx.recv_batch(timeout=1.0)
+    end_time = time.perf_counter() + 1.0
+    while logger.error is None and time.perf_counter() < end_time:
+        time.sleep(0.001)
+    # Nothing is collected anymore, the error shows up on the next flush
+    tx.send([CanMessage(arbitration_id=0x100, data=[1])] * 100)
+    rx.recv_batch(timeout=1.0)
+    assert not logger._buffer and logger._chunks.empty()
+    with pytest.raises(OSError):
+        logger.flush()
+    with pytest.raises(OSError):
+        logger.close()
+    assert logger not in rx.loggers
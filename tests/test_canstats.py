@@ -0,0 +1,69 @@
+##############################################################################
+#                                                                            #
+# Module: test_canstats                                                      #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import pytest
+
+import xlapi
+from canlib import CanBus, CanFdParameters, CanMessage, CanParameters
+from canstats import TxLatencyTracker
+
+@pytest.fixture(params=[False, True], ids=["can", "can_fd"])
+def tracked_bus(request):
+    if request.param:
+        bus = CanBus(
+            bus_params=CanFdParameters(), is_can_fd=True, can_filters=None, recv_own_messages=True
+        )
+    else:
+        bus = CanBus(bus_params=CanParameters(), can_filters=None, recv_own_messages=True)
+    rx = CanBus(is_can_fd=request.param, can_filters=None)
+    yield bus, TxLatencyTracker(bus)
+    bus.shutdown()
+    rx.shutdown()
+
+def read_receipts_during_transmit(monkeypatch, bus, queued=None):
+    # The receipts are read before the transmit call returns, like a reader
+    # thread would. With queued the call only queues that many frames and
+    # fails with XL_ERR_QUEUE_IS_FULL once.
+    name = "xlCanTransmitEx" if bus.is_can_fd else "xlCanTransmit"
+    original = getattr(xlapi, name)
+    calls = []
+    def transmit(port, mask, *args):
+        calls.append(args)
+        if queued is not None and len(calls) == 1:
+            if bus.is_can_fd:
+                original(port, mask, queued, args[1], args[2])
+            else:
+                count = args[0].value
+                args[0].value = queued
+                original(port, mask, args[0], args[1])
+                assert count > queued
+            bus.recv_batch(timeout=0.1)
+            raise xlapi.VectorError(
+                xlapi.XL_DRIVER_STATUS.ERR_QUEUE_IS_FULL, "XL_ERR_QUEUE_IS_FULL", name
+            )
+        result = original(port, mask, *args)
+        bus.recv_batch(timeout=0.1)
+        return result
+    monkeypatch.setattr(xlapi, name, transmit)
+    return calls
+
+def test_receipt_before_transmit_returns(monkeypatch, tracked_bus):
+    bus, tracker = tracked_bus
+    read_receipts_during_transmit(monkeypatch, bus)
+    bus.send([
+        CanMessage(is_can_fd=bus.is_can_fd, arbitration_id=0x100, data=[i]) for i in range(10)
+    ])
+    stats = tracker.stats()
+    assert (stats["sent"], stats["matched"], stats["pending"], stats["unmatched"]) == (10, 10, 0, 0)
+
+def test_unqueued_sends_are_removed(monkeypatch, tracked_bus):
+    bus, tracker = tracked_bus
+    flags = [xlapi.XL_CAN_TXMSG_FLAG.EDL] * 10 if bus.is_can_fd else None
+    calls = read_receipts_during_transmit(monkeypatch, bus, queued=4)
+    assert bus.send_many([0x100] * 10, [bytes([i]) for i in range(10)], flags=flags) == 10
+    assert len(calls) == 2
+    stats = tracker.stats()
+    assert (stats["sent"], stats["matched"], stats["pending"], stats["unmatched"]) == (10, 10, 0, 0)
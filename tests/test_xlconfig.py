@@ -0,0 +1,53 @@
+##############################################################################
+#                                                                            #
+# Module: test_xlconfig                                                      #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+##############################################################################
+import pytest
+
+import xlapi
+from canlib import CanBus, CanMessage
+from xlconfig import channel_registry, driver_session
+
+def test_driver_session_ref_count():
+    ref_count = driver_session.ref_count
+    first = CanBus(can_filters=None)
+    second = CanBus(can_filters=None)
+    assert driver_session.ref_count == ref_count + 2 and driver_session.is_open
+    first.shutdown()
+    first.shutdown()
+    assert driver_session.ref_count == ref_count + 1
+    second.shutdown()
+    assert driver_session.ref_count == ref_count
+    # The driver stays open for the next bus (keep_open)
+    assert driver_session.is_open
+
+def test_failed_setup_releases_driver(monkeypatch):
+    ref_count = driver_session.ref_count
+    def fail(*args):
+        raise xlapi.VectorError(
+            xlapi.XL_DRIVER_STATUS.ERR_HW_NOT_PRESENT, "XL_ERR_HW_NOT_PRESENT", "xlActivateChannel"
+        )
+    monkeypatch.setattr(xlapi, "xlActivateChannel", fail)
+    with pytest.raises(xlapi.VectorError):
+        CanBus(can_filters=None)
+    assert driver_session.ref_count == ref_count
+
+@pytest.mark.parametrize("pair,receive", [("can_pair", "xlReceive"), ("can_fd_pair", "xlCanReceive")])
+def test_transceiver_event_invalidates_registry(request, monkeypatch, pair, receive):
+    # The virtual driver has no cabs, the received frame is turned into a
+    # transceiver event
+    tx, rx = request.getfixturevalue(pair)
+    original = getattr(xlapi, receive)
+    def transceiver_event(port, *args):
+        original(port, *args)
+        # xlReceive reads into an event array, xlCanReceive into one event
+        xl_event = args[-1][0] if receive == "xlReceive" else args[-1]
+        xl_event.tag = xlapi.XL_EVENT_TAGS.TRANSCEIVER
+    monkeypatch.setattr(xlapi, receive, transceiver_event)
+    channel_registry.find()
+    assert channel_registry.load_time is not None
+    tx.send(CanMessage(arbitration_id=0x100, data=[1]))
+    assert rx.recv_batch(timeout=0.2) == []
+    assert channel_registry.load_time is None
@@ -0,0 +1,325 @@
+##############################################################################
+#                                                                            #
+# Module: xla429                                                             #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The ARINC429 part of the python ctypes wrapper for the Vector XL           #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.XLa429RxEvent.                                                  #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+### ARINC429 definitions ###
+
+class XL_A429_MSG_CHANNEL_DIR(enum.IntEnum):
+    TX = 1
+    RX = 2
+
+class XL_A429_MSG_BITRATE(enum.IntEnum):
+    SLOW_MIN = 10500
+    SLOW_MAX = 16000
+    FAST_MIN = 90000
+    FAST_MAX = 110000
+
+XL_A429_MSG_GAP_4BIT = 32
+
+class XL_A429_MSG_BITRATE_RX(enum.IntEnum):
+    MIN = 10000
+    MAX = 120000
+
+class XL_A429_MSG_AUTO_BAUDRATE(enum.IntEnum):
+    DISABLED = 0
+    ENABLED = 1
+
+class XL_A429_MSG_FLAG(enum.IntEnum):
+    ON_REQUEST = 1
+    CYCLIC = 2
+    DELETE_CYCLIC = 4
+
+XL_A429_MSG_CYCLE_MAX = 0x3FFFFFFF
+
+class XL_A429_MSG_GAP(enum.IntEnum):
+    #get minGap config from set channel params
+    DEFAULT = 0
+    MAX = 0x000FFFFF
+
+class XL_A429_MSG_PARITY(enum.IntEnum):
+    #get parity config from set channel params
+    DEFAULT = 0
+    #tx: get parity config from transmit data - rx: check disabled
+    DISABLED = 1
+    ODD = 2
+    EVEN = 3
+
+class XL_A429_EV_TX_MSG_CTRL(enum.IntEnum):
+    ON_REQUEST = 0
+    CYCLIC = 1
+
+class XL_A429_EV_TX_ERROR(enum.IntEnum):
+    ACCESS_DENIED = 0
+    TRANSMISSION_ERROR = 1
+
+class XL_A429_EV_RX_ERROR(enum.IntEnum):
+    GAP_VIOLATION = 0
+    PARITY = 1
+    BITRATE_LOW = 2
+    BITRATE_HIGH = 3
+    FRAME_FORMAT = 4
+    CODING_RZ = 5
+    DUTY_FACTOR = 6
+    AVG_BIT_LENGTH = 7
+
+XL_A429_QUEUE_OVERFLOW = 0x100
+#0,5 MByte
+XL_A429_RX_FIFO_QUEUE_SIZE_MAX = 524288
+#8 kByte
+XL_A429_RX_FIFO_QUEUE_SIZE_MIN = 8192
+
+class s_xl_a429_tx_params(ctypes.Structure):
+    _fields_ = [
+        ("bitrate", ctypes.c_uint),
+        ("parity", ctypes.c_uint),
+        ("minGap", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+
+class s_xl_a429_rx_params(ctypes.Structure):
+    _fields_ = [
+        ("bitrate", ctypes.c_uint),
+        ("minBitrate", ctypes.c_uint),
+        ("maxBitrate", ctypes.c_uint),
+        ("parity", ctypes.c_uint),
+        ("minGap", ctypes.c_uint),
+        ("autoBaudrate", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+
+class u_xl_a429_params(ctypes.Union):
+    _fields_ = [
+        ("tx", s_xl_a429_tx_params),
+        ("rx", s_xl_a429_rx_params),
+        ("raw", ctypes.c_ubyte*28),
+    ]
+    __str__ = cls2str
+
+class s_xl_a429_params(ctypes.Structure):
+    _anonymous_ = ("data",)
+    _fields_ = [
+        ("channelDirection", ctypes.c_ushort),
+        ("res1", ctypes.c_ushort),
+        ("data", u_xl_a429_params),
+    ]
+    __str__ = cls2str
+XL_A429_PARAMS = s_xl_a429_params
+
+class s_xl_a429_msg_tx(ctypes.Structure):
+    _fields_ = [
+        ("userHandle", ctypes.c_ushort),
+        ("res1", ctypes.c_ushort),
+        ("flags", ctypes.c_uint),
+        ("cycleTime", ctypes.c_uint),
+        ("gap", ctypes.c_uint),
+        ("label", ctypes.c_ubyte),
+        ("parity", ctypes.c_ubyte),
+        ("res2", ctypes.c_ushort),
+        ("data", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_A429_MSG_TX = s_xl_a429_msg_tx
+
+class s_xl_a429_ev_tx_ok(ctypes.Structure):
+    _fields_ = [
+        ("frameLength", ctypes.c_uint),
+        ("bitrate", ctypes.c_uint),
+        ("label", ctypes.c_ubyte),
+        ("msgCtrl", ctypes.c_ubyte),
+        ("res1", ctypes.c_ushort),
+        ("data", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_A429_EV_TX_OK = s_xl_a429_ev_tx_ok
+
+class s_xl_a429_ev_tx_err(ctypes.Structure):
+    _fields_ = [
+        ("frameLength", ctypes.c_uint),
+        ("bitrate", ctypes.c_uint),
+        ("errorPosition", ctypes.c_ubyte),
+        ("errorReason", ctypes.c_ubyte),
+        ("label", ctypes.c_ubyte),
+        ("res1", ctypes.c_ubyte),
+        ("data", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_A429_EV_TX_ERR = s_xl_a429_ev_tx_err
+
+class s_xl_a429_ev_rx_ok(ctypes.Structure):
+    _fields_ = [
+        ("frameLength", ctypes.c_uint),
+        ("bitrate", ctypes.c_uint),
+        ("label", ctypes.c_ubyte),
+        ("res1", ctypes.c_ubyte*3),
+        ("data", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_A429_EV_RX_OK = s_xl_a429_ev_rx_ok
+
+class s_xl_a429_ev_rx_err(ctypes.Structure):
+    _fields_ = [
+        ("frameLength", ctypes.c_uint),
+        ("bitrate", ctypes.c_uint),
+        ("bitLengthOfLastBit", ctypes.c_uint),
+        ("errorPosition", ctypes.c_ubyte),
+        ("errorReason", ctypes.c_ubyte),
+        ("label", ctypes.c_ubyte),
+        ("res1", ctypes.c_ubyte),
+        ("data", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_A429_EV_RX_ERR = s_xl_a429_ev_rx_err
+
+class s_xl_a429_ev_bus_statistic(ctypes.Structure):
+    _fields_ = [
+        #0.00-100.00%
+        ("busLoad", ctypes.c_uint),
+        ("res1", ctypes.c_uint*3),
+    ]
+    __str__ = cls2str
+XL_A429_EV_BUS_STATISTIC = s_xl_a429_ev_bus_statistic
+
+class u_xl_a429_rx_tag_data(ctypes.Union):
+    _fields_ = [
+        ("a429TxOkMsg", s_xl_a429_ev_tx_ok),
+        ("a429TxErrMsg", s_xl_a429_ev_tx_err),
+        ("a429RxOkMsg", s_xl_a429_ev_rx_ok),
+        ("a429RxErrMsg", s_xl_a429_ev_rx_err),
+        ("a429BusStatistic", s_xl_a429_ev_bus_statistic),
+        ("a429SyncPulse", s_xl_sync_pulse_ev),
+    ]
+    __str__ = cls2str
+
+class s_xl_a429_rx_event(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        #overall size of the complete event
+        ("size", ctypes.c_uint),
+        #type of the event
+        ("tag", ctypes.c_ushort),
+        ("channelIndex", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte),
+        #(lower 12 bit available for CAN)
+        ("userHandle", ctypes.c_uint),
+        #queue overflow (upper 8bit)
+        ("flagsChip", ctypes.c_ushort),
+        ("reserved0", ctypes.c_ushort),
+        #raw timestamp
+        ("timeStamp", XLuint64),
+        #timestamp which is synchronized by the driver
+        ("timeStampSync", XLuint64),
+        ("tagData", u_xl_a429_rx_tag_data),
+    ]
+    __str__ = cls2str
+XLa429RxEvent = s_xl_a429_rx_event
+
+### ARINC429 XL API functions ###
+
+xlA429Receive = _vector_xlapi_dll_.xlA429Receive
+xlA429Receive.restype = XLstatus
+xlA429Receive.argtypes = [
+    #portHandle
+    XLportHandle,
+    #pXlA429RxEvt
+    ctypes.POINTER(XLa429RxEvent),
+]
+xlA429Receive.errcheck = check_xl_status
+xlA429Receive.__doc__ = """
+xlapi.xlA429Receive
+    Retrieves one event from the event queue. This operation is synchronous.
+Syntax:
+    XLstatus xlA429Receive (
+        XLportHandle portHandle,
+        XLa429Event* pXlA429Event
+    )
+Args:
+    portHandle: The port handle retrieved by xlOpenPort
+    pXlA429Event: Pointer to the application allocated receive event buffer
+Returns:
+    XLstatus (error code)
+"""
+
+xlA429SetChannelParams = _vector_xlapi_dll_.xlA429SetChannelParams
+xlA429SetChannelParams.restype = XLstatus
+xlA429SetChannelParams.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pXlA429Params
+    ctypes.POINTER(XL_A429_PARAMS),
+]
+xlA429SetChannelParams.errcheck = check_xl_status
+xlA429SetChannelParams.__doc__ = """
+xlapi.xlA429SetChannelParams
+    This function configures basic ARINC 429 parameters. The device does not
+    keep those settings after a restart. This is a synchronous operation and
+    this function needs init access.
+Syntax:
+    XLstatus xlA429SetChannelParams(
+        XLportHandle portHandle,
+        XLaccess accessMask,
+        XL_A429_PARAMS* pXlA429Params
+    )
+Args:
+    portHandle: The port handle retrieved by xlOpenPort
+    accessMask: The access mask specifies the channels to be accessed
+    pXlA429Params: ARINC 429 configuration structure (XL_A429_PARAMS)
+Returns:
+    XLstatus (error code)
+"""
+
+xlA429Transmit = _vector_xlapi_dll_.xlA429Transmit
+xlA429Transmit.restype = XLstatus
+xlA429Transmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #msgCnt
+    ctypes.c_uint,
+    #pMsgCntSent
+    ctypes.POINTER(ctypes.c_uint),
+    #pXlA429MsgTx
+    ctypes.POINTER(XL_A429_MSG_TX),
+]
+xlA429Transmit.errcheck = check_xl_status
+xlA429Transmit.__doc__ = """
+xlapi.xlA429Transmit
+    The function writes ARINC 429 messages from host PC to the A429 interface.
+    It writes the transmit data to a transmit queue and the hardware
+    interface handles the message queue until all messages are transmitted.
+    It is possible to write more than one message to the message queue with
+    one call. This function is an asynchronous operation.
+Syntax:
+    XLstatus xlA429Transmit(
+        XLportHandle portHandle,
+        XLaccess accessMask,
+        unsigned int msgCnt,
+        unsigned int* pMsgCntSent,
+        XL_A429_MSG_TX* pXlA429MsgTx
+    )
+Args:
+    portHandle: The port handle retrieved by xlOpenPort
+    accessMask: The access mask specifies the channels to be accessed
+    msgCnt: Amount of messages to be transmitted
+    pMsgCntSent: Number of messages successfully transferred to the transmit queue
+    pXlA429MsgTx: Points to a user buffer with messages to be transmitted.
+                  At least the buffer must have the size of msgCnt multiplied
+                  with the size of XL_A429_MSG_TX structure
+Returns:
+    XLstatus (error code)
+"""
@@ -0,0 +1,197 @@
+##############################################################################
+#                                                                            #
+# Module: xlconfig                                                           #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# Process wide driver session and cache of the driver configuration. The    #
+# driver is opened once and shared by all buses. The channel list of         #
+# xlGetDriverConfig is read once and indexed by channel index, serial        #
+# number, hardware type/index and capabilities, so finding the channels of   #
+# a bus is a dictionary lookup instead of a driver call.                     #
+#                                                                            #
+##############################################################################
+import atexit
+import threading
+import time
+
+import xlapi
+
+class ChannelRegistry(object):
+    # The cached channels (XLchannelConfig) of the driver configuration. The
+    # configuration is read again after invalidate() or refresh(): when a
+    # CanBus reads a transceiver event (a cab was plugged or removed) or
+    # couldn't find or open its channels. As only buses that are open see
+    # transceiver events, it is also reread when it is older than max_age
+    # seconds (None: never), a cheap poll that picks up hardware plugged in
+    # while no bus was open. Requires an opened driver (see DriverSession).
+    def __init__(self, max_age=30.0):
+        self.lock = threading.RLock()
+        self.max_age = max_age
+        self.generation = 0
+        self.load_time = None
+        self.driver_config = None
+        self.channels = ()
+        self._by_index = {}
+        self._by_serial = {}
+        self._by_hw = {}
+        self._queries = {}
+        self._on_bus_counts = {}
+
+    def invalidate(self):
+        with self.lock:
+            self.load_time = None
+
+    def refresh(self):
+        # Reads the driver configuration and rebuilds the indexes, a new
+        # XLdriverConfig is used so channels returned before stay valid
+        driver_config = xlapi.XLdriverConfig()
+        try:
+            xlapi.xlGetDriverConfig(driver_config)
+        except xlapi.VectorError:
+            driver_config.channelCount = 0
+        with self.lock:
+            self.driver_config = driver_config
+            self.channels = tuple(
+                driver_config.channel[i] for i in range(driver_config.channelCount)
+            )
+            self._by_index, self._by_serial, self._by_hw = {}, {}, {}
+            for channel in self.channels:
+                self._by_index[channel.channelIndex] = channel
+                self._by_serial.setdefault(channel.serialNumber, []).append(channel)
+                self._by_hw.setdefault(channel.hwType, []).append(channel)
+                self._by_hw.setdefault((channel.hwType, channel.hwIndex), []).append(channel)
+                # Buses of this process that are still on bus
+                if self._on_bus_counts.get(channel.channelIndex):
+                    channel.isOnBus = 1
+            self._queries = {}
+            self.generation += 1
+            # An unreadable configuration is read again on the next lookup
+            self.load_time = time.perf_counter() if self.channels else None
+
+    def _check(self):
+        if self.load_time is None or (
+            self.max_age is not None and time.perf_counter() - self.load_time > self.max_age
+        ):
+            self.refresh()
+
+    def find(
+        self,
+        bus_capabilities=0,
+        channel_capabilities=0,
+        hw_type=None,
+        hw_index=None,
+        serial_number=None,
+    ):
+        # Channels (tuple) with all bits of bus_capabilities
+        # (XL_BUS_ACTIVE_CAP) and channel_capabilities (XL_CHANNEL_FLAG) on
+        # the given hardware. Every query is only evaluated once per
+        # configuration.
+        key = (int(bus_capabilities), int(channel_capabilities), hw_type, hw_index, serial_number)
+        with self.lock:
+            self._check()
+            channels = self._queries.get(key)
+            if channels is not None:
+                return channels
+            if serial_number is not None:
+                candidates = self._by_serial.get(serial_number, ())
+            elif hw_index is not None and hw_type is not None:
+                candidates = self._by_hw.get((hw_type, hw_index), ())
+            elif hw_type is not None:
+                candidates = self._by_hw.get(hw_type, ())
+            else:
+                candidates = self.channels
+            channels = tuple(
+                channel for channel in candidates
+                if channel.channelBusCapabilities & key[0] == key[0]
+                and channel.channelCapabilities & key[1] == key[1]
+                and (hw_type is None or channel.hwType == hw_type)
+                and (hw_index is None or channel.hwIndex == hw_index)
+            )
+            self._queries[key] = channels
+            return channels
+
+    def get_channel(self, channel_index):
+        with self.lock:
+            self._check()
+            try:
+                return self._by_index[channel_index]
+            except KeyError:
+                raise ValueError("Channel {0} not found.".format(channel_index))
+
+    def set_on_bus(self, access_mask, on_bus):
+        # Keeps isOnBus of the cached channels up to date for the buses of
+        # this process (other applications: after the next refresh)
+        with self.lock:
+            for channel in self.channels:
+                if not access_mask & channel.channelMask:
+                    continue
+                index = channel.channelIndex
+                count = self._on_bus_counts.get(index, 0) + (1 if on_bus else -1)
+                self._on_bus_counts[index] = max(0, count)
+                channel.isOnBus = 1 if count > 0 else 0
+
+    def __str__(self):
+        with self.lock:
+            return "\n".join(["Channel Registry (generation {0}):".format(self.generation)] + [
+                "  {0}: {1} (hw type {2}, index {3}, serial {4}{5})".format(
+                    channel.channelIndex, channel.name.decode(errors="replace"),
+                    channel.hwType, channel.hwIndex, channel.serialNumber,
+                    ", on bus" if channel.isOnBus else "",
+                )
+                for channel in self.channels
+            ])
+
+channel_registry = ChannelRegistry()
+
+class DriverSession(object):
+    # Opens the driver once per process. acquire()/release() count the users
+    # (every CanBus holds one reference while its port is open). With
+    # keep_open the driver stays open when the last user is gone, so buses
+    # can be created again without reopening it. Closed at exit.
+    def __init__(self, registry, keep_open=True):
+        self.lock = threading.Lock()
+        self.registry = registry
+        self.keep_open = keep_open
+        self.ref_count = 0
+        self.is_open = False
+        self._exit_registered = False
+
+    def acquire(self):
+        with self.lock:
+            if not self.is_open:
+                xlapi.xlOpenDriver()
+                self.is_open = True
+                if not self._exit_registered:
+                    atexit.register(self.close)
+                    self._exit_registered = True
+            self.ref_count += 1
+        return self
+
+    def release(self):
+        with self.lock:
+            if self.ref_count > 0:
+                self.ref_count -= 1
+            if self.ref_count == 0 and not self.keep_open:
+                self._close()
+
+    def close(self):
+        # Closes the driver even if there are still users (ports of buses
+        # that weren't shut down are closed by the driver)
+        with self.lock:
+            self.ref_count = 0
+            self._close()
+
+    def _close(self):
+        if self.is_open:
+            self.is_open = False
+            # The configuration may change until the driver is opened again
+            self.registry.invalidate()
+            xlapi.xlCloseDriver()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+driver_session = DriverSession(channel_registry)
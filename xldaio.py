@@ -0,0 +1,505 @@
+##############################################################################
+#                                                                            #
+# Module: xldaio                                                             #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The DAIO/IO part of the python ctypes wrapper for the Vector XL            #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.xlDAIOSetPWMOutput.                                             #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+### IO XL API ###
+
+class XL_DAIO_PORT_TYPE_MASK(enum.IntEnum):
+    DIGITAL = 1
+    ANALOG = 2
+
+# XL_DAIO_TRIGGER_MODE (CYCLIC/PORT) is part of the DAIO definitions in xlapi
+
+class s_xl_daio_trigger_type_params_digital(ctypes.Structure):
+    _fields_ = [
+        ("portMask", ctypes.c_uint),
+        # Use defines XL_DAIO_TRIGGER_TYPE_xxx(RISIONG|FALLING|BOTH)
+        ("type", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+
+class u_xl_trigger_type_params(ctypes.Union):
+    _fields_ = [
+        #specify time in microseconds
+        ("cycleTime", ctypes.c_uint),
+        ("digital", s_xl_daio_trigger_type_params_digital),
+    ]
+    __str__ = cls2str
+
+class s_xl_daio_trigger_mode(ctypes.Structure):
+    _anonymous_ = ("param",)
+    _fields_ = [
+        #Use defines XL_DAIO_PORT_TYPE_MASK_xxx. Unused for VN1630/VN1640.
+        ("portTypeMask", ctypes.c_uint),
+        #Use defines XL_DAIO_TRIGGER_TYPE_xxx(CYCLIC|PORT)
+        ("triggerType", ctypes.c_uint),
+        ("param", u_xl_trigger_type_params),
+    ]
+    __str__ = cls2str
+XLdaioTriggerMode = s_xl_daio_trigger_mode
+
+class XL_DAIO_TRIGGER_TYPE(enum.IntEnum):
+    RISING = 1
+    FALLING = 2
+    BOTH = 3
+
+class xl_daio_set_port(ctypes.Structure):
+    _fields_ = [
+        #Only one signal group is allowed. One of the defines XL_DAIO_PORT_TYPE_MASK_*
+        ("portType", ctypes.c_uint),
+        #Mask of affected ports.
+        ("portMask", ctypes.c_uint),
+        #Special function of port. One of the defines XL_DAIO_PORT_DIGITAL_* or XL_DAIO_PORT_ANALOG_*
+        ("portFunction", ctypes.c_uint*8),
+        #Set this parameters to zero!
+        ("reserved", ctypes.c_uint*8),
+    ]
+    __str__ = cls2str
+XLdaioSetPort = xl_daio_set_port
+
+class XL_DAIO_PORT_DIGITAL(enum.IntEnum):
+    IN = 0
+    PUSHPULL = 1
+    OPENDRAIN = 2
+    #(only for digital pin 4..7)
+    SWITCH = 5
+    #(only for WakeUp line)
+    IN_OUT = 6
+
+class XL_DAIO_PORT_ANALOG(enum.IntEnum):
+    IN = 0
+    OUT = 1
+    DIFF = 2
+    OFF = 3
+
+class XL_DAIO_DO_LEVEL(enum.IntEnum):
+    LEVEL_0V = 0
+    LEVEL_5V = 5
+    LEVEL_12V = 12
+
+class xl_daio_digital_params(ctypes.Structure):
+    _fields_ = [
+        #Use defines XL_DAIO_PORT_MASK_DIGITAL_*
+        ("portMask", ctypes.c_uint),
+        #Specify the port value (ON/HIGH 1 | OFF/LOW - 0)
+        ("valueMask", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLdaioDigitalParams = xl_daio_digital_params
+
+class XL_DAIO_PORT_MASK_DIGITAL(enum.IntEnum):
+    D0 = 1
+    D1 = 2
+    D2 = 4
+    D3 = 8
+    D4 = 16
+    D5 = 32
+    D6 = 64
+    D7 = 128
+
+class xl_daio_analog_params(ctypes.Structure):
+    _fields_ = [
+        #Use defines XL_DAIO_PORT_MASK_ANALOG_*
+        ("portMask", ctypes.c_uint),
+        #12-bit values
+        ("value", ctypes.c_uint*8),
+    ]
+    __str__ = cls2str
+XLdaioAnalogParams = xl_daio_analog_params
+
+class XL_DAIO_PORT_MASK_ANALOG(enum.IntEnum):
+    A0 = 1
+    A1 = 2
+    A2 = 4
+    A3 = 8
+
+class XL_DAIO_EVT_ID(enum.IntEnum):
+    #1
+    XL_DAIO_EVT_ID_DIGITAL = XL_DAIO_PORT_TYPE_MASK.DIGITAL
+    #2
+    XL_DAIO_EVT_ID_ANALOG  = XL_DAIO_PORT_TYPE_MASK.ANALOG
+
+### DAIO/IO XL API functions ###
+
+xlDAIOSetPWMOutput = _vector_xlapi_dll_.xlDAIOSetPWMOutput
+xlDAIOSetPWMOutput.restype = XLstatus
+xlDAIOSetPWMOutput.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #frequency
+    ctypes.c_uint,
+    #value
+    ctypes.c_uint,
+]
+xlDAIOSetPWMOutput.errcheck = check_xl_status
+xlDAIOSetPWMOutput.__doc__ = """
+xlapi.xlDAIOSetPWMOutput
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetDigitalOutput = _vector_xlapi_dll_.xlDAIOSetDigitalOutput
+xlDAIOSetDigitalOutput.restype = XLstatus
+xlDAIOSetDigitalOutput.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #outputMask
+    ctypes.c_uint,
+    #valuePattern
+    ctypes.c_uint,
+]
+xlDAIOSetDigitalOutput.errcheck = check_xl_status
+xlDAIOSetDigitalOutput.__doc__ = """
+xlapi.xlDAIOSetDigitalOutput
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetAnalogOutput = _vector_xlapi_dll_.xlDAIOSetAnalogOutput
+xlDAIOSetAnalogOutput.restype = XLstatus
+xlDAIOSetAnalogOutput.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #analogLine1
+    ctypes.c_uint,
+    #analogLine2
+    ctypes.c_uint,
+    #analogLine3
+    ctypes.c_uint,
+    #analogLine4
+    ctypes.c_uint,
+]
+xlDAIOSetAnalogOutput.errcheck = check_xl_status
+xlDAIOSetAnalogOutput.__doc__ = """
+xlapi.xlDAIOSetAnalogOutput
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIORequestMeasurement = _vector_xlapi_dll_.xlDAIORequestMeasurement
+xlDAIORequestMeasurement.restype = XLstatus
+xlDAIORequestMeasurement.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+]
+xlDAIORequestMeasurement.errcheck = check_xl_status
+xlDAIORequestMeasurement.__doc__ = """
+xlapi.xlDAIORequestMeasurement
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetDigitalParameters = _vector_xlapi_dll_.xlDAIOSetDigitalParameters
+xlDAIOSetDigitalParameters.restype = XLstatus
+xlDAIOSetDigitalParameters.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #inputMask
+    ctypes.c_uint,
+    #outputMask
+    ctypes.c_uint,
+]
+xlDAIOSetDigitalParameters.errcheck = check_xl_status
+xlDAIOSetDigitalParameters.__doc__ = """
+xlapi.xlDAIOSetDigitalParameters
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetAnalogParameters = _vector_xlapi_dll_.xlDAIOSetAnalogParameters
+xlDAIOSetAnalogParameters.restype = XLstatus
+xlDAIOSetAnalogParameters.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #inputMask
+    ctypes.c_uint,
+    #outputMask
+    ctypes.c_uint,
+    #highRangeMask
+    ctypes.c_uint,
+]
+xlDAIOSetAnalogParameters.errcheck = check_xl_status
+xlDAIOSetAnalogParameters.__doc__ = """
+xlapi.xlDAIOSetAnalogParameters
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetAnalogTrigger = _vector_xlapi_dll_.xlDAIOSetAnalogTrigger
+xlDAIOSetAnalogTrigger.restype = XLstatus
+xlDAIOSetAnalogTrigger.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #triggerMask
+    ctypes.c_uint,
+    #triggerLevel
+    ctypes.c_uint,
+    #triggerEventMode
+    ctypes.c_uint,
+]
+xlDAIOSetAnalogTrigger.errcheck = check_xl_status
+xlDAIOSetAnalogTrigger.__doc__ = """
+xlapi.xlDAIOSetAnalogTrigger
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetMeasurementFrequency = _vector_xlapi_dll_.xlDAIOSetMeasurementFrequency
+xlDAIOSetMeasurementFrequency.restype = XLstatus
+xlDAIOSetMeasurementFrequency.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #measurementInterval
+    ctypes.c_uint,
+]
+xlDAIOSetMeasurementFrequency.errcheck = check_xl_status
+xlDAIOSetMeasurementFrequency.__doc__ = """
+xlapi.xlDAIOSetMeasurementFrequency
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlDAIOSetDigitalTrigger = _vector_xlapi_dll_.xlDAIOSetDigitalTrigger
+xlDAIOSetDigitalTrigger.restype = XLstatus
+xlDAIOSetDigitalTrigger.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #triggerMask
+    ctypes.c_uint,
+]
+xlDAIOSetDigitalTrigger.errcheck = check_xl_status
+xlDAIOSetDigitalTrigger.__doc__ = """
+xlapi.xlDAIOSetDigitalTrigger
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoSetTriggerMode = _vector_xlapi_dll_.xlIoSetTriggerMode
+xlIoSetTriggerMode.restype = XLstatus
+xlIoSetTriggerMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlDaioTriggerMode
+    ctypes.POINTER(XLdaioTriggerMode),
+]
+xlIoSetTriggerMode.errcheck = check_xl_status
+xlIoSetTriggerMode.__doc__ = """
+xlapi.xlIoSetTriggerMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoSetDigitalOutput = _vector_xlapi_dll_.xlIoSetDigitalOutput
+xlIoSetDigitalOutput.restype = XLstatus
+xlIoSetDigitalOutput.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlDaioDigitalParams
+    ctypes.POINTER(XLdaioDigitalParams),
+]
+xlIoSetDigitalOutput.errcheck = check_xl_status
+xlIoSetDigitalOutput.__doc__ = """
+xlapi.xlIoSetDigitalOutput
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoConfigurePorts = _vector_xlapi_dll_.xlIoConfigurePorts
+xlIoConfigurePorts.restype = XLstatus
+xlIoConfigurePorts.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlDaioSetPort
+    ctypes.POINTER(XLdaioSetPort),
+]
+xlIoConfigurePorts.errcheck = check_xl_status
+xlIoConfigurePorts.__doc__ = """
+xlapi.xlIoConfigurePorts
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoSetDigInThreshold = _vector_xlapi_dll_.xlIoSetDigInThreshold
+xlIoSetDigInThreshold.restype = XLstatus
+xlIoSetDigInThreshold.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #level
+    ctypes.c_uint,
+]
+xlIoSetDigInThreshold.errcheck = check_xl_status
+xlIoSetDigInThreshold.__doc__ = """
+xlapi.xlIoSetDigInThreshold
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoSetDigOutLevel = _vector_xlapi_dll_.xlIoSetDigOutLevel
+xlIoSetDigOutLevel.restype = XLstatus
+xlIoSetDigOutLevel.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #level
+    ctypes.c_uint,
+]
+xlIoSetDigOutLevel.errcheck = check_xl_status
+xlIoSetDigOutLevel.__doc__ = """
+xlapi.xlIoSetDigOutLevel
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoSetAnalogOutput = _vector_xlapi_dll_.xlIoSetAnalogOutput
+xlIoSetAnalogOutput.restype = XLstatus
+xlIoSetAnalogOutput.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlDaioAnalogParams
+    ctypes.POINTER(XLdaioAnalogParams),
+]
+xlIoSetAnalogOutput.errcheck = check_xl_status
+xlIoSetAnalogOutput.__doc__ = """
+xlapi.xlIoSetAnalogOutput
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlIoStartSampling = _vector_xlapi_dll_.xlIoStartSampling
+xlIoStartSampling.restype = XLstatus
+xlIoStartSampling.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #portTypeMask
+    ctypes.c_uint,
+]
+xlIoStartSampling.errcheck = check_xl_status
+xlIoStartSampling.__doc__ = """
+xlapi.xlIoStartSampling
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
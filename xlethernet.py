@@ -0,0 +1,1095 @@
+##############################################################################
+#                                                                            #
+# Module: xlethernet                                                         #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The Ethernet part of the python ctypes wrapper for the Vector XL           #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.xlEthTransmit.                                                  #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+### Ethernet API ###
+
+XL_ETH_EVENT_SIZE_HEADER = 32
+XL_ETH_EVENT_SIZE_MAX = 2048
+#Maximum size of ethernet receive queue: 64 MByte
+XL_ETH_RX_FIFO_QUEUE_SIZE_MAX = 67108864
+#Minimum size of ethernet receive queue: 64 KByte
+XL_ETH_RX_FIFO_QUEUE_SIZE_MIN = 65536
+#maximum payload length for sending an ethernet packet
+XL_ETH_PAYLOAD_SIZE_MAX = 1500
+#minimum payload length for sending an ethernet packet (42 octets with VLAN tag present)
+XL_ETH_PAYLOAD_SIZE_MIN = 46
+#maximum buffer size for storing a "raw" Ethernet frame (including VLAN tags, if present)
+XL_ETH_RAW_FRAME_SIZE_MAX = 1600
+#minimum buffer size for storing a "raw" Ethernet frame (including VLAN tags, if present)
+XL_ETH_RAW_FRAME_SIZE_MIN = 24
+XL_ETH_MACADDR_OCTETS = 6
+XL_ETH_ETHERTYPE_OCTETS = 2
+XL_ETH_VLANTAG_OCTETS = 4
+
+class XL_ETH_CHANNEL_CAP(enum.IntEnum):
+    #Channel supports IEEE 802.3pw (100BASE-T1) - Automotive Ethernet over single twisted pair
+    IEEE100T1 = 1
+    #Channel supports IEEE 802.3u (100-BASE-TX) and 802.3i (10BASE-T) - Ethernet and Fast Ethernet
+    IEEE100TX = 2
+    #Channel supports IEEE 802.3ab (1000BASE-T) - Gigabit Ethernet
+    IEEE1000T = 4
+    #Channel supports IEEE 802.3bp (1000BASE-T1) - Automotive Ethernet over single twisted pair
+    IEEE1000T1 = 8
+
+class XL_NET_ETH_SWITCH_CAP(enum.IntEnum):
+    #Switch type is "normal" switch (learning is on)
+    REALSWITCH = 0
+    #Switch type is direct connection
+    DIRECTCONN = 1
+    #Switch type is TAP
+    TAP_LINK = 2
+
+class XL_ETH_FLAGS_CHIP(enum.IntEnum):
+    CONNECTOR_RJ45 = 1
+    CONNECTOR_DSUB = 2
+    PHY_IEEE = 4
+    PHY_BROADR = 8
+    #For Rx and RxError events
+    FRAME_BYPASSED = 16
+    QUEUE_OVERFLOW = 256
+    #MAC bypass queue full condition occurred, one or more packets dropped
+    BYPASS_QUEUE_OVERFLOW = 32768
+
+class XL_ETH_MODE_SPEED(enum.IntEnum):
+    #Set connection speed set to 100 Mbps via auto-negotiation
+    AUTO_100 = 2
+    #Set connection speed to 1000 Mbps via auto-negotiation
+    AUTO_1000 = 4
+    #Set connection speed automatically to either 100 or 1000 Mbps
+    AUTO_100_1000 = 5
+    #Set connection speed to 100 Mbps. Auto-negotiation disabled.
+    FIXED_100 = 8
+    #Set connection speed to 1 Gbps. Auto-negotiation disabled.
+    FIXED_1000 = 9
+
+class XL_ETH_MODE_DUPLEX(enum.IntEnum):
+    #Used for BroadR-Reach since only full duplex mode possible.
+    DONT_CARE = 0
+    #Duplex mode set via auto-negotiation. Requires connection speed set to an "auto" value. Only for IEEE 802.3
+    AUTO = 1
+    #Full duplex mode. Only for IEEE 802.3
+    FULL = 3
+
+class XL_ETH_MODE_CONNECTOR(enum.IntEnum):
+    #Apart from VN5610(A), always only one connector available anyway
+    DONT_CARE = 0
+    #Using RJ-45 connector
+    RJ45 = 1
+    #Using D-Sub connector
+    DSUB = 2
+
+class XL_ETH_MODE_PHY(enum.IntEnum):
+    #Set whatever PHY layer is available
+    DONT_CARE = 0
+    #Set IEEE 802.3
+    IEEE_802_3 = 1
+    #Set BroadR-Reach
+    BROADR_REACH = 2
+
+class XL_ETH_MODE_CLOCK(enum.IntEnum):
+    #Used for IEEE 802.3 100 and 10 MBit
+    DONT_CARE = 0
+    #Clock mode set automatically via auto-negotiation. Only for 1000Base-T if speed mode is one of the "auto" modes
+    AUTO = 1
+    #Clock mode is master. Only for 1000Base-T or BroadR-Reach
+    MASTER = 2
+    #Clock mode is slave. Only for 1000Base-T or BroadR-Reach
+    SLAVE = 3
+
+class XL_ETH_MODE_MDI(enum.IntEnum):
+    #Perform MDI auto detection
+    AUTO = 1
+    #Direct MDI (connected to switch)
+    STRAIGHT = 2
+    #Crossover MDI (connected to endpoint)
+    CROSSOVER = 3
+
+class XL_ETH_MODE_BR_PAIR(enum.IntEnum):
+    #Used for IEEE 802.3
+    DONT_CARE = 0
+    #BR 1-pair connection. Only for BroadR-Reach
+    BR_1PAIR = 1
+
+class XL_ETH_STATUS_LINK(enum.IntEnum):
+    #The link state could not be determined (e.g. lost connection to board)
+    UNKNOWN = 0
+    #Link is down (no cable attached, no configuration set, configuration does not match)
+    DOWN = 1
+    #Link is up
+    UP = 2
+    #Link is in error state (e.g. auto-negotiation failed)
+    ERROR = 4
+
+class XL_ETH_STATUS_SPEED(enum.IntEnum):
+    #Connection speed could not be determined (e.g. during auto-negotiation or if link down)
+    UNKNOWN = 0
+    #Link speed is 10 Mbps
+    SPEED_10 = 1
+    #Link speed is 100 Mbps
+    SPEED_100 = 2
+    #Link speed is 1000 Mbps
+    SPEED_1000 = 3
+    #Link speed is 2500 Mbps
+    SPEED_2500 = 4
+    #Link speed is 5000 Mbps
+    SPEED_5000 = 5
+    #Link speed is 10000 Mbps
+    SPEED_10000 = 6
+
+class XL_ETH_STATUS_DUPLEX(enum.IntEnum):
+    #Duplex mode could not be determined (e.g. during auto-negotiation or if link down)
+    UNKNOWN = 0
+    #Full duplex mode
+    FULL = 2
+
+class XL_ETH_STATUS_MDI(enum.IntEnum):
+    #MDI mode could not be determined  (e.g. during auto-negotiation or if link down)
+    UNKNOWN = 0
+    #Direct MDI
+    STRAIGHT = 1
+    #Crossover MDI
+    CROSSOVER = 2
+
+class XL_ETH_STATUS_CONNECTOR(enum.IntEnum):
+    #Using the only available connector on channel
+    DEFAULT = 0
+    #Using RJ-45 connector
+    RJ45 = 1
+    #Using D-Sub connector
+    DSUB = 2
+
+class XL_ETH_STATUS_PHY(enum.IntEnum):
+    #PHY is currently unknown (e.g. if link is down)
+    UNKNOWN = 0
+    #PHY is IEEE 802.3
+    IEEE_802_3 = 1
+    #PHY is BroadR-Reach
+    BROADR_REACH = 2
+    #PHY is IEEE  100BASE-T1 (802.3bw) - intentionally same value as BroadR-Reach 100Bit
+    PHY_100BASE_T1 = 2
+    #PHY is IEEE 1000BASE-T1 (802.3bp)
+    PHY_1000BASE_T1 = 4
+
+class XL_ETH_STATUS_CLOCK(enum.IntEnum):
+    #Clock mode not relevant. Only for IEEE 802.3 100/10 MBit
+    DONT_CARE = 0
+    #Clock mode is master. Only for 1000Base-T or BroadR-Reach
+    MASTER = 1
+    #Clock mode is slave. Only for 1000Base-T or BroadR-Reach
+    SLAVE = 2
+
+class XL_ETH_STATUS_BR_PAIR(enum.IntEnum):
+    #No BR pair available. Only for IEEE 802.3 1000/100/10 MBit
+    DONT_CARE = 0
+    #BR 1-pair connection. Only for BroadR-Reach
+    BR_1PAIR = 1
+
+class XL_ETH_RX_ERROR(enum.IntEnum):
+    #Invalid length error. Set when the receive frame has an invalid length as defined by IEEE802.3
+    INVALID_LENGTH = 1
+    #CRC error. Set when frame is received with CRC-32 error but valid length
+    INVALID_CRC = 2
+    #Corrupted receive frame caused by a PHY error
+    PHY_ERROR = 4
+
+#Use the given source MAC address (not set by hardware)
+XL_ETH_DATAFRAME_FLAGS_USE_SOURCE_MAC = 1
+
+class XL_ETH_BYPASS(enum.IntEnum):
+    #Bypass inactive (default state)
+    INACTIVE = 0
+    #Bypass active via PHY loop
+    PHY = 1
+    #Bypass active via L2 switch (using MAC cores)
+    MACCORE = 2
+
+class XL_ETH_TX_ERROR(enum.IntEnum):
+    #Bypass activated
+    BYPASS_ENABLED = 1
+    #No Link
+    NO_LINK = 2
+    #PHY not yet configured
+    PHY_NOT_CONFIGURED = 3
+    #Frame with invalid length transmitted
+    INVALID_LENGTH = 7
+
+class XL_ETH_NETWORK_TX_ERROR(enum.IntEnum):
+    #No Link
+    NO_LINK = 1
+    #PHY not yet configured
+    PHY_NOT_CONFIGURED = 2
+    #PHY Bypass activated
+    PHY_BRIDGE_ENABLED = 4
+    #RGMII Converter in reset
+    CONVERTER_RESET = 8
+    #Invalid length error. Set when the frame has an invalid length as defined by IEEE802.3
+    INVALID_LENGTH = 16
+    #CRC error. Set when frame is transmitted with CRC-32 error but valid length
+    INVALID_CRC = 32
+    #Invalid src or dest MAC address
+    MACADDR_ERROR = 64
+
+class XL_ETH_NETWORK_RX_ERROR(enum.IntEnum):
+    #Invalid length error. Set when the receive frame has an invalid length as defined by IEEE802.3
+    INVALID_LENGTH = 1
+    #CRC error. Set when frame is received with CRC-32 error but valid length
+    INVALID_CRC = 2
+    #Corrupted receive frame caused by a PHY error
+    PHY_ERROR = 4
+    #Invalid src or dest MAC address
+    MACADDR_ERROR = 8
+
+XL_NET_MAX_NAME_LENGTH = 32 #
+
+class XL_ACCESS_TYPE(enum.IntEnum):
+    #Only for Ethernet uplink, means UDP transfers. (Not supported yet)
+    UNRELIABLE = 0
+    #Always for USB uplink or TCP for Ethernet host uplink
+    RELIABLE = 1
+class XL_NET_CFG(enum.IntEnum):
+    STAT_OK = 0
+    DUPLICATE_SEGMENT_NAME = 1
+    DUPLICATE_VP_NAME = 2
+    DUPLICATE_MP_NAME = 3
+
+XLethEventTag = ctypes.c_ushort
+
+class s_xl_eth_frame(ctypes.Structure):
+    _fields_ = [
+        #Ethernet type in network byte order
+        ("etherType", ctypes.c_ushort),
+        ("payload", ctypes.c_ubyte*XL_ETH_PAYLOAD_SIZE_MAX),
+    ]
+    __str__ = cls2str
+T_XL_ETH_FRAME = s_xl_eth_frame
+
+class s_xl_eth_framedata(ctypes.Union):
+    _fields_ = [
+        ("rawData", ctypes.c_ubyte*XL_ETH_RAW_FRAME_SIZE_MAX),
+        ("ethFrame", s_xl_eth_frame),
+    ]
+    __str__ = cls2str
+T_XL_ETH_FRAMEDATA = s_xl_eth_framedata
+
+class s_xl_eth_dataframe_rx(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #FPGA internal identifier unique to every received frame
+        ("frameIdentifier", ctypes.c_uint),
+        #transmit duration of the Ethernet frame, in nanoseconds
+        ("frameDuration", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved2", ctypes.c_uint*3),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_ETH_DATAFRAME_RX = s_xl_eth_dataframe_rx
+
+class s_xl_eth_dataframe_rxerror(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #FPGA internal identifier unique to every received frame
+        ("frameIdentifier", ctypes.c_uint),
+        #transmit duration of the Ethernet frame, in nanoseconds
+        ("frameDuration", ctypes.c_uint),
+        #Error information (XL_ETH_RX_ERROR_*)
+        ("errorFlags", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved2", ctypes.c_uint*3),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_ETH_DATAFRAME_RX_ERROR = s_xl_eth_dataframe_rxerror
+
+class s_xl_eth_dataframe_tx(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #FPGA internal identifier unique to every frame sent
+        ("frameIdentifier", ctypes.c_uint),
+        #Flags to specify (see XL_ETH_DATAFRAME_FLAGS_)
+        ("flags", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - must be set to "0"
+        ("reserved", ctypes.c_ushort),
+        #reserved field - must be set to "0"
+        ("reserved2", ctypes.c_uint*4),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_ETH_DATAFRAME_TX = s_xl_eth_dataframe_tx
+
+class s_xl_eth_dataframe_tx_event(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #FPGA internal identifier unique to every frame sent
+        ("frameIdentifier", ctypes.c_uint),
+        #Flags (see XL_ETH_DATAFRAME_FLAGS_)
+        ("flags", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved", ctypes.c_ushort),
+        #transmit duration of the Ethernet frame, in nanoseconds
+        ("frameDuration", ctypes.c_uint),
+        #currently reserved field - not used, ignore
+        ("reserved2", ctypes.c_uint*2),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_ETH_DATAFRAME_TX_EVENT = s_xl_eth_dataframe_tx_event
+T_XL_ETH_DATAFRAME_TXACK = T_XL_ETH_DATAFRAME_TX_EVENT
+T_XL_ETH_DATAFRAME_TXACK_SW = T_XL_ETH_DATAFRAME_TX_EVENT
+T_XL_ETH_DATAFRAME_TXACK_OTHERAPP = T_XL_ETH_DATAFRAME_TX_EVENT
+
+class s_xl_eth_dataframe_txerror(ctypes.Structure):
+    _fields_ = [
+        ("errorType", ctypes.c_uint),
+        ("txFrame", s_xl_eth_dataframe_tx_event),
+    ]
+    __str__ = cls2str
+T_XL_ETH_DATAFRAME_TX_ERROR = s_xl_eth_dataframe_txerror
+T_XL_ETH_DATAFRAME_TX_ERR_SW = T_XL_ETH_DATAFRAME_TX_ERROR
+T_XL_ETH_DATAFRAME_TX_ERR_OTHERAPP = T_XL_ETH_DATAFRAME_TX_ERROR
+
+class s_xl_eth_config_result(ctypes.Structure):
+    _fields_ = [
+        ("result", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+T_XL_ETH_CONFIG_RESULT = s_xl_eth_config_result
+
+class s_xl_eth_channel_status(ctypes.Structure):
+    _fields_ = [
+        #(XL_ETH_STATUS_LINK_*)      Ethernet connection status
+        ("link", ctypes.c_uint),
+        #(XL_ETH_STATUS_SPEED_*)     Link connection speed
+        ("speed", ctypes.c_uint),
+        #(XL_ETH_STATUS_DUPLEX_*)    Ethernet duplex mode. 1000Base-T always uses full duplex.
+        ("duplex", ctypes.c_uint),
+        #(XL_ETH_STATUS_MDI_*)       Currently active MDI-mode
+        ("mdiType", ctypes.c_uint),
+        #(XL_ETH_STATUS_CONNECTOR_*) Connector (plug) to use (BroadR-REACH or RJ-45)
+        ("activeConnector", ctypes.c_uint),
+        #(XL_ETH_STATUS_PHY_*)       Currently active physical layer
+        ("activePhy", ctypes.c_uint),
+        #(XL_ETH_STATUS_CLOCK_*)     When in 1000Base-T or BroadR-mode, currently active mode
+        ("clockMode", ctypes.c_uint),
+        #(XL_ETH_STATUS_BR_PAIR_*)   When in BroadR-mode, number of used cable pairs
+        ("brPairs", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+T_XL_ETH_CHANNEL_STATUS = s_xl_eth_channel_status
+
+class s_xl_eth_txAck(ctypes.Structure):
+    _fields_ = [
+        #FPGA internal identifier unique to every frame sent
+        ("frameIdentifier", ctypes.c_uint),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #currently reserved field - not used
+        ("reserved", ctypes.c_ubyte*2),
+    ]
+    __str__ = cls2str
+s_xl_eth_txAckSw = s_xl_eth_txAck
+
+class s_xl_eth_txError(ctypes.Structure):
+    _fields_ = [
+        ("errorType", ctypes.c_uint),
+        #FPGA internal identifier unique to every frame sent
+        ("frameIdentifier", ctypes.c_uint),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #currently reserved field - not used
+        ("reserved", ctypes.c_ubyte*2),
+    ]
+    __str__ = cls2str
+s_xl_eth_txErrorSw = s_xl_eth_txError
+
+class u_xl_eth_eventInfo(ctypes.Union):
+    _fields_ = [
+        ("txAck", s_xl_eth_txAck),
+        ("txAckSw", s_xl_eth_txAckSw),
+        ("txError", s_xl_eth_txError),
+        ("txError", s_xl_eth_txErrorSw),
+        ("reserved", ctypes.c_uint*20),
+    ]
+    __str__ = cls2str
+
+class s_xl_eth_lostevent(ctypes.Structure):
+    #if a nested structure or union has a member of the same name it will shadow the other one,
+    #which is why eventInfo is not anonymous
+    #_anonymous_ = ("eventInfo",)
+    _fields_ = [
+        #Type of event lost
+        ("eventTypeLost", XLethEventTag),
+        #currently reserved field - not used
+        ("reserved", ctypes.c_ushort),
+        #Reason code why the events were lost (0 means unknown)
+        ("reason", ctypes.c_uint),
+        ("eventInfo", u_xl_eth_eventInfo),
+    ]
+    __str__ = cls2str
+T_XL_ETH_LOSTEVENT = s_xl_eth_lostevent
+
+class s_xl_eth_tag_data(ctypes.Union):
+    _fields_ = [
+        ("rawData", ctypes.c_ubyte*XL_ETH_EVENT_SIZE_MAX),
+        #(tag==XL_ETH_EVENT_TAG_FRAMERX) - Frame received from network
+        ("frameRxOk", s_xl_eth_dataframe_rx),
+        #(tag==XL_ETH_EVENT_TAG_FRAMERX_ERROR) - Erroneous frame received from network
+        ("frameRxError", s_xl_eth_dataframe_rxerror),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ACK) - ACK for frame sent by application
+        ("frameTxAck", s_xl_eth_dataframe_tx_event),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ACK_SWITCH) - ACK for frame sent by switch
+        ("frameTxAckSw", s_xl_eth_dataframe_tx_event),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ERROR_OTHER_APP) - ACK for frame sent by another application
+        ("frameTxAckOtherApp", s_xl_eth_dataframe_tx_event),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ERROR) - NACK for frame sent by application (frame could not be transmitted)
+        ("frameTxError", s_xl_eth_dataframe_txerror),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ERROR_SWITCH) - NACK for frame sent by switch. May indicate internal processing failure (e.g. queue full condition)
+        ("frameTxErrorSw", s_xl_eth_dataframe_txerror),
+        #(tag==XL_ETH_EVENT_TAG_FRAMETX_ERROR_OTHER_APP) - NACK for frame sent by another application
+        ("frameTxErrorOtherApp", s_xl_eth_dataframe_txerror),
+        ("configResult", s_xl_eth_config_result),
+        ("channelStatus", s_xl_eth_channel_status),
+        ("syncPulse", s_xl_sync_pulse_ev),
+        #(tag==XL_ETH_EVENT_TAG_LOSTEVENT) - Indication that one or more events have been lost
+        ("lostEvent", s_xl_eth_lostevent),
+    ]
+    __str__ = cls2str
+
+class s_xl_eth_event(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        #overall size of the complete event, depending on event type and piggybacked data
+        ("size", ctypes.c_uint),
+        #type of the event
+        ("tag", XLethEventTag),
+        ("channelIndex", ctypes.c_ushort),
+        ("userHandle", ctypes.c_uint),
+        ("flagsChip", ctypes.c_ushort),
+        ("reserved", ctypes.c_ushort),
+        ("reserved1", XLuint64),
+        #timestamp which is synchronized by the driver
+        ("timeStampSync", XLuint64),
+        ("tagData", s_xl_eth_tag_data),
+    ]
+    __str__ = cls2str
+T_XL_ETH_EVENT = s_xl_eth_event
+
+class s_xl_net_eth_dataframe_rx(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #Transmit duration of the Ethernet frame, in nanoseconds
+        ("frameDuration", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved1", ctypes.c_ubyte),
+        #currently reserved field - not used, ignore
+        ("reserved2", ctypes.c_ubyte),
+        #see XL_ETH_NETWORK_RX_ERROR_xxx and XL_ETH_NETWORK_TX_ERROR_xxx
+        ("errorFlags", ctypes.c_uint),
+        #currently reserved field - not used, ignore
+        ("reserved3", ctypes.c_uint),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_NET_ETH_DATAFRAME_RX =s_xl_net_eth_dataframe_rx
+T_XL_NET_ETH_DATAFRAME_SIMULATION_TX_ACK = T_XL_NET_ETH_DATAFRAME_RX
+T_XL_NET_ETH_DATAFRAME_MEASUREMENT_RX = T_XL_NET_ETH_DATAFRAME_RX
+T_XL_NET_ETH_DATAFRAME_MEASUREMENT_TX = T_XL_NET_ETH_DATAFRAME_RX
+
+class s_xl_net_eth_dataframe_rx_error(ctypes.Structure):
+    _anonymous_ = ("frameData",)
+    _fields_ = [
+        #Transmit duration of the Ethernet frame, in nanoseconds
+        ("frameDuration", ctypes.c_uint),
+        #see XL_ETH_NETWORK_RX_ERROR_xxx and XL_ETH_NETWORK_TX_ERROR_xxx
+        ("errorFlags", ctypes.c_uint),
+        #Overall data length of <frameData>
+        ("dataLen", ctypes.c_ushort),
+        #currently reserved field - not used, ignore
+        ("reserved1", ctypes.c_ubyte),
+        #currently reserved field - not used, ignore
+        ("reserved2", ctypes.c_ubyte),
+        #currently reserved field - not used, ignore
+        ("reserved3", ctypes.c_uint*2),
+        #Frame Check Sum
+        ("fcs", ctypes.c_uint),
+        #Destination MAC address
+        ("destMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        #Source MAC address
+        ("sourceMAC", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+        ("frameData", s_xl_eth_framedata),
+    ]
+    __str__ = cls2str
+T_XL_NET_ETH_DATAFRAME_RX_ERROR =s_xl_net_eth_dataframe_rx_error
+T_XL_NET_ETH_DATAFRAME_SIMULATION_TX_ERROR = T_XL_NET_ETH_DATAFRAME_RX_ERROR
+T_XL_NET_ETH_DATAFRAME_MEASUREMENT_RX_ERROR = T_XL_NET_ETH_DATAFRAME_RX_ERROR
+T_XL_NET_ETH_DATAFRAME_MEASUREMENT_TX_ERROR = T_XL_NET_ETH_DATAFRAME_RX_ERROR
+
+T_XL_NET_ETH_DATAFRAME_TX = T_XL_ETH_DATAFRAME_TX
+
+T_XL_NET_ETH_CHANNEL_STATUS = T_XL_ETH_CHANNEL_STATUS
+
+class s_xl_eth_net_tag_data(ctypes.Union):
+    _fields_ = [
+        ("rawData", ctypes.c_ubyte*XL_ETH_EVENT_SIZE_MAX),
+        ("frameSimRx", s_xl_net_eth_dataframe_rx),
+        ("frameSimRxError", s_xl_net_eth_dataframe_rx_error),
+        ("frameSimTxAck", s_xl_net_eth_dataframe_rx),
+        ("frameSimTxError", s_xl_net_eth_dataframe_rx_error),
+        ("frameMeasureRx", s_xl_net_eth_dataframe_rx),
+        ("frameMeasureRxError", s_xl_net_eth_dataframe_rx_error),
+        ("frameMeasureTx", s_xl_net_eth_dataframe_rx),
+        ("frameMeasureTxError", s_xl_net_eth_dataframe_rx_error),
+        ("channelStatus", s_xl_eth_channel_status),
+    ]
+    __str__ = cls2str
+
+class s_xl_net_eth_event(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        #overall size of the complete event
+        ("size", ctypes.c_uint),
+        #type of the event
+        ("tag", XLethEventTag),
+        #channel index
+        ("channelIndex", ctypes.c_ushort),
+        #application specific user handle
+        ("userHandle", ctypes.c_uint),
+        #flags
+        ("flagsChip", ctypes.c_ushort),
+        #currently reserved field - not used
+        ("reserved", ctypes.c_ushort),
+        #currently reserved field - not used
+        ("reserved1", XLuint64),
+        #synchronized TS by the driver
+        ("timeStampSync", XLuint64),
+        ("tagData", s_xl_eth_net_tag_data),
+    ]
+    __str__ = cls2str
+T_XL_NET_ETH_EVENT = s_xl_net_eth_event
+
+class s_xl_eth_config(ctypes.Structure):
+    _fields_ = [
+        #(XL_ETH_MODE_SPEED_*)       Connection speed setting
+        ("speed", ctypes.c_uint),
+        #(XL_ETH_MODE_DUPLEX_*)      Duplex mode setting. Not relevant for BroadR-REACH mode, set to "nochange" or "auto".
+        ("duplex", ctypes.c_uint),
+        #(XL_ETH_MODE_CONNECTOR_*)   Connector to use
+        ("connector", ctypes.c_uint),
+        #(XL_ETH_MODE_PHY_*)         Physical interface to enable
+        ("phy", ctypes.c_uint),
+        #(XL_ETH_MODE_CLOCK_*)       Master or slave clock mode setting (1000Base-T/BroadR-REACH mode only).
+        ("clockMode", ctypes.c_uint),
+        #(XL_ETH_MODE_MDI_*)         Currently active MDI-mode
+        ("mdiMode", ctypes.c_uint),
+        #(XL_ETH_MODE_BR_PAIR_*)     Number of cable pairs to use (BroadR-REACH mode only).
+        ("brPairs", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+T_XL_ETH_CONFIG = s_xl_eth_config
+
+class s_xl_eth_mac_address(ctypes.Structure):
+    _fields_ = [
+        ("address", ctypes.c_ubyte*XL_ETH_MACADDR_OCTETS),
+    ]
+    __str__ = cls2str
+T_XL_ETH_MAC_ADDRESS = s_xl_eth_mac_address
+
+### Ethernet XL API functions ###
+
+xlEthSetConfig = _vector_xlapi_dll_.xlEthSetConfig
+xlEthSetConfig.restype = XLstatus
+xlEthSetConfig.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #config
+    ctypes.POINTER(T_XL_ETH_CONFIG),
+]
+xlEthSetConfig.errcheck = check_xl_status
+xlEthSetConfig.__doc__ = """
+xlapi.xlEthSetConfig
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlEthGetConfig = _vector_xlapi_dll_.xlEthGetConfig
+xlEthGetConfig.restype = XLstatus
+xlEthGetConfig.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #config
+    ctypes.POINTER(T_XL_ETH_CONFIG),
+]
+xlEthGetConfig.errcheck = check_xl_status
+xlEthGetConfig.__doc__ = """
+xlapi.xlEthGetConfig
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlEthReceive = _vector_xlapi_dll_.xlEthReceive
+xlEthReceive.restype = XLstatus
+xlEthReceive.argtypes = [
+    #portHandle
+    XLportHandle,
+    #ethEventBuffer
+    ctypes.POINTER(T_XL_ETH_EVENT),
+]
+xlEthReceive.errcheck = check_xl_status
+xlEthReceive.__doc__ = """
+xlapi.xlEthReceive
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlEthSetBypass = _vector_xlapi_dll_.xlEthSetBypass
+xlEthSetBypass.restype = XLstatus
+xlEthSetBypass.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #mode
+    ctypes.c_uint,
+]
+xlEthSetBypass.errcheck = check_xl_status
+xlEthSetBypass.__doc__ = """
+xlapi.xlEthSetBypass
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlEthTwinkleStatusLed = _vector_xlapi_dll_.xlEthTwinkleStatusLed
+xlEthTwinkleStatusLed.restype = XLstatus
+xlEthTwinkleStatusLed.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlEthTwinkleStatusLed.errcheck = check_xl_status
+xlEthTwinkleStatusLed.__doc__ = """
+xlapi.xlEthTwinkleStatusLed
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlEthTransmit = _vector_xlapi_dll_.xlEthTransmit
+xlEthTransmit.restype = XLstatus
+xlEthTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #data
+    ctypes.POINTER(T_XL_ETH_DATAFRAME_TX),
+]
+xlEthTransmit.errcheck = check_xl_status
+xlEthTransmit.__doc__ = """
+xlapi.xlEthTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetEthOpenNetwork = _vector_xlapi_dll_.xlNetEthOpenNetwork
+xlNetEthOpenNetwork.restype = XLstatus
+xlNetEthOpenNetwork.argtypes = [
+    #pNetworkName
+    ctypes.c_char_p,
+    #pNetworkHandle
+    ctypes.POINTER(XLnetworkHandle),
+    #pAppName
+    ctypes.c_char_p,
+    #accessType
+    ctypes.c_uint,
+    #queueSize
+    ctypes.c_uint,
+]
+xlNetEthOpenNetwork.errcheck = check_xl_status
+xlNetEthOpenNetwork.__doc__ = """
+xlapi.xlNetEthOpenNetwork
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetCloseNetwork = _vector_xlapi_dll_.xlNetCloseNetwork
+xlNetCloseNetwork.restype = XLstatus
+xlNetCloseNetwork.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+]
+xlNetCloseNetwork.errcheck = check_xl_status
+xlNetCloseNetwork.__doc__ = """
+xlapi.xlNetCloseNetwork
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetOpenVirtualPort = _vector_xlapi_dll_.xlNetOpenVirtualPort
+xlNetOpenVirtualPort.restype = XLstatus
+xlNetOpenVirtualPort.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pVPortName
+    ctypes.c_char_p,
+    #pEthPortHandle
+    ctypes.POINTER(XLethPortHandle),
+    #rxHandle
+    XLrxHandle,
+]
+xlNetOpenVirtualPort.errcheck = check_xl_status
+xlNetOpenVirtualPort.__doc__ = """
+xlapi.xlNetOpenVirtualPort
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetAddVirtualPort = _vector_xlapi_dll_.xlNetAddVirtualPort
+xlNetAddVirtualPort.restype = XLstatus
+xlNetAddVirtualPort.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pSwitchName
+    ctypes.c_char_p,
+    #pVPortName
+    ctypes.c_char_p,
+    #pEthPortHandle
+    ctypes.POINTER(XLethPortHandle),
+    #rxHandle
+    XLrxHandle,
+]
+xlNetAddVirtualPort.errcheck = check_xl_status
+xlNetAddVirtualPort.__doc__ = """
+xlapi.xlNetAddVirtualPort
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetConnectMeasurementPoint = _vector_xlapi_dll_.xlNetConnectMeasurementPoint
+xlNetConnectMeasurementPoint.restype = XLstatus
+xlNetConnectMeasurementPoint.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pPortName
+    ctypes.c_char_p,
+    #pEthPortHandle
+    ctypes.POINTER(XLethPortHandle),
+    #rxHandle
+    XLrxHandle,
+]
+xlNetConnectMeasurementPoint.errcheck = check_xl_status
+xlNetConnectMeasurementPoint.__doc__ = """
+xlapi.xlNetConnectMeasurementPoint
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetActivateNetwork = _vector_xlapi_dll_.xlNetActivateNetwork
+xlNetActivateNetwork.restype = XLstatus
+xlNetActivateNetwork.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+]
+xlNetActivateNetwork.errcheck = check_xl_status
+xlNetActivateNetwork.__doc__ = """
+xlapi.xlNetActivateNetwork
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetDeactivateNetwork = _vector_xlapi_dll_.xlNetDeactivateNetwork
+xlNetDeactivateNetwork.restype = XLstatus
+xlNetDeactivateNetwork.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+]
+xlNetDeactivateNetwork.errcheck = check_xl_status
+xlNetDeactivateNetwork.__doc__ = """
+xlapi.xlNetDeactivateNetwork
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetEthSend = _vector_xlapi_dll_.xlNetEthSend
+xlNetEthSend.restype = XLstatus
+xlNetEthSend.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #ethPortHandle
+    XLethPortHandle,
+    #userHandle
+    XLuserHandle,
+    #pEthTxFrame
+    ctypes.POINTER(T_XL_NET_ETH_DATAFRAME_TX),
+]
+xlNetEthSend.errcheck = check_xl_status
+xlNetEthSend.__doc__ = """
+xlapi.xlNetEthSend
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetEthReceive = _vector_xlapi_dll_.xlNetEthReceive
+xlNetEthReceive.restype = XLstatus
+xlNetEthReceive.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pEventBuffer
+    ctypes.POINTER(T_XL_NET_ETH_EVENT),
+    #pRxHandleCount
+    ctypes.POINTER(ctypes.c_uint),
+    #pRxHandle
+    ctypes.POINTER(XLrxHandle),
+]
+xlNetEthReceive.errcheck = check_xl_status
+xlNetEthReceive.__doc__ = """
+xlapi.xlNetEthReceive
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetEthRequestChannelStatus = _vector_xlapi_dll_.xlNetEthRequestChannelStatus
+xlNetEthRequestChannelStatus.restype = XLstatus
+xlNetEthRequestChannelStatus.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+]
+xlNetEthRequestChannelStatus.errcheck = check_xl_status
+xlNetEthRequestChannelStatus.__doc__ = """
+xlapi.xlNetEthRequestChannelStatus
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetSetNotification = _vector_xlapi_dll_.xlNetSetNotification
+xlNetSetNotification.restype = XLstatus
+xlNetSetNotification.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pHandle
+    ctypes.POINTER(XLhandle),
+    #queueLevel
+    ctypes.c_int,
+]
+xlNetSetNotification.errcheck = check_xl_status
+xlNetSetNotification.__doc__ = """
+xlapi.xlNetSetNotification
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetRequestMACAddress = _vector_xlapi_dll_.xlNetRequestMACAddress
+xlNetRequestMACAddress.restype = XLstatus
+xlNetRequestMACAddress.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pMACAddress
+    ctypes.POINTER(T_XL_ETH_MAC_ADDRESS),
+]
+xlNetRequestMACAddress.errcheck = check_xl_status
+xlNetRequestMACAddress.__doc__ = """
+xlapi.xlNetRequestMACAddress
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetReleaseMACAddress = _vector_xlapi_dll_.xlNetReleaseMACAddress
+xlNetReleaseMACAddress.restype = XLstatus
+xlNetReleaseMACAddress.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+    #pMACAddress
+    ctypes.POINTER(T_XL_ETH_MAC_ADDRESS),
+]
+xlNetReleaseMACAddress.errcheck = check_xl_status
+xlNetReleaseMACAddress.__doc__ = """
+xlapi.xlNetReleaseMACAddress
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlNetFlushReceiveQueue = _vector_xlapi_dll_.xlNetFlushReceiveQueue
+xlNetFlushReceiveQueue.restype = XLstatus
+xlNetFlushReceiveQueue.argtypes = [
+    #networkHandle
+    XLnetworkHandle,
+]
+xlNetFlushReceiveQueue.errcheck = check_xl_status
+xlNetFlushReceiveQueue.__doc__ = """
+xlapi.xlNetFlushReceiveQueue
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
@@ -0,0 +1,891 @@
+##############################################################################
+#                                                                            #
+# Module: xlflexray                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The FlexRay part of the python ctypes wrapper for the Vector XL            #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.XLfrEvent.                                                      #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+### FlexRay XL API ###
+
+XL_FR_MAX_DATA_LENGTH = 254
+
+class s_xl_fr_cluster_configuration(ctypes.Structure):
+    _fields_ = [
+        ("busGuardianEnable", ctypes.c_uint),
+        ("baudrate", ctypes.c_uint),
+        ("busGuardianTick", ctypes.c_uint),
+        ("externalClockCorrectionMode", ctypes.c_uint),
+        ("gColdStartAttempts", ctypes.c_uint),
+        ("gListenNoise", ctypes.c_uint),
+        ("gMacroPerCycle", ctypes.c_uint),
+        ("gMaxWithoutClockCorrectionFatal", ctypes.c_uint),
+        ("gMaxWithoutClockCorrectionPassive", ctypes.c_uint),
+        ("gNetworkManagementVectorLength", ctypes.c_uint),
+        ("gNumberOfMinislots", ctypes.c_uint),
+        ("gNumberOfStaticSlots", ctypes.c_uint),
+        ("gOffsetCorrectionStart", ctypes.c_uint),
+        ("gPayloadLengthStatic", ctypes.c_uint),
+        ("gSyncNodeMax", ctypes.c_uint),
+        ("gdActionPointOffset", ctypes.c_uint),
+        ("gdDynamicSlotIdlePhase", ctypes.c_uint),
+        ("gdMacrotick", ctypes.c_uint),
+        ("gdMinislot", ctypes.c_uint),
+        ("gdMiniSlotActionPointOffset", ctypes.c_uint),
+        ("gdNIT", ctypes.c_uint),
+        ("gdStaticSlot", ctypes.c_uint),
+        ("gdSymbolWindow", ctypes.c_uint),
+        ("gdTSSTransmitter", ctypes.c_uint),
+        ("gdWakeupSymbolRxIdle", ctypes.c_uint),
+        ("gdWakeupSymbolRxLow", ctypes.c_uint),
+        ("gdWakeupSymbolRxWindow", ctypes.c_uint),
+        ("gdWakeupSymbolTxIdle", ctypes.c_uint),
+        ("gdWakeupSymbolTxLow", ctypes.c_uint),
+        ("pAllowHaltDueToClock", ctypes.c_uint),
+        ("pAllowPassiveToActive", ctypes.c_uint),
+        ("pChannels", ctypes.c_uint),
+        ("pClusterDriftDamping", ctypes.c_uint),
+        ("pDecodingCorrection", ctypes.c_uint),
+        ("pDelayCompensationA", ctypes.c_uint),
+        ("pDelayCompensationB", ctypes.c_uint),
+        ("pExternOffsetCorrection", ctypes.c_uint),
+        ("pExternRateCorrection", ctypes.c_uint),
+        ("pKeySlotUsedForStartup", ctypes.c_uint),
+        ("pKeySlotUsedForSync", ctypes.c_uint),
+        ("pLatestTx", ctypes.c_uint),
+        ("pMacroInitialOffsetA", ctypes.c_uint),
+        ("pMacroInitialOffsetB", ctypes.c_uint),
+        ("pMaxPayloadLengthDynamic", ctypes.c_uint),
+        ("pMicroInitialOffsetA", ctypes.c_uint),
+        ("pMicroInitialOffsetB", ctypes.c_uint),
+        ("pMicroPerCycle", ctypes.c_uint),
+        ("pMicroPerMacroNom", ctypes.c_uint),
+        ("pOffsetCorrectionOut", ctypes.c_uint),
+        ("pRateCorrectionOut", ctypes.c_uint),
+        ("pSamplesPerMicrotick", ctypes.c_uint),
+        ("pSingleSlotEnabled", ctypes.c_uint),
+        ("pWakeupChannel", ctypes.c_uint),
+        ("pWakeupPattern", ctypes.c_uint),
+        ("pdAcceptedStartupRange", ctypes.c_uint),
+        ("pdListenTimeout", ctypes.c_uint),
+        ("pdMaxDrift", ctypes.c_uint),
+        ("pdMicrotick", ctypes.c_uint),
+        ("gdCASRxLowMax", ctypes.c_uint),
+        ("gChannels", ctypes.c_uint),
+        ("vExternOffsetControl", ctypes.c_uint),
+        ("vExternRateControl", ctypes.c_uint),
+        ("pChannelsMTS", ctypes.c_uint),
+        #16-bit value with data for pre-initializing the Flexray payload data words
+        ("framePresetData", ctypes.c_uint),
+        ("reserved", ctypes.c_uint*15),
+    ]
+    __str__ = cls2str
+XLfrClusterConfig = s_xl_fr_cluster_configuration
+
+class s_xl_fr_channel_config(ctypes.Structure):
+    _fields_ = [
+        #XL_FR_CHANNEL_CFG_STATUS_xxx
+        ("status", ctypes.c_uint),
+        #XL_FR_CHANNEL_CFG_MODE_xxx
+        ("cfgMode", ctypes.c_uint),
+        ("reserved", ctypes.c_uint*6),
+        #same as used in function xlFrSetConfig
+        ("xlFrClusterConfig", s_xl_fr_cluster_configuration),
+    ]
+    __str__ = cls2str
+XLfrChannelConfig = s_xl_fr_channel_config
+
+class XL_FR_CHANNEL_CFG_STATUS(enum.IntFlag):
+    INIT_APP_PRESENT = 1
+    CHANNEL_ACTIVATED = 2
+    VALID_CLUSTER_CFG = 4
+    VALID_CFG_MODE = 8
+
+class XL_FR_CHANNEL_CFG_MODE(enum.IntEnum):
+    SYNCHRONOUS = 1
+    COMBINED = 2
+    ASYNCHRONOUS = 3
+
+class XL_FR_MODE(enum.IntEnum):
+    #setup the VN3000 (eRay) normal operation mode. (default mode)
+    NORMAL = 0
+    #setup the VN3000 (Fujitsu) normal operation mode. (default mode)
+    COLD_NORMAL = 4
+
+class XL_FR_MODE_STARTUP(enum.IntEnum):
+    #for normal use
+    NONE = 0
+    #for wakeup
+    WAKEUP = 1
+    #Coldstart path initiating the schedule synchronization
+    COLDSTART_LEADING = 2
+    #Coldstart path joining other coldstart nodes
+    COLDSTART_FOLLOWING = 3
+    #Send Wakeup and Coldstart path initiating the schedule synchronization
+    WAKEUP_AND_COLDSTART_LEADING = 4
+    #Send Wakeup and Coldstart path joining other coldstart nodes
+    WAKEUP_AND_COLDSTART_FOLLOWING = 5
+
+class s_xl_fr_set_modes(ctypes.Structure):
+    _fields_ = [
+        ("frMode", ctypes.c_uint),
+        ("frStartupAttributes", ctypes.c_uint),
+        ("reserved", ctypes.c_uint*30),
+    ]
+    __str__ = cls2str
+XLfrMode = s_xl_fr_set_modes
+
+class XL_FR_SYMBOL(enum.IntEnum):
+    #defines a MTS (Media Access Test Symbol)
+    MTS = 1
+    #defines a CAS (Collision Avoidance Symbol)
+    CAS = 2
+
+class XL_FR_TRANSCEIVER_MODE(enum.IntEnum):
+    SLEEP = 1
+    NORMAL = 2
+    RECEIVE_ONLY = 3
+    STANDBY = 4
+
+class XL_FR_SYNC_PULSE(enum.IntEnum):
+    EXTERNAL = XL_SYNC_PULSE.EXTERNAL
+    OUR = XL_SYNC_PULSE.OUR
+    OUR_SHARED = XL_SYNC_PULSE.OUR_SHARED
+
+XL_FR_SPY_MODE_ASYNCHRONOUS = 1
+
+class XL_FR_FILTER_STATUS(enum.IntEnum):
+    #maching frame passes the filter
+    PASS = 0
+    #maching frame is blocked
+    BLOCK = 1
+
+class XL_FR_FILTER_TYPE(enum.IntEnum):
+    #specifies a data frame
+    DATA = 1
+    #specifies a null frame in an used cycle
+    NF = 2
+    #specifies a null frame in an unused cycle
+    FILLUP_NF = 4
+
+class XL_FR_FILTER_CHANNEL(enum.IntEnum):
+    #specifies FlexRay channel A for the PC
+    A = 1
+    #specifies FlexRay channel B for the PC
+    B = 2
+
+class s_xl_fr_acceptance_filter(ctypes.Structure):
+    _fields_ = [
+        #defines if the specified frame should be blocked or pass the filter
+        ("filterStatus", ctypes.c_uint),
+        #specifies the frame type that should be filtered
+        ("filterTypeMask", ctypes.c_uint),
+        #beginning of the slot range
+        ("filterFirstSlot", ctypes.c_uint),
+        #end of the slot range (can be the same as filterFirstSlot)
+        ("filterLastSlot", ctypes.c_uint),
+        #channel A, B for PC, channel A, B for COB
+        ("filterChannelMask", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLfrAcceptanceFilter = s_xl_fr_acceptance_filter
+
+class XL_FR_FLAGS_CHIP(enum.IntFlag):
+    CHANNEL_A = 1
+    CHANNEL_B = 2
+    # 3
+    CHANNEL_AB = CHANNEL_A|CHANNEL_B
+    #second CC channel A to initiate the coldstart
+    CC_COLD_A = 4
+    #second CC channel B to initiate the coldstart
+    CC_COLD_B = 8
+    # 12
+    CC_COLD_AB = CC_COLD_A|CC_COLD_B
+    #Spy mode flags
+    SPY_CHANNEL_A = 16
+    #Spy mode flags
+    SPY_CHANNEL_B = 32
+
+#driver queue overflow
+XL_FR_QUEUE_OVERFLOW = 256
+
+class XL_FR_FRAMEFLAG(enum.IntEnum):
+    #indicates a startup frame
+    STARTUP = 1
+    #indicates a sync frame
+    SYNC = 2
+    #indicates a null frame
+    NULLFRAME = 4
+    #indicates a present payload preamble bit
+    PAYLOAD_PREAMBLE = 8
+    #reserved by Flexray protocol
+    FR_RESERVED = 16
+    #used for Tx events only
+    REQ_TXACK = 32
+    #indicates TxAck of SingleShot; used for TxAck events only
+    TXACK_SS = REQ_TXACK
+    #indicates unexpected Rx frame; used for Rx events only
+    RX_UNEXPECTED = REQ_TXACK
+    #flag used with TxAcks to indicate first TxAck after data update
+    NEW_DATA_TX = 64
+    #flag used with TxAcks indicating that data update has been lost
+    DATA_UPDATE_LOST = 128
+    SYNTAX_ERROR = 512
+    CONTENT_ERROR = 1024
+    SLOT_BOUNDARY_VIOLATION = 2048
+    TX_CONFLICT = 4096
+    EMPTY_SLOT = 8192
+    #Only used with TxAcks: Frame has been transmitted. If not set after transmission, an error has occurred.
+    FRAME_TRANSMITTED = 32768
+
+class XL_FR_SPY_FRAMEFLAG_ERROR(enum.IntEnum):
+    FRAMING_ERROR = 1
+    HEADER_CRC_ERROR = 2
+    FRAME_CRC_ERROR = 4
+    BUS_ERROR = 8
+
+class XL_FR_SPY_FRAMEFLAG_FRAME_CRC(enum.IntEnum):
+    NEW_LAYOUT = 2147483648
+
+class XL_FR_SPY_FRAMEFLAG_FRAME_FLAGS(enum.IntEnum):
+    STATIC_FRAME = 1
+
+class XL_FR_TX_MODE(enum.IntEnum):
+    #'normal' cyclic mode
+    CYCLIC = 1
+    #sends only a single shot
+    SINGLE_SHOT = 2
+    #switch off TX
+    NONE = 255
+
+class XL_FR_PAYLOAD_INCREMENT(enum.IntEnum):
+    INCREMENT_8BIT = 8
+    INCREMENT_16BIT = 16
+    INCREMENT_32BIT = 32
+    INCREMENT_NONE = 0
+
+class XL_FR_STATUS(enum.IntEnum):
+    #indicates the actual state of the POC in operation control
+    DEFAULT_CONFIG = 0
+    READY = 1
+    NORMAL_ACTIVE = 2
+    NORMAL_PASSIVE = 3
+    HALT = 4
+    MONITOR_MODE = 5
+    CONFIG = 15
+    #indicates the actual state of the POC in the wakeup path
+    WAKEUP_STANDBY = 16
+    WAKEUP_LISTEN = 17
+    WAKEUP_SEND = 18
+    WAKEUP_DETECT = 19
+    #indicates the actual state of the POC in the startup path
+    STARTUP_PREPARE = 32
+    COLDSTART_LISTEN = 33
+    COLDSTART_COLLISION_RESOLUTION = 34
+    COLDSTART_CONSISTENCY_CHECK = 35
+    COLDSTART_GAP = 36
+    COLDSTART_JOIN = 37
+    INTEGRATION_COLDSTART_CHECK = 38
+    INTEGRATION_LISTEN = 39
+    INTEGRATION_CONSISTENCY_CHECK = 40
+    INITIALIZE_SCHEDULE = 41
+    ABORT_STARTUP = 42
+    STARTUP_SUCCESS = 43
+
+class XL_FR_ERROR_POC(enum.IntEnum):
+    #Indicates the actual error mode of the POC: active (green)
+    ACTIVE = 0
+    #Indicates the actual error mode of the POC: passive (yellow)
+    PASSIVE = 1
+    #Indicates the actual error mode of the POC: comm-halt (red)
+    COMM_HALT = 2
+
+class XL_FR_ERROR_NIT(enum.IntEnum):
+    #Syntax Error during NIT Channel A
+    SENA = 256
+    #Slot Boundary Violation during NIT Channel A
+    SBNA = 512
+    #Syntax Error during NIT Channel B
+    SENB = 1024
+    #Slot Boundary Violation during NIT Channel B
+    SBNB = 2048
+
+class XL_FR_ERROR_CLOCK(enum.IntEnum):
+    #Set if no sync frames were received. -> no offset correction possible.
+    MISSING_OFFSET_CORRECTION = 1
+    #Set if max. offset correction limit is reached.
+    MAX_OFFSET_CORRECTION_REACHED = 2
+    #Set if no even/odd sync frames were received -> no rate correction possible.
+    MISSING_RATE_CORRECTION = 4
+    #Set if max. rate correction limit is reached.
+    MAX_RATE_CORRECTION_REACHED = 8
+
+class XL_FR_ERROR_CC(enum.IntEnum):
+    #Parity Error, data from MHDS (internal ERay error)
+    PERR = 64
+    #Illegal Input Buffer Access (internal ERay error)
+    IIBA = 512
+    #Illegal Output Buffer Access (internal ERay error)
+    IOBA = 1024
+    #Message Handler Constraints Flag data from MHDF (internal ERay error)
+    MHF = 2048
+    #Error Detection on channel A, data from ACS
+    EDA = 65536
+    #Latest Transmit Violation on channel A
+    LTVA = 131072
+    #Transmit Across Boundary on Channel A
+    TABA = 262144
+    #Error Detection on channel B, data from ACS
+    EDB = 16777216
+    #Latest Transmit Violation on channel B
+    LTVB = 33554432
+    #Transmit Across Boundary on Channel B
+    TABB = 67108864
+
+class XL_FR_WAKEUP(enum.IntEnum):
+    #No wakeup attempt since CONFIG state was left. (e.g. when a wakeup pattern A|B is received)
+    UNDEFINED = 0
+    #Frame header without coding violation received.
+    RECEIVED_HEADER = 1
+    #Wakeup pattern on the configured wakeup channel received.
+    RECEIVED_WUP = 2
+    #Detected collision during wakeup pattern transmission received.
+    COLLISION_HEADER = 3
+    #Collision during wakeup pattern transmission received.
+    COLLISION_WUP = 4
+    #Set when the CC stops wakeup.
+    COLLISION_UNKNOWN = 5
+    #Completed the transmission of the wakeup pattern.
+    TRANSMITTED = 6
+    #wakeup comes from external
+    EXTERNAL_WAKEUP = 7
+    #wakeupt pattern received from flexray bus
+    WUP_RECEIVED_WITHOUT_WUS_TX = 16
+    RESERVED = 255 #
+
+class XL_FR_SYMBOL_STATUS(enum.IntEnum):
+    #Syntax Error in Symbol Window Channel A
+    SESA = 1
+    #Slot Boundary Violation in Symbol Window Channel A
+    SBSA = 2
+    #Transmission Conflict in Symbol Window Channel A
+    TCSA = 4
+    #Syntax Error in Symbol Window Channel B
+    SESB = 8
+    #Slot Boundary Violation in Symbol Window Channel B
+    SBSB = 16
+    #Transmission Conflict in Symbol Window Channel B
+    TCSB = 32
+    #MTS received in Symbol Window Channel A
+    MTSA = 64
+    #MTS received in Symbol Window Channel B
+    MTSB = 128
+
+XL_FR_RX_EVENT_HEADER_SIZE = 32
+XL_FR_MAX_EVENT_SIZE = 512
+
+class s_xl_fr_start_cycle(ctypes.Structure):
+    _fields_ = [
+        ("cycleCount", ctypes.c_uint),
+        ("vRateCorrection", ctypes.c_int),
+        ("vOffsetCorrection", ctypes.c_int),
+        ("vClockCorrectionFailed", ctypes.c_uint),
+        ("vAllowPassivToActive", ctypes.c_uint),
+        ("reserved", ctypes.c_uint*3),
+    ]
+    __str__ = cls2str
+XL_FR_START_CYCLE_EV = s_xl_fr_start_cycle
+
+class s_xl_fr_rx_frame(ctypes.Structure):
+    _fields_ = [
+        ("flags", ctypes.c_ushort),
+        ("headerCRC", ctypes.c_ushort),
+        ("slotID", ctypes.c_ushort),
+        ("cycleCount", ctypes.c_ubyte),
+        ("payloadLength", ctypes.c_ubyte),
+        ("data", ctypes.c_ubyte*XL_FR_MAX_DATA_LENGTH),
+    ]
+    __str__ = cls2str
+XL_FR_RX_FRAME_EV = s_xl_fr_rx_frame
+
+class s_xl_fr_tx_frame(ctypes.Structure):
+    _fields_ = [
+        ("flags", ctypes.c_ushort),
+        ("slotID", ctypes.c_ushort),
+        ("offset", ctypes.c_ubyte),
+        ("repetition", ctypes.c_ubyte),
+        ("payloadLength", ctypes.c_ubyte),
+        ("txMode", ctypes.c_ubyte),
+        ("incrementSize", ctypes.c_ubyte),
+        ("incrementOffset", ctypes.c_ubyte),
+        ("reserved0", ctypes.c_ubyte),
+        ("reserved1", ctypes.c_ubyte),
+        ("data", ctypes.c_ubyte*XL_FR_MAX_DATA_LENGTH),
+    ]
+    __str__ = cls2str
+XL_FR_TX_FRAME_EV = s_xl_fr_tx_frame
+
+class s_xl_fr_wakeup(ctypes.Structure):
+    _fields_ = [
+        #Actual cyclecount.
+        ("cycleCount", ctypes.c_ubyte),
+        #XL_FR_WAKEUP_UNDEFINED, ...
+        ("wakeupStatus", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*6),
+    ]
+    __str__ = cls2str
+XL_FR_WAKEUP_EV = s_xl_fr_wakeup
+
+class s_xl_fr_symbol_window(ctypes.Structure):
+    _fields_ = [
+        #XL_FR_SYMBOL_MTS, ...
+        ("symbol", ctypes.c_uint),
+        #XL_FR_SYMBOL_STATUS_SESA, ...
+        ("flags", ctypes.c_uint),
+        #Actual cyclecount.
+        ("cycleCount", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*7),
+    ]
+    __str__ = cls2str
+XL_FR_SYMBOL_WINDOW_EV = s_xl_fr_symbol_window
+
+class s_xl_fr_status(ctypes.Structure):
+    _fields_ = [
+        #POC status XL_FR_STATUS_ defines like, normal, active...
+        ("statusType", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_FR_STATUS_EV = s_xl_fr_status
+
+class s_xl_fr_nm_vector(ctypes.Structure):
+    _fields_ = [
+        ("nmVector", ctypes.c_ubyte*12),
+        #Actual cyclecount.
+        ("cycleCount", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*3),
+    ]
+    __str__ = cls2str
+XL_FR_NM_VECTOR_EV = s_xl_fr_nm_vector
+
+class s_xl_fr_error_poc_mode(ctypes.Structure):
+    _fields_ = [
+        #error mode like: active, passive, comm_halt
+        ("errorMode", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*3),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_POC_MODE_EV = s_xl_fr_error_poc_mode
+
+class s_xl_fr_error_sync_frames(ctypes.Structure):
+    _fields_ = [
+        #valid RX/TX sync frames on frCh A for even cycles
+        ("evenSyncFramesA", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh A for odd cycles
+        ("oddSyncFramesA", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh B for even cycles
+        ("evenSyncFramesB", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh B for odd cycles
+        ("oddSyncFramesB", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_SYNC_FRAMES_EV = s_xl_fr_error_sync_frames
+
+class s_xl_fr_error_clock_corr_failure(ctypes.Structure):
+    _fields_ = [
+        #valid RX/TX sync frames on frCh A for even cycles
+        ("evenSyncFramesA", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh A for odd cycles
+        ("oddSyncFramesA", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh B for even cycles
+        ("evenSyncFramesB", ctypes.c_ushort),
+        #valid RX/TX sync frames on frCh B for odd cycles
+        ("oddSyncFramesB", ctypes.c_ushort),
+        #missing/maximum rate/offset correction flags.
+        ("flags", ctypes.c_uint),
+        #E-Ray: CCEV register (CCFC value)
+        ("clockCorrFailedCounter", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_CLOCK_CORR_FAILURE_EV = s_xl_fr_error_clock_corr_failure
+
+class s_xl_fr_error_nit_failure(ctypes.Structure):
+    _fields_ = [
+        #flags for NIT boundary, syntax error...
+        ("flags", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_NIT_FAILURE_EV = s_xl_fr_error_nit_failure
+
+class s_xl_fr_error_cc_error(ctypes.Structure):
+    _fields_ = [
+        #internal CC errors (Transmit Across Boundary, Transmit Violation...)
+        ("ccError", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_CC_ERROR_EV = s_xl_fr_error_cc_error
+
+class s_xl_fr_error_info(ctypes.Union):
+    _fields_ = [
+        #E-RAY: EIR_PEMC
+        ("frPocMode", s_xl_fr_error_poc_mode),
+        #E-RAY: EIR_SFBM
+        ("frSyncFramesBelowMin", s_xl_fr_error_sync_frames),
+        #E-RAY: EIR_SFO
+        ("frSyncFramesOverload", s_xl_fr_error_sync_frames),
+        #E-RAY: EIR_CCF
+        ("frClockCorrectionFailure", s_xl_fr_error_clock_corr_failure),
+        #NIT part of the E_RAY: SWNIT register
+        ("frNitFailure", s_xl_fr_error_nit_failure),
+        #internal CC error flags (E-RAY: EIR)
+        ("frCCError", s_xl_fr_error_cc_error),
+    ]
+    __str__ = cls2str
+
+class s_xl_fr_error(ctypes.Structure):
+    _fields_ = [
+        ("tag", ctypes.c_ubyte),
+        ("cycleCount", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*6),
+        ("errorInfo", s_xl_fr_error_info),
+    ]
+    __str__ = cls2str
+XL_FR_ERROR_EV = s_xl_fr_error
+
+class s_xl_fr_spy_frame(ctypes.Structure):
+    _fields_ = [
+        ("frameLength", ctypes.c_uint),
+        #XL_FR_SPY_FRAMEFLAG_XXX values
+        ("frameError", ctypes.c_ubyte),
+        ("tssLength", ctypes.c_ubyte),
+        ("headerFlags", ctypes.c_ushort),
+        ("slotID", ctypes.c_ushort),
+        ("headerCRC", ctypes.c_ushort),
+        ("payloadLength", ctypes.c_ubyte),
+        ("cycleCount", ctypes.c_ubyte),
+        ("frameFlags", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte),
+        ("frameCRC", ctypes.c_uint),
+        ("data", ctypes.c_ubyte*XL_FR_MAX_DATA_LENGTH),
+    ]
+    __str__ = cls2str
+XL_FR_SPY_FRAME_EV = s_xl_fr_spy_frame
+
+class s_xl_fr_spy_symbol(ctypes.Structure):
+    _fields_ = [
+        ("lowLength", ctypes.c_ushort),
+        ("reserved", ctypes.c_ushort),
+    ]
+    __str__ = cls2str
+XL_FR_SPY_SYMBOL_EV = s_xl_fr_spy_symbol
+
+class s_xl_fr_tag_data(ctypes.Union):
+    _fields_ = [
+        #XL_FR_START_CYCLE_EV
+        ("frStartCycle", s_xl_fr_start_cycle),
+        #XL_FR_RX_FRAME_EV
+        ("frRxFrame", s_xl_fr_rx_frame),
+        #XL_FR_TX_FRAME_EV
+        ("frTxFrame", s_xl_fr_tx_frame),
+        #XL_FR_WAKEUP_EV
+        ("frWakeup", s_xl_fr_wakeup),
+        #XL_FR_SYMBOL_WINDOW_EV
+        ("frSymbolWindow", s_xl_fr_symbol_window),
+        #XL_FR_ERROR_EV
+        ("frError", s_xl_fr_error),
+        #XL_FR_STATUS_EV
+        ("frStatus", s_xl_fr_status),
+        #XL_FR_NM_VECTOR_EV
+        ("frNmVector", s_xl_fr_nm_vector),
+        #XL_FR_SYNC_PULSE_EV
+        ("frSyncPulse", s_xl_sync_pulse_ev),
+        #XL_FR_SPY_FRAME_EV
+        ("frSpyFrame", s_xl_fr_spy_frame),
+        #XL_FR_SPY_SYMBOL_EV
+        ("frSpySymbol", s_xl_fr_spy_symbol),
+        #XL_APPLICATION_NOTIFICATION_EV
+        ("applicationNotification", s_xl_application_notification),
+    ]
+    __str__ = cls2str
+
+XLfrEventTag = ctypes.c_ushort
+
+class s_xl_fr_event(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        #overall size of the complete event
+        ("size", ctypes.c_uint),
+        #type of the event
+        ("tag", XLfrEventTag),
+        ("channelIndex", ctypes.c_ushort),
+        ("userHandle", ctypes.c_uint),
+        #frChannel e.g. XL_FR_CHANNEL_A (lower 8 bit), queue overflow (upper 8bit)
+        ("flagsChip", ctypes.c_ushort),
+        ("reserved", ctypes.c_ushort),
+        #raw timestamp
+        ("timeStamp", XLuint64),
+        #timestamp which is synchronized by the driver
+        ("timeStampSync", XLuint64),
+        ("tagData", s_xl_fr_tag_data),
+    ]
+    __str__ = cls2str
+XLfrEvent = s_xl_fr_event
+
+### FlexRay XL API functions ###
+
+xlFrSetConfiguration = _vector_xlapi_dll_.xlFrSetConfiguration
+xlFrSetConfiguration.restype = XLstatus
+xlFrSetConfiguration.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlClusterConfig
+    ctypes.POINTER(XLfrClusterConfig),
+]
+xlFrSetConfiguration.errcheck = check_xl_status
+xlFrSetConfiguration.__doc__ = """
+xlapi.xlFrSetConfiguration
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrGetChannelConfiguration = _vector_xlapi_dll_.xlFrGetChannelConfiguration
+xlFrGetChannelConfiguration.restype = XLstatus
+xlFrGetChannelConfiguration.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlFrChannelConfig
+    ctypes.POINTER(XLfrChannelConfig),
+]
+xlFrGetChannelConfiguration.errcheck = check_xl_status
+xlFrGetChannelConfiguration.__doc__ = """
+xlapi.xlFrGetChannelConfiguration
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrSetMode = _vector_xlapi_dll_.xlFrSetMode
+xlFrSetMode.restype = XLstatus
+xlFrSetMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlFrMode
+    ctypes.POINTER(XLfrMode),
+]
+xlFrSetMode.errcheck = check_xl_status
+xlFrSetMode.__doc__ = """
+xlapi.xlFrSetMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrInitStartupAndSync = _vector_xlapi_dll_.xlFrInitStartupAndSync
+xlFrInitStartupAndSync.restype = XLstatus
+xlFrInitStartupAndSync.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pEventBuffer
+    ctypes.POINTER(XLfrEvent),
+]
+xlFrInitStartupAndSync.errcheck = check_xl_status
+xlFrInitStartupAndSync.__doc__ = """
+xlapi.xlFrInitStartupAndSync
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrSetupSymbolWindow = _vector_xlapi_dll_.xlFrSetupSymbolWindow
+xlFrSetupSymbolWindow.restype = XLstatus
+xlFrSetupSymbolWindow.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #frChannel
+    ctypes.c_uint,
+    #symbolWindowMask
+    ctypes.c_uint,
+]
+xlFrSetupSymbolWindow.errcheck = check_xl_status
+xlFrSetupSymbolWindow.__doc__ = """
+xlapi.xlFrSetupSymbolWindow
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrReceive = _vector_xlapi_dll_.xlFrReceive
+xlFrReceive.restype = XLstatus
+xlFrReceive.argtypes = [
+    #portHandle
+    XLportHandle,
+    #pEventBuffer
+    ctypes.POINTER(XLfrEvent),
+]
+xlFrReceive.errcheck = check_xl_status
+xlFrReceive.__doc__ = """
+xlapi.xlFrReceive
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrTransmit = _vector_xlapi_dll_.xlFrTransmit
+xlFrTransmit.restype = XLstatus
+xlFrTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pEventBuffer
+    ctypes.POINTER(XLfrEvent),
+]
+xlFrTransmit.errcheck = check_xl_status
+xlFrTransmit.__doc__ = """
+xlapi.xlFrTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrSetTransceiverMode = _vector_xlapi_dll_.xlFrSetTransceiverMode
+xlFrSetTransceiverMode.restype = XLstatus
+xlFrSetTransceiverMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #frChannel
+    ctypes.c_uint,
+    #mode
+    ctypes.c_uint,
+]
+xlFrSetTransceiverMode.errcheck = check_xl_status
+xlFrSetTransceiverMode.__doc__ = """
+xlapi.xlFrSetTransceiverMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrSendSymbolWindow = _vector_xlapi_dll_.xlFrSendSymbolWindow
+xlFrSendSymbolWindow.restype = XLstatus
+xlFrSendSymbolWindow.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #symbolWindow
+    ctypes.c_uint,
+]
+xlFrSendSymbolWindow.errcheck = check_xl_status
+xlFrSendSymbolWindow.__doc__ = """
+xlapi.xlFrSendSymbolWindow
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrActivateSpy = _vector_xlapi_dll_.xlFrActivateSpy
+xlFrActivateSpy.restype = XLstatus
+xlFrActivateSpy.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #mode
+    ctypes.c_uint,
+]
+xlFrActivateSpy.errcheck = check_xl_status
+xlFrActivateSpy.__doc__ = """
+xlapi.xlFrActivateSpy
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlFrSetAcceptanceFilter = _vector_xlapi_dll_.xlFrSetAcceptanceFilter
+xlFrSetAcceptanceFilter.restype = XLstatus
+xlFrSetAcceptanceFilter.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pAcceptanceFilter
+    ctypes.POINTER(XLfrAcceptanceFilter),
+]
+xlFrSetAcceptanceFilter.errcheck = check_xl_status
+xlFrSetAcceptanceFilter.__doc__ = """
+xlapi.xlFrSetAcceptanceFilter
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
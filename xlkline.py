@@ -0,0 +1,446 @@
+##############################################################################
+#                                                                            #
+# Module: xlkline                                                            #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The K-Line part of the python ctypes wrapper for the Vector XL             #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.xlKlineTransmit.                                                #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+### K-Line XL API ###
+
+class XL_KLINE_EVT(enum.IntEnum):
+    """K-Line event tags"""
+    RX_DATA = 1
+    TX_DATA = 2
+    TESTER_5BD = 3
+    ECU_5BD = 5
+    TESTER_FI_WU_PATTERN = 7
+    ECU_FI_WU_PATTERN = 8
+    ERROR = 9
+    CONFIRMATION = 10
+
+class s_xl_kline_uart_params(ctypes.Structure):
+    _fields_ = [
+        ("databits", ctypes.c_uint),
+        ("stopbits", ctypes.c_uint),
+        ("parity", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLklineUartParameter = s_xl_kline_uart_params
+
+class s_xl_kline_init_tester(ctypes.Structure):
+    _fields_ = [
+        #us
+        ("TiniL", ctypes.c_uint),
+        #us
+        ("Twup", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLklineInitTester = s_xl_kline_init_tester
+
+class s_xl_kline_init_5BdTester(ctypes.Structure):
+    _fields_ = [
+        ("addr", ctypes.c_uint),
+        ("rate5bd", ctypes.c_uint),
+        #us
+        ("W1min", ctypes.c_uint),
+        #us
+        ("W1max", ctypes.c_uint),
+        #us
+        ("W2min", ctypes.c_uint),
+        #us
+        ("W2max", ctypes.c_uint),
+        #us
+        ("W3min", ctypes.c_uint),
+        #us
+        ("W3max", ctypes.c_uint),
+        #us
+        ("W4", ctypes.c_uint),
+        #us
+        ("W4min", ctypes.c_uint),
+        #us
+        ("W4max", ctypes.c_uint),
+        ("kb2Not", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLkline5BdTester = s_xl_kline_init_5BdTester
+
+class s_xl_kline_init_5BdEcu(ctypes.Structure):
+    _fields_ = [
+        ("configure", ctypes.c_uint),
+        ("addr", ctypes.c_uint),
+        ("rate5bd", ctypes.c_uint),
+        ("syncPattern", ctypes.c_uint),
+        #us
+        ("W1", ctypes.c_uint),
+        #us
+        ("W2", ctypes.c_uint),
+        #us
+        ("W3", ctypes.c_uint),
+        #us
+        ("W4", ctypes.c_uint),
+        #us
+        ("W4min", ctypes.c_uint),
+        #us
+        ("W4max", ctypes.c_uint),
+        ("kb1", ctypes.c_uint),
+        ("kb2", ctypes.c_uint),
+        ("addrNot", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLkline5BdEcu = s_xl_kline_init_5BdEcu
+
+class s_xl_kline_set_com_tester(ctypes.Structure):
+    _fields_ = [
+        #us
+        ("P1min", ctypes.c_uint),
+        #us
+        ("P4", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLklineSetComTester = s_xl_kline_set_com_tester
+
+class s_xl_kline_set_com_ecu(ctypes.Structure):
+    _fields_ = [
+        #us
+        ("P1", ctypes.c_uint),
+        #us
+        ("P4min", ctypes.c_uint),
+        #us
+        ("TinilMin", ctypes.c_uint),
+        #us
+        ("TinilMax", ctypes.c_uint),
+        #us
+        ("TwupMin", ctypes.c_uint),
+        #us
+        ("TwupMax", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLklineSetComEcu = s_xl_kline_set_com_ecu
+
+
+class XL_KLINE_UART_PARITY(enum.IntEnum):
+    """defines for xlKlineSetUartParams"""
+    NONE = 0
+    EVEN = 1
+    ODD = 2
+    MARK = 3
+    SPACE = 4
+
+class XL_KLINE_TRXMODE(enum.IntEnum):
+    """defines for xlKlineSwitchHighspeedMode"""
+    NORMAL = 0
+    HIGHSPEED = 1
+
+class XL_KLINE_TESTERRESISTOR(enum.IntEnum):
+    """defines for xlKlineSwitchTesterResistor"""
+    OFF = 0
+    ON = 1
+
+XL_KLINE_UNCONFIGURE_ECU = 0
+XL_KLINE_CONFIGURE_ECU = 1
+
+class XL_KLINE_EVT_TAG_5BD(enum.IntEnum):
+    """event defines 5bdTag"""
+    ADDR = 1
+    BAUDRATE = 2
+    KB1 = 3
+    KB2 = 4
+    KB2NOT = 5
+    ADDRNOT = 6
+
+class XL_KLINE_BYTE_ERROR_MASK(enum.IntEnum):
+    """defines for the tx/rx byte error mask"""
+    FRAMING_ERROR_MASK = 1
+    PARITY_ERROR_MASK = 2
+
+class XL_KLINE_EVT_TAG(enum.IntEnum):
+    """defines for confirmation event"""
+    SET_COMM_PARAM_TESTER = 1
+    COMM_PARAM_ECU = 2
+    SWITCH_HIGHSPEED = 3
+
+class XL_KLINE_FLAG(enum.IntEnum):
+    """"""
+    TAKE_KB2NOT  = 0x80000000
+    TAKE_ADDRNOT = 0x80000000
+
+class XL_KLINE_ERROR_TYPE(enum.IntEnum):
+    """defines for T_KLINE_ERROR - errorType"""
+    TYPE_RXTX_ERROR = 1
+    TYPE_5BD_TESTER = 2
+    TYPE_5BD_ECU = 3
+    TYPE_IBS = 4
+    TYPE_FI = 5
+
+class XL_KLINE_ERR_RXTX(enum.IntEnum):
+    """defines for XL_KLINE_ERROR_TYPE_RXTX_ERROR / XL_KLINE_ERROR_TYPE_FI"""
+    #unexpected activity
+    UA = 4
+    #missing activity
+    MA = 2
+    #invalid sync byte
+    ISB = 1
+
+class XL_KLINE_ERR_TESTER(enum.IntEnum):
+    """defines for XL_KLINE_ERROR_TYPE_5BD_TESTER"""
+    W1MIN = 1
+    W1MAX = 2
+    W2MIN = 3
+    W2MAX = 4
+    W3MIN = 5
+    W3MAX = 6
+    W4MIN = 7
+    W4MAX = 8
+
+class XL_KLINE_ERR_ECU(enum.IntEnum):
+    """defines for XL_KLINE_ERROR_TYPE_5BD_ECU"""
+    W4MIN = 1
+    W4MAX = 2
+
+class XL_KLINE_ERR_IBS(enum.IntEnum):
+    """defines for XL_KLINE_ERROR_TYPE_IBS"""
+    P1 = 1
+    P4 = 2
+
+### K-Line XL API functions ###
+
+xlKlineTransmit = _vector_xlapi_dll_.xlKlineTransmit
+xlKlineTransmit.restype = XLstatus
+xlKlineTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #length
+    ctypes.c_uint,
+    #data
+    ctypes.POINTER(ctypes.c_ubyte),
+]
+xlKlineTransmit.errcheck = check_xl_status
+xlKlineTransmit.__doc__ = """
+xlapi.xlKlineTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSetUartParams = _vector_xlapi_dll_.xlKlineSetUartParams
+xlKlineSetUartParams.restype = XLstatus
+xlKlineSetUartParams.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlKlineUartParams
+    ctypes.POINTER(XLklineUartParameter),
+]
+xlKlineSetUartParams.errcheck = check_xl_status
+xlKlineSetUartParams.__doc__ = """
+xlapi.xlKlineSetUartParams
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSwitchHighspeedMode = _vector_xlapi_dll_.xlKlineSwitchHighspeedMode
+xlKlineSwitchHighspeedMode.restype = XLstatus
+xlKlineSwitchHighspeedMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #trxMode
+    ctypes.c_uint,
+]
+xlKlineSwitchHighspeedMode.errcheck = check_xl_status
+xlKlineSwitchHighspeedMode.__doc__ = """
+xlapi.xlKlineSwitchHighspeedMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSwitchTesterResistor = _vector_xlapi_dll_.xlKlineSwitchTesterResistor
+xlKlineSwitchTesterResistor.restype = XLstatus
+xlKlineSwitchTesterResistor.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #testerR
+    ctypes.c_uint,
+]
+xlKlineSwitchTesterResistor.errcheck = check_xl_status
+xlKlineSwitchTesterResistor.__doc__ = """
+xlapi.xlKlineSwitchTesterResistor
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSetBaudrate = _vector_xlapi_dll_.xlKlineSetBaudrate
+xlKlineSetBaudrate.restype = XLstatus
+xlKlineSetBaudrate.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #baudrate
+    ctypes.c_uint,
+]
+xlKlineSetBaudrate.errcheck = check_xl_status
+xlKlineSetBaudrate.__doc__ = """
+xlapi.xlKlineSetBaudrate
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineFastInitTester = _vector_xlapi_dll_.xlKlineFastInitTester
+xlKlineFastInitTester.restype = XLstatus
+xlKlineFastInitTester.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #length
+    ctypes.c_uint,
+    #data
+    ctypes.POINTER(ctypes.c_ubyte),
+    #pxlKlineInitTester
+    ctypes.POINTER(XLklineInitTester),
+]
+xlKlineFastInitTester.errcheck = check_xl_status
+xlKlineFastInitTester.__doc__ = """
+xlapi.xlKlineFastInitTester
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineInit5BdTester = _vector_xlapi_dll_.xlKlineInit5BdTester
+xlKlineInit5BdTester.restype = XLstatus
+xlKlineInit5BdTester.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlKline5BdTester
+    ctypes.POINTER(XLkline5BdTester),
+]
+xlKlineInit5BdTester.errcheck = check_xl_status
+xlKlineInit5BdTester.__doc__ = """
+xlapi.xlKlineInit5BdTester
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineInit5BdEcu = _vector_xlapi_dll_.xlKlineInit5BdEcu
+xlKlineInit5BdEcu.restype = XLstatus
+xlKlineInit5BdEcu.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlKline5BdEcu
+    ctypes.POINTER(XLkline5BdEcu),
+]
+xlKlineInit5BdEcu.errcheck = check_xl_status
+xlKlineInit5BdEcu.__doc__ = """
+xlapi.xlKlineInit5BdEcu
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSetCommunicationTimingTester = _vector_xlapi_dll_.xlKlineSetCommunicationTimingTester
+xlKlineSetCommunicationTimingTester.restype = XLstatus
+xlKlineSetCommunicationTimingTester.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlKlineSetComTester
+    ctypes.POINTER(XLklineSetComTester),
+]
+xlKlineSetCommunicationTimingTester.errcheck = check_xl_status
+xlKlineSetCommunicationTimingTester.__doc__ = """
+xlapi.xlKlineSetCommunicationTimingTester
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlKlineSetCommunicationTimingEcu = _vector_xlapi_dll_.xlKlineSetCommunicationTimingEcu
+xlKlineSetCommunicationTimingEcu.restype = XLstatus
+xlKlineSetCommunicationTimingEcu.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pxlKlineSetComEcu
+    ctypes.POINTER(XLklineSetComEcu),
+]
+xlKlineSetCommunicationTimingEcu.errcheck = check_xl_status
+xlKlineSetCommunicationTimingEcu.__doc__ = """
+xlapi.xlKlineSetCommunicationTimingEcu
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
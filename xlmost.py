@@ -0,0 +1,1865 @@
+##############################################################################
+#                                                                            #
+# Module: xlmost                                                             #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The MOST part of the python ctypes wrapper for the Vector XL               #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.XL_MOST_SOURCE.                                                 #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+
+class XL_MOST_SOURCE(enum.IntEnum):
+    """Defines for xlMostSwitchEventSources"""
+    ASYNC_SPY          = 32768
+    ASYNC_RX           = 4096
+    ASYNC_TX           = 2048
+    CTRL_OS8104A       = 1024
+    CTRL_SPY           = 256
+    ALLOC_TABLE        = 128
+    SYNC_RC_OVER       = 64
+    SYNC_TX_UNDER      = 32
+    SYNCLINE           = 16
+    ASYNC_RX_FIFO_OVER = 8
+
+class XL_MOST_ERROR(enum.IntEnum):
+    OS8104_TX_LOCK_ERROR      = 1
+    OS8104_SPDIF_LOCK_ERROR   = 2
+    OS8104_ASYNC_BUFFER_FULL  = 3
+    OS8104_ASYNC_CRC_ERROR    = 4
+    ASYNC_TX_UNDERRUN         = 5
+    CTRL_TX_UNDERRUN          = 6
+    MCU_TS_CMD_QUEUE_UNDERRUN = 7
+    MCU_TS_CMD_QUEUE_OVERRUN  = 8
+    CMD_TX_UNDERRUN           = 9
+    SYNCPULSE_ERROR           = 10
+    OS8104_CODING_ERROR       = 11
+    ERROR_UNKNOWN_COMMAND     = 12
+    ASYNC_RX_OVERFLOW_ERROR   = 13
+    FPGA_TS_FIFO_OVERFLOW     = 14
+    SPY_OVERFLOW_ERROR        = 15
+    CTRL_TYPE_QUEUE_OVERFLOW  = 16
+    ASYNC_TYPE_QUEUE_OVERFLOW = 17
+    CTRL_UNKNOWN_TYPE         = 18
+    CTRL_QUEUE_UNDERRUN       = 19
+    ASYNC_UNKNOWN_TYPE        = 20
+    ASYNC_QUEUE_UNDERRUN      = 21
+
+#data for demanded timstamps
+XL_MOST_DEMANDED_START = 1
+XL_MOST_RX_DATA_SIZE = 1028
+XL_MOST_TS_DATA_SIZE = 12
+XL_MOST_RX_ELEMENT_HEADER_SIZE = 32
+XL_MOST_CTRL_RX_SPY_SIZE = 36
+XL_MOST_CTRL_RX_OS8104_SIZE = 28
+XL_MOST_SPECIAL_REGISTER_CHANGE_SIZE = 20
+XL_MOST_ERROR_EV_SIZE_4 = 4
+XL_MOST_ERROR_EV_SIZE = 16
+
+class XL_MOST_DEVICE(enum.IntEnum):
+    """defines for the audio devices"""
+    CASE_LINE_IN      = 0
+    CASE_LINE_OUT     = 1
+    SPDIF_IN          = 7
+    SPDIF_OUT         = 8
+    SPDIF_IN_OUT_SYNC = 11
+
+class XL_MOST_SPDIF(enum.IntEnum):
+    """defines for xlMostCtrlSyncAudioEx, mode"""
+    LOCK_OFF = 0
+    LOCK_ON  = 1
+
+class XL_MOST_SYNC_MUTES_STATUS(enum.IntEnum):
+    """defines for the XL_MOST_SYNC_MUTES_STATUS event"""
+    NO_MUTE = 0
+    MUTE    = 1
+
+class XL_MOST_EVENT_SOURCE(enum.IntEnum):
+    """defines for the event sources in XLmostEvent"""
+    XL_MOST_VN2600  = 1
+    XL_MOST_OS8104A = 2
+    XL_MOST_OS8104B = 4
+    XL_MOST_SPY     = 8
+
+class XL_MOST_MODE(enum.IntEnum):
+    """defines for xlMostSetAllBypass and XL_MOST_ALLBYPASS"""
+    DEACTIVATE       = 0
+    ACTIVATE         = 1
+    FORCE_DEACTIVATE = 2
+
+XL_MOST_RX_BUFFER_CLEAR_ONCE = 2
+
+class XL_MOST_TIMING(enum.IntEnum):
+    """defines for xlMostSetTimingMode and the XL_MOST_TIMINGMODE(_SPDIF)_EV event."""
+    SLAVE                   = 0
+    MASTER                  = 1
+    SLAVE_SPDIF_MASTER      = 2
+    SLAVE_SPDIF_SLAVE       = 3
+    MASTER_SPDIF_MASTER     = 4
+    MASTER_SPDIF_SLAVE      = 5
+    MASTER_FROM_SPDIF_SLAVE = 6
+
+class XL_MOST_FREQUENCY(enum.IntEnum):
+    """defines for xlMostSetFrequency and the XL_MOST_FREQUENCY_EV event."""
+    FREQUENCY_44100 = 0
+    FREQUENCY_48000 = 1
+    FREQUENCY_ERROR = 2
+
+class XL_MOST_LIGHT(enum.IntEnum):
+    """defines for xlMostSetTxLight"""
+    OFF       = 0
+    #unmodulated on
+    FORCE_ON  = 1
+    #modulated light
+    MODULATED = 2
+    #xlMostSetTxLightPower
+    FULL      = 100
+    LIGHT_3DB = 50
+
+class XL_MOST_LOCKSTATUS(enum.IntEnum):
+    """defines for the XL_MOST_LOCKSTATUS event"""
+    UNLOCK        = 5
+    LOCK          = 6
+    STATE_UNKNOWN = 9
+
+class XL_MOST_CTRL_RX_OS8104(enum.IntEnum):
+    """defines for the XL_MOST_CTRL_RX_OS8104 event (tx event)"""
+    TX_WHILE_UNLOCKED = 2147483648
+    TX_TIMEOUT        = 1073741824
+    DIRECTION_RX = 0
+    DIRECTION_TX = 1
+    #No rx-queue overflow occured
+    NO_QUEUE_OVERFLOW      = 0
+    #Overflow of rx-queue in firmware when trying to add a rx-event
+    QUEUE_OVERFLOW         = 32768
+    COMMAND_FAILED         = 16384
+    #Overflow of command-timestamp-queue in firmware
+    INTERNAL_OVERFLOW      = 8192
+    MEASUREMENT_NOT_ACTIVE = 4096
+    #Overflow of async rx-queue in firmware when trying to add a packet
+    QUEUE_OVERFLOW_ASYNC   = 2048
+    #Overflow of rx-queue in firmware when trying to add a message
+    QUEUE_OVERFLOW_CTRL    = 1024
+    NOT_SUPPORTED          = 512
+    #Overflow occured when trying to add an event to application rx-queue
+    QUEUE_OVERFLOW_DRV     = 256
+    #node address changed
+    NA_CHANGED   = 1
+    #group address changed
+    GA_CHANGED   = 2
+    #alternative packet address changed
+    APA_CHANGED  = 4
+    #node position register changed
+    NPR_CHANGED  = 8
+    #max position register changed
+    MPR_CHANGED  = 16
+    #node delay register changed
+    NDR_CHANGED  = 32
+    #max delay register changed
+    MDR_CHANGED  = 64
+    SBC_CHANGED  = 128
+    XTIM_CHANGED = 256
+    XRTY_CHANGED = 512
+
+class XL_MOST_REGISTER(enum.IntEnum):
+    """defines for the MOST register (xlMostWriteRegister)"""
+    #Group Address
+    bGA   = 137
+    #Node Address High
+    bNAH  = 138
+    #Node Address Low
+    bNAL  = 139
+    #Source Data Control 2
+    bSDC2 = 140
+    #Source Data Control 3
+    bSDC3 = 141
+    #Clock Manager 2
+    bCM2  = 142
+    #Node Delay
+    bNDR  = 143
+    #Maximum Position
+    bMPR  = 144
+    #Maximum Delay
+    bMDR  = 145
+    #Clock Manager 4
+    bCM4  = 147
+    #Synchronous Bandwidth Control
+    bSBC  = 150
+    #Transceiver Status 2
+    bXSR2 = 151
+    #Receive Message Type
+    bRTYP = 160
+    #Source Address High
+    bRSAH = 161
+    #Source Address Low
+    bRSAL = 162
+    #Receive Control Data 0 --> bRCD16 = bRCD0+16
+    bRCD0 = 163
+    #Transmit Retry Time
+    bXTIM = 190
+    #Transmit Retries
+    bXRTY = 191
+    #Transmit Priority
+    bXPRI = 192
+    #Transmit Message Type
+    bXTYP = 193
+    #Target Address High
+    bXTAH = 194
+    #Target Address Low
+    bXTAL = 195
+    #Transmit Control Data 0 --> bXCD16 = bXCD0+16
+    bXCD0 = 196
+    #Transmit Transfer Status
+    bXTS  = 213
+    #Packet Control
+    bPCTC = 226
+    #Packet Status
+    bPCTS = 227
+
+class XL_MOST_SPY_RX_STATUS(enum.IntEnum):
+    NO_LIGHT = 1
+    NO_LOCK = 2
+    BIPHASE_ERROR = 4
+    MESSAGE_LENGTH_ERROR = 8
+    PARITY_ERROR = 16
+    FRAME_LENGTH_ERROR = 32
+    PREAMBLE_TYPE_ERROR = 64
+    CRC_ERROR = 128
+
+class XL_MOST_ASYNC(enum.IntEnum):
+    """defines for status of async frames"""
+    NO_ERROR = 0
+    SBC_ERROR = 12
+    NEXT_STARTS_TO_EARLY = 13
+    TO_LONG = 14
+    #unlock occured within receiption of packet
+    UNLOCK = 15
+
+class XL_MOST_SYNC_PULSE(enum.IntEnum):
+    """defines for XL_MOST_SYNC_PULSE_EV member trigger_source"""
+    EXTERNAL = 0
+    OUR = 1
+
+class XL_MOST_CTRL_TYPE(enum.IntEnum):
+    """ctrlType value within the XL_CTRL_SPY event"""
+    NORMAL = 0
+    REMOTE_READ = 1
+    REMOTE_WRITE = 2
+    RESOURCE_ALLOCATE = 3
+    RESOURCE_DEALLOCATE = 4
+    GET_SOURCE = 5
+
+class XL_MOST_BUSLOAD_COUNTER(enum.IntEnum):
+    """counterType for the xlMost****GenerateBusload function"""
+    TYPE_NONE = 0
+    TYPE_1_BYTE = 1
+    TYPE_2_BYTE = 2
+    TYPE_3_BYTE = 3
+    TYPE_4_BYTE = 4
+
+class XL_MOST_STATESEL(enum.IntFlag):
+    """selection bits for xlMostGetDeviceStates / CMD_GET_DEVICE_STATE->selection_mask"""
+    LIGHTLOCK = 1
+    REGISTERBUNCH1 = 2
+    BYPASSTIMING = 4
+    REGISTERBUNCH2 = 8
+    REGISTERBUNCH3 = 16
+    VOLUMEMUTE = 32
+    EVENTSOURCE = 64
+    RXBUFFERMODE = 128
+    ALLOCTABLE = 256
+    SUPERVISOR_LOCKSTATUS = 512
+    SUPERVISOR_MESSAGE = 1024
+
+class XL_MOST_STREAM(enum.IntEnum):
+    #RX streaming: MOST -> PC
+    RX_DATA = 0
+    #TX streaming: PC -> MOST
+    TX_DATA = 1
+    #only for RX: additionally the orig. TS + status information are reported
+    ADD_FRAME_HEADER = 1
+
+class XL_MOST_STREAM_STATE(enum.IntEnum):
+    CLOSED = 1
+    OPENED = 2
+    STARTED = 3
+    STOPPED = 4
+    #waiting for result from hw
+    START_PENDING = 5
+    #waiting for result from hw
+    STOP_PENDING = 6
+    UNKNOWN = 255
+
+class XL_MOST_STREAM_MODE(enum.IntEnum):
+    ACTIVATE = 0
+    DEACTIVATE = 1
+
+XL_MOST_STREAM_INVALID_HANDLE = 0
+
+class XL_MOST_STREAM_LATENCY(enum.IntEnum):
+    VERY_LOW = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    VERY_HIGH = 4
+
+class XL_MOST_STREAM_ERR(enum.IntEnum):
+    """error defines for sync data streaming"""
+    NO_ERROR = 0
+    INVALID_HANDLE = 1
+    NO_MORE_BUFFERS_AVAILABLE = 2
+    ANY_BUFFER_LOCKED = 3
+    WRITE_RE_FAILED = 4
+    STREAM_ALREADY_STARTED = 5
+    TX_BUFFER_UNDERRUN = 6
+    RX_BUFFER_OVERFLOW = 7
+    INSUFFICIENT_RESOURCES = 8
+
+#max. size of rx fifo for rx event in bytes
+XL_MOST_RX_FIFO_QUEUE_SIZE_MAX = 1048576
+XL_MOST_RX_FIFO_QUEUE_SIZE_MIN = 8192
+
+class s_xl_most_ctrl_spy(ctypes.Structure):
+    _fields_ = [
+        ("arbitration", ctypes.c_uint),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("ctrlType", ctypes.c_ubyte),
+        ("ctrlData", ctypes.c_ubyte*17),
+        ("crc", ctypes.c_ushort),
+        ("txStatus", ctypes.c_ushort),
+        ("ctrlRes", ctypes.c_ushort),
+        ("spyRxStatus", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_SPY_EV = s_xl_most_ctrl_spy
+
+class s_xl_most_ctrl_msg(ctypes.Structure):
+    _fields_ = [
+        ("ctrlPrio", ctypes.c_ubyte),
+        ("ctrlType", ctypes.c_ubyte),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("ctrlData", ctypes.c_ubyte*17),
+        #transmission or real receiption
+        ("direction", ctypes.c_ubyte),
+        #unused for real rx msgs
+        ("status", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_MSG_EV = s_xl_most_ctrl_msg
+XLmostCtrlMsg = XL_MOST_CTRL_MSG_EV
+
+class s_xl_most_async_msg(ctypes.Structure):
+    _fields_ = [
+        #read as last data from PLD but stored first
+        ("status", ctypes.c_uint),
+        #not used
+        ("crc", ctypes.c_uint),
+        ("arbitration", ctypes.c_ubyte),
+        #real length of async data in quadlets
+        ("length", ctypes.c_ubyte),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        #max size but only used data is transmitted to pc
+        ("asyncData", ctypes.c_ubyte*1018),
+    ]
+    __str__ = cls2str
+XL_MOST_ASYNC_MSG_EV = s_xl_most_async_msg
+
+class s_xl_most_async_tx(ctypes.Structure):
+    _fields_ = [
+        ("arbitration", ctypes.c_ubyte),
+        #real length of async data in quadlets
+        ("length", ctypes.c_ubyte),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        #worst case
+        ("asyncData", ctypes.c_ubyte*1014),
+    ]
+    __str__ = cls2str
+XL_MOST_ASYNC_TX_EV = s_xl_most_async_tx
+XLmostAsyncMsg = XL_MOST_ASYNC_TX_EV
+
+class s_xl_most_special_register(ctypes.Structure):
+    _fields_ = [
+        #see defines "XL_MOST_..._CHANGED"
+        ("changeMask", ctypes.c_uint),
+        ("lockStatus", ctypes.c_uint),
+        ("register_bNAH", ctypes.c_ubyte),
+        ("register_bNAL", ctypes.c_ubyte),
+        ("register_bGA", ctypes.c_ubyte),
+        ("register_bAPAH", ctypes.c_ubyte),
+        ("register_bAPAL", ctypes.c_ubyte),
+        ("register_bNPR", ctypes.c_ubyte),
+        ("register_bMPR", ctypes.c_ubyte),
+        ("register_bNDR", ctypes.c_ubyte),
+        ("register_bMDR", ctypes.c_ubyte),
+        ("register_bSBC", ctypes.c_ubyte),
+        ("register_bXTIM", ctypes.c_ubyte),
+        ("register_bXRTY", ctypes.c_ubyte),
+    ]
+    __str__ = cls2str
+XL_MOST_SPECIAL_REGISTER_EV = s_xl_most_special_register
+
+class s_xl_most_event_source(ctypes.Structure):
+    _fields_ = [
+        ("mask", ctypes.c_uint),
+        ("state", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_EVENT_SOURCE_EV = s_xl_most_event_source
+
+class s_xl_most_all_bypass(ctypes.Structure):
+    _fields_ = [
+        ("bypassState", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_ALL_BYPASS_EV = s_xl_most_all_bypass
+
+class s_xl_most_timing_mode(ctypes.Structure):
+    _fields_ = [
+        ("timingmode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_TIMING_MODE_EV = s_xl_most_timing_mode
+
+class s_xl_most_timing_mode_spdif(ctypes.Structure):
+    _fields_ = [
+        ("timingmode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_TIMING_MODE_SPDIF_EV = s_xl_most_timing_mode_spdif
+
+class s_xl_most_frequency(ctypes.Structure):
+    _fields_ = [
+        ("frequency", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_FREQUENCY_EV = s_xl_most_frequency
+
+class s_xl_most_register_bytes(ctypes.Structure):
+    _fields_ = [
+        ("number", ctypes.c_uint),
+        ("address", ctypes.c_uint),
+        ("value", ctypes.c_ubyte*16),
+    ]
+    __str__ = cls2str
+XL_MOST_REGISTER_BYTES_EV = s_xl_most_register_bytes
+
+class s_xl_most_register_bits(ctypes.Structure):
+    _fields_ = [
+        ("address", ctypes.c_uint),
+        ("value", ctypes.c_uint),
+        ("mask", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_REGISTER_BITS_EV = s_xl_most_register_bits
+
+class s_xl_most_sync_alloc(ctypes.Structure):
+    _fields_ = [
+        ("allocTable", ctypes.c_ubyte*MOST_ALLOC_TABLE_SIZE),
+    ]
+    __str__ = cls2str
+XL_MOST_SYNC_ALLOC_EV = s_xl_most_sync_alloc
+
+class s_xl_most_ctrl_sync_audio(ctypes.Structure):
+    _fields_ = [
+        ("channelMask", ctypes.c_uint*4),
+        ("device", ctypes.c_uint),
+        ("mode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_SYNC_AUDIO_EV = s_xl_most_ctrl_sync_audio
+
+class s_xl_most_ctrl_sync_audio_ex(ctypes.Structure):
+    _fields_ = [
+        ("channelMask", ctypes.c_uint*16),
+        ("device", ctypes.c_uint),
+        ("mode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_SYNC_AUDIO_EX_EV = s_xl_most_ctrl_sync_audio_ex
+
+class s_xl_most_sync_volume_status(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_uint),
+        ("volume", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_SYNC_VOLUME_STATUS_EV = s_xl_most_sync_volume_status
+
+class s_xl_most_sync_mutes_status(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_uint),
+        ("mute", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_SYNC_MUTES_STATUS_EV = s_xl_most_sync_mutes_status
+
+class s_xl_most_rx_light(ctypes.Structure):
+    _fields_ = [
+        ("light", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_RX_LIGHT_EV = s_xl_most_rx_light
+
+class s_xl_most_tx_light(ctypes.Structure):
+    _fields_ = [
+        ("light", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_TX_LIGHT_EV = s_xl_most_tx_light
+
+class s_xl_most_light_power(ctypes.Structure):
+    _fields_ = [
+        ("lightPower", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_LIGHT_POWER_EV = s_xl_most_light_power
+
+class s_xl_most_lock_status(ctypes.Structure):
+    _fields_ = [
+        ("lockStatus", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_LOCK_STATUS_EV = s_xl_most_lock_status
+
+class s_xl_most_supervisor_lock_status(ctypes.Structure):
+    _fields_ = [
+        ("supervisorLockStatus", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_SUPERVISOR_LOCK_STATUS_EV = s_xl_most_supervisor_lock_status
+
+class s_xl_most_gen_light_error(ctypes.Structure):
+    _fields_ = [
+        ("lightOnTime", ctypes.c_uint),
+        ("lightOffTime", ctypes.c_uint),
+        ("repeat", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_GEN_LIGHT_ERROR_EV = s_xl_most_gen_light_error
+
+class s_xl_most_gen_lock_error(ctypes.Structure):
+    _fields_ = [
+        ("lockOnTime", ctypes.c_uint),
+        ("lockOffTime", ctypes.c_uint),
+        ("repeat", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_GEN_LOCK_ERROR_EV = s_xl_most_gen_lock_error
+
+class s_xl_most_rx_buffer(ctypes.Structure):
+    _fields_ = [
+        ("mode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_RX_BUFFER_EV = s_xl_most_rx_buffer
+
+class s_xl_most_error(ctypes.Structure):
+    _fields_ = [
+        ("errorCode", ctypes.c_uint),
+        ("parameter", ctypes.c_uint*3),
+    ]
+    __str__ = cls2str
+XL_MOST_ERROR_EV = s_xl_most_error
+
+class s_xl_most_ctrl_busload(ctypes.Structure):
+    _fields_ = [
+        ("busloadCtrlStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_BUSLOAD_EV = s_xl_most_ctrl_busload
+
+class s_xl_most_async_busload(ctypes.Structure):
+    _fields_ = [
+        ("busloadAsyncStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_ASYNC_BUSLOAD_EV = s_xl_most_async_busload
+
+class s_xl_most_stream_state(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        #see XL_MOST_STREAM_STATE_...
+        ("streamState", ctypes.c_uint),
+        #see XL_MOST_STREAM_STATE_...
+        ("streamError", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_STREAM_STATE_EV = s_xl_most_stream_state
+
+class s_xl_most_stream_buffer(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+#ifdef _MSC_VER
+        #32bit LSDW of buffer pointer
+        #("pBuffer", POINTER_32),
+#else
+        #32bit LSDW of buffer pointer
+        ("pBuffer", ctypes.c_uint),
+        ("validBytes", ctypes.c_uint),
+        #see XL_MOST_STREAM_ERR_...
+        ("status", ctypes.c_uint),
+        ("pBuffer_highpart", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_STREAM_BUFFER_EV = s_xl_most_stream_buffer
+
+class s_xl_most_sync_tx_underflow(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_SYNC_TX_UNDERFLOW_EV = s_xl_most_sync_tx_underflow
+
+class s_xl_most_sync_rx_overflow(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_SYNC_RX_OVERFLOW_EV = s_xl_most_sync_rx_overflow
+
+XL_MOST_EVENT_HEADER_SIZE = 32
+XL_MOST_EVENT_MAX_DATA_SIZE = 1024
+XL_MOST_EVENT_MAX_SIZE = XL_MOST_EVENT_HEADER_SIZE + XL_MOST_EVENT_MAX_DATA_SIZE
+
+class s_xl_most_tag_data(ctypes.Union):
+    _fields_ = [
+        #XL_MOST_CTRL_SPY_EV
+        ("mostCtrlSpy", s_xl_most_ctrl_spy),
+        #XL_MOST_CTRL_MSG_EV
+        ("mostCtrlMsg", s_xl_most_ctrl_msg),
+        #XL_MOST_ASYNC_MSG_EV, received async frame
+        ("mostAsyncMsg", s_xl_most_async_msg),
+        #XL_MOST_ASYNC_TX_EV, async frame tx acknowledge
+        ("mostAsyncTx", s_xl_most_async_tx),
+        #XL_MOST_SPECIAL_REGISTER_EV
+        ("mostSpecialRegister", s_xl_most_special_register),
+        #XL_MOST_EVENT_SOURCE_EV
+        ("mostEventSource", s_xl_most_event_source),
+        #XL_MOST_ALL_BYPASS_EV
+        ("mostAllBypass", s_xl_most_all_bypass),
+        #XL_MOST_TIMING_MODE_EV
+        ("mostTimingMode", s_xl_most_timing_mode),
+        #XL_MOST_TIMING_MODE_SPDIF_EV
+        ("mostTimingModeSpdif", s_xl_most_timing_mode_spdif),
+        #XL_MOST_FREQUENCY_EV
+        ("mostFrequency", s_xl_most_frequency),
+        #XL_MOST_REGISTER_BYTES_EV
+        ("mostRegisterBytes", s_xl_most_register_bytes),
+        #XL_MOST_REGISTER_BITS_EV
+        ("mostRegisterBits", s_xl_most_register_bits),
+        #XL_MOST_SYNC_ALLOC_EV
+        ("mostSyncAlloc", s_xl_most_sync_alloc),
+        #XL_MOST_CTRL_SYNC_AUDIO_EV
+        ("mostCtrlSyncAudio", s_xl_most_ctrl_sync_audio),
+        #XL_MOST_CTRL_SYNC_AUDIO_EX_EV
+        ("mostCtrlSyncAudioEx", s_xl_most_ctrl_sync_audio_ex),
+        #XL_MOST_SYNC_VOLUME_STATUS_EV
+        ("mostSyncVolumeStatus", s_xl_most_sync_volume_status),
+        #XL_MOST_SYNC_MUTES_STATUS_EV
+        ("mostSyncMuteStatus", s_xl_most_sync_mutes_status),
+        #XL_MOST_RX_LIGHT_EV
+        ("mostRxLight", s_xl_most_rx_light),
+        #XL_MOST_TX_LIGHT_EV
+        ("mostTxLight", s_xl_most_tx_light),
+        #XL_MOST_LIGHT_POWER_EV
+        ("mostLightPower", s_xl_most_light_power),
+        #XL_MOST_LOCK_STATUS_EV
+        ("mostLockStatus", s_xl_most_lock_status),
+        #XL_MOST_GEN_LIGHT_ERROR_EV
+        ("mostGenLightError", s_xl_most_gen_light_error),
+        #XL_MOST_GEN_LOCK_ERROR_EV
+        ("mostGenLockError", s_xl_most_gen_lock_error),
+        #XL_MOST_RX_BUFFER_EV
+        ("mostRxBuffer", s_xl_most_rx_buffer),
+        #XL_MOST_ERROR_EV
+        ("mostError", s_xl_most_error),
+        #XL_MOST_SYNC_PULSE_EV
+        ("mostSyncPulse", s_xl_sync_pulse_ev),
+        #XL_MOST_CTRL_BUSLOAD_EV
+        ("mostCtrlBusload", s_xl_most_ctrl_busload),
+        #XL_MOST_ASYNC_BUSLOAD_EV
+        ("mostAsyncBusload", s_xl_most_async_busload),
+        #XL_MOST_STREAM_STATE_EV
+        ("mostStreamState", s_xl_most_stream_state),
+        #XL_MOST_STREAM_BUFFER_EV
+        ("mostStreamBuffer", s_xl_most_stream_buffer),
+        #XL_MOST_SYNC_TX_UNDERFLOW_EV
+        ("mostSyncTxUnderflow", s_xl_most_sync_tx_underflow),
+        #XL_MOST_SYNC_RX_OVERFLOW_EV
+        ("mostSyncRxOverflow", s_xl_most_sync_rx_overflow),
+    ]
+    __str__ = cls2str
+
+XLmostEventTag = ctypes.c_ushort
+
+class s_xl_most_event(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        ("size", ctypes.c_uint),
+        ("tag", XLmostEventTag),
+        ("channelIndex", ctypes.c_ushort),
+        ("userHandle", ctypes.c_uint),
+        ("flagsChip", ctypes.c_ushort),
+        ("reserved", ctypes.c_ushort),
+        ("timeStamp", XLuint64),
+        ("timeStampSync", XLuint64),
+        ("tagData", s_xl_most_tag_data),
+    ]
+    __str__ = cls2str
+XLmostEvent = s_xl_most_event
+
+class s_xl_most_ctrl_busload_configuration(ctypes.Structure):
+    _fields_ = [
+        ("transmissionRate", ctypes.c_uint),
+        ("counterType", ctypes.c_uint),
+        ("counterPosition", ctypes.c_uint),
+        ("busloadCtrlMsg", XL_MOST_CTRL_MSG_EV),
+    ]
+    __str__ = cls2str
+XL_MOST_CTRL_BUSLOAD_CONFIGURATION = s_xl_most_ctrl_busload_configuration
+XLmostCtrlBusloadConfiguration = XL_MOST_CTRL_BUSLOAD_CONFIGURATION
+
+class s_xl_most_async_busload_configuration(ctypes.Structure):
+    _fields_ = [
+        ("transmissionRate", ctypes.c_uint),
+        ("counterType", ctypes.c_uint),
+        ("counterPosition", ctypes.c_uint),
+        ("busloadAsyncMsg", XL_MOST_ASYNC_TX_EV),
+    ]
+    __str__ = cls2str
+XL_MOST_ASYNC_BUSLOAD_CONFIGURATION = s_xl_most_async_busload_configuration
+XLmostAsyncBusloadConfiguration = XL_MOST_ASYNC_BUSLOAD_CONFIGURATION
+
+class s_xl_most_device_state(ctypes.Structure):
+    _fields_ = [
+     #XL_MOST_STATESEL_LIGHTLOCK
+
+        ("selectionMask", ctypes.c_uint),
+        #see XL_MOST_LOCK_STATUS_EV
+        ("lockState", ctypes.c_uint),
+        #see XL_MOST_RX_LIGHT_EV
+        ("rxLight", ctypes.c_uint),
+        #see XL_MOST_TX_LIGHT_EV
+        ("txLight", ctypes.c_uint),
+        #see XL_MOST_LIGHT_POWER_EV
+        ("txLightPower", ctypes.c_uint),
+     #XL_MOST_STATESEL_REGISTERBUNCH1
+
+        #16 OS8104 registers (0x87...0x96 -> NPR...SBC)
+        ("registerBunch1", ctypes.c_ubyte*16),
+     #XL_MOST_STATESEL_BYPASSTIMING
+
+        #see XL_MOST_ALL_BYPASS_EV
+        ("bypassState", ctypes.c_uint),
+        #see XL_MOST_TIMING_MODE_EV
+        ("timingMode", ctypes.c_uint),
+        #frame rate (if master); see XL_MOST_FREQUENCY_EV
+        ("frequency", ctypes.c_uint),
+     #XL_MOST_STATESEL_REGISTERBUNCH2
+
+        #2 OS8104 registers (0xBE, 0xBF -> XTIM, XRTY)
+        ("registerBunch2", ctypes.c_ubyte*2),
+     #XL_MOST_STATESEL_REGISTERBUNCH3
+
+        #2 OS8104 registers (0xE8, 0xE9 -> APAH, APAL)
+        ("registerBunch3", ctypes.c_ubyte*2),
+     #XL_MOST_STATESEL_VOLUMEMUTE
+
+        #volume state for DEVICE_CASE_LINE_IN, DEVICE_CASE_LINE_OUT
+        ("volume", ctypes.c_uint*2),
+        #mute state for DEVICE_CASE_LINE_IN, DEVICE_CASE_LINE_OUT
+        ("mute", ctypes.c_uint*2),
+     #XL_MOST_STATESEL_EVENTSOURCE
+
+        #see XL_MOST_EVENT_SOURCE_EV
+        ("eventSource", ctypes.c_uint),
+     #XL_MOST_STATESEL_RXBUFFERMODE
+
+        #see XL_MOST_RX_BUFFER_EV
+        ("rxBufferMode", ctypes.c_uint),
+     #XL_MOST_STATESEL_ALLOCTABLE
+
+        #see XL_MOST_SYNC_ALLOC_EV
+        ("allocTable", ctypes.c_ubyte*MOST_ALLOC_TABLE_SIZE),
+     #XL_MOST_STATESEL_SUPERVISOR_LOCKSTATUS
+
+        ("supervisorLockStatus", ctypes.c_uint),
+     #XL_MOST_STATESEL_SUPERVISOR_MESSAGE
+
+        ("broadcastedConfigStatus", ctypes.c_uint),
+        ("adrNetworkMaster", ctypes.c_uint),
+        ("abilityToWake", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_DEVICE_STATE = s_xl_most_device_state
+
+class s_xl_most_stream_open(ctypes.Structure):
+    _fields_ = [
+        ("pStreamHandle", ctypes.POINTER(ctypes.c_uint)),
+        ("numSyncChannels", ctypes.c_uint),
+        ("direction", ctypes.c_uint),
+        ("options", ctypes.c_uint),
+        ("latency", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST_STREAM_OPEN = s_xl_most_stream_open
+XLmostStreamOpen = XL_MOST_STREAM_OPEN
+
+class s_xl_most_stream_info(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("numSyncChannels", ctypes.c_uint),
+        ("direction", ctypes.c_uint),
+        ("options", ctypes.c_uint),
+        ("latency", ctypes.c_uint),
+        ("streamState", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+        ("syncChannels", ctypes.c_ubyte*60),
+    ]
+    __str__ = cls2str
+XL_MOST_STREAM_INFO = s_xl_most_stream_info
+XLmostStreamInfo = XL_MOST_STREAM_INFO
+
+### MOST XL API functions ###
+
+xlMostReceive = _vector_xlapi_dll_.xlMostReceive
+xlMostReceive.restype = XLstatus
+xlMostReceive.argtypes = [
+    #portHandle
+    XLportHandle,
+#  XLaccess, #accessMask -> is not in header (possible bug)
+    #pEventBuffer
+    ctypes.POINTER(XLmostEvent),
+]
+xlMostReceive.errcheck = check_xl_status
+xlMostReceive.__doc__ = """
+xlapi.xlMostReceive
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSwitchEventSources = _vector_xlapi_dll_.xlMostSwitchEventSources
+xlMostSwitchEventSources.restype = XLstatus
+xlMostSwitchEventSources.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #sourceMask
+    ctypes.c_ushort,
+]
+xlMostSwitchEventSources.errcheck = check_xl_status
+xlMostSwitchEventSources.__doc__ = """
+xlapi.xlMostSwitchEventSources
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSetAllBypass = _vector_xlapi_dll_.xlMostSetAllBypass
+xlMostSetAllBypass.restype = XLstatus
+xlMostSetAllBypass.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #bypassMode
+    ctypes.c_ubyte,
+]
+xlMostSetAllBypass.errcheck = check_xl_status
+xlMostSetAllBypass.__doc__ = """
+xlapi.xlMostSetAllBypass
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetAllBypass = _vector_xlapi_dll_.xlMostGetAllBypass
+xlMostGetAllBypass.restype = XLstatus
+xlMostGetAllBypass.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetAllBypass.errcheck = check_xl_status
+xlMostGetAllBypass.__doc__ = """
+xlapi.xlMostGetAllBypass
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSetTimingMode = _vector_xlapi_dll_.xlMostSetTimingMode
+xlMostSetTimingMode.restype = XLstatus
+xlMostSetTimingMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #timingMode
+    ctypes.c_ubyte,
+]
+xlMostSetTimingMode.errcheck = check_xl_status
+xlMostSetTimingMode.__doc__ = """
+xlapi.xlMostSetTimingMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetTimingMode = _vector_xlapi_dll_.xlMostGetTimingMode
+xlMostGetTimingMode.restype = XLstatus
+xlMostGetTimingMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetTimingMode.errcheck = check_xl_status
+xlMostGetTimingMode.__doc__ = """
+xlapi.xlMostGetTimingMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSetFrequency = _vector_xlapi_dll_.xlMostSetFrequency
+xlMostSetFrequency.restype = XLstatus
+xlMostSetFrequency.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #frequency
+    ctypes.c_ushort,
+]
+xlMostSetFrequency.errcheck = check_xl_status
+xlMostSetFrequency.__doc__ = """
+xlapi.xlMostSetFrequency
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetFrequency = _vector_xlapi_dll_.xlMostGetFrequency
+xlMostGetFrequency.restype = XLstatus
+xlMostGetFrequency.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetFrequency.errcheck = check_xl_status
+xlMostGetFrequency.__doc__ = """
+xlapi.xlMostGetFrequency
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostWriteRegister = _vector_xlapi_dll_.xlMostWriteRegister
+xlMostWriteRegister.restype = XLstatus
+xlMostWriteRegister.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #adr
+    ctypes.c_ushort,
+    #numBytes
+    ctypes.c_ubyte,
+    #data[16]
+    ctypes.c_ubyte*16,
+]
+xlMostWriteRegister.errcheck = check_xl_status
+xlMostWriteRegister.__doc__ = """
+xlapi.xlMostWriteRegister
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostReadRegister = _vector_xlapi_dll_.xlMostReadRegister
+xlMostReadRegister.restype = XLstatus
+xlMostReadRegister.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #adr
+    ctypes.c_ushort,
+    #numBytes
+    ctypes.c_ubyte,
+]
+xlMostReadRegister.errcheck = check_xl_status
+xlMostReadRegister.__doc__ = """
+xlapi.xlMostReadRegister
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostWriteRegisterBit = _vector_xlapi_dll_.xlMostWriteRegisterBit
+xlMostWriteRegisterBit.restype = XLstatus
+xlMostWriteRegisterBit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #adr
+    ctypes.c_ushort,
+    #mask
+    ctypes.c_ubyte,
+    #value
+    ctypes.c_ubyte,
+]
+xlMostWriteRegisterBit.errcheck = check_xl_status
+xlMostWriteRegisterBit.__doc__ = """
+xlapi.xlMostWriteRegisterBit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlTransmit = _vector_xlapi_dll_.xlMostCtrlTransmit
+xlMostCtrlTransmit.restype = XLstatus
+xlMostCtrlTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pCtrlMsg
+    ctypes.POINTER(XLmostCtrlMsg),
+]
+xlMostCtrlTransmit.errcheck = check_xl_status
+xlMostCtrlTransmit.__doc__ = """
+xlapi.xlMostCtrlTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostAsyncTransmit = _vector_xlapi_dll_.xlMostAsyncTransmit
+xlMostAsyncTransmit.restype = XLstatus
+xlMostAsyncTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pAsyncMsg
+    ctypes.POINTER(XLmostAsyncMsg),
+]
+xlMostAsyncTransmit.errcheck = check_xl_status
+xlMostAsyncTransmit.__doc__ = """
+xlapi.xlMostAsyncTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSyncGetAllocTable = _vector_xlapi_dll_.xlMostSyncGetAllocTable
+xlMostSyncGetAllocTable.restype = XLstatus
+xlMostSyncGetAllocTable.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostSyncGetAllocTable.errcheck = check_xl_status
+xlMostSyncGetAllocTable.__doc__ = """
+xlapi.xlMostSyncGetAllocTable
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlSyncAudio = _vector_xlapi_dll_.xlMostCtrlSyncAudio
+xlMostCtrlSyncAudio.restype = XLstatus
+xlMostCtrlSyncAudio.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #channel[4]
+    ctypes.c_uint*4,
+    #device
+    ctypes.c_uint,
+    #mode
+    ctypes.c_uint,
+]
+xlMostCtrlSyncAudio.errcheck = check_xl_status
+xlMostCtrlSyncAudio.__doc__ = """
+xlapi.xlMostCtrlSyncAudio
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlSyncAudioEx = _vector_xlapi_dll_.xlMostCtrlSyncAudioEx
+xlMostCtrlSyncAudioEx.restype = XLstatus
+xlMostCtrlSyncAudioEx.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #channel[16]
+    ctypes.c_uint*16,
+    #device
+    ctypes.c_uint,
+    #mode
+    ctypes.c_uint,
+]
+xlMostCtrlSyncAudioEx.errcheck = check_xl_status
+xlMostCtrlSyncAudioEx.__doc__ = """
+xlapi.xlMostCtrlSyncAudioEx
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSyncVolume = _vector_xlapi_dll_.xlMostSyncVolume
+xlMostSyncVolume.restype = XLstatus
+xlMostSyncVolume.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+    #volume
+    ctypes.c_ubyte,
+]
+xlMostSyncVolume.errcheck = check_xl_status
+xlMostSyncVolume.__doc__ = """
+xlapi.xlMostSyncVolume
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSyncMute = _vector_xlapi_dll_.xlMostSyncMute
+xlMostSyncMute.restype = XLstatus
+xlMostSyncMute.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+    #mute
+    ctypes.c_ubyte,
+]
+xlMostSyncMute.errcheck = check_xl_status
+xlMostSyncMute.__doc__ = """
+xlapi.xlMostSyncMute
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSyncGetVolumeStatus = _vector_xlapi_dll_.xlMostSyncGetVolumeStatus
+xlMostSyncGetVolumeStatus.restype = XLstatus
+xlMostSyncGetVolumeStatus.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+]
+xlMostSyncGetVolumeStatus.errcheck = check_xl_status
+xlMostSyncGetVolumeStatus.__doc__ = """
+xlapi.xlMostSyncGetVolumeStatus
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSyncGetMuteStatus = _vector_xlapi_dll_.xlMostSyncGetMuteStatus
+xlMostSyncGetMuteStatus.restype = XLstatus
+xlMostSyncGetMuteStatus.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+]
+xlMostSyncGetMuteStatus.errcheck = check_xl_status
+xlMostSyncGetMuteStatus.__doc__ = """
+xlapi.xlMostSyncGetMuteStatus
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetRxLight = _vector_xlapi_dll_.xlMostGetRxLight
+xlMostGetRxLight.restype = XLstatus
+xlMostGetRxLight.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetRxLight.errcheck = check_xl_status
+xlMostGetRxLight.__doc__ = """
+xlapi.xlMostGetRxLight
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSetTxLight = _vector_xlapi_dll_.xlMostSetTxLight
+xlMostSetTxLight.restype = XLstatus
+xlMostSetTxLight.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #txLight
+    ctypes.c_ubyte,
+]
+xlMostSetTxLight.errcheck = check_xl_status
+xlMostSetTxLight.__doc__ = """
+xlapi.xlMostSetTxLight
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetTxLight = _vector_xlapi_dll_.xlMostGetTxLight
+xlMostGetTxLight.restype = XLstatus
+xlMostGetTxLight.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetTxLight.errcheck = check_xl_status
+xlMostGetTxLight.__doc__ = """
+xlapi.xlMostGetTxLight
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostSetLightPower = _vector_xlapi_dll_.xlMostSetLightPower
+xlMostSetLightPower.restype = XLstatus
+xlMostSetLightPower.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #attenuation
+    ctypes.c_ubyte,
+]
+xlMostSetLightPower.errcheck = check_xl_status
+xlMostSetLightPower.__doc__ = """
+xlapi.xlMostSetLightPower
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGetLockStatus = _vector_xlapi_dll_.xlMostGetLockStatus
+xlMostGetLockStatus.restype = XLstatus
+xlMostGetLockStatus.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostGetLockStatus.errcheck = check_xl_status
+xlMostGetLockStatus.__doc__ = """
+xlapi.xlMostGetLockStatus
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGenerateLightError = _vector_xlapi_dll_.xlMostGenerateLightError
+xlMostGenerateLightError.restype = XLstatus
+xlMostGenerateLightError.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #lightOffTime
+    XLulong,
+    #lightOnTime
+    XLulong,
+    #repeat
+    ctypes.c_ushort,
+]
+xlMostGenerateLightError.errcheck = check_xl_status
+xlMostGenerateLightError.__doc__ = """
+xlapi.xlMostGenerateLightError
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostGenerateLockError = _vector_xlapi_dll_.xlMostGenerateLockError
+xlMostGenerateLockError.restype = XLstatus
+xlMostGenerateLockError.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #unmodTime
+    XLulong,
+    #modTime
+    XLulong,
+    #repeat
+    ctypes.c_ushort,
+]
+xlMostGenerateLockError.errcheck = check_xl_status
+xlMostGenerateLockError.__doc__ = """
+xlapi.xlMostGenerateLockError
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlRxBuffer = _vector_xlapi_dll_.xlMostCtrlRxBuffer
+xlMostCtrlRxBuffer.restype = XLstatus
+xlMostCtrlRxBuffer.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #bufferMode
+    ctypes.c_ushort,
+]
+xlMostCtrlRxBuffer.errcheck = check_xl_status
+xlMostCtrlRxBuffer.__doc__ = """
+xlapi.xlMostCtrlRxBuffer
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostTwinklePowerLed = _vector_xlapi_dll_.xlMostTwinklePowerLed
+xlMostTwinklePowerLed.restype = XLstatus
+xlMostTwinklePowerLed.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMostTwinklePowerLed.errcheck = check_xl_status
+xlMostTwinklePowerLed.__doc__ = """
+xlapi.xlMostTwinklePowerLed
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlConfigureBusload = _vector_xlapi_dll_.xlMostCtrlConfigureBusload
+xlMostCtrlConfigureBusload.restype = XLstatus
+xlMostCtrlConfigureBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pCtrlBusloadConfiguration
+    ctypes.POINTER(XLmostCtrlBusloadConfiguration),
+]
+xlMostCtrlConfigureBusload.errcheck = check_xl_status
+xlMostCtrlConfigureBusload.__doc__ = """
+xlapi.xlMostCtrlConfigureBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostCtrlGenerateBusload = _vector_xlapi_dll_.xlMostCtrlGenerateBusload
+xlMostCtrlGenerateBusload.restype = XLstatus
+xlMostCtrlGenerateBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #numberCtrlFrames
+    XLulong,
+]
+xlMostCtrlGenerateBusload.errcheck = check_xl_status
+xlMostCtrlGenerateBusload.__doc__ = """
+xlapi.xlMostCtrlGenerateBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostAsyncConfigureBusload = _vector_xlapi_dll_.xlMostAsyncConfigureBusload
+xlMostAsyncConfigureBusload.restype = XLstatus
+xlMostAsyncConfigureBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pAsyncBusloadConfiguration
+    ctypes.POINTER(XLmostAsyncBusloadConfiguration),
+]
+xlMostAsyncConfigureBusload.errcheck = check_xl_status
+xlMostAsyncConfigureBusload.__doc__ = """
+xlapi.xlMostAsyncConfigureBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostAsyncGenerateBusload = _vector_xlapi_dll_.xlMostAsyncGenerateBusload
+xlMostAsyncGenerateBusload.restype = XLstatus
+xlMostAsyncGenerateBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #numberAsyncFrames
+    XLulong,
+]
+xlMostAsyncGenerateBusload.errcheck = check_xl_status
+xlMostAsyncGenerateBusload.__doc__ = """
+xlapi.xlMostAsyncGenerateBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamOpen = _vector_xlapi_dll_.xlMostStreamOpen
+xlMostStreamOpen.restype = XLstatus
+xlMostStreamOpen.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pStreamOpen
+    ctypes.POINTER(XLmostStreamOpen),
+]
+xlMostStreamOpen.errcheck = check_xl_status
+xlMostStreamOpen.__doc__ = """
+xlapi.xlMostStreamOpen
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamClose = _vector_xlapi_dll_.xlMostStreamClose
+xlMostStreamClose.restype = XLstatus
+xlMostStreamClose.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMostStreamClose.errcheck = check_xl_status
+xlMostStreamClose.__doc__ = """
+xlapi.xlMostStreamClose
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamStart = _vector_xlapi_dll_.xlMostStreamStart
+xlMostStreamStart.restype = XLstatus
+xlMostStreamStart.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+    #syncChannels[60]
+    ctypes.c_ubyte*60,
+]
+xlMostStreamStart.errcheck = check_xl_status
+xlMostStreamStart.__doc__ = """
+xlapi.xlMostStreamStart
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamStop = _vector_xlapi_dll_.xlMostStreamStop
+xlMostStreamStop.restype = XLstatus
+xlMostStreamStop.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMostStreamStop.errcheck = check_xl_status
+xlMostStreamStop.__doc__ = """
+xlapi.xlMostStreamStop
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamBufferAllocate = _vector_xlapi_dll_.xlMostStreamBufferAllocate
+xlMostStreamBufferAllocate.restype = XLstatus
+xlMostStreamBufferAllocate.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+    #ppBuffer
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
+    #pBufferSize
+    ctypes.POINTER(ctypes.c_uint),
+]
+xlMostStreamBufferAllocate.errcheck = check_xl_status
+xlMostStreamBufferAllocate.__doc__ = """
+xlapi.xlMostStreamBufferAllocate
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamBufferDeallocateAll = _vector_xlapi_dll_.xlMostStreamBufferDeallocateAll
+xlMostStreamBufferDeallocateAll.restype = XLstatus
+xlMostStreamBufferDeallocateAll.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMostStreamBufferDeallocateAll.errcheck = check_xl_status
+xlMostStreamBufferDeallocateAll.__doc__ = """
+xlapi.xlMostStreamBufferDeallocateAll
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamBufferSetNext = _vector_xlapi_dll_.xlMostStreamBufferSetNext
+xlMostStreamBufferSetNext.restype = XLstatus
+xlMostStreamBufferSetNext.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+    #pBuffer
+    ctypes.POINTER(ctypes.c_ubyte),
+    #filledBytes
+    ctypes.c_uint,
+]
+xlMostStreamBufferSetNext.errcheck = check_xl_status
+xlMostStreamBufferSetNext.__doc__ = """
+xlapi.xlMostStreamBufferSetNext
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamGetInfo = _vector_xlapi_dll_.xlMostStreamGetInfo
+xlMostStreamGetInfo.restype = XLstatus
+xlMostStreamGetInfo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pStreamInfo
+    ctypes.POINTER(XLmostStreamInfo),
+]
+xlMostStreamGetInfo.errcheck = check_xl_status
+xlMostStreamGetInfo.__doc__ = """
+xlapi.xlMostStreamGetInfo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMostStreamBufferClearAll = _vector_xlapi_dll_.xlMostStreamBufferClearAll
+xlMostStreamBufferClearAll.restype = XLstatus
+xlMostStreamBufferClearAll.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMostStreamBufferClearAll.errcheck = check_xl_status
+xlMostStreamBufferClearAll.__doc__ = """
+xlapi.xlMostStreamBufferClearAll
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
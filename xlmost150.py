@@ -0,0 +1,2294 @@
+##############################################################################
+#                                                                            #
+# Module: xlmost150                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# The MOST150 part of the python ctypes wrapper for the Vector XL            #
+# Driver Library (definitions and functions of the 'vxlapi.h'). It is        #
+# imported lazily by xlapi on the first access of one of its names,          #
+# e.g. xlapi.XLmost150event.                                                 #
+#                                                                            #
+##############################################################################
+import ctypes
+import enum
+
+from xlapi import *
+from xlapi import _vector_xlapi_dll_
+from xlmost import *
+
+### MOST150 XL API ###
+
+XL_MOST150_RX_EVENT_HEADER_SIZE = 32
+XL_MOST150_MAX_EVENT_DATA_SIZE = 2048
+MOST150_SYNC_ALLOC_INFO_SIZE = 372
+XL_MOST150_CTRL_PAYLOAD_MAX_SIZE = 45
+#maximum valid length (s. INIC User Manual)
+XL_MOST150_ASYNC_PAYLOAD_MAX_SIZE = 1524
+#maximum valid length (s. INIC User Manual)
+XL_MOST150_ETHERNET_PAYLOAD_MAX_SIZE = 1506
+#maximum length for sending a MDP
+XL_MOST150_ASYNC_SEND_PAYLOAD_MAX_SIZE = 1600
+#maximum length for sending a MEP
+XL_MOST150_ETHERNET_SEND_PAYLOAD_MAX_SIZE = 1600
+
+class XL_MOST150_FLAGS_CHIP(enum.IntEnum):
+    #common VN2640 event
+    XL_MOST150_VN2640 = 1
+    #event was generated by INIC
+    XL_MOST150_INIC = 2
+    #event was generated by spy
+    XL_MOST150_SPY = 4
+    #queue overflow occured (some events are lost)
+    XL_MOST150_QUEUE_OVERFLOW = 256
+
+class XL_MOST150_SOURCE(enum.IntEnum):
+    SPECIAL_NODE = 1
+    SYNC_ALLOC_INFO = 4
+    CTRL_SPY = 8
+    ASYNC_SPY = 16
+    ETH_SPY = 32
+    SHUTDOWN_FLAG = 64
+    SYSTEMLOCK_FLAG = 128
+    LIGHTLOCK_SPY = 512
+    LIGHTLOCK_INIC = 1024
+    ECL_CHANGE = 2048
+    LIGHT_STRESS = 4096
+    LOCK_STRESS = 8192
+    BUSLOAD_CTRL = 16384
+    BUSLOAD_ASYNC = 32768
+    CTRL_MLB = 65536
+    ASYNC_MLB = 131072
+    ETH_MLB = 262144
+    TXACK_MLB = 524288
+    STREAM_UNDERFLOW = 1048576
+    STREAM_OVERFLOW = 2097152
+    STREAM_RX_DATA = 4194304
+    ECL_SEQUENCE = 8388608
+
+class XL_MOST150_DEVICEMODE(enum.IntEnum):
+    SLAVE = 0
+    MASTER = 1
+    STATIC_MASTER = 3
+    RETIMED_BYPASS_SLAVE = 4
+    RETIMED_BYPASS_MASTER = 5
+
+class XL_MOST150_FREQUENCY(enum.IntEnum):
+    FREQUENCY_44100 = 0
+    FREQUENCY_48000 = 1
+    FREQUENCY_ERROR = 2
+
+class XL_MOST150_SPECIAL_NODE_INFO(enum.IntEnum):
+    NA_CHANGED = 1
+    GA_CHANGED = 2
+    NPR_CHANGED = 4
+    MPR_CHANGED = 8
+    SBC_CHANGED = 16
+    CTRL_RETRY_PARAMS_CHANGED = 96
+    ASYNC_RETRY_PARAMS_CHANGED = 384
+    MAC_ADDR_CHANGED = 512
+    NPR_SPY_CHANGED = 1024
+    MPR_SPY_CHANGED = 2048
+    SBC_SPY_CHANGED = 4096
+    INIC_NISTATE_CHANGED = 8192
+    SPECIAL_NODE_MASK_CHANGED = 16383
+
+class XL_MOST150_CTRL_RETRY(enum.IntEnum):
+    #Time Unit: 16 MOST Frames
+    RETRY_TIME_MIN = 3
+    RETRY_TIME_MAX = 31
+    SEND_ATTEMPT_MIN = 1
+    SEND_ATTEMPT_MAX = 16
+    #Time Unit: 1 MOST Frame
+    ASYNC_RETRY_TIME_MIN = 0
+    ASYNC_RETRY_TIME_MAX = 255
+    #For both MDP and MEP
+    ASYNC_SEND_ATTEMPT_MIN = 1
+    ASYNC_SEND_ATTEMPT_MAX = 16
+
+class XL_MOST150_INIC_NISTATE(enum.IntEnum):
+    NET_OFF = 0
+    NET_INIT = 1
+    NET_RBD = 2
+    NET_ON = 3
+    NET_RBD_RESULT = 4
+
+class XL_MOST150_TX(enum.IntEnum):
+    OK = 1
+    FAILED_FORMAT_ERROR = 2
+    FAILED_NETWORK_OFF = 4
+    FAILED_TIMEOUT = 5
+    FAILED_WRONG_TARGET = 8
+    OK_ONE_SUCCESS = 9
+    FAILED_BAD_CRC = 12
+    FAILED_RECEIVER_BUFFER_FULL = 14
+
+class XL_MOST150_VALID(enum.IntEnum):
+    DATALENANNOUNCED = 1
+    SOURCEADDRESS = 2
+    TARGETADDRESS = 4
+    PACK = 8
+    CACK = 16
+    PINDEX = 32
+    PRIORITY = 64
+    CRC = 128
+    CRCCALCULATED = 256
+    MESSAGE = 2147483648
+
+class XL_MOST150_SPY_PACK(enum.IntEnum):
+    OK = 4
+    BUFFER_FULL = 1
+    #maybe spy before receiver
+    NO_RESPONSE = 0
+
+class XL_MOST150_SPY_CACK(enum.IntEnum):
+    OK = 4
+    CRC_ERROR = 1
+    #maybe spy before receiver
+    NO_RESPONSE = 0
+
+#flag indicating a received MDP with length > XL_MOST150_ASYNC_PAYLOAD_MAX_SIZE
+XL_MOST150_ASYNC_INVALID_RX_LENGTH    = 0x00008000
+#flag indicating a received MEP with length > XL_MOST150_ETHERNET_PAYLOAD_MAX_SIZE
+XL_MOST150_ETHERNET_INVALID_RX_LENGTH = 0x80000000
+
+class XL_MOST150_LIGHT(enum.IntEnum):
+    OFF = 0
+    FORCE_ON = 1
+    MODULATED = 2
+    ON_UNLOCK = 3
+    ON_LOCK = 4
+    ON_STABLE_LOCK = 5
+    ON_CRITICAL_UNLOCK = 6
+
+class XL_MOST150_ERROR(enum.IntEnum):
+    ASYNC_TX_ACK_HANDLE = 1
+    ETH_TX_ACK_HANDLE = 2
+
+class XL_MOST150_RX_BUFFER_TYPE(enum.IntEnum):
+    CTRL = 1
+    ASYNC = 2
+
+class XL_MOST150_RX_BUFFER_MODE(enum.IntEnum):
+    NORMAL_MODE = 0
+    BLOCK_MODE = 1
+
+class XL_MOST150_CTRL_SYNC_AUDIO(enum.IntEnum):
+    DEVICE_LINE_IN = 0
+    DEVICE_LINE_OUT = 1
+    DEVICE_SPDIF_IN = 2
+    DEVICE_SPDIF_OUT = 3
+    DEVICE_ALLOC_BANDWIDTH = 4
+
+class XL_MOST150_DEVICE_MODE(enum.IntEnum):
+    OFF = 0
+    ON = 1
+    OFF_BYPASS_CLOSED = 2
+    OFF_NOT_IN_NETON = 3
+    OFF_NO_MORE_RESOURCES = 4
+    OFF_NOT_ENOUGH_FREE_BW = 5
+    OFF_DUE_TO_NET_OFF = 6
+    OFF_DUE_TO_CFG_NOT_OK = 7
+    OFF_COMMUNICATION_ERROR = 8
+    OFF_STREAM_CONN_ERROR = 9
+    OFF_CL_ALREADY_USED = 10
+    CL_NOT_ALLOCATED = 255
+
+#Maximum number of CL that can be allocated for device XL_MOST150_DEVICE_ALLOC_BANDWIDTH
+XL_MOST150_ALLOC_BANDWIDTH_NUM_CL_MAX = 10
+#special CL for xlMost150CtrlSyncAudio to de-allocate all CLs for device XL_MOST150_DEVICE_ALLOC_BANDWIDTH
+XL_MOST150_CL_DEALLOC_ALL = 0x00000FFF
+
+class XL_MOST150_VOLUME(enum.IntEnum):
+    MIN = 0
+    MAX = 255
+
+class XL_MOST150_SYNC_MUTE_STATUS(enum.IntEnum):
+    NO_MUTE = 0
+    MUTE = 1
+
+class XL_MOST150_LIGHT_POWER(enum.IntEnum):
+    LIGHT_FULL = 100
+    LIGHT_3DB = 50
+
+class XL_MOST150_SYSTEMLOCK_FLAG(enum.IntEnum):
+    NOT_SET = 0
+    SET = 1
+
+class XL_MOST150_SHUTDOWN_FLAG(enum.IntEnum):
+    NOT_SET = 0
+    SET = 1
+
+class XL_MOST150_ECL_LINE(enum.IntEnum):
+    LOW = 0
+    HIGH = 1
+
+class XL_MOST150_ECL_LINE_PULL_UP(enum.IntEnum):
+    NOT_ACTIVE = 0
+    ACTIVE = 1
+
+class XL_MOST150_ECL_SEQ(enum.IntEnum):
+    #Maximum number of states that can be configured for a sequence
+    NUM_STATES_MAX = 200
+    #Value range for duration of ECL sequence states
+    #100 us
+    DURATION_MIN = 1
+    #65535 ms
+    DURATION_MAX = 655350
+
+class XL_MOST150_ECL_GLITCH_FILTER(enum.IntEnum):
+    #Value range for setting the glitch filter
+    #50 us
+    MIN = 50
+    #50 ms
+    MAX = 50000
+
+class XL_MOST150_MODE(enum.IntEnum):
+    DEACTIVATED = 0
+    ACTIVATED = 1
+
+class XL_MOST150_BUSLOAD_TYPE(enum.IntEnum):
+    DATA_PACKET = 0
+    ETHERNET_PACKET = 1
+
+class XL_MOST150_BUSLOAD_COUNTER_TYPE(enum.IntEnum):
+    TYPE_NONE = 0
+    TYPE_1_BYTE = 1
+    TYPE_2_BYTE = 2
+    TYPE_3_BYTE = 3
+    TYPE_4_BYTE = 4
+
+class XL_MOST150_SPDIF_MODE(enum.IntEnum):
+    SLAVE = 0
+    MASTER = 1
+
+class XL_MOST150_SPDIF_ERR(enum.IntEnum):
+    NO_ERROR = 0
+    HW_COMMUNICATION = 1
+
+class XL_MOST150_NW_STARTUP(enum.IntEnum):
+    NO_ERROR = 0
+    NO_ERRORINFO = 4294967295
+
+class XL_MOST150_NW_SHUTDOWN(enum.IntEnum):
+    NO_ERROR = 0
+    NO_ERRORINFO = 4294967295
+
+class XL_MOST150_STREAM(enum.IntEnum):
+    #RX streaming: MOST -> PC
+    RX_DATA = 0
+    #TX streaming: PC -> MOST
+    TX_DATA = 1
+
+XL_MOST150_STREAM_INVALID_HANDLE = 0
+
+class XL_MOST150_STREAM_STATE(enum.IntEnum):
+    CLOSED = 1
+    OPENED = 2
+    STARTED = 3
+    STOPPED = 4
+    START_PENDING = 5
+    STOP_PENDING = 6
+    OPEN_PENDING = 7
+    CLOSE_PENDING = 8
+#TX Streaming: Maximum number of bytes that can be streamed per MOST frame
+XL_MOST150_STREAM_TX_BYTES_PER_FRAME_MIN = 1
+XL_MOST150_STREAM_TX_BYTES_PER_FRAME_MAX = 152
+#RX Streaming: Maximum number of connection labels that can be streamed
+XL_MOST150_STREAM_RX_NUM_CL_MAX = 8
+#valid connection label range
+XL_MOST150_STREAM_CL_MIN = 0x000C
+XL_MOST150_STREAM_CL_MAX = 0x017F
+
+class XL_MOST150_STREAM_STATE_ERROR(enum.IntEnum):
+    NO_ERROR = 0
+    NOT_ENOUGH_BW = 1
+    NET_OFF = 2
+    CONFIG_NOT_OK = 3
+    CL_DISAPPEARED = 4
+    INIC_SC_ERROR = 5
+    DEVICEMODE_BYPASS = 6
+    NISTATE_NOT_NETON = 7
+    INIC_BUSY = 8
+    CL_MISSING = 9
+    NUM_BYTES_MISMATCH = 10
+    INIC_COMMUNICATION = 11
+
+class XL_MOST150_STREAM_TX_BUFFER(enum.IntEnum):
+    ERROR_NO_ERROR = 0
+    ERROR_NOT_ENOUGH_DATA = 1
+    TX_FIFO_CLEARED = 2
+
+class XL_MOST150_STREAM_RX_BUFFER(enum.IntEnum):
+    ERROR_STOP_BY_APP = 1
+    ERROR_MOST_SIGNAL_OFF = 2
+    ERROR_UNLOCK = 3
+    ERROR_CL_MISSING = 4
+    ERROR_ALL_CL_MISSING = 5
+    #overflow bit
+    ERROR_OVERFLOW = 128
+
+class XL_MOST150_STREAM_LATENCY(enum.IntEnum):
+    VERY_LOW = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    VERY_HIGH = 4
+
+class XL_MOST150_BYPASS_STRESS_TIME(enum.IntEnum):
+    MIN = 10
+    MAX = 65535
+
+class XL_MOST150_BYPASS_STRESS(enum.IntEnum):
+    STOPPED = 0
+    STARTED = 1
+    STOPPED_LIGHT_OFF = 2
+    STOPPED_DEVICE_MODE = 3
+
+class XL_MOST150_SSO_RESULT(enum.IntEnum):
+    NO_RESULT = 0
+    NO_FAULT_SAVED = 1
+    SUDDEN_SIGNAL_OFF = 2
+    CRITICAL_UNLOCK = 3
+
+class s_xl_most150_event_source(ctypes.Structure):
+    _fields_ = [
+        ("sourceMask", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_EVENT_SOURCE_EV = s_xl_most150_event_source
+
+class s_xl_most150_device_mode(ctypes.Structure):
+    _fields_ = [
+        ("deviceMode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_DEVICE_MODE_EV = s_xl_most150_device_mode
+
+class s_xl_most150_frequency(ctypes.Structure):
+    _fields_ = [
+        ("frequency", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_FREQUENCY_EV = s_xl_most150_frequency
+
+class s_xl_most150_special_node_info(ctypes.Structure):
+    _fields_ = [
+        ("changeMask", ctypes.c_uint),
+        ("nodeAddress", ctypes.c_ushort),
+        ("groupAddress", ctypes.c_ushort),
+        ("npr", ctypes.c_ubyte),
+        ("mpr", ctypes.c_ubyte),
+        ("sbc", ctypes.c_ubyte),
+        ("ctrlRetryTime", ctypes.c_ubyte),
+        ("ctrlSendAttempts", ctypes.c_ubyte),
+        ("asyncRetryTime", ctypes.c_ubyte),
+        ("asyncSendAttempts", ctypes.c_ubyte),
+        ("macAddr", ctypes.c_ubyte*6),
+        ("nprSpy", ctypes.c_ubyte),
+        ("mprSpy", ctypes.c_ubyte),
+        ("sbcSpy", ctypes.c_ubyte),
+        ("inicNIState", ctypes.c_ubyte),
+        ("reserved1", ctypes.c_ubyte*3),
+        ("reserved2", ctypes.c_uint*3),
+    ]
+    __str__ = cls2str
+XL_MOST150_SPECIAL_NODE_INFO_EV = s_xl_most150_special_node_info
+
+class s_xl_most150_ctrl_rx(ctypes.Structure):
+    _fields_ = [
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("fblockId", ctypes.c_ubyte),
+        ("instId", ctypes.c_ubyte),
+        ("functionId", ctypes.c_ushort),
+        ("opType", ctypes.c_ubyte),
+        ("telId", ctypes.c_ubyte),
+        ("telLen", ctypes.c_ushort),
+        ("ctrlData", ctypes.c_ubyte*45),
+    ]
+    __str__ = cls2str
+XL_MOST150_CTRL_RX_EV = s_xl_most150_ctrl_rx
+
+class s_xl_most150_ctrl_spy(ctypes.Structure):
+    _fields_ = [
+        ("frameCount", ctypes.c_uint),
+        #duration of message transmission in [ns]
+        ("msgDuration", ctypes.c_uint),
+        ("priority", ctypes.c_ubyte),
+        ("targetAddress", ctypes.c_ushort),
+        ("pAck", ctypes.c_ubyte),
+        ("ctrlDataLenAnnounced", ctypes.c_ushort),
+        ("reserved0", ctypes.c_ubyte),
+        ("pIndex", ctypes.c_ubyte),
+        ("sourceAddress", ctypes.c_ushort),
+        ("reserved1", ctypes.c_ushort),
+        ("crc", ctypes.c_ushort),
+        ("crcCalculated", ctypes.c_ushort),
+        ("cAck", ctypes.c_ubyte),
+        #number of bytes contained in ctrlData[]
+        ("ctrlDataLen", ctypes.c_ushort),
+        ("reserved2", ctypes.c_ubyte),
+        #currently not used
+        ("status", ctypes.c_uint),
+        ("validMask", ctypes.c_uint),
+        ("ctrlData", ctypes.c_ushort*51),
+    ]
+    __str__ = cls2str
+XL_MOST150_CTRL_SPY_EV = s_xl_most150_ctrl_spy
+
+class s_xl_most150_async_rx_msg(ctypes.Structure):
+    _fields_ = [
+        ("length", ctypes.c_ushort),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("asyncData", ctypes.c_ubyte*1524),
+    ]
+    __str__ = cls2str
+XL_MOST150_ASYNC_RX_EV = s_xl_most150_async_rx_msg
+
+class s_xl_most150_async_spy_msg(ctypes.Structure):
+    _fields_ = [
+        ("frameCount", ctypes.c_uint),
+        #duration of data packet transmission in [ns]
+        ("pktDuration", ctypes.c_uint),
+        ("asyncDataLenAnnounced", ctypes.c_ushort),
+        ("targetAddress", ctypes.c_ushort),
+        ("pAck", ctypes.c_ubyte),
+        ("pIndex", ctypes.c_ubyte),
+        ("sourceAddress", ctypes.c_ushort),
+        ("crc", ctypes.c_uint),
+        ("crcCalculated", ctypes.c_uint),
+        ("cAck", ctypes.c_ubyte),
+        #number of bytes contained in asyncData[]
+        ("asyncDataLen", ctypes.c_ushort),
+        ("reserved", ctypes.c_ubyte),
+        #currently not used
+        ("status", ctypes.c_uint),
+        ("validMask", ctypes.c_uint),
+        ("asyncData", ctypes.c_ushort*1524),
+    ]
+    __str__ = cls2str
+XL_MOST150_ASYNC_SPY_EV = s_xl_most150_async_spy_msg
+
+class s_xl_most150_ethernet_rx(ctypes.Structure):
+    _fields_ = [
+        ("sourceAddress", ctypes.c_ubyte*6),
+        ("targetAddress", ctypes.c_ubyte*6),
+        ("length", ctypes.c_uint),
+        ("ethernetData", ctypes.c_ubyte*1510),
+    ]
+    __str__ = cls2str
+XL_MOST150_ETHERNET_RX_EV = s_xl_most150_ethernet_rx
+
+class s_xl_most150_ethernet_spy(ctypes.Structure):
+    _fields_ = [
+        ("frameCount", ctypes.c_uint),
+        #duration of ethernet packet transmission in [ns]
+        ("pktDuration", ctypes.c_uint),
+        ("ethernetDataLenAnnounced", ctypes.c_ushort),
+        ("targetAddress", ctypes.c_ubyte*6),
+        ("pAck", ctypes.c_ubyte),
+        ("sourceAddress", ctypes.c_ubyte*6),
+        ("reserved0", ctypes.c_ubyte),
+        ("crc", ctypes.c_uint),
+        ("crcCalculated", ctypes.c_uint),
+        ("cAck", ctypes.c_ubyte),
+        #number of bytes contained in ethernetData[]
+        ("ethernetDataLen", ctypes.c_ushort),
+        ("reserved1", ctypes.c_ubyte),
+        #currently not used
+        ("status", ctypes.c_uint),
+        ("validMask", ctypes.c_uint),
+        ("ethernetData", ctypes.c_ushort*1506),
+    ]
+    __str__ = cls2str
+XL_MOST150_ETHERNET_SPY_EV = s_xl_most150_ethernet_spy
+
+class s_xl_most150_cl_info(ctypes.Structure):
+    _fields_ = [
+        ("label", ctypes.c_ushort),
+        ("channelWidth", ctypes.c_ushort),
+    ]
+    __str__ = cls2str
+XL_MOST150_CL_INFO = s_xl_most150_cl_info
+
+class s_xl_most150_sync_alloc_info(ctypes.Structure):
+    _fields_ = [
+        ("allocTable", s_xl_most150_cl_info*MOST150_SYNC_ALLOC_INFO_SIZE),
+    ]
+    __str__ = cls2str
+XL_MOST150_SYNC_ALLOC_INFO_EV = s_xl_most150_sync_alloc_info
+
+class s_xl_most150_sync_volume_status(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_uint),
+        ("volume", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SYNC_VOLUME_STATUS_EV = s_xl_most150_sync_volume_status
+
+class s_xl_most150_tx_light(ctypes.Structure):
+    _fields_ = [
+        ("light", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_TX_LIGHT_EV = s_xl_most150_tx_light
+
+class s_xl_most150_rx_light_lock_status(ctypes.Structure):
+    _fields_ = [
+        ("status", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_RXLIGHT_LOCKSTATUS_EV = s_xl_most150_rx_light_lock_status
+
+class s_xl_most150_error(ctypes.Structure):
+    _fields_ = [
+        ("errorCode", ctypes.c_uint),
+        ("parameter", ctypes.c_uint*3),
+    ]
+    __str__ = cls2str
+XL_MOST150_ERROR_EV = s_xl_most150_error
+
+class s_xl_most150_configure_rx_buffer(ctypes.Structure):
+    _fields_ = [
+        ("bufferType", ctypes.c_uint),
+        ("bufferMode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_CONFIGURE_RX_BUFFER_EV = s_xl_most150_configure_rx_buffer
+
+class s_xl_most150_ctrl_sync_audio(ctypes.Structure):
+    _fields_ = [
+        ("label", ctypes.c_uint),
+        ("width", ctypes.c_uint),
+        ("device", ctypes.c_uint),
+        ("mode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_CTRL_SYNC_AUDIO_EV = s_xl_most150_ctrl_sync_audio
+
+class s_xl_most150_sync_mute_status(ctypes.Structure):
+    _fields_ = [
+        ("device", ctypes.c_uint),
+        ("mute", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SYNC_MUTE_STATUS_EV = s_xl_most150_sync_mute_status
+
+class s_xl_most150_tx_light_power(ctypes.Structure):
+    _fields_ = [
+        ("lightPower", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_LIGHT_POWER_EV = s_xl_most150_tx_light_power
+
+class s_xl_most150_gen_light_error(ctypes.Structure):
+    _fields_ = [
+        ("stressStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_GEN_LIGHT_ERROR_EV = s_xl_most150_gen_light_error
+
+class s_xl_most150_gen_lock_error(ctypes.Structure):
+    _fields_ = [
+        ("stressStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_GEN_LOCK_ERROR_EV = s_xl_most150_gen_lock_error
+
+class s_xl_most150_ctrl_busload(ctypes.Structure):
+    _fields_ = [
+        ("busloadStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_CTRL_BUSLOAD_EV = s_xl_most150_ctrl_busload
+
+class s_xl_most150_async_busload(ctypes.Structure):
+    _fields_ = [
+        ("busloadStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_ASYNC_BUSLOAD_EV = s_xl_most150_async_busload
+
+class s_xl_most150_systemlock_flag(ctypes.Structure):
+    _fields_ = [
+        ("state", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SYSTEMLOCK_FLAG_EV = s_xl_most150_systemlock_flag
+
+class s_xl_most150_shutdown_flag(ctypes.Structure):
+    _fields_ = [
+        ("state", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SHUTDOWN_FLAG_EV = s_xl_most150_shutdown_flag
+
+class s_xl_most150_spdif_mode(ctypes.Structure):
+    _fields_ = [
+        ("spdifMode", ctypes.c_uint),
+        ("spdifError", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SPDIF_MODE_EV = s_xl_most150_spdif_mode
+
+class s_xl_most150_ecl(ctypes.Structure):
+    _fields_ = [
+        ("eclLineState", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_ECL_EV = s_xl_most150_ecl
+
+class s_xl_most150_ecl_termination(ctypes.Structure):
+    _fields_ = [
+        ("resistorEnabled", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_ECL_TERMINATION_EV = s_xl_most150_ecl_termination
+
+class s_xl_most150_nw_startup(ctypes.Structure):
+    _fields_ = [
+        ("error", ctypes.c_uint),
+        ("errorInfo", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_NW_STARTUP_EV = s_xl_most150_nw_startup
+
+class s_xl_most150_nw_shutdown(ctypes.Structure):
+    _fields_ = [
+        ("error", ctypes.c_uint),
+        ("errorInfo", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_NW_SHUTDOWN_EV = s_xl_most150_nw_shutdown
+
+class s_xl_most150_stream_state(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("streamState", ctypes.c_uint),
+        ("streamError", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_STREAM_STATE_EV = s_xl_most150_stream_state
+
+class s_xl_most150_stream_tx_buffer(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("numberOfBytes", ctypes.c_uint),
+        ("status", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_STREAM_TX_BUFFER_EV = s_xl_most150_stream_tx_buffer
+
+class s_xl_most150_stream_rx_buffer(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("numberOfBytes", ctypes.c_uint),
+        ("status", ctypes.c_uint),
+        ("labelInfo", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_STREAM_RX_BUFFER_EV = s_xl_most150_stream_rx_buffer
+
+class s_xl_most150_stream_tx_underflow(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_STREAM_TX_UNDERFLOW_EV = s_xl_most150_stream_tx_underflow
+
+class s_xl_most150_stream_tx_label(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("errorInfo", ctypes.c_uint),
+        ("connLabel", ctypes.c_uint),
+        ("width", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_STREAM_TX_LABEL_EV = s_xl_most150_stream_tx_label
+
+class s_xl_most150_gen_bypass_stress(ctypes.Structure):
+    _fields_ = [
+        ("stressStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_GEN_BYPASS_STRESS_EV = s_xl_most150_gen_bypass_stress
+
+class s_xl_most150_ecl_sequence(ctypes.Structure):
+    _fields_ = [
+        ("sequenceStarted", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_ECL_SEQUENCE_EV = s_xl_most150_ecl_sequence
+
+class s_xl_most150_ecl_glitch_filter(ctypes.Structure):
+    _fields_ = [
+        ("duration", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_ECL_GLITCH_FILTER_EV = s_xl_most150_ecl_glitch_filter
+
+class s_xl_most150_sso_result(ctypes.Structure):
+    _fields_ = [
+        ("status", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_SSO_RESULT_EV = s_xl_most150_sso_result
+
+class s_xl_most150_ctrl_tx_ack(ctypes.Structure):
+    _fields_ = [
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("ctrlPrio", ctypes.c_ubyte),
+        ("ctrlSendAttempts", ctypes.c_ubyte),
+        ("reserved", ctypes.c_ubyte*2),
+        ("status", ctypes.c_uint),
+     #ctrlData structure:
+
+     #-----------------------------------------------------------------------
+
+     #FBlockID | InstID | FunctionID | OpType | TelID | TelLen | Payload
+
+     #-----------------------------------------------------------------------
+
+     # 8 bit   | 8 bit  |   12 bit   | 4 bit  | 4 bit | 12 bit | 0 .. 45 byte
+
+     #-----------------------------------------------------------------------
+
+     #ctrlData[0]:   FBlockID
+
+     #ctrlData[1]:   InstID
+
+     #ctrlData[2]:   FunctionID (upper 8 bits)
+
+     #ctrlData[3]:   FunctionID (lower 4 bits) + OpType (4 bits)
+
+     #ctrlData[4]:   TelId (4 bits) + TelLen (upper 4 bits)
+
+     #ctrlData[5]:   TelLen (lower 8 bits)
+
+     #ctrlData[6..50]: Payload
+
+        ("ctrlData", ctypes.c_ubyte*51),
+    ]
+    __str__ = cls2str
+XL_MOST150_CTRL_TX_ACK_EV = s_xl_most150_ctrl_tx_ack
+
+class s_xl_most150_async_tx_ack(ctypes.Structure):
+    _fields_ = [
+        ("priority", ctypes.c_ubyte),
+        ("asyncSendAttempts", ctypes.c_ubyte),
+        ("length", ctypes.c_ushort),
+        ("targetAddress", ctypes.c_ushort),
+        ("sourceAddress", ctypes.c_ushort),
+        ("status", ctypes.c_uint),
+        ("asyncData", ctypes.c_ubyte*1524),
+    ]
+    __str__ = cls2str
+XL_MOST150_ASYNC_TX_ACK_EV = s_xl_most150_async_tx_ack
+
+class s_xl_most150_ethernet_tx(ctypes.Structure):
+    _fields_ = [
+        ("priority", ctypes.c_ubyte),
+        ("ethSendAttempts", ctypes.c_ubyte),
+        ("sourceAddress", ctypes.c_ubyte*6),
+        ("targetAddress", ctypes.c_ubyte*6),
+        ("reserved", ctypes.c_ubyte*2),
+        ("length", ctypes.c_uint),
+        ("ethernetData", ctypes.c_ubyte*1510),
+    ]
+    __str__ = cls2str
+XL_MOST150_ETHERNET_TX_ACK_EV = s_xl_most150_ethernet_tx
+
+class s_xl_most150_hw_sync(ctypes.Structure):
+    _fields_ = [
+        ("pulseCode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XL_MOST150_HW_SYNC_EV = s_xl_most150_hw_sync
+
+class u_xl_most150_tag_data(ctypes.Union):
+    _fields_ = [
+        ("rawData", ctypes.c_ubyte*XL_MOST150_MAX_EVENT_DATA_SIZE),
+        ("mostEventSource", s_xl_most150_event_source),
+        ("mostDeviceMode", s_xl_most150_device_mode),
+        ("mostFrequency", s_xl_most150_frequency),
+        ("mostSpecialNodeInfo", s_xl_most150_special_node_info),
+        ("mostCtrlRx", s_xl_most150_ctrl_rx),
+        ("mostCtrlTxAck", s_xl_most150_ctrl_tx_ack),
+        ("mostAsyncSpy", s_xl_most150_async_spy_msg),
+        ("mostAsyncRx", s_xl_most150_async_rx_msg),
+        ("mostSyncAllocInfo", s_xl_most150_sync_alloc_info),
+        ("mostSyncVolumeStatus", s_xl_most150_sync_volume_status),
+        ("mostTxLight", s_xl_most150_tx_light),
+        ("mostRxLightLockStatus", s_xl_most150_rx_light_lock_status),
+        ("mostError", s_xl_most150_error),
+        ("mostConfigureRxBuffer", s_xl_most150_configure_rx_buffer),
+        ("mostCtrlSyncAudio", s_xl_most150_ctrl_sync_audio),
+        ("mostSyncMuteStatus", s_xl_most150_sync_mute_status),
+        ("mostLightPower", s_xl_most150_tx_light_power),
+        ("mostGenLightError", s_xl_most150_gen_light_error),
+        ("mostGenLockError", s_xl_most150_gen_lock_error),
+        ("mostCtrlBusload", s_xl_most150_ctrl_busload),
+        ("mostAsyncBusload", s_xl_most150_async_busload),
+        ("mostEthernetRx", s_xl_most150_ethernet_rx),
+        ("mostSystemLockFlag", s_xl_most150_systemlock_flag),
+        ("mostShutdownFlag", s_xl_most150_shutdown_flag),
+        ("mostSpdifMode", s_xl_most150_spdif_mode),
+        ("mostEclEvent", s_xl_most150_ecl),
+        ("mostEclTermination", s_xl_most150_ecl_termination),
+        ("mostCtrlSpy", s_xl_most150_ctrl_spy),
+        ("mostAsyncTxAck", s_xl_most150_async_tx_ack),
+        ("mostEthernetSpy", s_xl_most150_ethernet_spy),
+        ("mostEthernetTxAck", s_xl_most150_ethernet_tx),
+        ("mostHWSync", s_xl_most150_hw_sync),
+        ("mostStartup", s_xl_most150_nw_startup),
+        ("mostShutdown", s_xl_most150_nw_shutdown),
+        ("mostStreamState", s_xl_most150_stream_state),
+        ("mostStreamTxBuffer", s_xl_most150_stream_tx_buffer),
+        ("mostStreamRxBuffer", s_xl_most150_stream_rx_buffer),
+        ("mostStreamTxUnderflow", s_xl_most150_stream_tx_underflow),
+        ("mostStreamTxLabel", s_xl_most150_stream_tx_label),
+        ("mostGenBypassStress", s_xl_most150_gen_bypass_stress),
+        ("mostEclSequence", s_xl_most150_ecl_sequence),
+        ("mostEclGlitchFilter", s_xl_most150_ecl_glitch_filter),
+        ("mostSsoResult", s_xl_most150_sso_result),
+    ]
+    __str__ = cls2str
+
+class s_xl_event_most150(ctypes.Structure):
+    _anonymous_ = ("tagData",)
+    _fields_ = [
+        ("size", ctypes.c_uint),
+        ("tag", XLmostEventTag),
+        ("channelIndex", ctypes.c_ushort),
+        ("userHandle", ctypes.c_uint),
+        ("flagsChip", ctypes.c_ushort),
+        ("reserved", ctypes.c_ushort),
+        ("timeStamp", XLuint64),
+        ("timeStampSync", XLuint64),
+        ("tagData", u_xl_most150_tag_data),
+    ]
+    __str__ = cls2str
+XLmost150event = s_xl_event_most150
+
+class s_xl_set_most150_special_node_info(ctypes.Structure):
+    _fields_ = [
+        #see XL_MOST150_SPECIAL_NODE_MASK_CHANGED
+        ("changeMask", ctypes.c_uint),
+        ("nodeAddress", ctypes.c_uint),
+        ("groupAddress", ctypes.c_uint),
+        ("sbc", ctypes.c_uint),
+        ("ctrlRetryTime", ctypes.c_uint),
+        ("ctrlSendAttempts", ctypes.c_uint),
+        ("asyncRetryTime", ctypes.c_uint),
+        ("asyncSendAttempts", ctypes.c_uint),
+        ("macAddr", ctypes.c_ubyte*6),
+    ]
+    __str__ = cls2str
+XLmost150SetSpecialNodeInfo = s_xl_set_most150_special_node_info
+
+class s_xl_most150_ctrl_tx_msg(ctypes.Structure):
+    _fields_ = [
+        #Prio: Currently fixed to 0x01 for Control Messages
+        ("ctrlPrio", ctypes.c_uint),
+        #1..16 attempts, set an invalid value to use the default value set by xlMost150SetCtrlRetryParameters
+        ("ctrlSendAttempts", ctypes.c_uint),
+        ("targetAddress", ctypes.c_uint),
+     #ctrlData structure:
+
+     #-----------------------------------------------------------------------
+
+     #FBlockID | InstID | FunctionID | OpType | TelID | TelLen | Payload
+
+     #-----------------------------------------------------------------------
+
+     # 8 bit   | 8 bit  |   12 bit   | 4 bit  | 4 bit | 12 bit | 0 .. 45 byte
+
+     #-----------------------------------------------------------------------
+
+     #ctrlData[0]:   FBlockID
+
+     #ctrlData[1]:   InstID
+
+     #ctrlData[2]:   FunctionID (upper 8 bits)
+
+     #ctrlData[3]:   FunctionID (lower 4 bits) + OpType (4 bits)
+
+     #ctrlData[4]:   TelId (4 bits) + TelLen (upper 4 bits)
+
+     #ctrlData[5]:   TelLen (lower 8 bits)
+
+     #ctrlData[6..50]: Payload
+
+        ("ctrlData", ctypes.c_ubyte*51),
+    ]
+    __str__ = cls2str
+XLmost150CtrlTxMsg = s_xl_most150_ctrl_tx_msg
+
+class s_xl_most150_async_tx_msg(ctypes.Structure):
+    _fields_ = [
+        #Prio: Currently fixed to 0x00 for MDP /MEP
+        ("priority", ctypes.c_uint),
+        #1..16 attempts,set an invalid value to use the default value set by xlMost150SetAsyncRetryParameters
+        ("asyncSendAttempts", ctypes.c_uint),
+        #max. 1600 bytes
+        ("length", ctypes.c_uint),
+        ("targetAddress", ctypes.c_uint),
+        ("asyncData", ctypes.c_ubyte*XL_MOST150_ASYNC_SEND_PAYLOAD_MAX_SIZE),
+    ]
+    __str__ = cls2str
+XLmost150AsyncTxMsg = s_xl_most150_async_tx_msg
+
+class s_xl_most150_ethernet_tx_msg(ctypes.Structure):
+    _fields_ = [
+        #Prio: Currently fixed to 0x00 for MDP /MEP
+        ("priority", ctypes.c_uint),
+        #1..16 attempts, set an invalid value to use the default value set by xlMost150SetAsyncRetryParameters
+        ("ethSendAttempts", ctypes.c_uint),
+        ("sourceAddress", ctypes.c_ubyte*6),
+        ("targetAddress", ctypes.c_ubyte*6),
+        #max. 1600 bytes
+        ("length", ctypes.c_uint),
+        ("ethernetData", ctypes.c_ubyte*XL_MOST150_ETHERNET_SEND_PAYLOAD_MAX_SIZE),
+    ]
+    __str__ = cls2str
+XLmost150EthernetTxMsg = s_xl_most150_ethernet_tx_msg
+
+class s_xl_most150_sync_audio_parameter(ctypes.Structure):
+    _fields_ = [
+        ("label", ctypes.c_uint),
+        ("width", ctypes.c_uint),
+        ("device", ctypes.c_uint),
+        ("mode", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLmost150SyncAudioParameter = s_xl_most150_sync_audio_parameter
+
+class s_xl_most150_ctrl_busload_config(ctypes.Structure):
+    _fields_ = [
+        ("transmissionRate", ctypes.c_uint),
+        ("counterType", ctypes.c_uint),
+        #counter can be only be set in the payload -> position 0 means first payload byte!
+        ("counterPosition", ctypes.c_uint),
+        ("busloadCtrlMsg", s_xl_most150_ctrl_tx_msg),
+    ]
+    __str__ = cls2str
+XLmost150CtrlBusloadConfig = s_xl_most150_ctrl_busload_config
+
+class u_xl_most150_busloadPkt(ctypes.Union):
+    _fields_ = [
+        ("rawBusloadPkt", ctypes.c_ubyte*1540),
+        ("busloadAsyncPkt", s_xl_most150_async_tx_msg),
+        ("busloadEthernetPkt", s_xl_most150_ethernet_tx_msg),
+    ]
+    __str__ = cls2str
+
+class s_xl_most150_async_busload_config(ctypes.Structure):
+    _anonymous_ = ("busloadPkt",)
+    _fields_ = [
+        ("busloadType", ctypes.c_uint),
+        ("transmissionRate", ctypes.c_uint),
+        ("counterType", ctypes.c_uint),
+        ("counterPosition", ctypes.c_uint),
+        ("busloadPkt", u_xl_most150_busloadPkt),
+    ]
+    __str__ = cls2str
+XLmost150AsyncBusloadConfig = s_xl_most150_async_busload_config
+
+class s_xl_most150_stream_open(ctypes.Structure):
+    _fields_ = [
+        ("pStreamHandle", ctypes.POINTER(ctypes.c_uint)),
+        ("direction", ctypes.c_uint),
+        ("numBytesPerFrame", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+        ("latency", ctypes.c_uint),
+    ]
+    __str__ = cls2str
+XLmost150StreamOpen = s_xl_most150_stream_open
+
+class s_xl_most150_stream_get_info(ctypes.Structure):
+    _fields_ = [
+        ("streamHandle", ctypes.c_uint),
+        ("numBytesPerFrame", ctypes.c_uint),
+        ("direction", ctypes.c_uint),
+        ("reserved", ctypes.c_uint),
+        ("latency", ctypes.c_uint),
+        ("streamState", ctypes.c_uint),
+        ("connLabels", ctypes.c_uint*XL_MOST150_STREAM_RX_NUM_CL_MAX),
+    ]
+    __str__ = cls2str
+XLmost150StreamInfo = s_xl_most150_stream_get_info
+
+### MOST150 XL API functions ###
+
+xlMost150Receive = _vector_xlapi_dll_.xlMost150Receive
+xlMost150Receive.restype = XLstatus
+xlMost150Receive.argtypes = [
+    #portHandle
+    XLportHandle,
+    #pEventBuffer
+    ctypes.POINTER(XLmost150event),
+]
+xlMost150Receive.errcheck = check_xl_status
+xlMost150Receive.__doc__ = """
+xlapi.xlMost150Receive
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150TwinklePowerLed = _vector_xlapi_dll_.xlMost150TwinklePowerLed
+xlMost150TwinklePowerLed.restype = XLstatus
+xlMost150TwinklePowerLed.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150TwinklePowerLed.errcheck = check_xl_status
+xlMost150TwinklePowerLed.__doc__ = """
+xlapi.xlMost150TwinklePowerLed
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SwitchEventSources = _vector_xlapi_dll_.xlMost150SwitchEventSources
+xlMost150SwitchEventSources.restype = XLstatus
+xlMost150SwitchEventSources.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #sourceMask
+    ctypes.c_uint,
+]
+xlMost150SwitchEventSources.errcheck = check_xl_status
+xlMost150SwitchEventSources.__doc__ = """
+xlapi.xlMost150SwitchEventSources
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetDeviceMode = _vector_xlapi_dll_.xlMost150SetDeviceMode
+xlMost150SetDeviceMode.restype = XLstatus
+xlMost150SetDeviceMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #deviceMode
+    ctypes.c_uint,
+]
+xlMost150SetDeviceMode.errcheck = check_xl_status
+xlMost150SetDeviceMode.__doc__ = """
+xlapi.xlMost150SetDeviceMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetDeviceMode = _vector_xlapi_dll_.xlMost150GetDeviceMode
+xlMost150GetDeviceMode.restype = XLstatus
+xlMost150GetDeviceMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetDeviceMode.errcheck = check_xl_status
+xlMost150GetDeviceMode.__doc__ = """
+xlapi.xlMost150GetDeviceMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetSPDIFMode = _vector_xlapi_dll_.xlMost150SetSPDIFMode
+xlMost150SetSPDIFMode.restype = XLstatus
+xlMost150SetSPDIFMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #spdifMode
+    ctypes.c_uint,
+]
+xlMost150SetSPDIFMode.errcheck = check_xl_status
+xlMost150SetSPDIFMode.__doc__ = """
+xlapi.xlMost150SetSPDIFMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetSPDIFMode = _vector_xlapi_dll_.xlMost150GetSPDIFMode
+xlMost150GetSPDIFMode.restype = XLstatus
+xlMost150GetSPDIFMode.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetSPDIFMode.errcheck = check_xl_status
+xlMost150GetSPDIFMode.__doc__ = """
+xlapi.xlMost150GetSPDIFMode
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetSpecialNodeInfo = _vector_xlapi_dll_.xlMost150SetSpecialNodeInfo
+xlMost150SetSpecialNodeInfo.restype = XLstatus
+xlMost150SetSpecialNodeInfo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pSpecialNodeInfo
+    ctypes.POINTER(XLmost150SetSpecialNodeInfo),
+]
+xlMost150SetSpecialNodeInfo.errcheck = check_xl_status
+xlMost150SetSpecialNodeInfo.__doc__ = """
+xlapi.xlMost150SetSpecialNodeInfo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetSpecialNodeInfo = _vector_xlapi_dll_.xlMost150GetSpecialNodeInfo
+xlMost150GetSpecialNodeInfo.restype = XLstatus
+xlMost150GetSpecialNodeInfo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #requestMask
+    ctypes.c_uint,
+]
+xlMost150GetSpecialNodeInfo.errcheck = check_xl_status
+xlMost150GetSpecialNodeInfo.__doc__ = """
+xlapi.xlMost150GetSpecialNodeInfo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetFrequency = _vector_xlapi_dll_.xlMost150SetFrequency
+xlMost150SetFrequency.restype = XLstatus
+xlMost150SetFrequency.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #frequency
+    ctypes.c_uint,
+]
+xlMost150SetFrequency.errcheck = check_xl_status
+xlMost150SetFrequency.__doc__ = """
+xlapi.xlMost150SetFrequency
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetFrequency = _vector_xlapi_dll_.xlMost150GetFrequency
+xlMost150GetFrequency.restype = XLstatus
+xlMost150GetFrequency.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetFrequency.errcheck = check_xl_status
+xlMost150GetFrequency.__doc__ = """
+xlapi.xlMost150GetFrequency
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150CtrlTransmit = _vector_xlapi_dll_.xlMost150CtrlTransmit
+xlMost150CtrlTransmit.restype = XLstatus
+xlMost150CtrlTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pCtrlTxMsg
+    ctypes.POINTER(XLmost150CtrlTxMsg),
+]
+xlMost150CtrlTransmit.errcheck = check_xl_status
+xlMost150CtrlTransmit.__doc__ = """
+xlapi.xlMost150CtrlTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150AsyncTransmit = _vector_xlapi_dll_.xlMost150AsyncTransmit
+xlMost150AsyncTransmit.restype = XLstatus
+xlMost150AsyncTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pAsyncTxMsg
+    ctypes.POINTER(XLmost150AsyncTxMsg),
+]
+xlMost150AsyncTransmit.errcheck = check_xl_status
+xlMost150AsyncTransmit.__doc__ = """
+xlapi.xlMost150AsyncTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150EthernetTransmit = _vector_xlapi_dll_.xlMost150EthernetTransmit
+xlMost150EthernetTransmit.restype = XLstatus
+xlMost150EthernetTransmit.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pEthernetTxMsg
+    ctypes.POINTER(XLmost150EthernetTxMsg),
+]
+xlMost150EthernetTransmit.errcheck = check_xl_status
+xlMost150EthernetTransmit.__doc__ = """
+xlapi.xlMost150EthernetTransmit
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetSystemLockFlag = _vector_xlapi_dll_.xlMost150GetSystemLockFlag
+xlMost150GetSystemLockFlag.restype = XLstatus
+xlMost150GetSystemLockFlag.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetSystemLockFlag.errcheck = check_xl_status
+xlMost150GetSystemLockFlag.__doc__ = """
+xlapi.xlMost150GetSystemLockFlag
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetShutdownFlag = _vector_xlapi_dll_.xlMost150GetShutdownFlag
+xlMost150GetShutdownFlag.restype = XLstatus
+xlMost150GetShutdownFlag.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetShutdownFlag.errcheck = check_xl_status
+xlMost150GetShutdownFlag.__doc__ = """
+xlapi.xlMost150GetShutdownFlag
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150Shutdown = _vector_xlapi_dll_.xlMost150Shutdown
+xlMost150Shutdown.restype = XLstatus
+xlMost150Shutdown.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150Shutdown.errcheck = check_xl_status
+xlMost150Shutdown.__doc__ = """
+xlapi.xlMost150Shutdown
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150Startup = _vector_xlapi_dll_.xlMost150Startup
+xlMost150Startup.restype = XLstatus
+xlMost150Startup.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150Startup.errcheck = check_xl_status
+xlMost150Startup.__doc__ = """
+xlapi.xlMost150Startup
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SyncGetAllocTable = _vector_xlapi_dll_.xlMost150SyncGetAllocTable
+xlMost150SyncGetAllocTable.restype = XLstatus
+xlMost150SyncGetAllocTable.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150SyncGetAllocTable.errcheck = check_xl_status
+xlMost150SyncGetAllocTable.__doc__ = """
+xlapi.xlMost150SyncGetAllocTable
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150CtrlSyncAudio = _vector_xlapi_dll_.xlMost150CtrlSyncAudio
+xlMost150CtrlSyncAudio.restype = XLstatus
+xlMost150CtrlSyncAudio.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pSyncAudioParameter
+    ctypes.POINTER(XLmost150SyncAudioParameter),
+]
+xlMost150CtrlSyncAudio.errcheck = check_xl_status
+xlMost150CtrlSyncAudio.__doc__ = """
+xlapi.xlMost150CtrlSyncAudio
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SyncSetVolume = _vector_xlapi_dll_.xlMost150SyncSetVolume
+xlMost150SyncSetVolume.restype = XLstatus
+xlMost150SyncSetVolume.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+    #volume
+    ctypes.c_uint,
+]
+xlMost150SyncSetVolume.errcheck = check_xl_status
+xlMost150SyncSetVolume.__doc__ = """
+xlapi.xlMost150SyncSetVolume
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SyncGetVolume = _vector_xlapi_dll_.xlMost150SyncGetVolume
+xlMost150SyncGetVolume.restype = XLstatus
+xlMost150SyncGetVolume.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+]
+xlMost150SyncGetVolume.errcheck = check_xl_status
+xlMost150SyncGetVolume.__doc__ = """
+xlapi.xlMost150SyncGetVolume
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SyncSetMute = _vector_xlapi_dll_.xlMost150SyncSetMute
+xlMost150SyncSetMute.restype = XLstatus
+xlMost150SyncSetMute.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+    #mute
+    ctypes.c_uint,
+]
+xlMost150SyncSetMute.errcheck = check_xl_status
+xlMost150SyncSetMute.__doc__ = """
+xlapi.xlMost150SyncSetMute
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SyncGetMute = _vector_xlapi_dll_.xlMost150SyncGetMute
+xlMost150SyncGetMute.restype = XLstatus
+xlMost150SyncGetMute.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #device
+    ctypes.c_uint,
+]
+xlMost150SyncGetMute.errcheck = check_xl_status
+xlMost150SyncGetMute.__doc__ = """
+xlapi.xlMost150SyncGetMute
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetRxLightLockStatus = _vector_xlapi_dll_.xlMost150GetRxLightLockStatus
+xlMost150GetRxLightLockStatus.restype = XLstatus
+xlMost150GetRxLightLockStatus.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #fromSpy
+    ctypes.c_uint,
+]
+xlMost150GetRxLightLockStatus.errcheck = check_xl_status
+xlMost150GetRxLightLockStatus.__doc__ = """
+xlapi.xlMost150GetRxLightLockStatus
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetTxLight = _vector_xlapi_dll_.xlMost150SetTxLight
+xlMost150SetTxLight.restype = XLstatus
+xlMost150SetTxLight.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #txLight
+    ctypes.c_uint,
+]
+xlMost150SetTxLight.errcheck = check_xl_status
+xlMost150SetTxLight.__doc__ = """
+xlapi.xlMost150SetTxLight
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetTxLight = _vector_xlapi_dll_.xlMost150GetTxLight
+xlMost150GetTxLight.restype = XLstatus
+xlMost150GetTxLight.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetTxLight.errcheck = check_xl_status
+xlMost150GetTxLight.__doc__ = """
+xlapi.xlMost150GetTxLight
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetTxLightPower = _vector_xlapi_dll_.xlMost150SetTxLightPower
+xlMost150SetTxLightPower.restype = XLstatus
+xlMost150SetTxLightPower.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #attenuation
+    ctypes.c_uint,
+]
+xlMost150SetTxLightPower.errcheck = check_xl_status
+xlMost150SetTxLightPower.__doc__ = """
+xlapi.xlMost150SetTxLightPower
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GenerateLightError = _vector_xlapi_dll_.xlMost150GenerateLightError
+xlMost150GenerateLightError.restype = XLstatus
+xlMost150GenerateLightError.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #lightOffTime
+    ctypes.c_uint,
+    #lightOnTime
+    ctypes.c_uint,
+    #repeat
+    ctypes.c_uint,
+]
+xlMost150GenerateLightError.errcheck = check_xl_status
+xlMost150GenerateLightError.__doc__ = """
+xlapi.xlMost150GenerateLightError
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GenerateLockError = _vector_xlapi_dll_.xlMost150GenerateLockError
+xlMost150GenerateLockError.restype = XLstatus
+xlMost150GenerateLockError.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #unlockTime
+    ctypes.c_uint,
+    #lockTime
+    ctypes.c_uint,
+    #repeat
+    ctypes.c_uint,
+]
+xlMost150GenerateLockError.errcheck = check_xl_status
+xlMost150GenerateLockError.__doc__ = """
+xlapi.xlMost150GenerateLockError
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150ConfigureRxBuffer = _vector_xlapi_dll_.xlMost150ConfigureRxBuffer
+xlMost150ConfigureRxBuffer.restype = XLstatus
+xlMost150ConfigureRxBuffer.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #bufferType
+    ctypes.c_uint,
+    #bufferMode
+    ctypes.c_uint,
+]
+xlMost150ConfigureRxBuffer.errcheck = check_xl_status
+xlMost150ConfigureRxBuffer.__doc__ = """
+xlapi.xlMost150ConfigureRxBuffer
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150CtrlConfigureBusload = _vector_xlapi_dll_.xlMost150CtrlConfigureBusload
+xlMost150CtrlConfigureBusload.restype = XLstatus
+xlMost150CtrlConfigureBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pCtrlBusLoad
+    ctypes.POINTER(XLmost150CtrlBusloadConfig),
+]
+xlMost150CtrlConfigureBusload.errcheck = check_xl_status
+xlMost150CtrlConfigureBusload.__doc__ = """
+xlapi.xlMost150CtrlConfigureBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150CtrlGenerateBusload = _vector_xlapi_dll_.xlMost150CtrlGenerateBusload
+xlMost150CtrlGenerateBusload.restype = XLstatus
+xlMost150CtrlGenerateBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #numberCtrlFrames
+    XLulong,
+]
+xlMost150CtrlGenerateBusload.errcheck = check_xl_status
+xlMost150CtrlGenerateBusload.__doc__ = """
+xlapi.xlMost150CtrlGenerateBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150AsyncConfigureBusload = _vector_xlapi_dll_.xlMost150AsyncConfigureBusload
+xlMost150AsyncConfigureBusload.restype = XLstatus
+xlMost150AsyncConfigureBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pAsyncBusLoad
+    ctypes.POINTER(XLmost150AsyncBusloadConfig),
+]
+xlMost150AsyncConfigureBusload.errcheck = check_xl_status
+xlMost150AsyncConfigureBusload.__doc__ = """
+xlapi.xlMost150AsyncConfigureBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150AsyncGenerateBusload = _vector_xlapi_dll_.xlMost150AsyncGenerateBusload
+xlMost150AsyncGenerateBusload.restype = XLstatus
+xlMost150AsyncGenerateBusload.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #numberAsyncPackets
+    XLulong,
+]
+xlMost150AsyncGenerateBusload.errcheck = check_xl_status
+xlMost150AsyncGenerateBusload.__doc__ = """
+xlapi.xlMost150AsyncGenerateBusload
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetECLLine = _vector_xlapi_dll_.xlMost150SetECLLine
+xlMost150SetECLLine.restype = XLstatus
+xlMost150SetECLLine.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #eclLineState
+    ctypes.c_uint,
+]
+xlMost150SetECLLine.errcheck = check_xl_status
+xlMost150SetECLLine.__doc__ = """
+xlapi.xlMost150SetECLLine
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetECLTermination = _vector_xlapi_dll_.xlMost150SetECLTermination
+xlMost150SetECLTermination.restype = XLstatus
+xlMost150SetECLTermination.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #eclLineTermination
+    ctypes.c_uint,
+]
+xlMost150SetECLTermination.errcheck = check_xl_status
+xlMost150SetECLTermination.__doc__ = """
+xlapi.xlMost150SetECLTermination
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetECLInfo = _vector_xlapi_dll_.xlMost150GetECLInfo
+xlMost150GetECLInfo.restype = XLstatus
+xlMost150GetECLInfo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetECLInfo.errcheck = check_xl_status
+xlMost150GetECLInfo.__doc__ = """
+xlapi.xlMost150GetECLInfo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamOpen = _vector_xlapi_dll_.xlMost150StreamOpen
+xlMost150StreamOpen.restype = XLstatus
+xlMost150StreamOpen.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pStreamOpen
+    ctypes.POINTER(XLmost150StreamOpen),
+]
+xlMost150StreamOpen.errcheck = check_xl_status
+xlMost150StreamOpen.__doc__ = """
+xlapi.xlMost150StreamOpen
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamClose = _vector_xlapi_dll_.xlMost150StreamClose
+xlMost150StreamClose.restype = XLstatus
+xlMost150StreamClose.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMost150StreamClose.errcheck = check_xl_status
+xlMost150StreamClose.__doc__ = """
+xlapi.xlMost150StreamClose
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamStart = _vector_xlapi_dll_.xlMost150StreamStart
+xlMost150StreamStart.restype = XLstatus
+xlMost150StreamStart.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+    #numConnLabels
+    ctypes.c_uint,
+    #pConnLabels
+    ctypes.POINTER(ctypes.c_uint),
+]
+xlMost150StreamStart.errcheck = check_xl_status
+xlMost150StreamStart.__doc__ = """
+xlapi.xlMost150StreamStart
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamStop = _vector_xlapi_dll_.xlMost150StreamStop
+xlMost150StreamStop.restype = XLstatus
+xlMost150StreamStop.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMost150StreamStop.errcheck = check_xl_status
+xlMost150StreamStop.__doc__ = """
+xlapi.xlMost150StreamStop
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamTransmitData = _vector_xlapi_dll_.xlMost150StreamTransmitData
+xlMost150StreamTransmitData.restype = XLstatus
+xlMost150StreamTransmitData.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+    #pBuffer
+    ctypes.POINTER(ctypes.c_ubyte),
+    #pNumberOfBytes
+    ctypes.POINTER(ctypes.c_uint),
+]
+xlMost150StreamTransmitData.errcheck = check_xl_status
+xlMost150StreamTransmitData.__doc__ = """
+xlapi.xlMost150StreamTransmitData
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamClearTxFifo = _vector_xlapi_dll_.xlMost150StreamClearTxFifo
+xlMost150StreamClearTxFifo.restype = XLstatus
+xlMost150StreamClearTxFifo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #streamHandle
+    ctypes.c_uint,
+]
+xlMost150StreamClearTxFifo.errcheck = check_xl_status
+xlMost150StreamClearTxFifo.__doc__ = """
+xlapi.xlMost150StreamClearTxFifo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamGetInfo = _vector_xlapi_dll_.xlMost150StreamGetInfo
+xlMost150StreamGetInfo.restype = XLstatus
+xlMost150StreamGetInfo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #pStreamInfo
+    ctypes.POINTER(XLmost150StreamInfo),
+]
+xlMost150StreamGetInfo.errcheck = check_xl_status
+xlMost150StreamGetInfo.__doc__ = """
+xlapi.xlMost150StreamGetInfo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamInitRxFifo = _vector_xlapi_dll_.xlMost150StreamInitRxFifo
+xlMost150StreamInitRxFifo.restype = XLstatus
+xlMost150StreamInitRxFifo.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+]
+xlMost150StreamInitRxFifo.errcheck = check_xl_status
+xlMost150StreamInitRxFifo.__doc__ = """
+xlapi.xlMost150StreamInitRxFifo
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150StreamReceiveData = _vector_xlapi_dll_.xlMost150StreamReceiveData
+xlMost150StreamReceiveData.restype = XLstatus
+xlMost150StreamReceiveData.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #pBuffer
+    ctypes.POINTER(ctypes.c_ubyte),
+    #pBufferSize
+    ctypes.POINTER(ctypes.c_uint),
+]
+xlMost150StreamReceiveData.errcheck = check_xl_status
+xlMost150StreamReceiveData.__doc__ = """
+xlapi.xlMost150StreamReceiveData
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GenerateBypassStress = _vector_xlapi_dll_.xlMost150GenerateBypassStress
+xlMost150GenerateBypassStress.restype = XLstatus
+xlMost150GenerateBypassStress.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #bypassCloseTime
+    ctypes.c_uint,
+    #bypassOpenTime
+    ctypes.c_uint,
+    #repeat
+    ctypes.c_uint,
+]
+xlMost150GenerateBypassStress.errcheck = check_xl_status
+xlMost150GenerateBypassStress.__doc__ = """
+xlapi.xlMost150GenerateBypassStress
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150EclConfigureSeq = _vector_xlapi_dll_.xlMost150EclConfigureSeq
+xlMost150EclConfigureSeq.restype = XLstatus
+xlMost150EclConfigureSeq.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #numStates
+    ctypes.c_uint,
+    #pEclStates
+    ctypes.POINTER(ctypes.c_uint),
+    #pEclStatesDuration
+    ctypes.POINTER(ctypes.c_uint),
+]
+xlMost150EclConfigureSeq.errcheck = check_xl_status
+xlMost150EclConfigureSeq.__doc__ = """
+xlapi.xlMost150EclConfigureSeq
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150EclGenerateSeq = _vector_xlapi_dll_.xlMost150EclGenerateSeq
+xlMost150EclGenerateSeq.restype = XLstatus
+xlMost150EclGenerateSeq.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #start
+    ctypes.c_uint,
+]
+xlMost150EclGenerateSeq.errcheck = check_xl_status
+xlMost150EclGenerateSeq.__doc__ = """
+xlapi.xlMost150EclGenerateSeq
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetECLGlitchFilter = _vector_xlapi_dll_.xlMost150SetECLGlitchFilter
+xlMost150SetECLGlitchFilter.restype = XLstatus
+xlMost150SetECLGlitchFilter.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #duration
+    ctypes.c_uint,
+]
+xlMost150SetECLGlitchFilter.errcheck = check_xl_status
+xlMost150SetECLGlitchFilter.__doc__ = """
+xlapi.xlMost150SetECLGlitchFilter
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150SetSSOResult = _vector_xlapi_dll_.xlMost150SetSSOResult
+xlMost150SetSSOResult.restype = XLstatus
+xlMost150SetSSOResult.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+    #ssoCUStatus
+    ctypes.c_uint,
+]
+xlMost150SetSSOResult.errcheck = check_xl_status
+xlMost150SetSSOResult.__doc__ = """
+xlapi.xlMost150SetSSOResult
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
+
+xlMost150GetSSOResult = _vector_xlapi_dll_.xlMost150GetSSOResult
+xlMost150GetSSOResult.restype = XLstatus
+xlMost150GetSSOResult.argtypes = [
+    #portHandle
+    XLportHandle,
+    #accessMask
+    XLaccess,
+    #userHandle
+    XLuserHandle,
+]
+xlMost150GetSSOResult.errcheck = check_xl_status
+xlMost150GetSSOResult.__doc__ = """
+xlapi.xlMost150GetSSOResult
+
+Syntax:
+
+Args:
+
+Returns:
+    XLstatus (error code)
+"""
@@ -0,0 +1,740 @@
+##############################################################################
+#                                                                            #
+# Module: xlvirtual                                                          #
+# Author: Maximilian Prindl                                                  #
+#                                                                            #
+# A pure python virtual driver that stands in for the vxlapi.dll. It is      #
+# loaded by xlapi on platforms without the Vector XL Driver Library (or if   #
+# the environment variable XLAPI_BACKEND is set to "virtual").               #
+#   1)All virtual channels are connected to one virtual CAN bus, a frame     #
+#     sent on one channel is received by all other active channels           #
+#   2)Functions that are not simulated return XL_ERR_NOT_IMPLEMENTED         #
+#   3)Notification handles can be awaited with the WaitForSingleObject and   #
+#     WaitForMultipleObjects functions of this module                        #
+#                                                                            #
+##############################################################################
+"""
+A pure python virtual Vector XL Driver Library for CAN and CAN FD.
+
+Author: Maximilian Prindl
+
+Usage:
+    XLAPI_BACKEND=virtual XLAPI_VIRTUAL_CHANNELS=4 python my_script.py
+
+    import xlapi
+    xlapi.xlOpenDriver()
+    ... DO STUFF (all virtual channels share one loopback bus) ...
+    xlapi.xlCloseDriver()
+"""
+
+import collections
+import ctypes
+import os
+import threading
+import time
+
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+# Handles of the notification events, shared by all driver instances so the
+# wait functions of this module work without knowing the driver
+_notify_condition = threading.Condition()
+_notify_events = {}
+
+class _NotificationEvent(object):
+    """An auto-resetting event like the WIN32 events of the vxlapi.dll."""
+    def __init__(self, queue_level):
+        self.queue_level = queue_level
+        self.signaled = False
+
+    def set(self):
+        with _notify_condition:
+            self.signaled = True
+            _notify_condition.notify_all()
+
+def _create_notification_event(queue_level):
+    with _notify_condition:
+        handle = len(_notify_events) + 1
+        _notify_events[handle] = _NotificationEvent(queue_level)
+        return handle, _notify_events[handle]
+
+def WaitForMultipleObjects(handles, wait_all, milliseconds):
+    """Waits for one (or all) notification handles like the WIN32 function."""
+    events = [_notify_events[handle] for handle in handles]
+    if wait_all:
+        predicate = lambda: all(event.signaled for event in events)
+    else:
+        predicate = lambda: any(event.signaled for event in events)
+    timeout = None if milliseconds == INFINITE else milliseconds / 1000.0
+    with _notify_condition:
+        if not _notify_condition.wait_for(predicate, timeout):
+            return WAIT_TIMEOUT
+        for i, event in enumerate(events):
+            if event.signaled:
+                if not wait_all:
+                    event.signaled = False
+                    return WAIT_OBJECT_0 + i
+        for event in events:
+            event.signaled = False
+        return WAIT_OBJECT_0
+
+def WaitForSingleObject(handle, milliseconds):
+    """Waits for a notification handle like the WIN32 function."""
+    return WaitForMultipleObjects([handle], False, milliseconds)
+
+def _value(arg):
+    """Returns the python value of a ctypes simple type or of a python value."""
+    return getattr(arg, "value", arg)
+
+def _ref(arg):
+    """Returns the object referenced by a byref/pointer argument."""
+    if isinstance(arg, ctypes._Pointer):
+        return arg.contents
+    return getattr(arg, "_obj", arg)
+
+def _array(arg, ctype, count):
+    """Returns an array view of count ctype elements starting at the argument."""
+    if isinstance(arg, ctypes._Pointer):
+        address = ctypes.cast(arg, ctypes.c_void_p).value
+    else:
+        address = ctypes.addressof(getattr(arg, "_obj", arg))
+    return (ctype * count).from_address(address)
+
+def _channels(mask):
+    index = 0
+    while mask:
+        if mask & 1:
+            yield index
+        mask, index = mask >> 1, index + 1
+
+class _VirtualFunction(object):
+    """Mimics a ctypes foreign function, so xlapi can set argtypes & errcheck."""
+    def __init__(self, name, function):
+        self.__name__ = name
+        self._function = function
+        self.restype = None
+        self.argtypes = None
+        self.errcheck = None
+
+    def __call__(self, *args):
+        result = self._function(*args)
+        if self.errcheck:
+            return self.errcheck(result, self, args)
+        return result
+
+# Receive queue entry of a chip state event (frames are plain tuples)
+_ChipState = collections.namedtuple(
+    "_ChipState", "timestamp channel bus_status tx_error_counter rx_error_counter"
+)
+
+class _VirtualChannel(object):
+    def __init__(self, index):
+        self.index = index
+        self.mask = 1 << index
+        self.init_port = None
+        self.bitrate = 500000
+        self.data_bitrate = 0
+        self.is_can_fd = False
+        # The virtual bus never has errors
+        self.tx_error_counter = 0
+        self.rx_error_counter = 0
+
+class _VirtualPort(object):
+    def __init__(self, xl, handle, access_mask, queue_size, interface_version):
+        self._xl = xl
+        self.handle = handle
+        self.access_mask = access_mask
+        self.active_mask = 0
+        self.queue = collections.deque()
+        self.queue_size = queue_size
+        self.interface_version = interface_version
+        self.overrun = False
+        self.tx_receipts = 0
+        self.clock_base = 0
+        self.notification = None
+        # Timer based notification: rate in 10 us, event set by a thread
+        self.timer_rate = 0
+        self.timer_notification = None
+        # Per channel acceptance filters: std/ext code & mask plus std ranges
+        self.std_filter = {}
+        self.ext_filter = {}
+        self.std_ranges = {}
+
+    def accepts(self, channel, can_id):
+        if can_id & self._xl.XL_CAN_EXT_MSG_ID:
+            code, mask = self.ext_filter.get(channel, (0, 0))
+            return (can_id & mask) == (code & mask)
+        code, mask = self.std_filter.get(channel, (0, 0))
+        if (can_id & mask) != (code & mask):
+            return False
+        ranges = self.std_ranges.get(channel, [(0, 0x7FF)])
+        return any(first <= can_id <= last for first, last in ranges)
+
+class VirtualXLDriver(object):
+    """
+    A virtual replacement of the loaded vxlapi.dll. Every function exported by
+    the library is available as attribute, unsimulated functions return
+    XL_ERR_NOT_IMPLEMENTED.
+    """
+    def __init__(self, xlapi, channel_count=None):
+        if channel_count is None:
+            channel_count = int(os.environ.get("XLAPI_VIRTUAL_CHANNELS", 2))
+        self._xl = xlapi
+        self._lock = threading.RLock()
+        self._open_count = 0
+        self._ports = {}
+        self._next_port_handle = 1
+        self.channels = [_VirtualChannel(i) for i in range(channel_count)]
+
+    def __getattr__(self, name):
+        if not name.startswith("xl"):
+            raise AttributeError(name)
+        function = getattr(self, "_" + name, None)
+        if function is None:
+            function = self._not_implemented
+        fnc = _VirtualFunction(name, function)
+        # Cache the function object, xlapi sets restype/argtypes/errcheck on it
+        setattr(self, name, fnc)
+        return fnc
+
+    def _not_implemented(self, *args):
+        return self._xl.XL_DRIVER_STATUS.ERR_NOT_IMPLEMENTED
+
+    def _port(self, port_handle):
+        return self._ports.get(_value(port_handle))
+
+    def _time(self, port):
+        return time.perf_counter_ns() - port.clock_base
+
+    ### Driver & configuration ###
+
+    def _xlOpenDriver(self):
+        with self._lock:
+            self._open_count += 1
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCloseDriver(self):
+        with self._lock:
+            self._open_count = max(0, self._open_count - 1)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlGetErrorString(self, err):
+        try:
+            name = self._xl.XL_DRIVER_STATUS(_value(err)).name
+        except ValueError:
+            return "XL_ERR_UNKNOWN ({0})".format(_value(err)).encode()
+        if name == "SUCCESS":
+            return b"XL_SUCCESS"
+        return "XL_{0}".format(name).encode()
+
+    def _xlGetEventString(self, event):
+        return str(_ref(event)).encode()
+
+    def _xlCanGetEventString(self, event):
+        return str(_ref(event)).encode()
+
+    def _xlGetDriverConfig(self, p_driver_config):
+        xl = self._xl
+        driver_config = _ref(p_driver_config)
+        with self._lock:
+            ctypes.memset(ctypes.addressof(driver_config), 0, ctypes.sizeof(driver_config))
+            driver_config.channelCount = len(self.channels)
+            for channel in self.channels:
+                config = driver_config.channel[channel.index]
+                config.name = "Virtual Channel {0}".format(channel.index + 1).encode()
+                config.hwType = xl.XL_HWTYPE.VIRTUAL
+                config.hwIndex = 0
+                config.hwChannel = channel.index
+                config.transceiverType = xl.XL_TRANSCEIVER_TYPE.CAN_VIRTUAL
+                config.channelIndex = channel.index
+                config.channelMask = channel.mask
+                config.channelCapabilities = (
+                    xl.XL_CHANNEL_FLAG.CANFD_ISO_SUPPORT |
+                    xl.XL_CHANNEL_FLAG.CANFD_BOSCH_SUPPORT
+                )
+                config.channelBusCapabilities = (
+                    xl.XL_BUS_ACTIVE_CAP.CAN | xl.XL_BUS_COMPATIBLE.CAN
+                )
+                config.isOnBus = int(any(
+                    port.active_mask & channel.mask for port in self._ports.values()
+                ))
+                config.connectedBusType = xl.XL_BUS_TYPE.CAN
+                config.busParams.busType = xl.XL_BUS_TYPE.CAN
+                if channel.is_can_fd:
+                    config.busParams.data.canFD.arbitrationBitRate = channel.bitrate
+                    config.busParams.data.canFD.dataBitRate = channel.data_bitrate
+                else:
+                    config.busParams.data.can.bitRate = channel.bitrate
+                config.transceiverName = b"Virtual CAN"
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlGetChannelMask(self, hw_type, hw_index, hw_channel):
+        hw_type, hw_channel = _value(hw_type), _value(hw_channel)
+        if hw_type not in (-1, self._xl.XL_HWTYPE.VIRTUAL):
+            return 0
+        if hw_channel == -1:
+            hw_channel = 0
+        if 0 <= hw_channel < len(self.channels):
+            return self.channels[hw_channel].mask
+        return 0
+
+    def _xlGetChannelIndex(self, hw_type, hw_index, hw_channel):
+        mask = self._xlGetChannelMask(hw_type, hw_index, hw_channel)
+        return mask.bit_length() - 1
+
+    ### Port handling ###
+
+    def _xlOpenPort(self, p_port_handle, user_name, access_mask,
+                    p_permission_mask, rx_queue_size, interface_version, bus_type):
+        xl = self._xl
+        access_mask = _value(access_mask)
+        if _value(bus_type) != xl.XL_BUS_TYPE.CAN:
+            return xl.XL_DRIVER_STATUS.ERR_WRONG_BUS_TYPE
+        if not access_mask or access_mask >> len(self.channels):
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_ACCESS
+        interface_version = _value(interface_version)
+        rx_queue_size = _value(rx_queue_size)
+        if interface_version == xl.XL_INTERFACE_VERSION.V4:
+            # V4 queues are sized in bytes
+            rx_queue_size //= xl.XL_CANFD_MAX_EVENT_SIZE
+        with self._lock:
+            handle = self._next_port_handle
+            self._next_port_handle += 1
+            port = _VirtualPort(xl, handle, access_mask, rx_queue_size - 1, interface_version)
+            if p_permission_mask is not None:
+                permission_mask, permission = _ref(p_permission_mask), 0
+                for index in _channels(permission_mask.value & access_mask):
+                    channel = self.channels[index]
+                    if channel.init_port is None:
+                        channel.init_port = handle
+                        permission |= channel.mask
+                permission_mask.value = permission
+            port.clock_base = time.perf_counter_ns()
+            self._ports[handle] = port
+        _ref(p_port_handle).value = handle
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlClosePort(self, port_handle):
+        with self._lock:
+            port = self._ports.pop(_value(port_handle), None)
+            if port is None:
+                return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+            for channel in self.channels:
+                if channel.init_port == port.handle:
+                    channel.init_port = None
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlActivateChannel(self, port_handle, access_mask, bus_type, flags):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            port.active_mask |= _value(access_mask) & port.access_mask
+            if _value(flags) & self._xl.XL_ACTIVATE.RESET_CLOCK:
+                port.clock_base = time.perf_counter_ns()
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlDeactivateChannel(self, port_handle, access_mask):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            port.active_mask &= ~_value(access_mask)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _set_channel_params(self, port_handle, access_mask, set_params):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            for index in _channels(_value(access_mask)):
+                if index >= len(self.channels):
+                    return self._xl.XL_DRIVER_STATUS.ERR_INVALID_ACCESS
+                if self.channels[index].init_port != port.handle:
+                    return self._xl.XL_DRIVER_STATUS.ERR_INIT_ACCESS_MISSING
+            for index in _channels(_value(access_mask)):
+                set_params(self.channels[index])
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanSetChannelParams(self, port_handle, access_mask, p_chip_params):
+        chip_params = _ref(p_chip_params)
+        def set_params(channel):
+            channel.bitrate = chip_params.bitRate
+            channel.is_can_fd = False
+        return self._set_channel_params(port_handle, access_mask, set_params)
+
+    def _xlCanSetChannelBitrate(self, port_handle, access_mask, bitrate):
+        def set_params(channel):
+            channel.bitrate = _value(bitrate)
+            channel.is_can_fd = False
+        return self._set_channel_params(port_handle, access_mask, set_params)
+
+    def _xlCanFdSetConfiguration(self, port_handle, access_mask, p_can_fd_conf):
+        can_fd_conf = _ref(p_can_fd_conf)
+        def set_params(channel):
+            channel.bitrate = can_fd_conf.arbitrationBitRate
+            channel.data_bitrate = can_fd_conf.dataBitRate
+            channel.is_can_fd = True
+        return self._set_channel_params(port_handle, access_mask, set_params)
+
+    def _xlCanSetChannelMode(self, port_handle, access_mask, tx, txrq):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        port.tx_receipts = _value(tx)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanSetChannelOutput(self, port_handle, access_mask, mode):
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanRequestChipState(self, port_handle, access_mask):
+        xl = self._xl
+        port = self._port(port_handle)
+        if port is None:
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            for index in _channels(_value(access_mask) & port.active_mask):
+                channel = self.channels[index]
+                self._enqueue(port, _ChipState(
+                    time.perf_counter_ns(), index, xl.XL_CHIPSTAT.ERROR_ACTIVE,
+                    channel.tx_error_counter, channel.rx_error_counter,
+                ))
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    ### Acceptance filters ###
+
+    def _xlCanSetChannelAcceptance(self, port_handle, access_mask, code, mask, id_range):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        if _value(id_range) == self._xl.XL_ACCEPTANCE_FILTER.CAN_EXT:
+            filters = port.ext_filter
+            code = _value(code) | self._xl.XL_CAN_EXT_MSG_ID
+        else:
+            filters = port.std_filter
+            code = _value(code)
+        with self._lock:
+            for index in _channels(_value(access_mask)):
+                filters[index] = (code, _value(mask))
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanAddAcceptanceRange(self, port_handle, access_mask, first_id, last_id):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            for index in _channels(_value(access_mask)):
+                ranges = port.std_ranges.setdefault(index, [(0, 0x7FF)])
+                ranges.append((_value(first_id), _value(last_id)))
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanRemoveAcceptanceRange(self, port_handle, access_mask, first_id, last_id):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        first_id, last_id = _value(first_id), _value(last_id)
+        with self._lock:
+            for index in _channels(_value(access_mask)):
+                remaining = []
+                for first, last in port.std_ranges.get(index, [(0, 0x7FF)]):
+                    if first < first_id:
+                        remaining.append((first, min(last, first_id - 1)))
+                    if last > last_id:
+                        remaining.append((max(first, last_id + 1), last))
+                port.std_ranges[index] = remaining
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanResetAcceptance(self, port_handle, access_mask, id_range):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            for index in _channels(_value(access_mask)):
+                if _value(id_range) == self._xl.XL_ACCEPTANCE_FILTER.CAN_EXT:
+                    port.ext_filter.pop(index, None)
+                else:
+                    port.std_filter.pop(index, None)
+                    port.std_ranges.pop(index, None)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    ### Notification & time ###
+
+    def _xlSetNotification(self, port_handle, p_handle, queue_level):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            if port.notification is None:
+                port.notification_handle, port.notification = (
+                    _create_notification_event(max(1, _value(queue_level)))
+                )
+            else:
+                port.notification.queue_level = max(1, _value(queue_level))
+            if len(port.queue) >= port.notification.queue_level:
+                port.notification.set()
+        _ref(p_handle).value = port.notification_handle
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlSetTimerRate(self, port_handle, timer_rate):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        port.timer_rate = _value(timer_rate)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlSetTimerBasedNotify(self, port_handle, p_handle):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            if port.timer_notification is None:
+                port.timer_notification_handle, port.timer_notification = (
+                    _create_notification_event(1)
+                )
+                threading.Thread(
+                    target=self._run_timer, args=(port,), name="XLVirtualTimer", daemon=True
+                ).start()
+        _ref(p_handle).value = port.timer_notification_handle
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _run_timer(self, port):
+        # Like the real driver the timer runs in steps of 1 ms, until the port
+        # is closed
+        next_time = time.perf_counter()
+        while self._ports.get(port.handle) is port:
+            next_time += max(1, port.timer_rate // 100) / 1000.0
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+            if port.timer_rate:
+                port.timer_notification.set()
+
+    def _xlResetClock(self, port_handle):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        port.clock_base = time.perf_counter_ns()
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlGetSyncTime(self, port_handle, p_time):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        _ref(p_time).value = self._time(port)
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlGetChannelTime(self, port_handle, access_mask, p_channel_time):
+        return self._xlGetSyncTime(port_handle, p_channel_time)
+
+    ### Receive queue ###
+
+    def _xlGetReceiveQueueLevel(self, port_handle, p_level):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        level = len(port.queue)
+        if port.interface_version == self._xl.XL_INTERFACE_VERSION.V4:
+            level *= self._xl.XL_CANFD_MAX_EVENT_SIZE
+        _ref(p_level).value = level
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlFlushReceiveQueue(self, port_handle):
+        port = self._port(port_handle)
+        if port is None:
+            return self._xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        with self._lock:
+            port.queue.clear()
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanFlushTransmitQueue(self, port_handle, access_mask):
+        # Frames are put on the virtual bus immediately, nothing to flush
+        return self._xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _enqueue(self, port, event):
+        # The caller holds the driver lock
+        if len(port.queue) >= port.queue_size:
+            port.overrun = True
+            return
+        port.queue.append(event)
+        if port.notification and len(port.queue) >= port.notification.queue_level:
+            port.notification.set()
+
+    def _xlReceive(self, port_handle, p_event_count, p_events):
+        xl = self._xl
+        port = self._port(port_handle)
+        if port is None:
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        event_count = _ref(p_event_count)
+        if port.interface_version == xl.XL_INTERFACE_VERSION.V4:
+            event_count.value = 0
+            return xl.XL_DRIVER_STATUS.ERR_WRONG_VERSION
+        with self._lock:
+            count = min(event_count.value, len(port.queue))
+            if not count:
+                event_count.value = 0
+                return xl.XL_DRIVER_STATUS.ERR_QUEUE_IS_EMPTY
+            xl_events = _array(p_events, xl.XLevent, count)
+            for i in range(count):
+                self._build_xl_event(port, xl_events[i], port.queue.popleft())
+        event_count.value = count
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanReceive(self, port_handle, p_xl_can_rx_event):
+        xl = self._xl
+        port = self._port(port_handle)
+        if port is None:
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        if port.interface_version != xl.XL_INTERFACE_VERSION.V4:
+            return xl.XL_DRIVER_STATUS.ERR_WRONG_VERSION
+        with self._lock:
+            if not port.queue:
+                return xl.XL_DRIVER_STATUS.ERR_QUEUE_IS_EMPTY
+            self._build_xl_can_rx_event(port, _ref(p_xl_can_rx_event), port.queue.popleft())
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _build_xl_event(self, port, xl_event, frame):
+        xl = self._xl
+        ctypes.memset(ctypes.addressof(xl_event), 0, ctypes.sizeof(xl_event))
+        xl_event.portHandle = port.handle
+        if port.overrun:
+            xl_event.flags = xl.XL_EVENT_FLAG_OVERRUN
+            port.overrun = False
+        if isinstance(frame, _ChipState):
+            xl_event.tag = xl.XL_EVENT_TAGS.CHIP_STATE
+            xl_event.chanIndex = frame.channel
+            xl_event.timeStamp = frame.timestamp - port.clock_base
+            xl_event.chipState.busStatus = frame.bus_status
+            xl_event.chipState.txErrorCounter = frame.tx_error_counter
+            xl_event.chipState.rxErrorCounter = frame.rx_error_counter
+            return
+        timestamp, channel, can_id, msg_flags, dlc, data, is_tx = frame
+        xl_event.tag = xl.XL_EVENT_TAGS.RECEIVE_MSG
+        xl_event.chanIndex = channel
+        xl_event.timeStamp = timestamp - port.clock_base
+        xl_event.msg.id = can_id
+        flags = 0
+        if msg_flags & xl.XL_CAN_RXMSG_FLAG.RTR:
+            flags |= xl.XL_CAN_MSG_FLAG.REMOTE_FRAME
+        if is_tx:
+            flags |= xl.XL_CAN_MSG_FLAG.TX_COMPLETED
+        xl_event.msg.flags = flags
+        xl_event.msg.dlc = dlc
+        ctypes.memmove(xl_event.msg.data, data, len(data))
+
+    def _build_xl_can_rx_event(self, port, xl_can_rx_event, frame):
+        xl = self._xl
+        ctypes.memset(ctypes.addressof(xl_can_rx_event), 0, ctypes.sizeof(xl_can_rx_event))
+        xl_can_rx_event.size = xl.XL_CANFD_MAX_EVENT_SIZE
+        if port.overrun:
+            xl_can_rx_event.flagsChip = xl.XL_CAN_QUEUE_OVERFLOW
+            port.overrun = False
+        if isinstance(frame, _ChipState):
+            xl_can_rx_event.tag = xl.XL_EVENT_TAGS.CAN_EV_TAG_CHIP_STATE
+            xl_can_rx_event.channelIndex = frame.channel
+            xl_can_rx_event.timeStampSync = frame.timestamp - port.clock_base
+            xl_can_rx_event.canChipState.busStatus = frame.bus_status
+            xl_can_rx_event.canChipState.txErrorCounter = frame.tx_error_counter
+            xl_can_rx_event.canChipState.rxErrorCounter = frame.rx_error_counter
+            return
+        timestamp, channel, can_id, msg_flags, dlc, data, is_tx = frame
+        xl_can_rx_event.channelIndex = channel
+        xl_can_rx_event.timeStampSync = timestamp - port.clock_base
+        if is_tx:
+            xl_can_rx_event.tag = xl.XL_EVENT_TAGS.CAN_EV_TAG_TX_OK
+            msg = xl_can_rx_event.canTxOkMsg
+        else:
+            xl_can_rx_event.tag = xl.XL_EVENT_TAGS.CAN_EV_TAG_RX_OK
+            msg = xl_can_rx_event.canRxOkMsg
+        msg.canId = can_id
+        msg.msgFlags = msg_flags
+        msg.dlc = dlc
+        ctypes.memmove(msg.data, data, len(data))
+
+    ### Transmit ###
+
+    def _transmit(self, port, access_mask, frames):
+        # frames: (can_id, msg_flags, dlc, data) with XL_CAN_RXMSG_FLAG flags
+        xl = self._xl
+        fd_flags = xl.XL_CAN_RXMSG_FLAG.EDL
+        with self._lock:
+            tx_channels = list(_channels(access_mask & port.active_mask))
+            if not tx_channels:
+                return xl.XL_DRIVER_STATUS.ERR_TX_NOT_POSSIBLE
+            ports = list(self._ports.values())
+            for can_id, msg_flags, dlc, data in frames:
+                timestamp = time.perf_counter_ns()
+                for tx_channel in tx_channels:
+                    for rx_port in ports:
+                        if (rx_port.interface_version != xl.XL_INTERFACE_VERSION.V4
+                            and msg_flags & fd_flags
+                        ):
+                            continue
+                        if rx_port is port and rx_port.tx_receipts:
+                            self._enqueue(rx_port, (
+                                timestamp, tx_channel, can_id, msg_flags, dlc, data, True
+                            ))
+                        for rx_channel in _channels(rx_port.active_mask):
+                            if rx_channel == tx_channel:
+                                continue
+                            if not rx_port.accepts(rx_channel, can_id):
+                                continue
+                            self._enqueue(rx_port, (
+                                timestamp, rx_channel, can_id, msg_flags, dlc, data, False
+                            ))
+        return xl.XL_DRIVER_STATUS.SUCCESS
+
+    def _xlCanTransmit(self, port_handle, access_mask, p_message_count, p_messages):
+        xl = self._xl
+        port = self._port(port_handle)
+        if port is None:
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        message_count = _ref(p_message_count)
+        xl_events = _array(p_messages, xl.XLevent, message_count.value)
+        frames = []
+        for xl_event in xl_events:
+            if xl_event.tag != xl.XL_EVENT_TAGS.TRANSMIT_MSG:
+                return xl.XL_DRIVER_STATUS.ERR_INVALID_TAG
+            msg_flags = 0
+            if xl_event.msg.flags & xl.XL_CAN_MSG_FLAG.REMOTE_FRAME:
+                msg_flags |= xl.XL_CAN_RXMSG_FLAG.RTR
+            dlc = min(xl_event.msg.dlc, 8)
+            length = 0 if msg_flags else dlc
+            frames.append((xl_event.msg.id, msg_flags, dlc, bytes(xl_event.msg.data[:length])))
+        return self._transmit(port, _value(access_mask), frames)
+
+    def _xlCanTransmitEx(self, port_handle, access_mask, msg_count, p_msg_count_sent, p_xl_can_tx_event):
+        xl = self._xl
+        port = self._port(port_handle)
+        if port is None:
+            return xl.XL_DRIVER_STATUS.ERR_INVALID_PORT
+        if port.interface_version != xl.XL_INTERFACE_VERSION.V4:
+            return xl.XL_DRIVER_STATUS.ERR_WRONG_VERSION
+        msg_count_sent = _ref(p_msg_count_sent)
+        msg_count_sent.value = 0
+        tx_events = _array(p_xl_can_tx_event, xl.XLcanTxEvent, _value(msg_count))
+        frames = []
+        for tx_event in tx_events:
+            if tx_event.tag != xl.XL_EVENT_TAGS.CAN_EV_TAG_TX_MSG:
+                return xl.XL_DRIVER_STATUS.ERR_INVALID_TAG
+            msg = tx_event.canMsg
+            flags = msg.msgFlags
+            if msg.dlc > 15:
+                return xl.XL_DRIVER_STATUS.ERR_INVALID_DLC
+            if flags & xl.XL_CAN_TXMSG_FLAG.EDL:
+                if flags & xl.XL_CAN_TXMSG_FLAG.RTR:
+                    return xl.XL_DRIVER_STATUS.ERR_EDL_RTR
+            elif flags & xl.XL_CAN_TXMSG_FLAG.BRS:
+                return xl.XL_DRIVER_STATUS.ERR_EDL_NOT_SET
+            # EDL, BRS and RTR have the same bits in the tx & rx flags
+            msg_flags = flags & (
+                xl.XL_CAN_RXMSG_FLAG.EDL | xl.XL_CAN_RXMSG_FLAG.BRS | xl.XL_CAN_RXMSG_FLAG.RTR
+            )
+            length = xl.CANFD_GET_NUM_DATABYTES(
+                msg.dlc,
+                flags & xl.XL_CAN_TXMSG_FLAG.EDL,
+                flags & xl.XL_CAN_TXMSG_FLAG.RTR,
+            )
+            frames.append((msg.canId, msg_flags, msg.dlc, bytes(msg.data[:length])))
+        status = self._transmit(port, _value(access_mask), frames)
+        if status == xl.XL_DRIVER_STATUS.SUCCESS:
+            msg_count_sent.value = len(frames)
+        return status